@@ -0,0 +1,65 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A micro-benchmark of action message dispatch throughput.
+
+This compares the cached dispatcher returned by `make_dispatcher` with
+the equivalent dynamic `getattr` lookup for a batch of messages sent to
+a mix of handler classes.
+
+Usage: python bench_dispatch.py [message count]
+
+"""
+import sys
+import timeit
+
+from enaml.utils import make_dispatcher
+
+
+class Handler(object):
+
+    def on_action_set_text(self, content):
+        pass
+
+    def on_action_set_enabled(self, content):
+        pass
+
+    def on_action_relayout(self, content):
+        pass
+
+
+class SubHandler(Handler):
+
+    def on_action_set_value(self, content):
+        pass
+
+
+def dynamic_dispatch(obj, name, *args):
+    handler = getattr(obj, 'on_action_' + name, None)
+    if handler is not None:
+        handler(*args)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    objects = [Handler(), SubHandler()]
+    names = ['set_text', 'set_enabled', 'relayout']
+    messages = [
+        (objects[i % 2], names[i % 3], {}) for i in xrange(count)
+    ]
+    cached_dispatch = make_dispatcher('on_action_')
+
+    def run(dispatch):
+        for obj, name, content in messages:
+            dispatch(obj, name, content)
+
+    for label, dispatch in (('getattr', dynamic_dispatch),
+                            ('cached', cached_dispatch)):
+        best = min(timeit.repeat(lambda: run(dispatch), number=1, repeat=5))
+        rate = count / best
+        print '%-8s %10.0f messages/sec' % (label, rate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A benchmark of the flow layout line computation.
+
+This times the lines computed by a FlowLineCache for 1k and 10k items,
+when every pass recomputes all of the lines, and when the cache is
+reused. The cases are a window resize sweep, and a change to the size
+hint of a single item near the end of the layout. If a Qt binding is
+available, a QFlowArea with the same number of items is also resized.
+
+Usage: python bench_flow_layout.py [item count ...]
+
+"""
+import random
+import sys
+import timeit
+
+from enaml.qt.flow_line_cache import FlowLineCache
+
+
+def make_metrics(count):
+    rnd = random.Random(0)
+    metrics = []
+    for i in xrange(count):
+        w = rnd.randint(60, 140)
+        h = rnd.randint(60, 140)
+        metrics.append((w, w // 2, h, h // 2, 0, 0))
+    return metrics
+
+
+def bench_lines(count):
+    metrics = make_metrics(count)
+    measure = metrics.__getitem__
+    widths = range(800, 1000, 4)
+
+    def resize(cache, reset):
+        for width in widths:
+            if reset:
+                cache.reset()
+            cache.lines(width, 10, measure)
+
+    def change(cache, reset):
+        for i in xrange(50):
+            if reset:
+                cache.reset()
+            else:
+                cache.invalidate(count - 10)
+            cache.lines(900, 10, measure)
+
+    for label, func in (('resize', resize), ('change', change)):
+        for mode, reset in (('full', True), ('cached', False)):
+            cache = FlowLineCache()
+            cache.insert(0, count)
+            cache.lines(900, 10, measure)
+            best = min(timeit.repeat(
+                lambda: func(cache, reset), number=1, repeat=5
+            ))
+            print '%6d items  %-7s %-7s %8.2f ms' % (
+                count, label, mode, best * 1000
+            )
+
+
+def bench_qt(count):
+    try:
+        from enaml.qt.qt.QtCore import QSize
+        from enaml.qt.qt.QtGui import QApplication
+        from enaml.qt.qt_flow_area import QFlowArea
+        from enaml.qt.qt_flow_item import QFlowItem
+    except ImportError:
+        print 'Qt is not available, skipping the QFlowArea benchmark'
+        return False
+    app = QApplication.instance() or QApplication([])
+    area = QFlowArea()
+    layout = area.layout()
+    for w, mw, h, mh, s, os in make_metrics(count):
+        item = QFlowItem()
+        item.setPreferredSize(QSize(w, h))
+        layout.addWidget(item)
+    area.resize(900, 600)
+    area.show()
+    app.processEvents()
+
+    def resize():
+        for width in xrange(800, 1000, 20):
+            area.resize(width, 600)
+            app.processEvents()
+
+    best = min(timeit.repeat(resize, number=1, repeat=3))
+    print '%6d items  qt      resize  %8.2f ms' % (count, best * 1000)
+    area.close()
+    return True
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 10000]
+    for count in counts:
+        bench_lines(count)
+    for count in counts:
+        if not bench_qt(count):
+            break
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" A benchmark of the memory used by server-side Enaml objects.
+
+This creates a flat tree of objects under a single parent, drives them
+through their initialization, and reports the average number of bytes
+of process memory used per object, along with the size of a single
+instance and its dict. The server-side widgets are used if
+they can be imported, otherwise only the core classes are measured.
+
+Usage: python bench_object_memory.py [object count]
+
+"""
+import gc
+import resource
+import sys
+
+from enaml.core.messenger import Messenger
+from enaml.core.object import Object
+
+
+def memory_usage():
+    """ Get the current resident memory of the process, in bytes.
+
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize()
+    except IOError:
+        # ru_maxrss is in kilobytes on Linux and bytes on OSX, but the
+        # /proc filesystem is available on Linux, so assume bytes.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def instance_size(obj):
+    """ Get the size of an object and its instance dict, in bytes.
+
+    """
+    return sys.getsizeof(obj) + sys.getsizeof(obj.__dict__)
+
+
+def measure(cls, count):
+    """ Measure the bytes per instance for the given class.
+
+    Returns
+    -------
+    result : tuple
+        A 2-tuple of the average growth in process memory and the size
+        of a single instance and its dict, both in bytes.
+
+    """
+    gc.collect()
+    start = memory_usage()
+    root = Object()
+    children = [cls() for i in xrange(count)]
+    root.insert_children(None, children)
+    root.initialize()
+    for child in children:
+        child.object_id
+    gc.collect()
+    stop = memory_usage()
+    size = instance_size(children[0])
+    root.destroy()
+    del root, children
+    gc.collect()
+    return (float(stop - start) / count, size)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    classes = [Object, Messenger]
+    try:
+        from enaml.widgets.api import PushButton, Field
+    except ImportError:
+        pass
+    else:
+        classes.extend([PushButton, Field])
+    # Warm up the classes and the heap so that one-time costs are not
+    # attributed to the first class measured.
+    for cls in classes:
+        measure(cls, count / 10)
+    for cls in classes:
+        process, instance = measure(cls, count)
+        msg = '%-12s %8.0f bytes per object, %6d bytes per instance dict'
+        print msg % (cls.__name__, process, instance)
+
+
+if __name__ == '__main__':
+    main()
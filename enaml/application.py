@@ -7,6 +7,10 @@ from heapq import heappush, heappop
 from itertools import count
 import logging
 from threading import Lock
+import uuid
+
+from .image_cache import ImageCache
+from .session_pool import SessionPool
 
 
 logger = logging.getLogger(__name__)
@@ -151,6 +155,8 @@ class Application(object):
         self._task_heap = []
         self._counter = count()
         self._heap_lock = Lock()
+        self._image_cache = ImageCache()
+        self._session_pool = SessionPool(self)
         self.add_factories(factories)
 
     #--------------------------------------------------------------------------
@@ -176,6 +182,34 @@ class Application(object):
                 priority, ignored, task = heappop(heap)
                 self.deferred_call(self._process_task, task)
 
+    def _open_session(self, name):
+        """ Get an opened session of the given name.
+
+        A session is taken from the session pool for the name if one is
+        available, otherwise a new session is created and opened. This
+        should be called by the `start_session` implementation of a
+        subclass.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to open.
+
+        Returns
+        -------
+        result : Session
+            An opened session which has not been activated. Its
+            `session_id` is the unique identifier of the session.
+
+        """
+        if name not in self._named_factories:
+            raise ValueError('Invalid session name')
+        session = self._session_pool.acquire(name)
+        if session is None:
+            session = self._named_factories[name]()
+            session.open(uuid.uuid4().hex)
+        return session
+
     #--------------------------------------------------------------------------
     # Abstract API
     #--------------------------------------------------------------------------
@@ -394,6 +428,7 @@ class Application(object):
                 all_factories.remove(old_factory)
             all_factories.append(factory)
             named_factories[name] = factory
+            self._session_pool.discard(name)
 
     def discover(self):
         """ Get a dictionary of session information for the application.
@@ -410,6 +445,52 @@ class Application(object):
         ]
         return info
 
+    def set_pool_size(self, name, size):
+        """ Set the number of opened sessions to keep ready for a name.
+
+        Sessions in the pool are opened ahead of time by low priority
+        scheduled tasks, so that `start_session` only has to activate
+        a session. The pool is refilled in the background as sessions
+        are started.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session factory.
+
+        size : int
+            The number of opened sessions to keep ready. A size of zero
+            disables the pool for the name.
+
+        """
+        if name not in self._named_factories:
+            raise ValueError('Invalid session name')
+        self._session_pool.set_size(name, size)
+
+    def pool_size(self, name):
+        """ Get the number of opened sessions kept ready for a name.
+
+        """
+        return self._session_pool.size(name)
+
+    def pooled_count(self, name):
+        """ Get the number of opened sessions currently ready for a name.
+
+        """
+        return self._session_pool.idle_count(name)
+
+    def image_cache(self):
+        """ Get the image cache for the application.
+
+        Returns
+        -------
+        result : ImageCache
+            The cache of loaded images which is shared by the resource
+            managers of all sessions of the application.
+
+        """
+        return self._image_cache
+
     def destroy(self):
         """ Destroy this application instance.
 
@@ -419,8 +500,11 @@ class Application(object):
         """
         for session in self.sessions():
             self.end_session(session.session_id)
+        self._session_pool.clear()
         self._all_factories = []
         self._named_factories = {}
+        self._image_cache.clear()
+        self._image_cache.shutdown()
         Application._instance = None
 
 
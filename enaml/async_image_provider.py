@@ -0,0 +1,393 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from abc import abstractmethod
+from heapq import heappush, heappop
+from itertools import count
+import logging
+from threading import Condition, Thread
+
+from .application import deferred_call
+from .image_provider import ImageProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class ImageRequest(object):
+    """ A handle to a pending request made to an AsyncImageProvider.
+
+    Instances of this class are returned by the `request_image` method
+    of an `AsyncImageProvider`. They can be used to cancel the request
+    before the image is delivered, or to raise its priority.
+
+    """
+    __slots__ = ('_job', '_callback')
+
+    def __init__(self, job, callback):
+        """ Initialize an ImageRequest.
+
+        Parameters
+        ----------
+        job : _ImageJob
+            The job which will load the image for the request.
+
+        callback : callable
+            The callback to invoke with the loaded image.
+
+        """
+        self._job = job
+        self._callback = callback
+
+    def cancel(self):
+        """ Cancel the request.
+
+        The callback for the request will not be invoked. If no other
+        requests are waiting on the same image, the image will not be
+        loaded if loading has not yet started. This method must be
+        called from the main thread.
+
+        """
+        job = self._job
+        if job is not None:
+            self._job = None
+            job.provider._cancel(job, self)
+
+    def raise_priority(self, priority):
+        """ Raise the priority of the request.
+
+        The priority of the load is raised if it has not yet started
+        and its priority is lower. This method must be called from the
+        main thread.
+
+        Parameters
+        ----------
+        priority : int
+            The new queue priority for the request.
+
+        """
+        job = self._job
+        if job is not None:
+            job.provider._raise_priority(job, priority)
+
+
+class _ImageJob(object):
+    """ A private class which represents the loading of one image.
+
+    A job is shared by all of the concurrent requests for the same
+    image from a provider.
+
+    """
+    __slots__ = (
+        'provider', 'key', 'requests', 'priority', 'started', 'cancelled',
+    )
+
+    def __init__(self, provider, key, priority):
+        self.provider = provider
+        self.key = key
+        self.requests = []
+        self.priority = priority
+        self.started = False
+        self.cancelled = False
+
+
+class AsyncImageProvider(ImageProvider):
+    """ An image provider which loads images on a pool of threads.
+
+    Subclasses must implement the `load_image` method, which is called
+    on a worker thread. The provider takes care of queueing the loads
+    by priority, running at most `max_workers` at once, sharing a load
+    between concurrent requests for the same path and size, and
+    delivering the result on the main thread. Requests which are
+    cancelled before their load starts are never loaded. Subclasses
+    may also implement `load_preview` to deliver a quick preview of
+    an image before the final image is loaded.
+
+    """
+    def __init__(self, max_workers=4):
+        """ Initialize an AsyncImageProvider.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker threads to use for loading
+            images. The threads are started on demand. The default is 4.
+
+        """
+        self._max_workers = max_workers
+        self._workers = []
+        self._idle = 0
+        self._heap = []
+        self._counter = count()
+        self._condition = Condition()
+        self._jobs = {}
+        self._shutdown = False
+
+    #--------------------------------------------------------------------------
+    # Abstract API
+    #--------------------------------------------------------------------------
+    @abstractmethod
+    def load_image(self, path, size):
+        """ Load an image from this provider.
+
+        This method is called on a worker thread. It must not touch
+        any state which belongs to the main thread.
+
+        Parameters
+        ----------
+        path : str
+            The requested path of the image, with the provider prefix
+            removed.
+
+        size : tuple
+            The (width, height) requested size of the image. If this
+            value is (-1, -1), the image should be loaded in its
+            original size.
+
+        Returns
+        -------
+        result : Image or None
+            The loaded image, or None if the image could not be loaded.
+
+        """
+        raise NotImplementedError
+
+    def load_preview(self, path, size):
+        """ Load a preview of an image from this provider.
+
+        This method is called on a worker thread before `load_image`.
+        A preview is delivered to the requests for the image while the
+        final image is loading. The default implementation returns None.
+
+        Parameters
+        ----------
+        path : str
+            The requested path of the image, with the provider prefix
+            removed.
+
+        size : tuple
+            The (width, height) requested size of the image.
+
+        Returns
+        -------
+        result : Image or None
+            A preview of the image, such as a low resolution version,
+            or None if there is no preview.
+
+        """
+        return None
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _push(self, job):
+        """ Push a job onto the queue with its current priority.
+
+        A job may be pushed more than once if its priority is raised.
+        The stale entries are skipped by the workers.
+
+        """
+        with self._condition:
+            heappush(self._heap, (-job.priority, self._counter.next(), job))
+            if self._idle > 0:
+                self._condition.notify()
+            elif len(self._workers) < self._max_workers:
+                worker = Thread(target=self._run_worker)
+                worker.daemon = True
+                self._workers.append(worker)
+                worker.start()
+
+    def _run_worker(self):
+        """ The main loop of a worker thread.
+
+        """
+        condition = self._condition
+        heap = self._heap
+        while True:
+            with condition:
+                job = None
+                while job is None:
+                    while not heap and not self._shutdown:
+                        self._idle += 1
+                        condition.wait()
+                        self._idle -= 1
+                    if self._shutdown:
+                        return
+                    job = heappop(heap)[2]
+                    if job.started or job.cancelled:
+                        job = None
+                job.started = True
+            path, size = job.key
+            try:
+                preview = self.load_preview(path, size)
+            except Exception:
+                msg = 'exception loading preview `%s` at size %s'
+                logger.exception(msg % (path, size))
+                preview = None
+            if preview is not None:
+                preview.preview = True
+                deferred_call(self._deliver_preview, job, preview)
+            try:
+                image = self.load_image(path, size)
+            except Exception:
+                msg = 'exception loading image `%s` at size %s'
+                logger.exception(msg % (path, size))
+                image = None
+            deferred_call(self._finish, job, image)
+
+    def _deliver_preview(self, job, preview):
+        """ Deliver the preview loaded by a job to its requests.
+
+        This is invoked on the main thread.
+
+        """
+        for request in job.requests[:]:
+            request._callback(preview)
+
+    def _finish(self, job, image):
+        """ Deliver the image loaded by a job to its requests.
+
+        This is invoked on the main thread.
+
+        """
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        requests = job.requests
+        job.requests = []
+        for request in requests:
+            request._job = None
+            request._callback(image)
+
+    def _raise_priority(self, job, priority):
+        """ Raise the priority of a job which has not yet started.
+
+        This is invoked on the main thread.
+
+        """
+        if priority > job.priority and not job.started:
+            job.priority = priority
+            self._push(job)
+
+    def _cancel(self, job, request):
+        """ Cancel a request for the image loaded by a job.
+
+        This is invoked on the main thread by `ImageRequest.cancel`.
+
+        """
+        requests = job.requests
+        if request in requests:
+            requests.remove(request)
+        if not requests:
+            job.cancelled = True
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def request_image(self, path, size, callback, priority=0):
+        """ Request an image from this provider.
+
+        This method must be called from the main thread.
+
+        Parameters
+        ----------
+        path : str
+            The requested path of the image, with the provider prefix
+            removed.
+
+        size : tuple
+            The (width, height) requested size of the image.
+
+        callback : callable
+            A callable which will be invoked on the main thread with
+            the loaded `Image`, or None if the image failed to load.
+
+        priority : int, optional
+            The queue priority for the request. Larger values are
+            loaded first. If a load for the same path and size is
+            already queued, its priority is raised to this value if
+            needed. The default is zero.
+
+        Returns
+        -------
+        result : ImageRequest
+            A request object which can be used to cancel the request.
+
+        """
+        key = (path, tuple(size))
+        job = self._jobs.get(key)
+        if job is None:
+            job = self._jobs[key] = _ImageJob(self, key, priority)
+            self._push(job)
+        else:
+            self._raise_priority(job, priority)
+        request = ImageRequest(job, callback)
+        job.requests.append(request)
+        return request
+
+    def shutdown(self):
+        """ Stop the worker threads of the provider.
+
+        Queued loads are abandoned and their requests are never
+        delivered. Loads which are in progress run to completion, but
+        are not delivered. The provider cannot be used once it has
+        been shut down.
+
+        """
+        with self._condition:
+            self._shutdown = True
+            del self._heap[:]
+            self._condition.notify_all()
+        for job in self._jobs.values():
+            job.cancelled = True
+            job.requests = []
+        self._jobs.clear()
+
+
+class ResampleProvider(AsyncImageProvider):
+    """ An AsyncImageProvider which resamples source images.
+
+    This provider is used by an `ImageCache` to derive the sizes of an
+    image from its cached natural size image on worker threads, rather
+    than on the main thread. The path of a request is a key which is
+    passed to the source callable.
+
+    """
+    def __init__(self, source, resampler, max_workers=2):
+        """ Initialize a ResampleProvider.
+
+        Parameters
+        ----------
+        source : callable
+            A thread-safe callable which accepts the path of a request
+            and returns the source Image, or None if the source is not
+            available.
+
+        resampler : callable
+            A callable with the signature of `resample_image` which is
+            called on a worker thread to resample the source image.
+
+        max_workers : int, optional
+            The maximum number of worker threads. The default is 2.
+
+        """
+        super(ResampleProvider, self).__init__(max_workers)
+        self._source = source
+        self._resampler = resampler
+
+    def load_image(self, path, size):
+        """ Resample the source image for a path.
+
+        Returns
+        -------
+        result : Image or None
+            The resampled image, or None if the source is no longer
+            available or could not be resampled.
+
+        """
+        source = self._source(path)
+        if source is None:
+            return None
+        return self._resampler(source, size)
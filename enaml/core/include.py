@@ -52,8 +52,7 @@ class Include(Declarative):
             with new.children_event_context():
                 with old.children_event_context():
                     if new is None:
-                        for obj in self.objects:
-                            obj.set_parent(None)
+                        old.remove_children(self.objects)
                     else:
                         new.insert_children(self, self.objects)
 
@@ -76,9 +75,9 @@ class Include(Declarative):
                             if obj not in new_set:
                                 obj.destroy()
                     else:
-                        for obj in old:
-                            if obj not in new_set:
-                                obj.set_parent(None)
+                        parent.remove_children(
+                            obj for obj in old if obj not in new_set
+                        )
                     if new_set:
                         parent.insert_children(self, self.objects)
 
@@ -101,9 +100,9 @@ class Include(Declarative):
                             if obj not in add_set:
                                 obj.destroy()
                     else:
-                        for obj in event.removed:
-                            if obj not in add_set:
-                                obj.set_parent(None)
+                        parent.remove_children(
+                            obj for obj in event.removed if obj not in add_set
+                        )
                     if add_set:
                         parent.insert_children(self, self.objects)
 
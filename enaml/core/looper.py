@@ -141,7 +141,7 @@ class Looper(Templated):
                             if not old.is_destroyed:
                                 old.destroy()
                 if len(items) > 0:
-                    flat = sum(items, ())
+                    flat = [item for iteration in items for item in iteration]
                     self.parent.insert_children(self, flat)
                     for item in flat:
                         item.initialize()
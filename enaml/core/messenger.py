@@ -2,12 +2,12 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Instance, Uninitialized
+from traits.api import Any, Bool, Property, Uninitialized
 
 from enaml.utils import LoopbackGuard
 
 from .declarative import Declarative
-from .object import Object
+from .object import Object, ACTIVE
 
 
 class PublishAttributeNotifier(object):
@@ -18,8 +18,12 @@ class PublishAttributeNotifier(object):
         """ Called by traits to dispatch the notifier.
 
         """
-        if old is not Uninitialized and name not in obj.loopback_guard:
-            obj.send_action('set_' + name, {name: new})
+        if old is not Uninitialized and obj._state == ACTIVE:
+            # The guard is read from the instance dict so that one is
+            # not created for objects which never guard an attribute.
+            guard = obj.__dict__.get('_loopback_guard')
+            if guard is None or name not in guard:
+                obj.send_action('set_' + name, {name: new})
 
     def equals(self, other):
         """ Compares this notifier against another for equality.
@@ -77,9 +81,11 @@ class ChildrenChangedTask(object):
         content['removed'] = [
             c.object_id for c in removed if isinstance(c, Messenger)
         ]
-        content['added'] = [
-            c.snapshot() for c in added if isinstance(c, Messenger)
-        ]
+        messengers = [c for c in added if isinstance(c, Messenger)]
+        realized = self._parent._realized
+        for obj in messengers:
+            obj._set_realized(realized)
+        content['added'] = [c.snapshot() for c in messengers]
         session = self._parent.session
         for obj in added:
             if obj.is_initialized:
@@ -97,7 +103,33 @@ class Messenger(Declarative):
     """
     #: A loopback guard which can be used to prevent a notification
     #: cycle when setting attributes from within an action handler.
-    loopback_guard = Instance(LoopbackGuard, ())
+    #: The guard is created lazily, the first time it is requested.
+    loopback_guard = Property
+
+    #: Private storage for the lazily created loopback guard.
+    _loopback_guard = Any
+
+    #: Whether the client object for this messenger exists. Messages
+    #: for an object which is not realized are discarded, since the
+    #: client receives its current state when it is realized.
+    _realized = Bool(True)
+
+    #: Whether the children of this messenger are realized on the
+    #: client. The children of an unrealized object are not included
+    #: in its snapshot.
+    _children_realized = Bool(True)
+
+    #--------------------------------------------------------------------------
+    # Property Getters
+    #--------------------------------------------------------------------------
+    def _get_loopback_guard(self):
+        """ The getter for the `loopback_guard` property.
+
+        """
+        guard = self.__dict__.get('_loopback_guard')
+        if guard is None:
+            guard = self._loopback_guard = LoopbackGuard()
+        return guard
 
     #--------------------------------------------------------------------------
     # Lifetime API
@@ -145,14 +177,16 @@ class Messenger(Declarative):
         snap['class'] = self.class_name()
         snap['bases'] = self.base_names()
         snap['children'] = [c.snapshot() for c in self.snap_children()]
+        snap['children_realized'] = self._children_realized
         return snap
 
     def snap_children(self):
         """ Get an iterable of children to include in the snapshot.
 
         The default implementation returns the list of children which
-        are instances of Messenger. Subclasses may reimplement this
-        method if more control is needed.
+        are instances of Messenger, or an empty list if the children
+        are not realized. Subclasses may reimplement this method if
+        more control is needed.
 
         Returns
         -------
@@ -160,6 +194,8 @@ class Messenger(Declarative):
             The list of children which are instances of Messenger.
 
         """
+        if not self._children_realized:
+            return []
         return [c for c in self.children if isinstance(c, Messenger)]
 
     def class_name(self):
@@ -251,7 +287,122 @@ class Messenger(Declarative):
         # fired, and they may still be executing their constructor. The
         # batched task allows the children to finish initializing before
         # their snapshot is taken.
-        if self.is_active:
+        #
+        # The children added to an unrealized subtree are unrealized.
+        # The children added to a realized subtree are realized by the
+        # task which sends their snapshots.
+        if not (self._realized and self._children_realized):
+            for child in set(event.new) - set(event.old):
+                if isinstance(child, Messenger):
+                    child._set_realized(False)
+        if self.is_active and self._children_realized:
             task = ChildrenChangedTask(self, event)
             self.batch_action_task('children_changed', task)
 
+
+    #--------------------------------------------------------------------------
+    # Lazy Realization API
+    #--------------------------------------------------------------------------
+    def _set_realized(self, realized):
+        """ Set the realized state of this object and its descendants.
+
+        The descendants of an object whose children are not realized
+        remain unrealized.
+
+        """
+        self._realized = realized
+        realized = realized and self._children_realized
+        for child in self.children:
+            if isinstance(child, Messenger):
+                child._set_realized(realized)
+
+    def _set_children_realized(self, realized):
+        """ Set the realized state of the children of this object.
+
+        This method only updates the state. It does not send a message
+        to the client, and is suitable for use before a snapshot.
+
+        """
+        self._children_realized = realized
+        realized = realized and self._realized
+        for child in self.children:
+            if isinstance(child, Messenger):
+                child._set_realized(realized)
+
+    def children_realized(self):
+        """ Get whether the children of this object are realized on the
+        client.
+
+        """
+        return self._children_realized
+
+    def realize_children(self):
+        """ Realize the children of this object on the client.
+
+        The snapshot of the children is sent to the client, which builds
+        them. This is a no-op if the children are already realized.
+
+        """
+        if not self._children_realized:
+            self._set_children_realized(True)
+            children = self.snap_children()
+            content = {'children': [c.snapshot() for c in children]}
+            self.send_action('realize_children', content)
+
+    def unrealize_children(self):
+        """ Unrealize the children of this object on the client.
+
+        The client destroys its objects for the children, and messages
+        for them are discarded until they are realized again. The
+        server side objects are not affected. This is a no-op if the
+        children are not realized.
+
+        """
+        if self._children_realized:
+            self._set_children_realized(False)
+            self.send_action('unrealize_children', {})
+
+    #--------------------------------------------------------------------------
+    # Messaging API
+    #--------------------------------------------------------------------------
+    def send_action(self, action, content):
+        """ A reimplemented parent class method.
+
+        The action is discarded if the object is not realized.
+
+        """
+        if self._realized:
+            super(Messenger, self).send_action(action, content)
+
+    def batch_action(self, action, content):
+        """ A reimplemented parent class method.
+
+        The action is discarded if the object is not realized.
+
+        """
+        if self._realized:
+            super(Messenger, self).batch_action(action, content)
+
+    def batch_action_task(self, action, task):
+        """ A reimplemented parent class method.
+
+        The task is discarded if the object is not realized.
+
+        """
+        if self._realized:
+            super(Messenger, self).batch_action_task(action, task)
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_realize_children(self, content):
+        """ Handle the 'realize_children' action from the client.
+
+        """
+        self.realize_children()
+
+    def on_action_unrealize_children(self, content):
+        """ Handle the 'unrealize_children' action from the client.
+
+        """
+        self.unrealize_children()
@@ -0,0 +1,229 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import re
+
+
+class NameIndex(object):
+    """ An index of the objects in a tree, keyed by object name.
+
+    A NameIndex is created by the `enable_name_index` method of Object
+    and is shared by every object in the tree. It is kept up-to-date by
+    the Object as names change and as objects are added to or removed
+    from the tree. The index provides constant time lookup of the set
+    of objects with a given name, and caches the results of matching
+    regular expressions against the names in the tree.
+
+    """
+    __slots__ = ('_names', '_regex_cache')
+
+    def __init__(self):
+        """ Initialize a NameIndex.
+
+        """
+        self._names = {}
+        self._regex_cache = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def _bfs_key(obj, root, positions):
+        """ Compute the breadth first sort key for an object.
+
+        Parameters
+        ----------
+        obj : Object
+            The object for which to compute the key.
+
+        root : Object
+            The object from which the breadth first search starts.
+
+        positions : dict
+            A cache which maps a parent to a dict of the positions of
+            its children. It is filled as needed, so that the children
+            of a parent are indexed once for all of the keys computed
+            with the same cache, rather than searched for every key.
+
+        Returns
+        -------
+        result : tuple or None
+            A tuple which sorts in the breadth first order of the tree
+            rooted at `root`, or None if the object is not in the tree.
+
+        """
+        path = []
+        while obj is not root:
+            parent = obj._parent
+            if parent is None:
+                return None
+            try:
+                index = positions[parent]
+            except KeyError:
+                children = parent._children
+                index = positions[parent] = dict(
+                    (child, i) for i, child in enumerate(children)
+                )
+            path.append(index[obj])
+            obj = parent
+        path.reverse()
+        return (len(path), path)
+
+    def _match_names(self, pattern):
+        """ Get the names in the index which match a regex pattern.
+
+        """
+        cache = self._regex_cache
+        try:
+            return cache[pattern]
+        except KeyError:
+            pass
+        match = re.compile(pattern).match
+        names = tuple(n for n in self._names if match(n))
+        cache[pattern] = names
+        return names
+
+    def _candidates(self, name, regex):
+        """ Get the set of objects which match the given name.
+
+        """
+        names = self._names
+        if not regex:
+            return names.get(name, ())
+        matched = self._match_names(name)
+        if len(matched) == 1:
+            return names[matched[0]]
+        res = set()
+        for n in matched:
+            res.update(names[n])
+        return res
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def add(self, obj):
+        """ Add an object to the index.
+
+        Parameters
+        ----------
+        obj : Object
+            The object to add to the index under its current name.
+
+        """
+        name = obj.name
+        names = self._names
+        try:
+            names[name].add(obj)
+        except KeyError:
+            names[name] = set([obj])
+            self._regex_cache.clear()
+
+    def discard(self, obj, name=None):
+        """ Remove an object from the index, if present.
+
+        Parameters
+        ----------
+        obj : Object
+            The object to remove from the index.
+
+        name : str, optional
+            The name under which the object was indexed. The default
+            uses the current name of the object.
+
+        """
+        if name is None:
+            name = obj.name
+        names = self._names
+        objs = names.get(name)
+        if objs is not None:
+            objs.discard(obj)
+            if not objs:
+                del names[name]
+                self._regex_cache.clear()
+
+    def rename(self, obj, old, new):
+        """ Update the index for an object whose name has changed.
+
+        Parameters
+        ----------
+        obj : Object
+            The object which was renamed.
+
+        old : str
+            The old name of the object.
+
+        new : str
+            The new name of the object.
+
+        """
+        self.discard(obj, old)
+        self.add(obj)
+
+    def find(self, root, name, regex=False):
+        """ Find the first object in a subtree with the given name.
+
+        Parameters
+        ----------
+        root : Object
+            The object at the top of the subtree to search.
+
+        name : str
+            The name or regex pattern of the object to find.
+
+        regex : bool, optional
+            Whether the name is a regex pattern. Defaults to False.
+
+        Returns
+        -------
+        result : Object or None
+            The first object in breadth first order with the given
+            name, or None if no such object exists.
+
+        """
+        candidates = self._candidates(name, regex)
+        if len(candidates) == 1:
+            for obj in candidates:
+                if obj is root or root in obj.traverse_ancestors():
+                    return obj
+            return None
+        best = None
+        best_key = None
+        key_func = self._bfs_key
+        positions = {}
+        for obj in candidates:
+            key = key_func(obj, root, positions)
+            if key is not None and (best_key is None or key < best_key):
+                best = obj
+                best_key = key
+        return best
+
+    def find_all(self, root, name, regex=False):
+        """ Find all objects in a subtree with the given name.
+
+        Parameters
+        ----------
+        root : Object
+            The object at the top of the subtree to search.
+
+        name : str
+            The name or regex pattern of the objects to find.
+
+        regex : bool, optional
+            Whether the name is a regex pattern. Defaults to False.
+
+        Returns
+        -------
+        result : list of Object
+            The objects with the given name in breadth first order.
+
+        """
+        keyed = []
+        key_func = self._bfs_key
+        positions = {}
+        for obj in self._candidates(name, regex):
+            key = key_func(obj, root, positions)
+            if key is not None:
+                keyed.append((key, obj))
+        keyed.sort(key=lambda item: item[0])
+        return [obj for key, obj in keyed]
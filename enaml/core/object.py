@@ -7,11 +7,12 @@ import logging
 import re
 
 from traits.api import (
-    HasStrictTraits, Disallow, Property, Str, Enum, ReadOnly, Any,
+    HasStrictTraits, Disallow, Property, Str, ReadOnly, Any,
 )
 
 from enaml.utils import make_dispatcher, id_generator
 
+from .name_index import NameIndex
 from .trait_types import EnamlEvent
 
 
@@ -38,6 +39,26 @@ ParentEvent = namedtuple('ParentEvent', 'old new')
 object_id_generator = id_generator('o_')
 
 
+#: The integer lifetime states of an Object. The state is stored as an
+#: integer for fast comparisons and is exposed as a string through the
+#: `state` property for backwards compatibility.
+(
+    INACTIVE, INITIALIZING, INITIALIZED, ACTIVATING, ACTIVE, DESTROYING,
+    DESTROYED,
+) = range(7)
+
+
+#: The string names of the integer lifetime states.
+STATE_NAMES = (
+    'inactive', 'initializing', 'initialized', 'activating', 'active',
+    'destroying', 'destroyed',
+)
+
+
+#: A mapping of the string state names to the integer states.
+STATE_VALUES = dict((name, idx) for idx, name in enumerate(STATE_NAMES))
+
+
 class ChildrenEventContext(object):
     """ A context manager which will emit a child event on an Object.
 
@@ -150,43 +171,51 @@ class Object(HasStrictTraits):
     #: value is guaranteed to be unique for the current process. The
     #: initial value may be supplied by user code if more control is
     #: required, with proper care that the value is a unique string.
+    #: Generated identifiers are interned, so that they are shared by
+    #: the dictionaries which map them to objects.
     object_id = ReadOnly
     def _object_id_default(self):
-        return object_id_generator.next()
+        return intern(object_id_generator.next())
 
     #: The current state of the object in terms of its lifetime within
-    #: a session. This value should not be manipulated by user code.
-    state = Enum(
-        'inactive', 'initializing', 'initialized', 'activating', 'active',
-        'destroying', 'destroyed',
+    #: a session. This is a string view of the integer `_state` value.
+    #: This value should not be manipulated by user code.
+    state = Property(
+        fget=lambda self: STATE_NAMES[self._state],
+        fset=lambda self, state: setattr(self, '_state', STATE_VALUES[state]),
     )
 
     #: A read-only property which is True if the object is inactive.
-    is_inactive = Property(fget=lambda self: self.state == 'inactive')
+    is_inactive = Property(fget=lambda self: self._state == INACTIVE)
 
     #: A read-only property which is True if the object is initializing.
-    is_initializing = Property(fget=lambda self: self.state == 'initializing')
+    is_initializing = Property(fget=lambda self: self._state == INITIALIZING)
 
     #: A read-only property which is True if the object is initialized.
-    is_initialized = Property(fget=lambda self: self.state == 'initialized')
+    is_initialized = Property(fget=lambda self: self._state == INITIALIZED)
 
     #: A read-only property which is True if the object is activating.
-    is_activating = Property(fget=lambda self: self.state == 'activating')
+    is_activating = Property(fget=lambda self: self._state == ACTIVATING)
 
     #: A read-only property which is True if the object is active.
-    is_active = Property(fget=lambda self: self.state == 'active')
+    is_active = Property(fget=lambda self: self._state == ACTIVE)
 
     #: A read-only property which is True if the object is destroying.
-    is_destroying = Property(fget=lambda self: self.state == 'destroying')
+    is_destroying = Property(fget=lambda self: self._state == DESTROYING)
 
     #: A read-only property which is True if the object is destroyed.
-    is_destroyed = Property(fget=lambda self: self.state == 'destroyed')
+    is_destroyed = Property(fget=lambda self: self._state == DESTROYED)
 
     #: Private storage traits. These should *never* be manipulated by
     #: user code. For performance reasons, these are not type-checked.
+    #: The `_name_index` value is only stored in the instance dict when
+    #: an index is enabled, and must be read with `__dict__.get` so that
+    #: the default value is not stored for every object.
     _parent = Any       # Object or None
     _children = Any     # tuple of Object
     _session = Any      # Session or None
+    _state = Any(0)     # int lifetime state
+    _name_index = Any   # NameIndex or None
 
     def __init__(self, parent=None, **kwargs):
         """ Initialize an Object.
@@ -223,11 +252,11 @@ class Object(HasStrictTraits):
         for messaging.
 
         """
-        self.state = 'initializing'
+        self._state = INITIALIZING
         self.pre_initialize()
         for child in self.children:
             child.initialize()
-        self.state = 'initialized'
+        self._state = INITIALIZED
         self.post_initialize()
 
     def pre_initialize(self):
@@ -262,13 +291,13 @@ class Object(HasStrictTraits):
             The session to use for messaging with this object tree.
 
         """
-        self.state = 'activating'
+        self._state = ACTIVATING
         self.pre_activate(session)
         self._session = session
         session.register(self)
         for child in self._children:
             child.activate(session)
-        self.state = 'active'
+        self._state = ACTIVE
         self.post_activate(session)
 
     def pre_activate(self, session):
@@ -312,23 +341,27 @@ class Object(HasStrictTraits):
         # being destroyed. This reduces the number of messages since
         # the automatic destruction of children is assumed.
         parent = self._parent
-        if parent is None or not parent.is_destroying:
+        if parent is None or parent._state != DESTROYING:
             self.batch_action('destroy', {})
-        self.state = 'destroying'
+        index = self.__dict__.get('_name_index')
+        if index is not None:
+            index.discard(self)
+            self._name_index = None
+        self._state = DESTROYING
         self.pre_destroy()
         if self._children:
             for child in self._children:
                 child.destroy()
             self._children = ()
         if parent is not None:
-            if parent.is_destroying:
+            if parent._state == DESTROYING:
                 self._parent = None
             else:
                 self.set_parent(None)
         session = self._session
         if session is not None:
             session.unregister(self)
-        self.state = 'destroyed'
+        self._state = DESTROYED
         self.post_destroy()
 
     def pre_destroy(self):
@@ -383,6 +416,7 @@ class Object(HasStrictTraits):
         if parent is not None and not isinstance(parent, Object):
             raise TypeError('parent must be an Object or None')
         self._parent = parent
+        self._update_name_index(parent)
         self.parent_event(ParentEvent(old_parent, parent))
         if old_parent is not None:
             old_kids = old_parent._children
@@ -398,7 +432,11 @@ class Object(HasStrictTraits):
 
         The children will be automatically parented and inserted into
         the object's children. If any children are already children of
-        this object, then they will be moved appropriately.
+        this object, then they will be moved appropriately. Children
+        which belong to other parents are removed from those parents
+        in bulk, so that each affected parent is updated once and emits
+        a single children event, regardless of the number of children
+        moved.
 
         Parameters
         ----------
@@ -426,33 +464,101 @@ class Object(HasStrictTraits):
         if not all(isinstance(child, Object) for child in insert_tup):
             raise TypeError('children must be an Object instances')
 
-        new = []
-        added = False
-        for child in self._children:
-            if child in insert_set:
-                continue
-            if child is before:
-                new.extend(insert_tup)
-                added = True
-            new.append(child)
-        if not added:
-            new.extend(insert_tup)
-
-        for child in insert_tup:
-            old_parent = child._parent
-            if old_parent is not self:
-                child._parent = self
-                child.parent_event(ParentEvent(old_parent, self))
-                if old_parent is not None:
-                    old_kids = old_parent._children
-                    idx = old_kids.index(child)
-                    old_kids = old_kids[:idx] + old_kids[idx + 1:]
-                    with old_parent.children_event_context():
-                        old_parent._children = old_kids
-
         with self.children_event_context():
+            # Reparent the children first, collecting the old parents
+            # so that each is updated with a single pass over its
+            # children, instead of once for every child moved. The
+            # children which a parent event handler inserts into this
+            # object, such as the objects of an Include, are recorded
+            # so that they can be placed directly before the child.
+            old_parents = []
+            seen = set()
+            attached = {}
+            for child in insert_tup:
+                old_parent = child._parent
+                if old_parent is not self:
+                    child._parent = self
+                    child._update_name_index(self)
+                    kids = self._children
+                    child.parent_event(ParentEvent(old_parent, self))
+                    if self._children is not kids:
+                        kids = set(kids)
+                        extra = [
+                            c for c in self._children
+                            if c not in kids and c not in insert_set
+                        ]
+                        if extra:
+                            attached[child] = extra
+                    if old_parent is not None and old_parent not in seen:
+                        seen.add(old_parent)
+                        old_parents.append(old_parent)
+
+            for old_parent in old_parents:
+                with old_parent.children_event_context():
+                    old_parent._children = tuple(
+                        c for c in old_parent._children
+                        if c._parent is old_parent
+                    )
+
+            # The new order is computed after the parent events have
+            # been emitted, since the handlers may modify the children.
+            if attached:
+                skip = set(insert_set)
+                block = []
+                for child in insert_tup:
+                    extra = attached.get(child)
+                    if extra is not None:
+                        skip.update(extra)
+                        block.extend(extra)
+                    block.append(child)
+            else:
+                skip = insert_set
+                block = insert_tup
+            new = []
+            added = False
+            for child in self._children:
+                if child in skip:
+                    continue
+                if child is before:
+                    new.extend(block)
+                    added = True
+                new.append(child)
+            if not added:
+                new.extend(block)
             self._children = tuple(new)
 
+    def remove_children(self, remove):
+        """ Remove children from this object.
+
+        The children will be unparented and removed from the object's
+        children with a single pass over the children, and a single
+        children event will be emitted. Objects which are not children
+        of this object are ignored.
+
+        Parameters
+        ----------
+        remove : iterable
+            An iterable of Object children to remove from this object.
+
+        Notes
+        -----
+        It is the responsibility of the caller to destroy the removed
+        objects as needed.
+
+        """
+        remove_set = set(remove)
+        if not remove_set:
+            return
+        with self.children_event_context():
+            for child in self._children:
+                if child in remove_set:
+                    child._parent = None
+                    child._update_name_index(None)
+                    child.parent_event(ParentEvent(self, None))
+            self._children = tuple(
+                c for c in self._children if c._parent is self
+            )
+
     def parent_event(self, event):
         """ Handle a `ParentEvent` posted to this object.
 
@@ -527,7 +633,7 @@ class Object(HasStrictTraits):
             The content data for the action.
 
         """
-        if self.is_active:
+        if self._state == ACTIVE:
             self._session.send(self.object_id, action, content)
 
     def batch_action(self, action, content):
@@ -546,7 +652,7 @@ class Object(HasStrictTraits):
             The content data for the action.
 
         """
-        if self.is_active:
+        if self._state == ACTIVE:
             self._session.batch(self.object_id, action, content)
 
     def batch_action_task(self, action, task):
@@ -566,7 +672,7 @@ class Object(HasStrictTraits):
             return the content dictionary for the action.
 
         """
-        if self.is_active:
+        if self._state == ACTIVE:
             self._session.batch_task(self.object_id, action, task)
 
     def receive_action(self, action, content):
@@ -586,7 +692,7 @@ class Object(HasStrictTraits):
             The content data for the action.
 
         """
-        if self.is_active:
+        if self._state == ACTIVE:
             dispatch_action(self, action, content)
 
     #--------------------------------------------------------------------------
@@ -650,7 +756,9 @@ class Object(HasStrictTraits):
         This method will traverse the tree of objects, breadth first,
         from this object downward, looking for an object with the given
         name. The first object with the given name is returned, or None
-        if no object is found with the given name.
+        if no object is found with the given name. If the name index
+        is enabled for the tree (see `enable_name_index`), the index
+        is used instead of traversing the tree.
 
         Parameters
         ----------
@@ -669,6 +777,9 @@ class Object(HasStrictTraits):
             object is found with the given name.
 
         """
+        index = self.__dict__.get('_name_index')
+        if index is not None:
+            return index.find(self, name, regex)
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -684,7 +795,8 @@ class Object(HasStrictTraits):
         This method will traverse the tree of objects, breadth first,
         from this object downward, looking for a objects with the given
         name. All of the objects with the given name are returned as a
-        list.
+        list. If the name index is enabled for the tree, the index is
+        used instead of traversing the tree.
 
         Parameters
         ----------
@@ -703,6 +815,9 @@ class Object(HasStrictTraits):
             list if no objects are found with the given name.
 
         """
+        index = self.__dict__.get('_name_index')
+        if index is not None:
+            return index.find_all(self, name, regex)
         if regex:
             rgx = re.compile(name)
             match = lambda n: bool(rgx.match(n))
@@ -715,6 +830,57 @@ class Object(HasStrictTraits):
                 push(obj)
         return res
 
+    def enable_name_index(self):
+        """ Enable the name index for the tree to which this object
+        belongs.
+
+        Once enabled, the index is maintained automatically as objects
+        are renamed, added to, or removed from the tree, and is used by
+        the `find` and `find_all` methods of every object in the tree.
+        Calling this method when the index is already enabled is a
+        no-op. An object which is removed from the tree no longer uses
+        the index.
+
+        """
+        root = self.root_object()
+        if root.__dict__.get('_name_index') is None:
+            index = NameIndex()
+            for obj in root.traverse():
+                index.add(obj)
+                obj._name_index = index
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _update_name_index(self, parent):
+        """ Update the name index for the subtree after a parent change.
+
+        This should be called whenever the parent of the object changes.
+        The subtree is moved from the current name index to the index
+        of the new parent, if they differ.
+
+        """
+        old = self.__dict__.get('_name_index')
+        if parent is not None:
+            new = parent.__dict__.get('_name_index')
+        else:
+            new = None
+        if old is not new:
+            for obj in self.traverse():
+                if old is not None:
+                    old.discard(obj)
+                if new is not None:
+                    new.add(obj)
+                obj._name_index = new
+
+    def _name_changed(self, old, new):
+        """ A change handler for the `name` attribute.
+
+        """
+        index = self.__dict__.get('_name_index')
+        if index is not None:
+            index.rename(self, old, new)
+
     #--------------------------------------------------------------------------
     # HasTraits Fixes
     #--------------------------------------------------------------------------
@@ -0,0 +1,156 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from enaml.application import Application
+from enaml.local_socket import local_socket_pair
+from enaml.server.event_loop import EventLoop
+
+from .headless_session import HeadlessSession
+
+
+class HeadlessApplication(Application):
+    """ An Enaml application which runs its sessions against headless
+    clients.
+
+    A HeadlessApplication requires no display or toolkit. Every session
+    is paired with a HeadlessSession which consumes the snapshot and
+    the action stream of the session. The event loop is driven on
+    demand with `process_events`, which makes the application suitable
+    for tests and benchmarks of server side code.
+
+    """
+    def __init__(self, factories, synchronous=False):
+        """ Initialize a HeadlessApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor.
+
+        synchronous : bool, optional
+            Whether the in-process sockets deliver messages immediately
+            rather than on the next cycle of the event loop. The default
+            is False.
+
+        """
+        super(HeadlessApplication, self).__init__(factories)
+        self._synchronous = synchronous
+        self._loop = EventLoop()
+        self._sessions = {}
+        self._client_sessions = {}
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start_session(self, name):
+        """ Start a new session of the given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        Returns
+        -------
+        result : str
+            The unique identifier for the created session.
+
+        """
+        session = self._open_session(name)
+        session_id = session.session_id
+        self._sessions[session_id] = session
+
+        client = HeadlessSession(session_id, session.widget_groups[:])
+        self._client_sessions[session_id] = client
+        client.open(session.snapshot())
+
+        server_socket, client_socket = local_socket_pair(self._synchronous)
+        session.activate(server_socket)
+        client.activate(client_socket)
+
+        return session_id
+
+    def end_session(self, session_id):
+        """ End the session with the given session id.
+
+        """
+        if session_id not in self._sessions:
+            raise ValueError('Invalid session id')
+        self._sessions.pop(session_id).close()
+        del self._client_sessions[session_id]
+
+    def session(self, session_id):
+        """ Get the session for the given session id.
+
+        """
+        return self._sessions.get(session_id)
+
+    def sessions(self):
+        """ Get the currently active sessions for the application.
+
+        """
+        return self._sessions.values()
+
+    def start(self):
+        """ Run the event loop until `stop` is called.
+
+        """
+        self._loop.run()
+
+    def stop(self):
+        """ Stop the application's event loop.
+
+        """
+        self._loop.stop()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the event loop.
+
+        """
+        self._loop.call_soon(callback, *args, **kwargs)
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the event loop after a delay.
+
+        """
+        self._loop.call_later(ms / 1000.0, callback, *args, **kwargs)
+
+    def is_main_thread(self):
+        """ Indicates whether the caller is on the event loop thread.
+
+        """
+        return self._loop.is_loop_thread()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def client_session(self, session_id):
+        """ Get the headless client of the session with the given id.
+
+        Returns
+        -------
+        result : HeadlessSession or None
+            The client session, or None if the id is not valid.
+
+        """
+        return self._client_sessions.get(session_id)
+
+    def process_events(self):
+        """ Run the event loop until no callbacks are ready.
+
+        Timed calls which have not yet expired are not waited for.
+
+        """
+        loop = self._loop
+        loop.run_once(0)
+        while loop.has_ready():
+            loop.run_once(0)
+
+    def destroy(self):
+        """ Destroy the application and close its event loop.
+
+        """
+        super(HeadlessApplication, self).destroy()
+        self._loop.close()
@@ -0,0 +1,255 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import logging
+
+from enaml.utils import make_dispatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for action dispatching.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+class HeadlessObject(object):
+    """ A client object which mirrors the state of a server object
+    without creating a toolkit widget.
+
+    A HeadlessObject is built for every object in a snapshot. It keeps
+    the attributes of its snapshot as a state dict, which is updated by
+    the 'set_*' actions sent by the server object. The object follows
+    the build and messaging surface of QtObject so that the server
+    sees the same protocol as it would with a real toolkit client.
+
+    """
+    @classmethod
+    def construct(cls, tree, parent, session):
+        """ Construct the HeadlessObject for the given snapshot tree.
+
+        Parameters
+        ----------
+        tree : dict
+            An Enaml snapshot dict for the object. The children of the
+            tree are built by the session.
+
+        parent : HeadlessObject or None
+            The parent of the object, or None if it is top-level.
+
+        session : HeadlessSession
+            The session which owns the object.
+
+        Returns
+        -------
+        result : HeadlessObject
+            The new object, registered with the session.
+
+        """
+        self = cls(tree['object_id'], parent, session)
+        self.create(tree)
+        session.register(self)
+        return self
+
+    def __init__(self, object_id, parent, session):
+        """ Initialize a HeadlessObject.
+
+        Parameters
+        ----------
+        object_id : str
+            The unique identifier of the object.
+
+        parent : HeadlessObject or None
+            The parent of the object, or None if it has no parent.
+
+        session : HeadlessSession
+            The session which owns the object.
+
+        """
+        self._object_id = object_id
+        self._session = session
+        self._parent = None
+        self._children = []
+        self._initialized = False
+        self.class_name = ''
+        self.name = ''
+        self.state = {}
+        self.received = 0
+        self.set_parent(parent)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def object_id(self):
+        """ Get the object id of the object.
+
+        """
+        return self._object_id
+
+    def create(self, tree):
+        """ Initialize the state of the object from its snapshot.
+
+        """
+        self.class_name = tree['class']
+        self.name = tree.get('name', '')
+        state = self.state
+        for key, value in tree.iteritems():
+            if key != 'children':
+                state[key] = value
+
+    def initialize(self):
+        """ Mark the object and its children as initialized.
+
+        """
+        for child in self._children:
+            child.initialize()
+        self._initialized = True
+
+    def activate(self):
+        """ Activate the object and its children.
+
+        """
+        for child in self._children:
+            child.activate()
+
+    def destroy(self):
+        """ Destroy the object and its children.
+
+        """
+        for child in self._children[:]:
+            child.destroy()
+        self._children = []
+        self._initialized = False
+        parent = self._parent
+        if parent is not None:
+            if self in parent._children:
+                parent._children.remove(self)
+            self._parent = None
+        self._session.unregister(self)
+        self._session = None
+
+    def parent(self):
+        """ Get the parent of the object.
+
+        """
+        return self._parent
+
+    def children(self):
+        """ Get the list of children of the object.
+
+        """
+        return self._children
+
+    def set_parent(self, parent):
+        """ Set the parent of the object.
+
+        """
+        curr = self._parent
+        if curr is parent or parent is self:
+            return
+        self._parent = parent
+        if curr is not None and self in curr._children:
+            curr._children.remove(self)
+        if parent is not None:
+            parent._children.append(self)
+
+    def find(self, name):
+        """ Find the first object with the given name in this subtree.
+
+        Parameters
+        ----------
+        name : str
+            The name of the object to find.
+
+        Returns
+        -------
+        result : HeadlessObject or None
+            The first matching object in depth first order, or None.
+
+        """
+        if self.name == name:
+            return self
+        for child in self._children:
+            found = child.find(name)
+            if found is not None:
+                return found
+
+    #--------------------------------------------------------------------------
+    # Messaging API
+    #--------------------------------------------------------------------------
+    def send_action(self, action, content):
+        """ Send an action to the server side object.
+
+        The action is only sent if the object is initialized.
+
+        """
+        if self._initialized:
+            self._session.send(self._object_id, action, content)
+
+    def receive_action(self, action, content):
+        """ Receive an action from the server side object.
+
+        Actions with a handler method are dispatched to it. The value
+        of a 'set_*' action with a single content item is stored in the
+        state dict. Other actions are counted and ignored.
+
+        """
+        self.received += 1
+        if hasattr(self, 'on_action_' + action):
+            dispatch_action(self, action, content)
+        elif action.startswith('set_') and len(content) == 1:
+            self.state.update(content)
+
+    #--------------------------------------------------------------------------
+    # Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_children_changed(self, content):
+        """ Handle the 'children_changed' action from the Enaml object.
+
+        """
+        lookup = self._session.lookup
+        for object_id in content['removed']:
+            child = lookup(object_id)
+            if child is not None and child._parent is self:
+                child.set_parent(None)
+        for tree in content['added']:
+            child = lookup(tree['object_id'])
+            if child is not None:
+                child.set_parent(self)
+            else:
+                child = self._session.build(tree, self)
+                child.initialize()
+        ordered = []
+        curr_set = set(self._children)
+        for object_id in content['order']:
+            child = lookup(object_id)
+            if child is not None and child._parent is self:
+                ordered.append(child)
+                curr_set.discard(child)
+        ordered.extend(curr_set)
+        self._children = ordered
+
+    def on_action_destroy(self, content):
+        """ Handle the 'destroy' action from the Enaml object.
+
+        """
+        self.destroy()
+
+    def on_action_realize_children(self, content):
+        """ Handle the 'realize_children' action from the Enaml object.
+
+        """
+        self.state['children_realized'] = True
+        for tree in content['children']:
+            child = self._session.build(tree, self)
+            child.initialize()
+            child.activate()
+
+    def on_action_unrealize_children(self, content):
+        """ Handle the 'unrealize_children' action from the Enaml object.
+
+        """
+        self.state['children_realized'] = False
+        for child in self._children[:]:
+            child.destroy()
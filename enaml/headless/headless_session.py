@@ -0,0 +1,269 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from itertools import count
+import logging
+
+from enaml.utils import make_dispatcher
+
+from .headless_object import HeadlessObject
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for action dispatching.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+class HeadlessSession(object):
+    """ An object which manages a session of headless client objects.
+
+    A HeadlessSession consumes the snapshot and action stream of an
+    Enaml session the same way as a QtSession, but builds a tree of
+    HeadlessObjects instead of toolkit widgets. It can be activated
+    with any action socket, so it can be attached to a session in the
+    same process or to a session served by a ServerApplication.
+
+    """
+    def __init__(self, session_id, widget_groups):
+        """ Initialize a HeadlessSession.
+
+        Parameters
+        ----------
+        session_id : str
+            The string identifier for this session.
+
+        widget_groups : list of str
+            The list of string widget groups for this session. They
+            are unused, since every object is built headless.
+
+        """
+        self._session_id = session_id
+        self._widget_groups = widget_groups
+        self._registered_objects = {}
+        self._windows = []
+        self._socket = None
+        self._req_counter = count()
+        self._message_listener = None
+        self.url_replies = {}
+        self.closed = False
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def session_id(self):
+        """ Get the identifier of the session.
+
+        """
+        return self._session_id
+
+    def windows(self):
+        """ Get the list of top-level objects of the session.
+
+        """
+        return self._windows
+
+    def open(self, snapshot):
+        """ Open the session using the given snapshot.
+
+        Parameters
+        ----------
+        snapshot : list of dicts
+            The list of tree snapshots to build for this session.
+
+        """
+        for tree in snapshot:
+            window = self.build(tree, None)
+            self._windows.append(window)
+            window.initialize()
+
+    def activate(self, socket):
+        """ Active the session and its windows.
+
+        Parameters
+        ----------
+        socket : ActionSocketInterface
+            The socket interface to use for messaging with the server
+            side Enaml objects.
+
+        """
+        self._socket = socket
+        socket.on_message(self.on_message)
+        for window in self._windows:
+            window.activate()
+
+    def build(self, tree, parent):
+        """ Build and return a new object using the given tree dict.
+
+        Parameters
+        ----------
+        tree : dict
+            The dictionary snapshot representation of the tree of
+            items to build.
+
+        parent : HeadlessObject or None
+            The parent for the tree, or None if the tree is top-level.
+
+        Returns
+        -------
+        result : HeadlessObject
+            The object representation of the root of the tree.
+
+        """
+        obj = HeadlessObject.construct(tree, parent, self)
+        for child in tree['children']:
+            self.build(child, obj)
+        return obj
+
+    def register(self, obj):
+        """ Register an object with the session.
+
+        """
+        self._registered_objects[obj.object_id()] = obj
+
+    def unregister(self, obj):
+        """ Unregister an object from the session.
+
+        """
+        self._registered_objects.pop(obj.object_id(), None)
+
+    def lookup(self, object_id):
+        """ Lookup a registered object with the given object id.
+
+        """
+        return self._registered_objects.get(object_id)
+
+    def find(self, name):
+        """ Find the first object with the given name in the session.
+
+        Parameters
+        ----------
+        name : str
+            The name of the object to find.
+
+        Returns
+        -------
+        result : HeadlessObject or None
+            The first matching object of the windows of the session.
+
+        """
+        for window in self._windows:
+            found = window.find(name)
+            if found is not None:
+                return found
+
+    def object_count(self):
+        """ Get the number of registered objects in the session.
+
+        """
+        return len(self._registered_objects)
+
+    def load_resource(self, url, metadata=None):
+        """ Request the resource pointed to by the given url.
+
+        The reply is stored in the `url_replies` dict by request id.
+
+        Returns
+        -------
+        result : str
+            The identifier of the request.
+
+        """
+        req_id = 'r_%d' % self._req_counter.next()
+        content = {'id': req_id, 'url': url, 'metadata': metadata or {}}
+        self.send(self._session_id, 'url_request', content)
+        return req_id
+
+    def set_message_listener(self, listener):
+        """ Set a callable to be notified of every received message.
+
+        Parameters
+        ----------
+        listener : callable or None
+            A callable which accepts the object id, action and content
+            of every message received by the session. It is invoked
+            before the message is handled.
+
+        """
+        self._message_listener = listener
+
+    #--------------------------------------------------------------------------
+    # Messaging API
+    #--------------------------------------------------------------------------
+    def send(self, object_id, action, content):
+        """ Send a message to a server object.
+
+        """
+        socket = self._socket
+        if socket is not None:
+            socket.send(object_id, action, content)
+
+    def on_message(self, object_id, action, content):
+        """ Receive a message sent to an object owned by this session.
+
+        """
+        listener = self._message_listener
+        if listener is not None:
+            listener(object_id, action, content)
+        if object_id == self._session_id:
+            dispatch_action(self, action, content)
+        else:
+            obj = self._registered_objects.get(object_id)
+            if obj is None:
+                msg = "Invalid object id sent to HeadlessSession: %s:%s"
+                logger.warn(msg % (object_id, action))
+                return
+            obj.receive_action(action, content)
+
+    #--------------------------------------------------------------------------
+    # Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_add_window(self, content):
+        """ Handle the 'add_window' action from the Enaml session.
+
+        """
+        window = self.build(content['window'], None)
+        self._windows.append(window)
+        window.initialize()
+        window.activate()
+
+    def on_action_url_reply(self, content):
+        """ Handle the 'url_reply' action from the Enaml session.
+
+        """
+        self.url_replies[content['id']] = content
+
+    def on_action_message_batch(self, content):
+        """ Handle the 'message_batch' action sent by the Enaml session.
+
+        The actions are processed in the same order as a QtSession:
+        'children_changed' -> 'destroy' -> other. Messages for objects
+        destroyed by the batch are dropped.
+
+        """
+        children = []
+        destroys = []
+        others = []
+        groups = {'children_changed': children, 'destroy': destroys}
+        for item in content['batch']:
+            groups.get(item[1], others).append(item)
+        objects = self._registered_objects
+        for item in children + destroys + others:
+            obj = objects.get(item[0])
+            if obj is not None:
+                obj.receive_action(item[1], item[2])
+
+    def on_action_close(self, content):
+        """ Handle the 'close' action sent by the Enaml session.
+
+        """
+        for window in self._windows:
+            window.destroy()
+        self._windows = []
+        self._registered_objects = {}
+        if self._socket is not None:
+            self._socket.on_message(None)
+            self._socket = None
+        self.closed = True
@@ -0,0 +1,180 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import time
+
+
+def percentile(values, p):
+    """ Compute a percentile of a list of values.
+
+    Parameters
+    ----------
+    values : list
+        The values. They need not be sorted.
+
+    p : float
+        The percentile to compute, between 0 and 100.
+
+    Returns
+    -------
+    result : float
+        The nearest rank percentile of the values, or 0.0 if there are
+        no values.
+
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = int(round(p / 100.0 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+class LoadTestResult(object):
+    """ The measurements of a run of a LoadTest.
+
+    """
+    def __init__(self, sessions, startup, latencies, elapsed):
+        """ Initialize a LoadTestResult.
+
+        Parameters
+        ----------
+        sessions : int
+            The number of sessions driven by the test.
+
+        startup : list
+            The time in seconds taken to start each session, including
+            the processing of the messages sent during activation.
+
+        latencies : list
+            The time in seconds taken to run each script step, including
+            the processing of all of the messages it caused.
+
+        elapsed : float
+            The total time in seconds taken to run the script steps.
+
+        """
+        self.sessions = sessions
+        self.startup = startup
+        self.latencies = latencies
+        self.elapsed = elapsed
+
+    def throughput(self):
+        """ Get the number of script steps run per second.
+
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.latencies) / self.elapsed
+
+    def latency(self, p):
+        """ Get a percentile of the step latencies in seconds.
+
+        """
+        return percentile(self.latencies, p)
+
+    def report(self):
+        """ Get a human readable report of the results.
+
+        Returns
+        -------
+        result : str
+            A multi-line summary of the throughput and latencies.
+
+        """
+        ms = 1000.0
+        lines = [
+            'sessions:   %d' % self.sessions,
+            'steps:      %d' % len(self.latencies),
+            'throughput: %.1f steps/s' % self.throughput(),
+            'startup:    p50 %.2f ms, p95 %.2f ms, max %.2f ms' % (
+                percentile(self.startup, 50) * ms,
+                percentile(self.startup, 95) * ms,
+                max(self.startup or [0.0]) * ms,
+            ),
+            'latency:    p50 %.2f ms, p95 %.2f ms, p99 %.2f ms' % (
+                self.latency(50) * ms,
+                self.latency(95) * ms,
+                self.latency(99) * ms,
+            ),
+        ]
+        return '\n'.join(lines)
+
+
+class LoadTest(object):
+    """ A harness which drives many sessions of a HeadlessApplication
+    with a scripted sequence of client actions.
+
+    Each iteration runs one step of the script on every session in
+    turn. The latency of a step is the time taken to run it and to
+    process all of the messages it causes between the server and the
+    headless client.
+
+    """
+    def __init__(self, app, name, script, sessions=10, iterations=100):
+        """ Initialize a LoadTest.
+
+        Parameters
+        ----------
+        app : HeadlessApplication
+            The application which hosts the sessions.
+
+        name : str
+            The name of the session to start.
+
+        script : callable
+            A callable which accepts the HeadlessSession of a client and
+            the iteration number, and sends the client actions of one
+            step, for example with `HeadlessObject.send_action`.
+
+        sessions : int, optional
+            The number of sessions to start. The default is 10.
+
+        iterations : int, optional
+            The number of script steps to run on every session. The
+            default is 100.
+
+        """
+        self.app = app
+        self.name = name
+        self.script = script
+        self.sessions = sessions
+        self.iterations = iterations
+
+    def run(self):
+        """ Run the load test.
+
+        The sessions are started, driven by the script, and ended.
+
+        Returns
+        -------
+        result : LoadTestResult
+            The measurements of the run.
+
+        """
+        app = self.app
+        timer = time.time
+        startup = []
+        session_ids = []
+        for idx in xrange(self.sessions):
+            t0 = timer()
+            session_ids.append(app.start_session(self.name))
+            app.process_events()
+            startup.append(timer() - t0)
+        clients = [app.client_session(sid) for sid in session_ids]
+
+        script = self.script
+        latencies = []
+        start = timer()
+        for iteration in xrange(self.iterations):
+            for client in clients:
+                t0 = timer()
+                script(client, iteration)
+                app.process_events()
+                latencies.append(timer() - t0)
+        elapsed = timer() - start
+
+        for session_id in session_ids:
+            app.end_session(session_id)
+        app.process_events()
+        return LoadTestResult(self.sessions, startup, latencies, elapsed)
@@ -0,0 +1,170 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Utilities for patching the content of an element of an html source.
+
+A patch inserts an html fragment into the element with a given id. The
+'append' mode inserts the fragment at the end of the content of the
+element, the 'prepend' mode at the start, and the 'replace' mode
+replaces the content. An empty element id refers to the body of the
+document, or to the whole source if it has no body.
+
+The source is scanned for tags rather than parsed, which is sufficient
+to locate an element in the well-formed html which an application
+generates. The content of comments is skipped.
+
+"""
+import re
+
+
+#: The modes supported by a patch.
+PATCH_MODES = ('append', 'prepend', 'replace')
+
+
+#: The elements which never have content.
+_VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+))
+
+
+#: A regex which matches a comment or a start or end tag. The groups
+#: are the end tag marker, the tag name and the attributes.
+_TAG_RE = re.compile(
+    r'<!--.*?-->|<(/?)([A-Za-z][\w:.-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>',
+    re.DOTALL,
+)
+
+
+#: A regex which matches the id attribute in the attributes of a tag.
+_ID_RE = re.compile(
+    r'''(?:^|\s)id\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''',
+    re.IGNORECASE,
+)
+
+
+#: A regex which matches the start tag of the body.
+_BODY_RE = re.compile(r'<body\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.I)
+
+
+def _tag_id(attrs):
+    """ Get the id in the attributes of a tag, or None.
+
+    """
+    match = _ID_RE.search(attrs)
+    if match is not None:
+        value = match.group(1)
+        if value is None:
+            value = match.group(2)
+        if value is None:
+            value = match.group(3)
+        return value
+
+
+def _body_range(source):
+    """ Get the range of the content of the body of a source.
+
+    """
+    match = _BODY_RE.search(source)
+    if match is None:
+        return (0, len(source))
+    start = match.end()
+    end = max(source.rfind('</body'), source.rfind('</BODY'))
+    if end < start:
+        end = len(source)
+    return (start, end)
+
+
+def element_range(source, element_id):
+    """ Get the range of the content of an element of an html source.
+
+    Parameters
+    ----------
+    source : basestring
+        The html source.
+
+    element_id : basestring
+        The id of the element, or an empty string for the body.
+
+    Returns
+    -------
+    result : tuple
+        The (start, end) indices of the content of the element. If the
+        end tag of the element is omitted, the content extends to the
+        end of the source.
+
+    Raises
+    ------
+    ValueError
+        The source has no element with the given id which can have
+        content.
+
+    """
+    if not element_id:
+        return _body_range(source)
+    tags = _TAG_RE.finditer(source)
+    name = None
+    for match in tags:
+        if match.group(2) is None or match.group(1):
+            continue
+        if _tag_id(match.group(3)) == element_id:
+            name = match.group(2).lower()
+            attrs = match.group(3)
+            if name in _VOID_ELEMENTS or attrs.rstrip().endswith('/'):
+                msg = "the element '%s' cannot have content"
+                raise ValueError(msg % element_id)
+            start = match.end()
+            break
+    if name is None:
+        raise ValueError("no element with the id '%s'" % element_id)
+    depth = 1
+    for match in tags:
+        if match.group(2) is None or match.group(2).lower() != name:
+            continue
+        if match.group(1):
+            depth -= 1
+            if depth == 0:
+                return (start, match.start())
+        elif not match.group(3).rstrip().endswith('/'):
+            depth += 1
+    return (start, len(source))
+
+
+def patch_html(source, element_id, html, mode='append'):
+    """ Insert an html fragment into an element of an html source.
+
+    Parameters
+    ----------
+    source : basestring
+        The html source to patch.
+
+    element_id : basestring
+        The id of the element, or an empty string for the body.
+
+    html : basestring
+        The html fragment to insert.
+
+    mode : str, optional
+        One of 'append', 'prepend' or 'replace'. The default is
+        'append'.
+
+    Returns
+    -------
+    result : basestring
+        The patched html source.
+
+    Raises
+    ------
+    ValueError
+        The mode is not supported, or the element cannot be found.
+
+    """
+    if mode not in PATCH_MODES:
+        raise ValueError("invalid patch mode '%s'" % mode)
+    start, end = element_range(source, element_id)
+    if mode == 'append':
+        return source[:end] + html + source[end:]
+    if mode == 'prepend':
+        return source[:start] + html + source[start:]
+    return source[:start] + html + source[end:]
@@ -0,0 +1,306 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from cStringIO import StringIO
+import logging
+from threading import Lock
+
+from .image_provider import Image
+from .lru_cache import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The default budget of an image cache, in bytes.
+DEFAULT_CACHE_BYTES = 128 * 1024 * 1024
+
+
+#: The natural size of an image, as requested by a client.
+NATURAL_SIZE = (-1, -1)
+
+
+def image_size(image):
+    """ Get the size of the data held by an Image, in bytes.
+
+    """
+    data = image.data
+    nbytes = getattr(data, 'nbytes', None)
+    if nbytes is not None:
+        return nbytes
+    return len(data)
+
+
+def resample_image(image, size):
+    """ Resample an image to a new size.
+
+    Array images are resampled with nearest neighbor sampling, which
+    requires numpy. Encoded images are resampled with antialiasing and
+    encoded as png, which requires PIL. If the required library is not
+    available, the image is not resampled.
+
+    Parameters
+    ----------
+    image : Image
+        The image to resample.
+
+    size : tuple
+        The (width, height) size of the resampled image. Both values
+        must be positive.
+
+    Returns
+    -------
+    result : Image or None
+        The resampled image, or None if the image could not be
+        resampled.
+
+    """
+    width, height = size
+    if width <= 0 or height <= 0:
+        return None
+    if image.format == 'array':
+        try:
+            import numpy
+        except ImportError:
+            return None
+        data = image.data
+        rows = numpy.arange(height) * data.shape[0] // height
+        cols = numpy.arange(width) * data.shape[1] // width
+        resampled = data[rows][:, cols]
+        return Image(format='array', data=resampled)
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return None
+    try:
+        source = PILImage.open(StringIO(image.data))
+        resampled = source.resize((width, height), PILImage.ANTIALIAS)
+        output = StringIO()
+        resampled.save(output, 'png')
+    except Exception:
+        msg = 'failed to resample image to size %s'
+        logger.exception(msg % (size,))
+        return None
+    return Image(format='png', size=(width, height), data=output.getvalue())
+
+
+class ImageCache(object):
+    """ A cache of the images loaded from image providers.
+
+    The images are keyed by the `cache_key` of their provider, their
+    path and the requested size, so the cache does not hold on to the
+    providers of closed sessions, and the images of providers with the
+    same key are shared by every session. When
+    an image is requested at a size which is not cached, but the image
+    is cached at its natural size, the cache can derive the requested
+    size by resampling the natural image rather than loading it again.
+    The resampling is done on worker threads, see `request_resampled`.
+    The cache is bounded by the memory used by the image data.
+
+    An `Application` provides an image cache which is shared by the
+    resource managers of all of its sessions. All methods of the cache
+    are thread-safe.
+
+    """
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES, resampler=None):
+        """ Initialize an ImageCache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            The maximum combined size, in bytes, of the image data
+            held by the cache.
+
+        resampler : callable, optional
+            A callable with the signature of `resample_image` which is
+            used to derive the images at a requested size. The default
+            is `resample_image`.
+
+        """
+        self._cache = LRUCache(max_bytes, image_size)
+        self._resampler = resampler or resample_image
+        self._lock = Lock()
+        self._worker = None
+
+    def _natural_image(self, source):
+        """ Get the cached natural image for a (key, path) source.
+
+        This is the source callable of the resample worker.
+
+        """
+        key, path = source
+        with self._lock:
+            return self._cache.get((key, path, NATURAL_SIZE))
+
+    def get(self, key, path, size):
+        """ Get an image from the cache.
+
+        Parameters
+        ----------
+        key : object
+            The cache key of the provider of the image.
+
+        path : str
+            The path of the image within the provider.
+
+        size : tuple
+            The requested (width, height) size of the image.
+
+        Returns
+        -------
+        result : Image or None
+            The cached image, or None if the image is not cached at the
+            requested size.
+
+        """
+        with self._lock:
+            return self._cache.get((key, path, tuple(size)))
+
+    def request_resampled(self, key, path, size, callback,
+                          priority=0):
+        """ Request an image resampled from the cached natural image.
+
+        The image is resampled on a worker thread, and the callback is
+        invoked on the main thread. The resampled image is not added to
+        the cache; wrap the callback in a `CachingReply` to do so. This
+        method must be called from the main thread.
+
+        Parameters
+        ----------
+        key : object
+            The cache key of the provider of the image.
+
+        path : str
+            The path of the image within the provider.
+
+        size : tuple
+            The requested (width, height) size of the image.
+
+        callback : callable
+            A callable which is invoked with the resampled `Image`, or
+            None if the image could not be resampled.
+
+        priority : int, optional
+            The queue priority for the request. The default is zero.
+
+        Returns
+        -------
+        result : ImageRequest or None
+            A request object which can be used to cancel the request,
+            or None if the natural image is not cached, in which case
+            the callback is never invoked.
+
+        """
+        size = tuple(size)
+        if size == NATURAL_SIZE:
+            return None
+        source = (key, path)
+        if self._natural_image(source) is None:
+            return None
+        worker = self._worker
+        if worker is None:
+            # Imported here since the provider module depends on the
+            # application module, which depends on this module.
+            from .async_image_provider import ResampleProvider
+            worker = ResampleProvider(self._natural_image, self._resampler)
+            self._worker = worker
+        return worker.request_image(source, size, callback, priority)
+
+    def put(self, key, path, size, image):
+        """ Add an image to the cache.
+
+        Parameters
+        ----------
+        key : object
+            The cache key of the provider of the image.
+
+        path : str
+            The path of the image within the provider.
+
+        size : tuple
+            The requested (width, height) size of the image.
+
+        image : Image
+            The image loaded by the provider for the request.
+
+        """
+        with self._lock:
+            self._cache.put((key, path, tuple(size)), image)
+
+    def clear(self):
+        """ Remove all images from the cache.
+
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self):
+        """ Stop the worker threads which resample images.
+
+        Pending resample requests are abandoned. The cache can still be
+        used, and the workers are restarted on demand.
+
+        """
+        worker = self._worker
+        if worker is not None:
+            self._worker = None
+            worker.shutdown()
+
+    def stats(self):
+        """ Get the usage statistics for the cache.
+
+        Returns
+        -------
+        result : dict
+            The statistics dictionary described by `LRUCache.stats`.
+
+        """
+        with self._lock:
+            return self._cache.stats()
+
+
+class CachingReply(object):
+    """ A url reply wrapper which caches a loaded image.
+
+    """
+    def __init__(self, cache, key, path, size, reply):
+        """ Initialize a CachingReply.
+
+        Parameters
+        ----------
+        cache : ImageCache
+            The cache in which to store the loaded image.
+
+        key : object
+            The cache key of the provider from which the image is
+            loaded.
+
+        path : str
+            The path of the image within the provider.
+
+        size : tuple
+            The requested (width, height) size of the image.
+
+        reply : callable
+            The reply to invoke with the loaded image.
+
+        """
+        self._cache = cache
+        self._key = key
+        self._path = path
+        self._size = size
+        self._reply = reply
+
+    def __call__(self, image):
+        """ Cache the loaded image and forward it to the reply.
+
+        Parameters
+        ----------
+        image : Image or None
+            The loaded image, or None if the image failed to load.
+
+        """
+        if image is not None and not image.preview:
+            self._cache.put(self._key, self._path, self._size, image)
+        self._reply(image)
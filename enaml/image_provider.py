@@ -4,11 +4,54 @@
 #------------------------------------------------------------------------------
 from abc import ABCMeta, abstractmethod
 
-from traits.api import Enum, Str, Tuple, Int
+from traits.api import Any, Bool, Enum, Tuple, Int
 
 from .resource import Resource
 
 
+def array_image_data(array):
+    """ Validate the layout of a numpy array for use as image data.
+
+    The array must have a uint8 dtype and a shape of (height, width)
+    for grayscale, or (height, width, channels) where channels is 1 for
+    grayscale, 3 for RGB, or 4 for RGBA. The pixels of each row must be
+    packed and the buffer must be 32-bit aligned, but the rows may be
+    strided, so that views which crop a larger image can be used without
+    copying. Arrays with any other layout are copied into a contiguous
+    array.
+
+    Parameters
+    ----------
+    array : ndarray
+        The array of image data.
+
+    Returns
+    -------
+    result : ndarray
+        The array, or a contiguous copy of the array if its memory
+        layout cannot be used directly by a toolkit image.
+
+    """
+    shape = array.shape
+    ndim = len(shape)
+    if ndim == 2:
+        channels = 1
+    elif ndim == 3:
+        channels = shape[2]
+    else:
+        channels = 0
+    if str(array.dtype) != 'uint8' or channels not in (1, 3, 4):
+        msg = 'array image must be a uint8 array of shape (h, w), '
+        msg += '(h, w, 1), (h, w, 3), or (h, w, 4), not %s %s'
+        raise ValueError(msg % (array.dtype, shape))
+    strides = array.strides
+    packed = strides[1] == channels and (ndim == 2 or strides[2] == 1)
+    aligned = strides[0] > 0 and array.ctypes.data % 4 == 0
+    if not (packed and aligned):
+        array = array.copy()
+    return array
+
+
 class Image(Resource):
     """ A resource object representing an image.
 
@@ -31,16 +74,26 @@ class Image(Resource):
         'pgm',      # Portable Graymap
         'ppm',      # Portable Pixmap
         'tiff',     # Tagged Image File Format
-        # 'array',    # A numpy array with an appropriate image dtype.
+        'array',    # A numpy array with an appropriate image dtype.
     )
 
     #: The (width, height) size of the image. An invalid size indicates
-    #: that the size of the image should be automatically inferred.
+    #: that the size of the image should be automatically inferred. The
+    #: size of an 'array' image is always taken from the array.
     size = Tuple(Int(-1), Int(-1))
 
-    # XXX this needs to be augmented to support arrays.
-    #: The bytestring holding the data for the image.
-    data = Str
+    #: The data for the image. This is a bytestring of encoded image
+    #: data, or a numpy array for the 'array' format. The supported
+    #: arrays are described by `array_image_data`. An array is sent to
+    #: the client by reference when the client is in-process, and as a
+    #: raw buffer otherwise, so it should not be modified once the
+    #: image is created.
+    data = Any('')
+
+    #: Whether the image is a preview, such as a low resolution version
+    #: of the requested image, which will be followed by another image
+    #: for the same request. Previews are not cached.
+    preview = Bool(False)
 
     def snapshot(self):
         """ Get a snapshot dictionary for this image.
@@ -48,8 +101,15 @@ class Image(Resource):
         """
         snap = super(Image, self).snapshot()
         snap['format'] = self.format
-        snap['size'] = self.size
-        snap['data'] = self.data
+        data = self.data
+        if self.format == 'array':
+            data = array_image_data(data)
+            shape = data.shape
+            snap['size'] = (shape[1], shape[0])
+            snap['channels'] = shape[2] if len(shape) == 3 else 1
+        else:
+            snap['size'] = self.size
+        snap['data'] = data
         return snap
 
 
@@ -59,6 +119,14 @@ class ImageProvider(object):
     """
     __metaclass__ = ABCMeta
 
+    #: A hashable key under which the images of the provider are held
+    #: in the image cache of the application. A provider which yields
+    #: the same image for a path in every session should set a stable
+    #: key, such as its name, so that its images are shared by all of
+    #: the sessions. The images of a provider with no key are not
+    #: cached.
+    cache_key = None
+
     @abstractmethod
     def request_image(self, path, size, callback):
         """ Request an image from this provider.
@@ -81,6 +149,9 @@ class ImageProvider(object):
             A callable which should be invoked when the image is loaded.
             It accepts a single argument, which is the loaded `Image`
             object. It is safe to invoke this callable from a thread.
+            To load an image progressively, the callable may first be
+            invoked with one or more images whose `preview` flag is
+            set, before it is invoked with the final image.
 
         """
         raise NotImplementedError
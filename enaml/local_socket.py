@@ -0,0 +1,195 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import deque
+from threading import Lock
+import types
+
+from .application import deferred_call
+from .socket_interface import ActionSocketInterface
+from .weakmethod import WeakMethod
+
+
+class LocalActionSocket(object):
+    """ A concrete implementation of ActionSocketInterface for use when
+    the server and client sessions live in the same process.
+
+    A LocalActionSocket is connected directly to a peer socket, and
+    delivers the messages sent on it to the peer's callback without
+    any toolkit signal marshaling. In the default deferred mode, the
+    messages are queued and delivered together on the next cycle of
+    the event loop, using a single deferred call for all messages
+    posted during a cycle. In synchronous mode, the messages are
+    delivered before `send` returns.
+
+    Sockets should be created in pairs with `local_socket_pair`.
+
+    """
+    def __init__(self, synchronous=False):
+        """ Initialize a LocalActionSocket.
+
+        Parameters
+        ----------
+        synchronous : bool, optional
+            Whether to deliver messages to the peer synchronously. The
+            default is False and delivers them on the next cycle of the
+            event loop. Synchronous delivery is not thread-safe and can
+            recurse if a message handler sends a message in response.
+
+        """
+        self._callback = None
+        self._peer = None
+        self._synchronous = synchronous
+        self._queue = deque()
+        self._lock = Lock()
+        self._flush_pending = False
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _flush(self):
+        """ Deliver the messages queued on the socket.
+
+        This is invoked as a deferred call on the event loop thread.
+        Messages which are posted while the queue is being delivered
+        will be delivered on the next cycle of the event loop.
+
+        """
+        with self._lock:
+            items = list(self._queue)
+            self._queue.clear()
+            self._flush_pending = False
+        for object_id, action, content in items:
+            self.receive(object_id, action, content)
+
+    #--------------------------------------------------------------------------
+    # ActionSocketInterface
+    #--------------------------------------------------------------------------
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by a client
+        object.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable with an argument signature that is equivalent to
+            the `send` method. If the callback is a bound method, then
+            the lifetime of the callback will be bound to lifetime of
+            the method owner object.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+
+    def send(self, object_id, action, content):
+        """ Send the action to the peer socket.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        peer = self._peer
+        if peer is not None:
+            peer.post(object_id, action, content)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def connect(self, peer):
+        """ Connect this socket to a peer socket.
+
+        Parameters
+        ----------
+        peer : LocalActionSocket or None
+            The socket to which messages sent on this socket should be
+            delivered, or None to disconnect the socket.
+
+        """
+        self._peer = peer
+
+    def post(self, object_id, action, content):
+        """ Post a message for delivery to this socket's callback.
+
+        This is called by the peer socket when a message is sent. The
+        message is delivered according to the mode of this socket.
+        This method is thread-safe when the socket is not synchronous.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        if self._synchronous:
+            self.receive(object_id, action, content)
+            return
+        with self._lock:
+            self._queue.append((object_id, action, content))
+            needs_flush = not self._flush_pending
+            self._flush_pending = True
+        if needs_flush:
+            deferred_call(self._flush)
+
+    def receive(self, object_id, action, content):
+        """ Receive a message sent to the socket.
+
+        The message will be routed to the registered callback, if one
+        exists.
+
+        Parameters
+        ----------
+        object_id : str
+            The object id of the target object.
+
+        action : str
+            The action that should be performed by the object.
+
+        content : dict
+            The content dictionary for the action.
+
+        """
+        callback = self._callback
+        if callback is not None:
+            callback(object_id, action, content)
+
+
+ActionSocketInterface.register(LocalActionSocket)
+
+
+def local_socket_pair(synchronous=False):
+    """ Create a pair of connected local action sockets.
+
+    Parameters
+    ----------
+    synchronous : bool, optional
+        Whether the sockets deliver their messages synchronously. The
+        default is False. See `LocalActionSocket` for details.
+
+    Returns
+    -------
+    result : tuple
+        A 2-tuple of connected LocalActionSocket instances. Messages
+        sent on either socket are delivered to the other.
+
+    """
+    first = LocalActionSocket(synchronous)
+    second = LocalActionSocket(synchronous)
+    first.connect(second)
+    second.connect(first)
+    return (first, second)
@@ -0,0 +1,265 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """ A least recently used cache with a budget in bytes.
+
+    The cache holds strong references to its most recently used items
+    until their combined size exceeds the budget, at which point the
+    least recently used items are evicted. A consumer which is using
+    an item can pin its key, and an evicted item whose key is pinned is
+    moved to a pinned tier, so that it can be found and promoted back
+    into the cache without being reloaded. The pinned tier holds the
+    item until every pin of its key has been released.
+
+    """
+    def __init__(self, max_bytes, sizeof=None):
+        """ Initialize an LRUCache.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The maximum combined size, in bytes, of the items held
+            strongly by the cache.
+
+        sizeof : callable, optional
+            A callable which accepts an item and returns its estimated
+            size in bytes. The default treats every item as 1 byte, in
+            which case `max_bytes` is the maximum number of items.
+
+        """
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda item: 1)
+        self._items = OrderedDict()
+        self._pins = {}
+        self._pinned_items = {}
+        self._bytes = 0
+        self._hits = 0
+        self._pinned_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _evict(self):
+        """ Evict the least recently used items until the cache is
+        within its budget.
+
+        """
+        items = self._items
+        pins = self._pins
+        max_bytes = self._max_bytes
+        while self._bytes > max_bytes and items:
+            key, (value, size) = items.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+            if key in pins:
+                self._pinned_items[key] = value
+
+    def _remove(self, key):
+        """ Remove the item for a key from both tiers of the cache.
+
+        """
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+        self._pinned_items.pop(key, None)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def get(self, key, default=None):
+        """ Get an item from the cache.
+
+        A hit marks the item as most recently used. An item found in
+        the pinned tier is promoted back into the cache.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key for the item.
+
+        default : object, optional
+            The value to return if the item is not in the cache.
+
+        Returns
+        -------
+        result : object
+            The cached item or the default.
+
+        """
+        items = self._items
+        try:
+            entry = items.pop(key)
+        except KeyError:
+            if key not in self._pinned_items:
+                self._misses += 1
+                return default
+            value = self._pinned_items[key]
+            self._pinned_hits += 1
+            self.put(key, value)
+            return value
+        items[key] = entry
+        self._hits += 1
+        return entry[0]
+
+    def put(self, key, value):
+        """ Add an item to the cache.
+
+        The item is marked as most recently used, and the least recently
+        used items are evicted if the cache exceeds its budget. An item
+        larger than the entire budget is only held if its key is pinned.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key for the item.
+
+        value : object
+            The item to add to the cache.
+
+        """
+        self._remove(key)
+        size = self._sizeof(value)
+        self._items[key] = (value, size)
+        self._bytes += size
+        self._evict()
+
+    def discard(self, key):
+        """ Remove an item from the cache, if present.
+
+        The pins of the key are not affected.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key for the item.
+
+        """
+        self._remove(key)
+
+    def pin(self, key):
+        """ Pin the item for a key while it is in use.
+
+        A key may be pinned multiple times, and it remains pinned until
+        each pin is released with `unpin`. A key may be pinned before
+        its item is added to the cache.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key for the item.
+
+        """
+        pins = self._pins
+        pins[key] = pins.get(key, 0) + 1
+
+    def unpin(self, key):
+        """ Release a pin of a key.
+
+        When the last pin of a key is released, an item of the key in
+        the pinned tier is dropped. Unpinning a key which is not pinned
+        has no effect.
+
+        Parameters
+        ----------
+        key : object
+            The hashable key for the item.
+
+        """
+        pins = self._pins
+        count = pins.get(key, 0)
+        if count > 1:
+            pins[key] = count - 1
+        elif count == 1:
+            del pins[key]
+            self._pinned_items.pop(key, None)
+
+    def purge(self, predicate):
+        """ Remove the items and pins of the keys matching a predicate.
+
+        This is used to drop every item of a consumer which is being
+        closed, regardless of whether the items are pinned.
+
+        Parameters
+        ----------
+        predicate : callable
+            A callable which accepts a key and returns True if the
+            item and pins of the key should be removed.
+
+        """
+        keys = [key for key in self._items if predicate(key)]
+        keys.extend(key for key in self._pinned_items if predicate(key))
+        for key in keys:
+            self._remove(key)
+        pins = self._pins
+        for key in [key for key in pins if predicate(key)]:
+            del pins[key]
+
+    def clear(self):
+        """ Remove all items and pins from the cache.
+
+        The statistics of the cache are not reset.
+
+        """
+        self._items.clear()
+        self._pins.clear()
+        self._pinned_items.clear()
+        self._bytes = 0
+
+    def max_bytes(self):
+        """ Get the budget of the cache in bytes.
+
+        """
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes):
+        """ Set the budget of the cache in bytes.
+
+        Items will be evicted immediately if the cache is over the new
+        budget.
+
+        """
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def stats(self):
+        """ Get the usage statistics for the cache.
+
+        Returns
+        -------
+        result : dict
+            A dictionary with the current 'count' and 'bytes' of the
+            items within the budget, the number of items in the
+            'pinned' tier, and the cumulative 'hits', 'pinned_hits',
+            'misses' and 'evictions' of the cache.
+
+        """
+        stats = {}
+        stats['count'] = len(self._items)
+        stats['bytes'] = self._bytes
+        stats['pinned'] = len(self._pinned_items)
+        stats['hits'] = self._hits
+        stats['pinned_hits'] = self._pinned_hits
+        stats['misses'] = self._misses
+        stats['evictions'] = self._evictions
+        return stats
+
+    def __contains__(self, key):
+        """ Returns whether the key is in the cache or its pinned tier.
+
+        This does not affect the usage order or statistics.
+
+        """
+        return key in self._items or key in self._pinned_items
+
+    def __len__(self):
+        """ Returns the number of items within the budget of the cache.
+
+        """
+        return len(self._items)
@@ -0,0 +1,268 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+
+
+class FlowLine(object):
+    """ A line of items computed by a FlowLineCache.
+
+    The extents of a line are measured in the direction of the layout
+    flow, and the ortho extents in the orthogonal direction. All of the
+    attributes should be considered read-only by users of the cache.
+
+    """
+    __slots__ = (
+        'start', 'end', 'min_extent', 'hint_extent', 'min_ortho',
+        'hint_ortho', 'stretch', 'ortho_stretch', 'geometry',
+    )
+
+    def __init__(self, start):
+        """ Initialize a FlowLine.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first item in the line.
+
+        """
+        self.start = start
+        self.end = start
+        self.min_extent = 0
+        self.hint_extent = 0
+        self.min_ortho = 0
+        self.hint_ortho = 0
+        self.stretch = 0
+        self.ortho_stretch = 0
+
+        #: Storage for the owner of the cache. This is reset to None
+        #: whenever the line is rebuilt, so the owner can use it to
+        #: skip the layout of a line which has not changed.
+        self.geometry = None
+
+    def add(self, metrics, extent, spacing):
+        """ Add an item to the end of the line.
+
+        Parameters
+        ----------
+        metrics : tuple
+            The metrics of the item. See `FlowLineCache.lines`.
+
+        extent : int
+            The extent of the layout area in the flow direction.
+
+        spacing : int
+            The space between items in the flow direction.
+
+        Returns
+        -------
+        result : bool
+            Whether the item was added. An item is not added to a line
+            which is not empty if it would overflow the line.
+
+        """
+        hint, minimum, hint_ortho, min_ortho, stretch, ortho = metrics
+        empty = self.end == self.start
+        if not empty and self.hint_extent + spacing + hint > extent:
+            return False
+        if not empty:
+            self.min_extent += spacing
+            self.hint_extent += spacing
+        self.min_extent += minimum
+        self.hint_extent += hint
+        self.min_ortho = max(self.min_ortho, min_ortho)
+        self.hint_ortho = max(self.hint_ortho, hint_ortho)
+        self.stretch += stretch
+        self.ortho_stretch = max(self.ortho_stretch, ortho)
+        self.end += 1
+        return True
+
+    def shift(self, delta):
+        """ Shift the item indices of the line.
+
+        """
+        self.start += delta
+        self.end += delta
+
+
+class FlowLineCache(object):
+    """ A cache of the metrics of the items of a flow layout and of the
+    lines into which they are broken.
+
+    The owner reports the items which are inserted, removed or changed.
+    When the lines are requested, only the changed items are measured
+    again. A cached line is reused if none of its items have changed
+    and it still breaks at the same item for the requested extent, so
+    the lines are only rebuilt from the first affected line onward. The
+    rebuild stops as soon as a rebuilt line ends at the start of an
+    unchanged cached line which is still valid.
+
+    This class has no toolkit dependencies.
+
+    """
+    def __init__(self):
+        """ Initialize a FlowLineCache.
+
+        """
+        self._metrics = []
+        self._lines = []
+        self._spacing = None
+        self._dirty_min = 0
+        self._dirty_max = -1
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _mark(self, first, last):
+        """ Mark a range of item indices as changed.
+
+        """
+        self._dirty_min = min(self._dirty_min, first)
+        self._dirty_max = max(self._dirty_max, last)
+
+    def _measure(self, index, measure):
+        """ Get the metrics of an item, measuring it if needed.
+
+        """
+        metrics = self._metrics[index]
+        if metrics is None:
+            metrics = self._metrics[index] = measure(index)
+        return metrics
+
+    def _is_valid(self, line, extent, spacing, measure):
+        """ Get whether a cached line breaks at the same item for an
+        extent.
+
+        """
+        count = len(self._metrics)
+        if line.end > count:
+            return False
+        if line.end - line.start > 1 and line.hint_extent > extent:
+            return False
+        if line.end < count:
+            hint = self._measure(line.end, measure)[0]
+            if line.hint_extent + spacing + hint <= extent:
+                return False
+        return True
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def count(self):
+        """ Get the number of items in the cache.
+
+        """
+        return len(self._metrics)
+
+    def insert(self, index, count=1):
+        """ Update the cache for items inserted at an index.
+
+        """
+        self._metrics[index:index] = [None] * count
+        lines = []
+        for line in self._lines:
+            if line.end <= index:
+                lines.append(line)
+            elif line.start >= index:
+                line.shift(count)
+                lines.append(line)
+        self._lines = lines
+        self._dirty_max += count if self._dirty_max >= index else 0
+        self._mark(index, index + count - 1)
+
+    def remove(self, index, count=1):
+        """ Update the cache for items removed at an index.
+
+        """
+        del self._metrics[index:index + count]
+        lines = []
+        for line in self._lines:
+            if line.end <= index:
+                lines.append(line)
+            elif line.start >= index + count:
+                line.shift(-count)
+                lines.append(line)
+        self._lines = lines
+        if self._dirty_max >= index + count:
+            self._dirty_max -= count
+        self._mark(index, index)
+
+    def invalidate(self, index):
+        """ Discard the metrics of a changed item.
+
+        """
+        self._metrics[index] = None
+        self._mark(index, index)
+
+    def reset(self, count=None):
+        """ Discard all metrics and lines.
+
+        Parameters
+        ----------
+        count : int, optional
+            The new number of items. The default keeps the current
+            number of items.
+
+        """
+        if count is None:
+            count = len(self._metrics)
+        self._metrics = [None] * count
+        self._lines = []
+        self._dirty_min = 0
+        self._dirty_max = count - 1
+
+    def lines(self, extent, spacing, measure):
+        """ Get the lines of items for a layout extent.
+
+        Parameters
+        ----------
+        extent : int
+            The extent of the layout area in the flow direction.
+
+        spacing : int
+            The space between items in the flow direction.
+
+        measure : callable
+            A callable which accepts the index of an item and returns
+            its metrics as a tuple of (hint_extent, min_extent,
+            hint_ortho, min_ortho, stretch, ortho_stretch).
+
+        Returns
+        -------
+        result : list
+            The list of FlowLine objects. The list and the lines must
+            not be modified.
+
+        """
+        if spacing != self._spacing:
+            self._spacing = spacing
+            self._lines = []
+            self._mark(0, len(self._metrics) - 1)
+        count = len(self._metrics)
+        dirty_min = self._dirty_min
+        dirty_max = self._dirty_max
+        cached = dict((line.start, line) for line in self._lines)
+        lines = []
+        index = 0
+        while index < count:
+            # Reuse the cached lines which start at the current index,
+            # do not contain a changed item, and are still valid.
+            line = cached.get(index)
+            if line is not None and (line.end <= dirty_min or
+                                     line.start > dirty_max):
+                if self._is_valid(line, extent, spacing, measure):
+                    lines.append(line)
+                    index = line.end
+                    continue
+            # Otherwise, build a new line from the current index.
+            line = FlowLine(index)
+            while index < count:
+                metrics = self._measure(index, measure)
+                if not line.add(metrics, extent, spacing):
+                    break
+                index += 1
+            lines.append(line)
+        self._lines = lines
+        self._dirty_min = count
+        self._dirty_max = -1
+        return lines
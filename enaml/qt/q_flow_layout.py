@@ -6,6 +6,7 @@ from abc import ABCMeta, abstractmethod
 
 from .qt.QtCore import Qt, QSize, QRect
 from .qt.QtGui import QLayout, QWidgetItem
+from .flow_line_cache import FlowLineCache
 
 
 class AbstractFlowWidget(object):
@@ -185,11 +186,11 @@ class QFlowWidgetItem(QWidgetItem):
 class _LayoutRow(object):
     """ A private class used by QFlowLayout.
 
-    This class accumulates information about a row of items as the items
-    are added to the row. Instances of the this class are created by the
-    QFlowLayout during a layout pass. For performance reasons, there are
-    several publically accesible attributes. See their documentation for
-    restrictions on their use.
+    This class holds the information about a row of items which is
+    computed by the line cache of the layout. Instances of the this
+    class are created by the QFlowLayout during a layout pass. For
+    performance reasons, there are several publically accesible
+    attributes. See their documentation for restrictions on their use.
 
     """
     #: The height to use for laying out the row. This attribute is
@@ -197,29 +198,29 @@ class _LayoutRow(object):
     #: space amongst the rows.
     layout_height = 0
 
-    #: The minimum height required for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only to external users.
+    #: The minimum height required for the row. This is set from
+    #: the cached line of the row. It should be considered read-only
+    #: to external users.
     min_height = 0
 
-    #: The minimum width required for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only to external users.
+    #: The minimum width required for the row. This is set from
+    #: the cached line of the row. It should be considered read-only
+    #: to external users.
     min_width = 0
 
-    #: The desired height for the row. This is automatically updated as
-    #: items are added to the row. It should be considered read-only to
+    #: The desired height for the row. This is set from the cached
+    #: line of the row. It should be considered read-only to
     #: external users.
     hint_height = 0
 
-    #: The desired width for the row. This is automatically updated as
-    #: items are added to the row. It should be considered read-only to
+    #: The desired width for the row. This is set from the cached
+    #: line of the row. It should be considered read-only to
     #: external users.
     hint_width = 0
 
-    #: The vertical stretch factor for the row. This is automatically
-    #: updated as items are added to the row. It should be considered
-    #: read-only by external users.
+    #: The vertical stretch factor for the row. This is set from
+    #: the cached line of the row. It should be considered read-only
+    #: by external users.
     stretch = 0
 
     def __init__(self, width, options):
@@ -239,48 +240,25 @@ class _LayoutRow(object):
         self._items_stretch = 0
         self._items = []
 
-    @property
-    def diff_height(self):
-        """ A read-only property which computes the difference between
-        the desired height and the minimum height.
-
-        """
-        return self.hint_height - self.min_height
-
-    def add_item(self, item):
-        """ Add an item to the layout row.
+    def set_line(self, line, items):
+        """ Set the items of the row from a cached line.
 
         Parameters
         ----------
-        item : QFlowWidgetItem
-            The flow widget item to add to the layout row.
+        line : FlowLine
+            The cached line computed for the items.
 
-        Returns
-        -------
-        result : bool
-            True if the items was added. False if the item was not
-            added. An item will not be added if the row already
-            contains an item and adding another item would cause
-            it to overflow.
+        items : list
+            The list of QFlowWidgetItem instances in the line.
 
         """
-        min_size = item.minimumSize()
-        hint_size = item.sizeHint()
-        n = len(self._items)
-        s = self._options.h_spacing
-        if n > 0 and (self.hint_width + s + hint_size.width()) > self._width:
-            return False
-        self.min_height = max(self.min_height, min_size.height())
-        self.hint_height = max(self.hint_height, hint_size.height())
-        self.stretch = max(self.stretch, item.data.ortho_stretch)
-        self.min_width += min_size.width()
-        self.hint_width += hint_size.width()
-        self._items_stretch += item.data.stretch
-        if n > 0:
-            self.min_width += s
-            self.hint_width += s
-        self._items.append(item)
-        return True
+        self.min_height = line.min_ortho
+        self.hint_height = line.hint_ortho
+        self.stretch = line.ortho_stretch
+        self.min_width = line.min_extent
+        self.hint_width = line.hint_extent
+        self._items_stretch = line.stretch
+        self._items = items
 
     def layout(self, x, y):
         """ Layout the row using the given starting coordinates.
@@ -412,11 +390,11 @@ class _LayoutRow(object):
 class _LayoutColumn(object):
     """ A private class used by QFlowLayout.
 
-    This class accumulates information about a column of items as the
-    items are added to the column. Instances of the this class are
-    created by the QFlowLayout during a layout pass. For performance
-    reasons, there are several publically accesible attributes. See
-    their documentation for restrictions on their use.
+    This class holds the information about a column of items which is
+    computed by the line cache of the layout. Instances of the this
+    class are created by the QFlowLayout during a layout pass. For
+    performance reasons, there are several publically accesible
+    attributes. See their documentation for restrictions on their use.
 
     """
     #: The width to use for laying out the column. This attribute is
@@ -424,29 +402,29 @@ class _LayoutColumn(object):
     #: space amongst the columns.
     layout_width = 0
 
-    #: The minimum height required for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only to external users.
+    #: The minimum height required for the column. This is set from
+    #: the cached line of the column. It should be considered read-only
+    #: to external users.
     min_height = 0
 
-    #: The minimum width required for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only to external users.
+    #: The minimum width required for the column. This is set from
+    #: the cached line of the column. It should be considered read-only
+    #: to external users.
     min_width = 0
 
-    #: The desired height for the column. This is automatically updated
-    #: as items are added to the column. It should be considered
+    #: The desired height for the column. This is set from the
+    #: cached line of the column. It should be considered
     #: read-only to external users.
     hint_height = 0
 
-    #: The desired width for the column. This is automatically updated
-    #: as items are added to the column. It should be considered
+    #: The desired width for the column. This is set from the
+    #: cached line of the column. It should be considered
     #: read-only to external users.
     hint_width = 0
 
-    #: The vertical stretch factor for the column. This is automatically
-    #: updated as items are added to the column. It should be considered
-    #: read-only by external users.
+    #: The vertical stretch factor for the column. This is set from
+    #: the cached line of the column. It should be considered read-only
+    #: by external users.
     stretch = 0
 
     def __init__(self, height, options):
@@ -466,48 +444,25 @@ class _LayoutColumn(object):
         self._items_stretch = 0
         self._items = []
 
-    @property
-    def diff_width(self):
-        """ A read-only property which computes the difference between
-        the desired width and the minimum width.
-
-        """
-        return self.hint_width - self.min_width
-
-    def add_item(self, item):
-        """ Add an item to the layout column.
+    def set_line(self, line, items):
+        """ Set the items of the column from a cached line.
 
         Parameters
         ----------
-        item : QFlowWidgetItem
-            The flow widget item to add to the layout column.
+        line : FlowLine
+            The cached line computed for the items.
 
-        Returns
-        -------
-        result : bool
-            True if the items was added. False if the item was not
-            added. An item will not be added if the column already
-            contains an item and adding another item would cause
-            it to overflow.
+        items : list
+            The list of QFlowWidgetItem instances in the line.
 
         """
-        min_size = item.minimumSize()
-        hint_size = item.sizeHint()
-        n = len(self._items)
-        s = self._options.v_spacing
-        if n > 0 and self.hint_height + s + hint_size.height() > self._height:
-            return False
-        self.min_width = max(self.min_width, min_size.width())
-        self.hint_width = max(self.hint_width, hint_size.width())
-        self.stretch = max(self.stretch, item.data.ortho_stretch)
-        self.min_height += min_size.height()
-        self.hint_height += hint_size.height()
-        self._items_stretch += item.data.stretch
-        if n > 0:
-            self.min_height += s
-            self.hint_height += s
-        self._items.append(item)
-        return True
+        self.min_width = line.min_ortho
+        self.hint_width = line.hint_ortho
+        self.stretch = line.ortho_stretch
+        self.min_height = line.min_extent
+        self.hint_height = line.hint_extent
+        self._items_stretch = line.stretch
+        self._items = items
 
     def layout(self, x, y):
         """ Layout the row using the given starting coordinates.
@@ -659,6 +614,8 @@ class QFlowLayout(QLayout):
         super(QFlowLayout, self).__init__()
         self._items = []
         self._options = _LayoutOptions()
+        self._lines = FlowLineCache()
+        self._options_generation = 0
         self._cached_w = -1
         self._cached_hfw = -1
         self._cached_min = None
@@ -692,6 +649,7 @@ class QFlowLayout(QLayout):
         self.addChildWidget(widget)
         item = QFlowWidgetItem(widget, widget.layoutData())
         self._items.insert(index, item)
+        self._lines.insert(index)
         widget.show()
         self.invalidate()
 
@@ -716,6 +674,8 @@ class QFlowLayout(QLayout):
 
         """
         self._options.direction = direction
+        self._lines.reset()
+        self._options_generation += 1
         self.invalidate()
 
     def alignment(self):
@@ -740,6 +700,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.alignment = alignment
+        self._options_generation += 1
         self.invalidate()
 
     def horizontalSpacing(self):
@@ -765,6 +726,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.h_spacing = spacing
+        self._options_generation += 1
         self.invalidate()
 
     def verticalSpacing(self):
@@ -790,6 +752,7 @@ class QFlowLayout(QLayout):
 
         """
         self._options.v_spacing = spacing
+        self._options_generation += 1
         self.invalidate()
 
     def hasHeightForWidth(self):
@@ -841,8 +804,11 @@ class QFlowLayout(QLayout):
         self._cached_wfh = -1
         self._cached_min = None
         self._cached_hint = None
-        for item in self._items:
-            item.invalidate()
+        lines = self._lines
+        for index, item in enumerate(self._items):
+            if item.data.dirty:
+                item.invalidate()
+                lines.invalidate(index)
         super(QFlowLayout, self).invalidate()
 
     def count(self):
@@ -870,6 +836,7 @@ class QFlowLayout(QLayout):
         if idx < len(items):
             item = items[idx]
             del items[idx]
+            self._lines.remove(idx)
             item.widget().hide()
             # The creation path of the layout items bypasses the virtual
             # wrapper methods, this means that the ownership of the cpp
@@ -955,73 +922,104 @@ class QFlowLayout(QLayout):
             self._cached_wfh = res + rect.x()
         return res
 
+    def _measureHorizontal(self, index):
+        """ Get the metrics of an item for a horizontal flow.
+
+        This is the measure callable for the line cache.
+
+        """
+        item = self._items[index]
+        hint = item.sizeHint()
+        min_size = item.minimumSize()
+        data = item.data
+        return (
+            hint.width(), min_size.width(), hint.height(),
+            min_size.height(), data.stretch, data.ortho_stretch,
+        )
+
+    def _measureVertical(self, index):
+        """ Get the metrics of an item for a vertical flow.
+
+        This is the measure callable for the line cache.
+
+        """
+        item = self._items[index]
+        hint = item.sizeHint()
+        min_size = item.minimumSize()
+        data = item.data
+        return (
+            hint.height(), min_size.height(), hint.width(),
+            min_size.width(), data.stretch, data.ortho_stretch,
+        )
+
     def _doHorizontalLayout(self, rect, test):
         """ Perform the layout for a horizontal flow direction.
 
         The method signature is identical to the `_doLayout` method.
 
         """
-        # Walk over the items and create the layout rows.
-        rows = []
-        width = rect.width()
+        # Get the layout rows from the line cache. Only the items which
+        # have changed are measured, and only the rows from the first
+        # affected row onward are rebuilt. If this is a test run, only
+        # the minimum height is required.
         opts = self._options
-        for item in self._items:
-            if len(rows) == 0:
-                row = _LayoutRow(width, opts)
-                row.add_item(item)
-                rows.append(row)
-            else:
-                row = rows[-1]
-                if not row.add_item(item):
-                    row = _LayoutRow(width, opts)
-                    row.add_item(item)
-                    rows.append(row)
-
-        # After collecting rows all of the rows, compute the metrics. If
-        # this is a test run, only the minimum height is required.
-        space = opts.v_spacing * (len(rows) - 1)
+        width = rect.width()
+        lines = self._lines.lines(
+            width, opts.h_spacing, self._measureHorizontal
+        )
+        space = opts.v_spacing * (len(lines) - 1)
         if test:
-            return sum(row.min_height for row in rows) + space
+            return sum(line.min_ortho for line in lines) + space
 
         min_height = space
-        hint_height = space
         total_diff = 0
         stretch = 0
-        for row in rows:
-            min_height += row.min_height
-            hint_height += row.hint_height
-            total_diff += row.diff_height
-            stretch += row.stretch
+        for line in lines:
+            min_height += line.min_ortho
+            total_diff += line.hint_ortho - line.min_ortho
+            stretch += line.ortho_stretch
 
         # Make an initial pass to distribute extra space to rows which
         # lie between their minimum height and desired height.
         height = rect.height()
         play_space = max(0, height - min_height)
         diff_space = max(total_diff, 1) # Guard against divide by zero
+        heights = []
         layout_height = 0
-        for row in rows:
-            d = play_space * row.diff_height / diff_space
-            row.layout_height = min(row.min_height + d, row.hint_height)
-            layout_height += row.layout_height
+        for line in lines:
+            d = play_space * (line.hint_ortho - line.min_ortho) / diff_space
+            h = min(line.min_ortho + d, line.hint_ortho)
+            heights.append(h)
+            layout_height += h
         layout_height += space
 
         # Make a second pass to distribute remaining space to rows
         # which with a stretch factor greater than zero.
         remaining = height - layout_height
         if remaining > 0 and stretch > 0:
-            for row in rows:
-                if row.stretch > 0:
-                    row.layout_height += remaining * row.stretch / stretch
+            for idx, line in enumerate(lines):
+                if line.ortho_stretch > 0:
+                    heights[idx] += remaining * line.ortho_stretch / stretch
 
         # Make a final pass to layout the rows, computing the overall
-        # final layout height along the way.
+        # final layout height along the way. A cached row which is laid
+        # out in the same place with the same options is skipped, since
+        # the geometry of its items has not changed.
         final_height = 0
         x = rect.x()
         curr_y = rect.y()
         v_space = opts.v_spacing
-        for row in rows:
-            row.layout(x, curr_y)
-            d = row.layout_height + v_space
+        items = self._items
+        generation = self._options_generation
+        for line, row_height in zip(lines, heights):
+            geometry = (x, curr_y, width, row_height, generation)
+            if line.geometry != geometry:
+                row = _LayoutRow(width, opts)
+                row.set_line(line, items[line.start:line.end])
+                row.layout_height = row_height
+                row.layout(x, curr_y)
+                line.geometry = geometry
+            d = row_height + v_space
             final_height += d
             curr_y += d
 
@@ -1033,67 +1031,68 @@ class QFlowLayout(QLayout):
         The method signature is identical to the `_doLayout` method.
 
         """
-        # Walk over the items and create the layout columns.
-        cols = []
-        height = rect.height()
+        # Get the layout columns from the line cache. Only the items
+        # which have changed are measured, and only the columns from
+        # the first affected column onward are rebuilt. If this is a
+        # test run, only the minimum width is required.
         opts = self._options
-        for item in self._items:
-            if len(cols) == 0:
-                col = _LayoutColumn(height, opts)
-                col.add_item(item)
-                cols.append(col)
-            else:
-                col = cols[-1]
-                if not col.add_item(item):
-                    col = _LayoutColumn(height, opts)
-                    col.add_item(item)
-                    cols.append(col)
-
-        # After collecting rows all of the columns, compute the metrics.
-        # If this is a test run, only the minimum width is required.
-        space = opts.h_spacing * (len(cols) - 1)
+        height = rect.height()
+        lines = self._lines.lines(
+            height, opts.v_spacing, self._measureVertical
+        )
+        space = opts.h_spacing * (len(lines) - 1)
         if test:
-            return sum(col.min_width for col in cols) + space
+            return sum(line.min_ortho for line in lines) + space
 
         min_width = space
-        hint_width = space
         total_diff = 0
         stretch = 0
-        for col in cols:
-            min_width += col.min_width
-            hint_width += col.hint_width
-            total_diff += col.diff_width
-            stretch += col.stretch
+        for line in lines:
+            min_width += line.min_ortho
+            total_diff += line.hint_ortho - line.min_ortho
+            stretch += line.ortho_stretch
 
         # Make an initial pass to distribute extra space to columns
         # which lie between their minimum width and desired width.
         width = rect.width()
         play_space = max(0, width - min_width)
         diff_space = max(total_diff, 1) # Guard against divide by zero
+        widths = []
         layout_width = 0
-        for col in cols:
-            d = play_space * col.diff_width / diff_space
-            col.layout_width = min(col.min_width + d, col.hint_width)
-            layout_width += col.layout_width
+        for line in lines:
+            d = play_space * (line.hint_ortho - line.min_ortho) / diff_space
+            w = min(line.min_ortho + d, line.hint_ortho)
+            widths.append(w)
+            layout_width += w
         layout_width += space
 
         # Make a second pass to distribute remaining space to columns
         # which with a stretch factor greater than zero.
         remaining = width - layout_width
         if remaining > 0 and stretch > 0:
-            for col in cols:
-                if col.stretch > 0:
-                    col.layout_width += remaining * col.stretch / stretch
+            for idx, line in enumerate(lines):
+                if line.ortho_stretch > 0:
+                    widths[idx] += remaining * line.ortho_stretch / stretch
 
         # Make a final pass to layout the columns, computing the overall
-        # final layout width along the way.
+        # final layout width along the way. A cached column which is
+        # laid out in the same place with the same options is skipped,
+        # since the geometry of its items has not changed.
         final_width = 0
         y = rect.y()
         curr_x = rect.x()
         h_space = opts.h_spacing
-        for col in cols:
-            col.layout(curr_x, y)
-            d = col.layout_width + h_space
+        items = self._items
+        generation = self._options_generation
+        for line, col_width in zip(lines, widths):
+            geometry = (curr_x, y, height, col_width, generation)
+            if line.geometry != geometry:
+                col = _LayoutColumn(height, opts)
+                col.set_line(line, items[line.start:line.end])
+                col.layout_width = col_width
+                col.layout(curr_x, y)
+                line.geometry = geometry
+            d = col_width + h_space
             final_width += d
             curr_x += d
 
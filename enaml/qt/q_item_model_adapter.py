@@ -0,0 +1,181 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtCore import Qt, QAbstractTableModel, QModelIndex
+from .q_deferred_caller import deferredCall
+from .row_block_cache import MISSING, RowBlockCache
+
+
+class QItemModelAdapter(QAbstractTableModel):
+    """ A QAbstractTableModel which exposes the rows of a server side
+    ItemModel to a Qt item view.
+
+    The adapter only knows the shape of the model up front. The data of
+    a row is requested from the server the first time the view asks for
+    it, and is cached in blocks by a RowBlockCache. All of the rows which
+    are requested during a cycle of the event loop are fetched with a
+    single message.
+
+    """
+    def __init__(self, fetch, parent=None):
+        """ Initialize a QItemModelAdapter.
+
+        Parameters
+        ----------
+        fetch : callable
+            A callable which accepts a list of [row, count] ranges and
+            the cache generation, and sends the fetch request to the
+            server.
+
+        parent : QObject, optional
+            The parent object of the adapter.
+
+        """
+        super(QItemModelAdapter, self).__init__(parent)
+        self._fetch = fetch
+        self._cache = RowBlockCache()
+        self._column_count = 0
+        self._headers = []
+        self._flush_pending = False
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _schedule_flush(self):
+        """ Schedule a request for the wanted rows on the next cycle.
+
+        """
+        if not self._flush_pending:
+            self._flush_pending = True
+            deferredCall(self._flush)
+
+    def _flush(self):
+        """ Request the wanted rows from the server.
+
+        """
+        self._flush_pending = False
+        cache = self._cache
+        if cache.has_wanted():
+            self._fetch(cache.take_wanted(), cache.generation())
+
+    def _emit_rows_changed(self, row, count):
+        """ Emit the dataChanged signal for a range of rows.
+
+        """
+        last_row = min(row + count, self._cache.row_count()) - 1
+        last_col = self._column_count - 1
+        if last_row >= row and last_col >= 0:
+            first = self.index(row, 0)
+            last = self.index(last_row, last_col)
+            self.dataChanged.emit(first, last)
+
+    #--------------------------------------------------------------------------
+    # QAbstractTableModel Interface
+    #--------------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        """ Get the number of rows in the model.
+
+        """
+        if parent.isValid():
+            return 0
+        return self._cache.row_count()
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Get the number of columns in the model.
+
+        """
+        if parent.isValid():
+            return 0
+        return self._column_count
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Get the data for an item of the model.
+
+        A row which is not yet cached is requested from the server and
+        displays as empty until it arrives.
+
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._cache.get(index.row(), index.column())
+        if value is MISSING:
+            if self._cache.has_wanted():
+                self._schedule_flush()
+            return None
+        return value
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """ Get the data for a header section.
+
+        """
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            headers = self._headers
+            if section < len(headers) and headers[section] is not None:
+                return headers[section]
+        return section + 1
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def set_prefetch(self, prefetch):
+        """ Set the number of rows to prefetch around a missing row.
+
+        """
+        self._cache.set_prefetch(prefetch)
+
+    def reset_model(self, row_count, column_count, headers):
+        """ Reset the model to a new shape and discard all cached rows.
+
+        """
+        self.beginResetModel()
+        self._cache.reset(row_count)
+        self._column_count = column_count
+        self._headers = headers
+        self.endResetModel()
+
+    def store_rows(self, ranges, generation):
+        """ Store the rows fetched from the server.
+
+        Parameters
+        ----------
+        ranges : list
+            A list of [row, data] pairs, where data is a list of rows.
+
+        generation : int
+            The cache generation of the request.
+
+        """
+        cache = self._cache
+        for row, rows in ranges:
+            if cache.store(row, rows, generation):
+                self._emit_rows_changed(row, len(rows))
+
+    def invalidate_rows(self, row, count):
+        """ Discard the cached data of a range of rows.
+
+        The rows are fetched again when the view next displays them.
+
+        """
+        self._cache.invalidate(row, count)
+        self._emit_rows_changed(row, count)
+
+    def insert_rows(self, row, count):
+        """ Insert rows into the model.
+
+        """
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._cache.insert_rows(row, count)
+        self.endInsertRows()
+        self._emit_rows_changed(row, self._cache.row_count() - row)
+
+    def remove_rows(self, row, count):
+        """ Remove rows from the model.
+
+        """
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        self._cache.remove_rows(row, count)
+        self.endRemoveRows()
+        self._emit_rows_changed(row, self._cache.row_count() - row)
@@ -75,16 +75,18 @@ class QPixmapPainter(QObject):
         """ Filter the events for the given object.
 
         This method will only filter paint events for the target of this
-        object. If there is a pixmap available for drawing, then that
-        will be drawn onto the target.
+        object. If there is a pixmap available for drawing, then the
+        region of it which needs repainting will be drawn onto the
+        target.
 
         """
         if event.type() == QEvent.Paint:
             if obj is self._target:
                 pm = self._pixmap
                 if pm is not None:
+                    rect = event.rect()
                     painter = QPainter(obj)
-                    painter.drawPixmap(0, 0, pm)
+                    painter.drawPixmap(rect, pm, rect)
                     return True
         return False
 
@@ -18,6 +18,10 @@ class QtAction(QtObject):
     #: Temporary internal storage for the icon source url.
     _icon_source = ''
 
+    #: The deferred resource for the icon, which keeps the icon
+    #: pinned in the resource cache while it is displayed.
+    _icon_loader = None
+
     # FIXME Currently, the checked state of the action is lost when
     # switching from checkable to non-checkable and back again.
     #--------------------------------------------------------------------------
@@ -159,11 +163,16 @@ class QtAction(QtObject):
         """ Set the icon source for the action.
 
         """
+        loader = None
         if icon_source:
             loader = self._session.load_resource(icon_source)
             loader.on_load(self._on_icon_load)
         else:
             self._on_icon_load(QIcon())
+        old_loader = self._icon_loader
+        self._icon_loader = loader
+        if old_loader is not None:
+            old_loader.cancel()
 
     def set_checkable(self, checkable):
         """ Set the checkable state on the underlying control.
@@ -3,9 +3,9 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 import logging
-import uuid
 
 from enaml.application import Application
+from enaml.local_socket import local_socket_pair
 
 from .qt.QtCore import Qt, QThread
 from .qt.QtGui import QApplication
@@ -30,7 +30,7 @@ class QtApplication(Application):
     runs in the local process.
 
     """
-    def __init__(self, factories):
+    def __init__(self, factories, delivery='deferred'):
         """ Initialize a QtApplication.
 
         Parameters
@@ -39,8 +39,20 @@ class QtApplication(Application):
             An iterable of SessionFactory instances to pass to the
             superclass constructor.
 
+        delivery : str, optional
+            How messages are delivered between the server and client
+            sessions. 'deferred' uses in-process sockets which deliver
+            all of the messages sent during a cycle of the event loop
+            with a single deferred call. 'synchronous' uses in-process
+            sockets which deliver messages immediately. 'queued' uses
+            Qt action sockets which post a queued signal per message.
+            The default is 'deferred'.
+
         """
         super(QtApplication, self).__init__(factories)
+        if delivery not in ('deferred', 'synchronous', 'queued'):
+            raise ValueError('Invalid message delivery `%s`' % delivery)
+        self._delivery = delivery
         self._qapp = QApplication.instance() or QApplication([])
         self._qt_sessions = {}
         self._sessions = {}
@@ -66,14 +78,9 @@ class QtApplication(Application):
             The unique identifier for the created session.
 
         """
-        if name not in self._named_factories:
-            raise ValueError('Invalid session name')
-
-        # Create and open a new server-side session.
-        factory = self._named_factories[name]
-        session = factory()
-        session_id = uuid.uuid4().hex
-        session.open(session_id)
+        # Get an opened server-side session, from the pool if possible.
+        session = self._open_session(name)
+        session_id = session.session_id
         self._sessions[session_id] = session
 
         # Create and open a new client-side session.
@@ -83,11 +90,16 @@ class QtApplication(Application):
         qt_session.open(session.snapshot())
 
         # Setup the sockets for the session pair
-        server_socket = QActionSocket()
-        client_socket = QActionSocket()
-        conn = Qt.QueuedConnection
-        server_socket.messagePosted.connect(client_socket.receive, conn)
-        client_socket.messagePosted.connect(server_socket.receive, conn)
+        delivery = self._delivery
+        if delivery == 'queued':
+            server_socket = QActionSocket()
+            client_socket = QActionSocket()
+            conn = Qt.QueuedConnection
+            server_socket.messagePosted.connect(client_socket.receive, conn)
+            client_socket.messagePosted.connect(server_socket.receive, conn)
+        else:
+            synchronous = delivery == 'synchronous'
+            server_socket, client_socket = local_socket_pair(synchronous)
 
         # Activate the server and client sessions. The server session
         # is activated first so that it is ready to receive messages
@@ -46,6 +46,31 @@ class QtComboBox(QtControl):
         """
         self.set_items(content['items'])
 
+    def on_action_insert_items(self, content):
+        """ Handle the 'insert_items' action from the Enaml widget.
+
+        """
+        with self.loopback_guard('index'):
+            self.widget().insertItems(content['index'], content['items'])
+
+    def on_action_remove_items(self, content):
+        """ Handle the 'remove_items' action from the Enaml widget.
+
+        """
+        model = self.widget().model()
+        with self.loopback_guard('index'):
+            model.removeRows(content['index'], content['count'])
+
+    def on_action_replace_items(self, content):
+        """ Handle the 'replace_items' action from the Enaml widget.
+
+        """
+        widget = self.widget()
+        index = content['index']
+        with self.loopback_guard('index'):
+            for offset, item in enumerate(content['items']):
+                widget.setItemText(index + offset, item)
+
     def on_action_set_editable(self, content):
         """ Handle the 'set_editable' action from the Enaml widget.
 
@@ -119,6 +119,26 @@ class QtConstraintsWidget(QtWidget):
     def on_action_relayout(self, content):
         """ Handle the 'relayout' action from the Enaml widget.
 
+        """
+        self.update_layout_info(content)
+        self.relayout()
+
+    #--------------------------------------------------------------------------
+    # Layout Handling
+    #--------------------------------------------------------------------------
+    def update_layout_info(self, content):
+        """ Update the layout information for this constraints widget.
+
+        This method updates the stored layout state from the content of
+        a 'relayout' action, but does *not* trigger a relayout. It is
+        used by the QtSession to apply the state of several relayout
+        actions in a batch before relaying out their owners only once.
+
+        Parameters
+        ----------
+        content : dict
+            The content dictionary of the 'relayout' action.
+
         """
         # XXX The QtContainer needs to get in on the action to grab the
         # share_layout flag.
@@ -126,11 +146,24 @@ class QtConstraintsWidget(QtWidget):
         self._resist = content['resist']
         self._user_cns = content['constraints']
         self.clear_size_hint_constraints()
-        self.relayout()
 
-    #--------------------------------------------------------------------------
-    # Layout Handling
-    #--------------------------------------------------------------------------
+    def relayout_owner(self):
+        """ Get the object which performs a relayout for this widget.
+
+        The default behavior of this method is to proxy the call up the
+        tree of ancestors in the same fashion as `relayout`.
+
+        Returns
+        -------
+        result : QtConstraintsWidget or None
+            The object which will perform the work when `relayout` is
+            called on this widget, or None if the request is dropped.
+
+        """
+        parent = self.parent()
+        if isinstance(parent, QtConstraintsWidget):
+            return parent.relayout_owner()
+
     def relayout(self):
         """ Peform a relayout for this constraints widget.
 
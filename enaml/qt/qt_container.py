@@ -237,6 +237,20 @@ class QtContainer(QtConstraintsWidget):
         else:
             self._layout_owner.relayout()
 
+    def relayout_owner(self):
+        """ Get the object which performs a relayout for this widget.
+
+        Returns
+        -------
+        result : QtContainer
+            This container if it owns its layout, otherwise the
+            container which has taken ownership of its layout.
+
+        """
+        if self._owns_layout:
+            return self
+        return self._layout_owner.relayout_owner()
+
     def refresh(self):
         """ Makes a layout pass over the descendents if this widget owns
         the responsibility for their layout.
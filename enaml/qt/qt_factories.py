@@ -112,6 +112,11 @@ def list_item_factory():
     return QtListItem
 
 
+def list_view_factory():
+    from .qt_list_view import QtListView
+    return QtListView
+
+
 def main_window_factory():
     from .qt_main_window import QtMainWindow
     return QtMainWindow
@@ -142,6 +147,11 @@ def mpl_canvas_factory():
     return QtMPLCanvas
 
 
+def model_combo_box_factory():
+    from .qt_model_combo_box import QtModelComboBox
+    return QtModelComboBox
+
+
 def multiline_field_factory():
     from .qt_multiline_field import QtMultilineField
     return QtMultilineField
@@ -217,6 +227,11 @@ def stack_item_factory():
 #    return QtTextEditor
 
 
+def table_view_factory():
+    from .qt_table_view import QtTableView
+    return QtTableView
+
+
 def time_selector_factory():
     from .qt_time_selector import QtTimeSelector
     return QtTimeSelector
@@ -268,11 +283,13 @@ def register_default():
     register('Label', label_factory)
     register('ListControl', list_control_factory)
     register('ListItem', list_item_factory)
+    register('ListView', list_view_factory)
     register('MainWindow', main_window_factory)
     register('MdiArea', mdi_area_factory)
     register('MdiWindow', mdi_window_factory)
     register('Menu', menu_factory)
     register('MenuBar', menu_bar_factory)
+    register('ModelComboBox', model_combo_box_factory)
     register('MPLCanvas', mpl_canvas_factory)
     register('MultilineField', multiline_field_factory)
     register('Notebook', notebook_factory)
@@ -288,6 +305,7 @@ def register_default():
     register('Splitter', splitter_factory)
     register('Stack', stack_factory)
     register('StackItem', stack_item_factory)
+    register('TableView', table_view_factory)
     register('TimeSelector', time_selector_factory)
     register('ToolBar', tool_bar_factory)
     register('TraitsItem', traits_item_factory)
@@ -5,7 +5,7 @@
 from enaml.validation.client_validators import null_validator, make_validator
 
 from .qt.QtGui import QLineEdit
-from .qt.QtCore import Signal
+from .qt.QtCore import Signal, QTimer
 from .qt_control import QtControl
 
 
@@ -47,6 +47,13 @@ class QtField(QtControl):
     #: A flag indicating whether the current field is invalid.
     _is_error_state = False
 
+    #: The timer which delays an 'auto_sync' submission while the user
+    #: is typing.
+    _sync_timer = None
+
+    #: The number of the most recent submission to the server.
+    _submit_request = 0
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -61,9 +68,13 @@ class QtField(QtControl):
 
         """
         super(QtField, self).create(tree)
+        timer = self._sync_timer = QTimer(self.widget())
+        timer.setSingleShot(True)
+        timer.timeout.connect(self._validate_and_submit)
         self.set_text(tree['text'])
         self.set_validator(tree['validator'])
         self.set_submit_triggers(tree['submit_triggers'])
+        self.set_sync_delay(tree['sync_delay'])
         self.set_placeholder(tree['placeholder'])
         self.set_echo_mode(tree['echo_mode'])
         self.set_max_length(tree['max_length'])
@@ -79,13 +90,17 @@ class QtField(QtControl):
     def _submit_text(self, text):
         """ Submit the given text as an update to the server widget.
 
+        The submission is numbered so that a reply for text which has
+        since been edited can be discarded.
+
         Parameters
         ----------
         text : unicode
             The unicode text to send to the server widget.
 
         """
-        content = {'text': text}
+        self._submit_request += 1
+        content = {'text': text, 'request': self._submit_request}
         self.send_action('submit_text', content)
 
     def _validate_and_submit(self):
@@ -93,6 +108,7 @@ class QtField(QtControl):
         the server widget if it's valid.
 
         """
+        self._sync_timer.stop()
         text = self.widget().text()
         if text != self._last_value:
             if self._validator(text):
@@ -132,9 +148,13 @@ class QtField(QtControl):
 
     def on_text_edited(self):
         """ The signal handler for 'textEdited' signal.
+
         """
-        if 'text_edited' in self._submit_triggers:
+        triggers = self._submit_triggers
+        if 'text_edited' in triggers:
             self._validate_and_submit()
+        elif 'auto_sync' in triggers:
+            self._sync_timer.start()
 
     #--------------------------------------------------------------------------
     # Message Handlers
@@ -142,7 +162,13 @@ class QtField(QtControl):
     def on_action_set_text(self, content):
         """ Handle the 'set_text' action from the Enaml widget.
 
+        A reply to a submission is ignored if the text has been
+        submitted again since.
+
         """
+        request = content.get('request')
+        if request is not None and request != self._submit_request:
+            return
         self.set_text(content['text'])
 
     def on_action_set_validator(self, content):
@@ -158,6 +184,12 @@ class QtField(QtControl):
         """
         self.set_submit_triggers(content['submit_triggers'])
 
+    def on_action_set_sync_delay(self, content):
+        """ Handle the 'set_sync_delay' action from the Enaml widget.
+
+        """
+        self.set_sync_delay(content['sync_delay'])
+
     def on_action_set_placeholder(self, content):
         """ Hanlde the 'set_placeholder' action from the Enaml widget.
 
@@ -216,6 +248,14 @@ class QtField(QtControl):
 
         """
         self._submit_triggers = triggers
+        if 'auto_sync' not in triggers:
+            self._sync_timer.stop()
+
+    def set_sync_delay(self, delay):
+        """ Set the delay before an 'auto_sync' submission.
+
+        """
+        self._sync_timer.setInterval(delay)
 
     def set_placeholder(self, text):
         """ Set the placeholder text of the underlying widget.
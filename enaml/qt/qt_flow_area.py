@@ -2,7 +2,11 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from time import time
+
+from .qt.QtCore import QEvent, QRect, QSize, QTimer, Signal
 from .qt.QtGui import QScrollArea, QFrame
+from .q_deferred_caller import deferredCall
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_flow_item import QtFlowItem
 from .q_flow_layout import QFlowLayout
@@ -28,6 +32,11 @@ class QFlowArea(QScrollArea):
     """ A custom QScrollArea which implements a flowing layout.
 
     """
+    #: A signal emitted when the area of the layout which is visible in
+    #: the viewport may have changed. This occurs when the area scrolls
+    #: or resizes, or when the layout requests a relayout.
+    viewportChanged = Signal()
+
     def __init__(self, parent=None):
         """ Initialize a QFlowArea.
 
@@ -41,9 +50,44 @@ class QFlowArea(QScrollArea):
         self._widget = QFrame(self)
         self._layout = QFlowLayout()
         self._widget.setLayout(self._layout)
+        self._widget.installEventFilter(self)
         self.setWidgetResizable(True)
         self.setWidget(self._widget)
 
+    def visibleRect(self):
+        """ Get the rect of the layout which is visible in the viewport.
+
+        Returns
+        -------
+        result : QRect
+            The visible rect in the coordinates of the layout widget.
+
+        """
+        widget = self._widget
+        size = self.viewport().size()
+        return QRect(-widget.x(), -widget.y(), size.width(), size.height())
+
+    def scrollContentsBy(self, dx, dy):
+        """ Scroll the contents of the area.
+
+        This is reimplemented to emit the `viewportChanged` signal.
+
+        """
+        super(QFlowArea, self).scrollContentsBy(dx, dy)
+        self.viewportChanged.emit()
+
+    def eventFilter(self, obj, event):
+        """ Filter the events of the layout widget.
+
+        A resize or a layout request of the layout widget emits the
+        `viewportChanged` signal.
+
+        """
+        etype = event.type()
+        if etype == QEvent.Resize or etype == QEvent.LayoutRequest:
+            self.viewportChanged.emit()
+        return False
+
     def layout(self):
         """ Get the layout for this flow area.
 
@@ -69,7 +113,41 @@ class QFlowArea(QScrollArea):
 class QtFlowArea(QtConstraintsWidget):
     """ A Qt implementation of an Enaml FlowArea.
 
+    A virtual flow area requests the realization of the contents of the
+    items which are within the overscan distance of the viewport. The
+    contents of an item which has been out of view for the unrealize
+    delay are released, while the item itself remains in the layout at
+    its last size.
+
     """
+    #: Whether the contents of the flow items are realized lazily.
+    _virtual = False
+
+    #: The distance beyond the viewport within which items are realized.
+    _overscan = 0
+
+    #: The delay in ms before the contents of a hidden item are released.
+    _unrealize_delay = 0
+
+    #: The size of an item which has never been realized.
+    _placeholder_size = QSize()
+
+    #: Whether an update of the realized items is scheduled.
+    _update_pending = False
+
+    #: The timer which releases the contents of hidden items.
+    _release_timer = None
+
+    #: A mapping of the realized items which are out of view to the
+    #: time at which they were last seen.
+    _hidden = None
+
+    #: The items whose contents have been requested from the server.
+    _realizing = None
+
+    #: The items whose contents have been requested to be released.
+    _unrealizing = None
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -84,21 +162,126 @@ class QtFlowArea(QtConstraintsWidget):
 
         """
         super(QtFlowArea, self).create(tree)
+        self._hidden = {}
+        self._realizing = set()
+        self._unrealizing = set()
+        timer = self._release_timer = QTimer(self.widget())
+        timer.setSingleShot(True)
+        timer.timeout.connect(self._release_hidden)
         self.set_direction(tree['direction'])
         self.set_align(tree['align'])
         self.set_horizontal_spacing(tree['horizontal_spacing'])
         self.set_vertical_spacing(tree['vertical_spacing'])
         self.set_margins(tree['margins'])
+        self.set_placeholder_size(tree['placeholder_size'])
+        self.set_overscan(tree['overscan'])
+        self.set_unrealize_delay(tree['unrealize_delay'])
+        self.set_virtual(tree['virtual'])
 
     def init_layout(self):
         """ Initialize the layout for the underlying control.
 
         """
         super(QtFlowArea, self).init_layout()
-        layout = self.widget().layout()
+        widget = self.widget()
+        layout = widget.layout()
+        placeholder = self._placeholder_size
         for child in self.children():
             if isinstance(child, QtFlowItem):
-                layout.addWidget(child.widget())
+                item = child.widget()
+                item.setPlaceholderSize(placeholder)
+                layout.addWidget(item)
+        widget.viewportChanged.connect(self._schedule_update)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _schedule_update(self):
+        """ Schedule an update of the realized items of a virtual area.
+
+        The updates requested during a cycle of the event loop are
+        collapsed into a single update.
+
+        """
+        if self._virtual and not self._update_pending:
+            self._update_pending = True
+            deferredCall(self._update_realized)
+
+    def _update_realized(self):
+        """ Update the realized items of a virtual area.
+
+        The contents of the items near the viewport are requested if
+        they are not realized. The realized items which are out of view
+        are timestamped for release.
+
+        """
+        self._update_pending = False
+        if not self._virtual:
+            return
+        margin = self._overscan
+        rect = self.widget().visibleRect()
+        rect.adjust(-margin, -margin, margin, margin)
+        now = time()
+        hidden = self._hidden
+        realizing = self._realizing
+        unrealizing = self._unrealizing
+        for child in self.children():
+            if not isinstance(child, QtFlowItem):
+                continue
+            realized = child.children_realized()
+            if realized:
+                realizing.discard(child)
+            else:
+                unrealizing.discard(child)
+            if child.widget().geometry().intersects(rect):
+                hidden.pop(child, None)
+                # An item which is shown before the server replies to
+                # a request to release it must be realized again. The
+                # server handles the requests in order.
+                if child in unrealizing:
+                    unrealizing.discard(child)
+                    child.request_realize_children()
+                elif not realized and child not in realizing:
+                    realizing.add(child)
+                    child.request_realize_children()
+            elif realized and child not in unrealizing:
+                if child not in hidden:
+                    hidden[child] = now
+        timer = self._release_timer
+        if hidden and self._unrealize_delay > 0 and not timer.isActive():
+            timer.start(self._unrealize_delay)
+
+    def _release_hidden(self):
+        """ Release the contents of the items which have been out of
+        view for the unrealize delay.
+
+        """
+        delay = self._unrealize_delay / 1000.0
+        if not self._virtual or delay <= 0:
+            self._hidden.clear()
+            return
+        now = time()
+        hidden = self._hidden
+        remaining = delay
+        for child, seen in hidden.items():
+            age = now - seen
+            if age >= delay:
+                del hidden[child]
+                if child.children_realized():
+                    self._unrealizing.add(child)
+                    child.request_unrealize_children()
+            else:
+                remaining = min(remaining, delay - age)
+        if hidden:
+            self._release_timer.start(int(remaining * 1000) + 1)
+
+    def _discard_item(self, child):
+        """ Discard the virtualization state held for an item.
+
+        """
+        self._hidden.pop(child, None)
+        self._realizing.discard(child)
+        self._unrealizing.discard(child)
 
     #--------------------------------------------------------------------------
     # Child Events
@@ -108,6 +291,7 @@ class QtFlowArea(QtConstraintsWidget):
 
         """
         if isinstance(child, QtFlowItem):
+            self._discard_item(child)
             self.widget().layout().removeWidget(child.widget())
 
     def child_added(self, child):
@@ -116,7 +300,9 @@ class QtFlowArea(QtConstraintsWidget):
         """
         if isinstance(child, QtFlowItem):
             index = self.index_of(child)
-            self.widget().layout().insertWidget(index, child.widget())
+            widget = child.widget()
+            widget.setPlaceholderSize(self._placeholder_size)
+            self.widget().layout().insertWidget(index, widget)
 
     #--------------------------------------------------------------------------
     # Message Handling
@@ -153,6 +339,32 @@ class QtFlowArea(QtConstraintsWidget):
         """
         self.set_margins(content['margins'])
 
+    def on_action_set_virtual(self, content):
+        """ Handle the 'set_virtual' action from the Enaml widget.
+
+        """
+        self.set_virtual(content['virtual'])
+
+    def on_action_set_overscan(self, content):
+        """ Handle the 'set_overscan' action from the Enaml widget.
+
+        """
+        self.set_overscan(content['overscan'])
+
+    def on_action_set_unrealize_delay(self, content):
+        """ Handle the 'set_unrealize_delay' action from the Enaml
+        widget.
+
+        """
+        self.set_unrealize_delay(content['unrealize_delay'])
+
+    def on_action_set_placeholder_size(self, content):
+        """ Handle the 'set_placeholder_size' action from the Enaml
+        widget.
+
+        """
+        self.set_placeholder_size(content['placeholder_size'])
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -187,6 +399,42 @@ class QtFlowArea(QtConstraintsWidget):
         top, right, bottom, left = margins
         self.widget().layout().setContentsMargins(left, top, right, bottom)
 
+    def set_virtual(self, virtual):
+        """ Set whether the contents of the items are realized lazily.
+
+        """
+        self._virtual = virtual
+        if virtual:
+            self._schedule_update()
+        else:
+            self._release_timer.stop()
+            self._hidden.clear()
+
+    def set_overscan(self, overscan):
+        """ Set the distance beyond the viewport to realize items.
+
+        """
+        self._overscan = overscan
+        self._schedule_update()
+
+    def set_unrealize_delay(self, delay):
+        """ Set the delay before the contents of a hidden item are
+        released.
+
+        """
+        self._unrealize_delay = delay
+        self._release_timer.stop()
+        self._schedule_update()
+
+    def set_placeholder_size(self, size):
+        """ Set the placeholder size of the unrealized items.
+
+        """
+        placeholder = self._placeholder_size = QSize(*size)
+        for child in self.children():
+            if isinstance(child, QtFlowItem):
+                child.widget().setPlaceholderSize(placeholder)
+
     #--------------------------------------------------------------------------
     # Overrides
     #--------------------------------------------------------------------------
@@ -32,6 +32,8 @@ class QFlowItem(QFrame):
         """
         super(QFlowItem, self).__init__(parent)
         self._flow_widget = None
+        self._placeholder_size = QSize()
+        self._last_size = QSize()
         self._layout_data = FlowLayoutData()
         self.setLayout(QSingleWidgetLayout())
         self.layout().setSizeConstraint(QLayout.SetMinAndMaxSize)
@@ -181,8 +183,57 @@ class QFlowItem(QFrame):
             The QWidget to use as the flow widget in this item.
 
         """
+        old = self._flow_widget
+        if old is not None and widget is None:
+            self._last_size = self.sizeHint()
         self._flow_widget = widget
         self.layout().setWidget(widget)
+        if widget is None or old is None:
+            self._layout_data.dirty = True
+            self.updateGeometry()
+
+    def placeholderSize(self):
+        """ Get the placeholder size for this flow item.
+
+        Returns
+        -------
+        result : QSize
+            The size hint of the flow item while it has no flow widget
+            and has never had one.
+
+        """
+        return self._placeholder_size
+
+    def setPlaceholderSize(self, size):
+        """ Set the placeholder size for this flow item.
+
+        The placeholder size is used while the contents of an item of a
+        virtual flow area are not realized. An item which had a flow
+        widget uses the last size hint of that widget instead.
+
+        Parameters
+        ----------
+        size : QSize
+            The placeholder size for the flow item.
+
+        """
+        self._placeholder_size = size
+        if self._flow_widget is None:
+            self._layout_data.dirty = True
+            self.updateGeometry()
+
+    def sizeHint(self):
+        """ Get the size hint for this flow item.
+
+        This is reimplemented to return the placeholder size when the
+        item has no flow widget.
+
+        """
+        if self._flow_widget is None:
+            if self._last_size.isValid():
+                return QSize(self._last_size)
+            return QSize(self._placeholder_size)
+        return super(QFlowItem, self).sizeHint()
 
     def event(self, event):
         """ A custom event handler which handles LayoutRequest events.
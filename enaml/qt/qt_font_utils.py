@@ -5,6 +5,7 @@
 from enaml.fonts import parse_font
 
 from .qt.QtGui import QFont, QApplication
+from .qt_resource_cache import QtGlobalResourceCache
 
 
 STYLE = {
@@ -93,8 +94,15 @@ UNIT_CONVERTERS = {
 
 
 class QtFontCache(object):
+    """ A cache which maps font strings and Font objects to QFonts.
 
-    def __init__(self, default=None):
+    The QFonts are stored in a bounded cache which is shared with the
+    other font caches and resource managers in the process. The cache
+    keys are scoped to the font cache, since the fonts it creates are
+    resolved against its default font.
+
+    """
+    def __init__(self, default=None, cache=None):
         """ Initialize a QFontCache.
 
         Parameters
@@ -102,23 +110,32 @@ class QtFontCache(object):
         default: QFont, optional
             The font to use to fill the default parameters of fonts.
 
+        cache : LRUCache, optional
+            The cache in which to store the fonts. The default is the
+            global Qt resource cache.
+
         """
+        if cache is None:
+            cache = QtGlobalResourceCache
         self._default = default
-        self._cache = {}  # XXX need an lru cache here.
+        self._cache = cache
+        self._cache_scope = object()
 
     def __getitem__(self, font):
         cache = self._cache
-        if font in cache:
-            return cache[font]
+        scope = self._cache_scope
+        qfont = cache.get((scope, font))
+        if qfont is not None:
+            return qfont
         if isinstance(font, basestring):
             font_ = parse_font(font)
             if font_ is None:
                 return self._default or QFont()
             qfont = self._make_qfont(font_)
-            cache[font] = cache[font_] = qfont
+            cache.put((scope, font_), qfont)
         else:
             qfont = self._make_qfont(font)
-            cache[font] = qfont
+        cache.put((scope, font), qfont)
         return qfont
 
     def _make_qfont(self, font):
@@ -2,14 +2,29 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from .qt.QtGui import QTextEdit
+import re
+
+from enaml.html_patch import patch_html
+
+from .qt.QtGui import QTextEdit, QTextCursor
 from .qt_control import QtControl
 
 
+#: A regex which matches a fragment which starts with a block element.
+#: Such a fragment is inserted into a new block, since a block inserted
+#: by QTextCursor.insertHtml is merged with the current block.
+_BLOCK_FRAGMENT_RE = re.compile(
+    r'\s*<(?:p|div|h[1-6]|ul|ol|li|dl|table|pre|blockquote|hr)\b', re.I
+)
+
+
 class QtHtml(QtControl):
     """ A Qt implementation of an Enaml HTML widget.
 
     """
+    #: The html source displayed by the widget.
+    _source = ''
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -37,6 +52,13 @@ class QtHtml(QtControl):
         """
         self.set_source(content['source'])
 
+    def on_action_patch_html(self, content):
+        """ Handle the 'patch_html' action from the Enaml widget.
+
+        """
+        self.patch_html(content['html'], content['element_id'],
+                        content['mode'])
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -44,5 +66,31 @@ class QtHtml(QtControl):
         """ Set the source of the html widget
 
         """
+        self._source = source
         self.widget().setHtml(source)
 
+    def patch_html(self, html, element_id, mode):
+        """ Insert an html fragment into an element of the source.
+
+        A fragment appended to the body is inserted at the end of the
+        document. A QTextDocument does not keep the ids of elements, so
+        any other patch reloads the patched source. The view stays
+        scrolled to the bottom if it was at the bottom before.
+
+        """
+        self._source = patch_html(self._source, element_id, html, mode)
+        widget = self.widget()
+        scroll_bar = widget.verticalScrollBar()
+        value = scroll_bar.value()
+        at_bottom = value == scroll_bar.maximum()
+        if not element_id and mode == 'append':
+            document = widget.document()
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            if not document.isEmpty() and _BLOCK_FRAGMENT_RE.match(html):
+                cursor.insertBlock()
+            cursor.insertHtml(html)
+        else:
+            widget.setHtml(self._source)
+        scroll_bar.setValue(scroll_bar.maximum() if at_bottom else value)
+
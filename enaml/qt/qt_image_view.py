@@ -4,6 +4,7 @@
 #------------------------------------------------------------------------------
 import logging
 
+from .qt.QtCore import Qt, Signal
 from .qt.QtGui import QFrame, QPainter, QImage, QPixmap
 from .qt_constraints_widget import size_hint_guard
 from .qt_control import QtControl
@@ -18,6 +19,9 @@ class QImageView(QFrame):
     how the image scales.
 
     """
+    #: A signal emitted when the widget is shown.
+    shown = Signal()
+
     def __init__(self, parent=None):
         """ Initialize a QImageView.
 
@@ -29,6 +33,7 @@ class QImageView(QFrame):
         """
         super(QImageView, self).__init__(parent)
         self._pixmap = None
+        self._scaled_pixmap = None
         self._scaled_contents = False
         self._allow_upscaling = False
         self._preserve_aspect_ratio = False
@@ -96,14 +101,37 @@ class QImageView(QFrame):
             paint_x = int((evt_width / 2. - paint_width / 2.) + evt_x)
             paint_y = int((evt_height / 2. - paint_height / 2.) + evt_y)
 
+        # The scaled pixmap is cached so that it is only rescaled when
+        # the paint size or the pixmap changes.
+        if paint_width != pm_width or paint_height != pm_height:
+            scaled = self._scaled_pixmap
+            if (scaled is None or scaled.width() != paint_width or
+                scaled.height() != paint_height):
+                scaled = pixmap.scaled(
+                    paint_width, paint_height, Qt.IgnoreAspectRatio,
+                    Qt.SmoothTransformation,
+                )
+                self._scaled_pixmap = scaled
+            pixmap = scaled
+        else:
+            self._scaled_pixmap = None
+
         # Finally, draw the pixmap into the calculated rect.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.drawPixmap(paint_x, paint_y, paint_width, paint_height, pixmap)
+        painter.drawPixmap(paint_x, paint_y, pixmap)
 
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
+    def showEvent(self, event):
+        """ Handle the show event for the widget.
+
+        This emits the `shown` signal.
+
+        """
+        super(QImageView, self).showEvent(event)
+        self.shown.emit()
+
     def sizeHint(self):
         """ Returns a appropriate size hint for the image based on the
         underlying QPixmap.
@@ -130,6 +158,7 @@ class QImageView(QFrame):
 
         """
         self._pixmap  = pixmap
+        self._scaled_pixmap = None
         self.update()
 
     def scaledContents(self):
@@ -205,6 +234,9 @@ class QtImageView(QtControl):
     #: Temporary internal storage for the image source url.
     _image_source = ''
 
+    #: The deferred resource for the image which is being loaded.
+    _loader = None
+
     #--------------------------------------------------------------------------
     # Setup methods
     #--------------------------------------------------------------------------
@@ -223,6 +255,7 @@ class QtImageView(QtControl):
         self.set_scale_to_fit(tree['scale_to_fit'])
         self.set_allow_upscaling(tree['allow_upscaling'])
         self.set_preserve_aspect_ratio(tree['preserve_aspect_ratio'])
+        self.widget().shown.connect(self.on_shown)
 
     def activate(self):
         """ Activate the image view.
@@ -234,6 +267,32 @@ class QtImageView(QtControl):
         self.set_source(self._image_source)
         super(QtImageView, self).activate()
 
+    def destroy(self):
+        """ A reimplemented destructor method.
+
+        This method cancels the load of a pending image.
+
+        """
+        loader = self._loader
+        if loader is not None:
+            self._loader = None
+            loader.cancel()
+        super(QtImageView, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_shown(self):
+        """ The signal handler for the 'shown' signal.
+
+        The priority of a pending image load is raised, since the
+        widget is rarely visible when the load is requested.
+
+        """
+        loader = self._loader
+        if loader is not None:
+            loader.raise_priority(1)
+
     #--------------------------------------------------------------------------
     # Message Handlers
     #--------------------------------------------------------------------------
@@ -291,12 +350,21 @@ class QtImageView(QtControl):
         """ Set the image source for the underlying widget.
 
         This will trigger a deferred load of the image pointed to by
-        the given source url.
+        the given source url, and cancel the load of the previous
+        source if it is still pending. The load is requested with a
+        higher priority if the widget is visible, and the priority is
+        raised when a hidden widget is shown.
 
         """
+        loader = self._loader
+        if loader is not None:
+            self._loader = None
+            loader.cancel()
         if source:
-            loader = self._session.load_resource(source)
+            metadata = {'priority': int(self.widget().isVisible())}
+            loader = self._session.load_resource(source, metadata)
             loader.on_load(self._on_image_load)
+            self._loader = loader
         else:
             self._on_image_load(QImage())
 
@@ -309,6 +377,8 @@ class QtImageView(QtControl):
         This method is invoked when the requested image is successfully
         loaded. It will update the image in the image view widget and
         issue a size hint updated event to the layout system if needed.
+        It is invoked for each preview of a progressively loaded image,
+        and then for the final image.
 
         Parameters
         ----------
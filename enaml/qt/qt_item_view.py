@@ -0,0 +1,153 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtGui import QAbstractItemView, QItemSelectionModel
+from .q_item_model_adapter import QItemModelAdapter
+from .qt_control import QtControl
+
+
+SELECTION_MODES = {
+    'single': QAbstractItemView.SingleSelection,
+    'extended': QAbstractItemView.ExtendedSelection,
+    'none': QAbstractItemView.NoSelection,
+}
+
+
+class QtItemView(QtControl):
+    """ A Qt implementation of an Enaml ItemView.
+
+    The widget is a Qt item view whose model is a QItemModelAdapter,
+    which fetches the rows of the server model as they are displayed.
+    Subclasses must implement `create_widget` to create the view.
+
+    """
+    #: Storage for the model adapter of the view.
+    _adapter = None
+
+    def create(self, tree):
+        """ Create and initialize the underlying control.
+
+        """
+        super(QtItemView, self).create(tree)
+        adapter = QItemModelAdapter(self.fetch_rows, self.widget())
+        adapter.set_prefetch(tree['prefetch'])
+        adapter.reset_model(
+            tree['row_count'], tree['column_count'], tree['headers'],
+        )
+        self._adapter = adapter
+        widget = self.widget()
+        widget.setModel(adapter)
+        self.set_selection_mode(tree['selection_mode'])
+        self.set_selected_rows(tree['selected_rows'])
+        widget.selectionModel().selectionChanged.connect(
+            self.on_selection_changed
+        )
+        widget.activated.connect(self.on_activated)
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_selection_changed(self):
+        """ The signal handler for the selection changed signal.
+
+        """
+        if 'selected_rows' not in self.loopback_guard:
+            model = self.widget().selectionModel()
+            rows = sorted(set(index.row() for index in model.selectedIndexes()))
+            self.send_action('selection_changed', {'rows': rows})
+
+    def on_activated(self, index):
+        """ The signal handler for the activated signal.
+
+        """
+        self.send_action('activated', {'row': index.row()})
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def fetch_rows(self, ranges, generation):
+        """ Send a request for a list of row ranges to the server.
+
+        This is called by the model adapter.
+
+        """
+        content = {'ranges': ranges, 'generation': generation}
+        self.send_action('fetch_rows', content)
+
+    #--------------------------------------------------------------------------
+    # Message Handlers
+    #--------------------------------------------------------------------------
+    def on_action_rows(self, content):
+        """ Handle the 'rows' action from the Enaml widget.
+
+        """
+        self._adapter.store_rows(content['ranges'], content['generation'])
+
+    def on_action_reset(self, content):
+        """ Handle the 'reset' action from the Enaml widget.
+
+        """
+        self._adapter.reset_model(
+            content['row_count'], content['column_count'], content['headers'],
+        )
+
+    def on_action_data_changed(self, content):
+        """ Handle the 'data_changed' action from the Enaml widget.
+
+        """
+        self._adapter.invalidate_rows(content['row'], content['count'])
+
+    def on_action_rows_inserted(self, content):
+        """ Handle the 'rows_inserted' action from the Enaml widget.
+
+        """
+        self._adapter.insert_rows(content['row'], content['count'])
+
+    def on_action_rows_removed(self, content):
+        """ Handle the 'rows_removed' action from the Enaml widget.
+
+        """
+        self._adapter.remove_rows(content['row'], content['count'])
+
+    def on_action_set_prefetch(self, content):
+        """ Handle the 'set_prefetch' action from the Enaml widget.
+
+        """
+        self._adapter.set_prefetch(content['prefetch'])
+
+    def on_action_set_selection_mode(self, content):
+        """ Handle the 'set_selection_mode' action from the Enaml widget.
+
+        """
+        self.set_selection_mode(content['selection_mode'])
+
+    def on_action_set_selected_rows(self, content):
+        """ Handle the 'set_selected_rows' action from the Enaml widget.
+
+        """
+        with self.loopback_guard('selected_rows'):
+            self.set_selected_rows(content['selected_rows'])
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_selection_mode(self, mode):
+        """ Set the selection mode of the underlying widget.
+
+        """
+        widget = self.widget()
+        widget.setSelectionMode(SELECTION_MODES[mode])
+        widget.setSelectionBehavior(QAbstractItemView.SelectRows)
+
+    def set_selected_rows(self, rows):
+        """ Set the selected rows of the underlying widget.
+
+        """
+        widget = self.widget()
+        model = widget.selectionModel()
+        model.clearSelection()
+        adapter = self._adapter
+        flags = QItemSelectionModel.Select | QItemSelectionModel.Rows
+        for row in rows:
+            model.select(adapter.index(row, 0), flags)
@@ -2,10 +2,21 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from .qt.QtCore import QSize
-from .qt.QtGui import QListWidget
+import logging
+
+from enaml.colors import parse_color
+
+from .qt.QtCore import Qt, QSize
+from .qt.QtGui import (
+    QListWidget, QListWidgetItem, QColor, QIcon, QPixmap, QImage
+)
 from .qt_control import QtControl
-from .qt_list_item import QtListItem
+from .qt_font_utils import QtFontCache
+from .qt_list_item import QtListItem, CHECKED_STATE
+from .qt_object import deferred_updates
+
+
+logger = logging.getLogger(__name__)
 
 
 VIEW_MODES = {
@@ -32,10 +43,47 @@ LAYOUT_MODES = {
 }
 
 
+#: The default values of the item data keys. They are used to reset the
+#: state of an item when its data is replaced.
+ITEM_DATA_DEFAULTS = {
+    'text': u'',
+    'tool_tip': u'',
+    'status_tip': u'',
+    'background': '',
+    'foreground': '',
+    'font': '',
+    'icon_source': '',
+    'checkable': False,
+    'checked': None,
+    'selectable': True,
+    'editable': False,
+    'enabled': True,
+    'visible': True,
+}
+
+
+#: The item flags which are controlled by the item data keys.
+ITEM_FLAGS = (
+    ('checkable', Qt.ItemIsUserCheckable),
+    ('selectable', Qt.ItemIsSelectable),
+    ('editable', Qt.ItemIsEditable),
+    ('enabled', Qt.ItemIsEnabled),
+)
+
+
 class QtListControl(QtControl):
     """ A Qt implementation of an Enaml ListControl.
 
     """
+    #: The number of data items at the end of the widget's rows.
+    _data_count = 0
+
+    #: The generation of the data items, echoed by the item events.
+    _items_generation = 0
+
+    #: The cache of fonts for the items, shared with the QtListItems.
+    _items_font_cache = None
+
     def create_widget(self, parent, tree):
         """ Create the underlying widget.
 
@@ -61,6 +109,8 @@ class QtListControl(QtControl):
         self.set_uniform_item_sizes(tree['uniform_item_sizes'])
         self.set_layout_mode(tree['layout_mode'])
         self.set_batch_size(tree['batch_size'])
+        self._init_items = tree['items']
+        self._items_generation = tree['items_generation']
 
     def init_layout(self):
         """ Initialize the layout of the underlying control.
@@ -72,6 +122,8 @@ class QtListControl(QtControl):
             if isinstance(child, QtListItem):
                 widget.addItem(child.create_item())
                 child.initialize_item()
+        self.insert_items(0, self._init_items)
+        del self._init_items
 
         # Late-bind the signal handlers to avoid doing any unnecessary
         # work while the child items are being intialized.
@@ -115,6 +167,16 @@ class QtListControl(QtControl):
         owner = getattr(item, 'item_owner', None)
         if owner is not None:
             owner.on_changed()
+        elif 'items' not in self.loopback_guard:
+            index = self._data_index(item)
+            if index >= 0:
+                content = {
+                    'index': index,
+                    'text': item.data(Qt.DisplayRole) or u'',
+                    'checked': CHECKED_STATE[item.data(Qt.CheckStateRole)],
+                    'generation': self._items_generation,
+                }
+                self.send_action('item_changed', content)
 
     def on_item_clicked(self, item):
         """ The signal handler for the `itemClicked` signal.
@@ -125,6 +187,13 @@ class QtListControl(QtControl):
         owner = getattr(item, 'item_owner', None)
         if owner is not None:
             owner.on_clicked()
+        else:
+            index = self._data_index(item)
+            if index >= 0:
+                content = {
+                    'index': index, 'generation': self._items_generation,
+                }
+                self.send_action('item_clicked', content)
 
     def on_item_double_clicked(self, item):
         """ The signal handler for the `itemDoubleClicked` signal.
@@ -135,6 +204,13 @@ class QtListControl(QtControl):
         owner = getattr(item, 'item_owner', None)
         if owner is not None:
             owner.on_double_clicked()
+        else:
+            index = self._data_index(item)
+            if index >= 0:
+                content = {
+                    'index': index, 'generation': self._items_generation,
+                }
+                self.send_action('item_double_clicked', content)
 
     #--------------------------------------------------------------------------
     # Message Handlers
@@ -146,6 +222,48 @@ class QtListControl(QtControl):
         """
         self.widget().scheduleDelayedItemsLayout()
 
+    @deferred_updates
+    def on_action_set_items(self, content):
+        """ Handle the 'set_items' action from the Enaml widget.
+
+        """
+        self._items_generation = content['generation']
+        self.remove_items(0, self._data_count)
+        self.insert_items(0, content['items'])
+
+    @deferred_updates
+    def on_action_insert_items(self, content):
+        """ Handle the 'insert_items' action from the Enaml widget.
+
+        """
+        self._items_generation = content['generation']
+        self.insert_items(content['index'], content['items'])
+
+    @deferred_updates
+    def on_action_remove_items(self, content):
+        """ Handle the 'remove_items' action from the Enaml widget.
+
+        """
+        self._items_generation = content['generation']
+        self.remove_items(content['index'], content['count'])
+
+    @deferred_updates
+    def on_action_move_items(self, content):
+        """ Handle the 'move_items' action from the Enaml widget.
+
+        """
+        self._items_generation = content['generation']
+        self.move_items(
+            content['index'], content['count'], content['destination'],
+        )
+
+    @deferred_updates
+    def on_action_update_items(self, content):
+        """ Handle the 'update_items' action from the Enaml widget.
+
+        """
+        self.update_items(content['index'], content['items'])
+
     def on_action_set_view_mode(self, content):
         """ Handle the 'set_view_mode' action from the Enaml widget.
 
@@ -207,6 +325,213 @@ class QtListControl(QtControl):
         """
         self.set_batch_size(content['batch_size'])
 
+    #--------------------------------------------------------------------------
+    # Data Item Methods
+    #--------------------------------------------------------------------------
+    def insert_items(self, index, items):
+        """ Insert data items into the underlying control.
+
+        When every item only has text, the items are created by the
+        widget with a single call to `insertItems`.
+
+        """
+        if not items:
+            return
+        widget = self.widget()
+        row = widget.count() - self._data_count + index
+        self._data_count += len(items)
+        with self.loopback_guard('items'):
+            if all(len(data) == 1 and 'text' in data for data in items):
+                widget.insertItems(row, [data['text'] for data in items])
+                return
+            for offset, data in enumerate(items):
+                item = QListWidgetItem()
+                widget.insertItem(row + offset, item)
+                self._apply_item_data(item, data, False)
+
+    def remove_items(self, index, count):
+        """ Remove a range of data items from the underlying control.
+
+        """
+        if count <= 0:
+            return
+        widget = self.widget()
+        self._data_count -= count
+        if self._data_count == 0 and widget.count() == count:
+            widget.clear()
+            return
+        row = widget.count() - self._data_count - count + index
+        widget.model().removeRows(row, count)
+
+    def move_items(self, index, count, destination):
+        """ Move a range of data items within the underlying control.
+
+        The widget model cannot move a block of rows, so the smaller of
+        the moved range and the range of items it passes over is taken
+        and reinserted on the other side.
+
+        """
+        if destination == index or count <= 0:
+            return
+        widget = self.widget()
+        offset = widget.count() - self._data_count
+        if destination > index:
+            passed = destination - index
+            if passed < count:
+                # Move the passed items in front of the moved range.
+                index, count, destination = index + count, passed, index
+        elif index - destination < count:
+            # Move the passed items behind the moved range.
+            index, count, destination = (
+                destination, index - destination, destination + count
+            )
+        row = offset + index
+        items = [widget.takeItem(row) for _ in xrange(count)]
+        row = offset + destination
+        for item in items:
+            widget.insertItem(row, item)
+            row += 1
+
+    def update_items(self, index, items):
+        """ Replace the data of a range of data items.
+
+        """
+        widget = self.widget()
+        row = widget.count() - self._data_count + index
+        with self.loopback_guard('items'):
+            for offset, data in enumerate(items):
+                item = widget.item(row + offset)
+                if item is not None:
+                    self._apply_item_data(item, data, True)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _data_index(self, item):
+        """ Get the data item index of a widget item.
+
+        Returns
+        -------
+        result : int
+            The index of the item relative to the first data item, or
+            -1 if the item is not a data item.
+
+        """
+        widget = self.widget()
+        index = widget.row(item) - (widget.count() - self._data_count)
+        return index if index >= 0 else -1
+
+    def _apply_item_data(self, item, data, reset):
+        """ Apply a dict of item data to a widget item.
+
+        Parameters
+        ----------
+        item : QListWidgetItem
+            The widget item to update.
+
+        data : dict
+            The item data sent by the Enaml widget.
+
+        reset : bool
+            Whether the keys which are not in the data should be reset
+            to their default values. This is False for new items, which
+            already have the default values.
+
+        """
+        if reset:
+            full = dict(ITEM_DATA_DEFAULTS)
+            full.update(data)
+            data = full
+        get = data.get
+        if 'text' in data:
+            item.setData(Qt.DisplayRole, get('text') or None)
+        if 'tool_tip' in data:
+            item.setData(Qt.ToolTipRole, get('tool_tip') or None)
+        if 'status_tip' in data:
+            item.setData(Qt.StatusTipRole, get('status_tip') or None)
+        if 'background' in data:
+            item.setData(Qt.BackgroundRole, self._qcolor(get('background')))
+        if 'foreground' in data:
+            item.setData(Qt.ForegroundRole, self._qcolor(get('foreground')))
+        if 'font' in data:
+            font = get('font')
+            if font:
+                cache = self._items_font_cache
+                if cache is None:
+                    cache = QtFontCache(self.widget().font())
+                    self._items_font_cache = cache
+                item.setData(Qt.FontRole, cache[font])
+            else:
+                item.setData(Qt.FontRole, None)
+        flags = item.flags()
+        for key, flag in ITEM_FLAGS:
+            if key in data:
+                if get(key):
+                    flags |= flag
+                else:
+                    flags &= ~flag
+        item.setFlags(flags)
+        if 'checked' in data:
+            item.setData(Qt.CheckStateRole, CHECKED_STATE[get('checked')])
+        if 'visible' in data:
+            item.setHidden(not get('visible'))
+        if 'icon_source' in data:
+            source = get('icon_source')
+            # The token identifies the latest icon request of the item,
+            # so that the result of an older request is ignored. The
+            # loader is kept by the item to pin the icon in the cache.
+            token = object()
+            item._icon_token = token if source else None
+            loader = None
+            if source:
+                loader = self._session.load_resource(source)
+                loader.on_load(
+                    lambda icon: self._on_icon_load(item, token, icon)
+                )
+            else:
+                item.setData(Qt.DecorationRole, None)
+            old_loader = getattr(item, '_icon_loader', None)
+            item._icon_loader = loader
+            if old_loader is not None:
+                old_loader.cancel()
+
+    def _qcolor(self, color):
+        """ Convert a CSS color string into a QColor or None.
+
+        """
+        if color:
+            rgba = parse_color(color)
+            if rgba is not None:
+                return QColor.fromRgbF(*rgba)
+        return None
+
+    def _on_icon_load(self, item, token, icon):
+        """ A private resource loader callback for a data item icon.
+
+        The icon is ignored if the item was removed from the widget or
+        has requested another icon since the load was started.
+
+        """
+        widget = self.widget()
+        if widget is None:
+            return
+        try:
+            if item.listWidget() is not widget:
+                return
+        except RuntimeError:
+            # The underlying item was deleted by the widget.
+            return
+        if getattr(item, '_icon_token', None) is not token:
+            return
+        if isinstance(icon, QImage):
+            icon = QIcon(QPixmap.fromImage(icon))
+        elif not isinstance(icon, QIcon):
+            msg = 'got incorrect type for icon: `%s`'
+            logger.error(msg % type(icon).__name__)
+            icon = None
+        with self.loopback_guard('items'):
+            item.setData(Qt.DecorationRole, icon)
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
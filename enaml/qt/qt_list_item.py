@@ -46,6 +46,10 @@ class QtListItem(QtObject):
     # Temporary internal storage for the icon source.
     _icon_source = None
 
+    # The deferred resource for the icon, which keeps the icon
+    # pinned in the resource cache while it is displayed.
+    _icon_loader = None
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -355,12 +359,17 @@ class QtListItem(QtObject):
         """ Set the icon source for the list item.
 
         """
+        loader = None
         if icon_source:
             loader = self._session.load_resource(icon_source)
             loader.on_load(self._on_icon_load)
         else:
             with self.loopback_guard('changed'):
                 self._item.setData(Qt.DecorationRole, None)
+        old_loader = self._icon_loader
+        self._icon_loader = loader
+        if old_loader is not None:
+            old_loader.cancel()
 
     def set_checkable(self, checkable):
         """ Set the checkable state for the list item.
@@ -0,0 +1,56 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtGui import QListView
+from .qt_item_view import QtItemView
+
+
+class QtListView(QtItemView):
+    """ A Qt implementation of an Enaml ListView.
+
+    """
+    def create_widget(self, parent, tree):
+        """ Create the underlying list view widget.
+
+        """
+        return QListView(parent)
+
+    def create(self, tree):
+        """ Create and initialize the underlying widget.
+
+        """
+        super(QtListView, self).create(tree)
+        self.set_uniform_item_sizes(tree['uniform_item_sizes'])
+        self.set_word_wrap(tree['word_wrap'])
+
+    #--------------------------------------------------------------------------
+    # Message Handlers
+    #--------------------------------------------------------------------------
+    def on_action_set_uniform_item_sizes(self, content):
+        """ Handle the 'set_uniform_item_sizes' action from the Enaml
+        widget.
+
+        """
+        self.set_uniform_item_sizes(content['uniform_item_sizes'])
+
+    def on_action_set_word_wrap(self, content):
+        """ Handle the 'set_word_wrap' action from the Enaml widget.
+
+        """
+        self.set_word_wrap(content['word_wrap'])
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_uniform_item_sizes(self, uniform):
+        """ Set the uniform item sizes flag on the underlying widget.
+
+        """
+        self.widget().setUniformItemSizes(uniform)
+
+    def set_word_wrap(self, wrap):
+        """ Set the word wrap on the underlying widget.
+
+        """
+        self.widget().setWordWrap(wrap)
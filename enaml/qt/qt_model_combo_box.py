@@ -0,0 +1,217 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtCore import QModelIndex, QTimer
+from .qt.QtGui import QComboBox, QCompleter, QStringListModel
+from .q_item_model_adapter import QItemModelAdapter
+from .qt_control import QtControl
+
+
+class QtModelComboBox(QtControl):
+    """ A Qt implementation of an Enaml ModelComboBox.
+
+    The model of the combo box is a QItemModelAdapter, which fetches
+    the items from the server as the popup displays them. The text
+    typed into the combo box is sent to the server as a search once
+    the user pauses, and the matches are shown in a completer popup.
+
+    """
+    #: Storage for the model adapter of the combo box.
+    _adapter = None
+
+    #: The timer which delays the search while the user is typing.
+    _search_timer = None
+
+    #: The number of the most recent search request.
+    _search_request = 0
+
+    #: The rows of the matches shown in the completer popup.
+    _search_rows = []
+
+    #--------------------------------------------------------------------------
+    # Setup Methods
+    #--------------------------------------------------------------------------
+    def create_widget(self, parent, tree):
+        """ Create the underlying combo box widget.
+
+        """
+        box = QComboBox(parent)
+        box.setEditable(True)
+        box.setInsertPolicy(QComboBox.NoInsert)
+        # Adjusting the size to the contents would fetch every item.
+        box.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLength)
+        box.setMinimumContentsLength(20)
+        box.view().setUniformItemSizes(True)
+        return box
+
+    def create(self, tree):
+        """ Create and initialize the underlying widget.
+
+        """
+        super(QtModelComboBox, self).create(tree)
+        widget = self.widget()
+        adapter = QItemModelAdapter(self.fetch_rows, widget)
+        adapter.set_prefetch(tree['prefetch'])
+        adapter.reset_model(
+            tree['row_count'], tree['column_count'], tree['headers'],
+        )
+        self._adapter = adapter
+        widget.setModel(adapter)
+
+        # The default completer of an editable combo box filters the
+        # whole model, so it is replaced by one which shows the matches
+        # found by the server.
+        completer = QCompleter(QStringListModel(widget), widget)
+        completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        completer.activated[QModelIndex].connect(self.on_match_activated)
+        widget.setCompleter(completer)
+
+        timer = self._search_timer = QTimer(widget)
+        timer.setSingleShot(True)
+        timer.timeout.connect(self.send_search)
+        self.set_search_delay(tree['search_delay'])
+        self.set_index(tree['index'])
+        widget.currentIndexChanged.connect(self.on_index_changed)
+        widget.lineEdit().textEdited.connect(self.on_text_edited)
+
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_index_changed(self):
+        """ The signal handler for the index changed signal.
+
+        """
+        if 'index' not in self.loopback_guard:
+            content = {'index': self.widget().currentIndex()}
+            self.send_action('index_changed', content)
+
+    def on_text_edited(self):
+        """ The signal handler for the text edited signal.
+
+        This restarts the search timer.
+
+        """
+        self._search_timer.start()
+
+    def on_match_activated(self, index):
+        """ The signal handler for the activation of a search match.
+
+        """
+        row = index.row()
+        if 0 <= row < len(self._search_rows):
+            self.widget().setCurrentIndex(self._search_rows[row])
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def fetch_rows(self, ranges, generation):
+        """ Send a request for a list of row ranges to the server.
+
+        This is called by the model adapter.
+
+        """
+        content = {'ranges': ranges, 'generation': generation}
+        self.send_action('fetch_rows', content)
+
+    def send_search(self):
+        """ Send a search for the text of the combo box to the server.
+
+        """
+        self._search_request += 1
+        content = {
+            'text': self.widget().lineEdit().text(),
+            'request': self._search_request,
+        }
+        self.send_action('search', content)
+
+    #--------------------------------------------------------------------------
+    # Message Handlers
+    #--------------------------------------------------------------------------
+    def on_action_rows(self, content):
+        """ Handle the 'rows' action from the Enaml widget.
+
+        """
+        self._adapter.store_rows(content['ranges'], content['generation'])
+
+    def on_action_search_results(self, content):
+        """ Handle the 'search_results' action from the Enaml widget.
+
+        The results of a search which has been superseded are ignored.
+
+        """
+        if content['request'] != self._search_request:
+            return
+        matches = content['matches']
+        self._search_rows = [row for row, value in matches]
+        completer = self.widget().completer()
+        model = completer.model()
+        model.setStringList([unicode(value) for row, value in matches])
+        if matches:
+            completer.complete()
+        else:
+            completer.popup().hide()
+
+    def on_action_reset(self, content):
+        """ Handle the 'reset' action from the Enaml widget.
+
+        """
+        with self.loopback_guard('index'):
+            self._adapter.reset_model(
+                content['row_count'], content['column_count'],
+                content['headers'],
+            )
+
+    def on_action_data_changed(self, content):
+        """ Handle the 'data_changed' action from the Enaml widget.
+
+        """
+        self._adapter.invalidate_rows(content['row'], content['count'])
+
+    def on_action_rows_inserted(self, content):
+        """ Handle the 'rows_inserted' action from the Enaml widget.
+
+        """
+        with self.loopback_guard('index'):
+            self._adapter.insert_rows(content['row'], content['count'])
+
+    def on_action_rows_removed(self, content):
+        """ Handle the 'rows_removed' action from the Enaml widget.
+
+        """
+        with self.loopback_guard('index'):
+            self._adapter.remove_rows(content['row'], content['count'])
+
+    def on_action_set_index(self, content):
+        """ Handle the 'set_index' action from the Enaml widget.
+
+        """
+        self.set_index(content['index'])
+
+    def on_action_set_prefetch(self, content):
+        """ Handle the 'set_prefetch' action from the Enaml widget.
+
+        """
+        self._adapter.set_prefetch(content['prefetch'])
+
+    def on_action_set_search_delay(self, content):
+        """ Handle the 'set_search_delay' action from the Enaml widget.
+
+        """
+        self.set_search_delay(content['search_delay'])
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_index(self, index):
+        """ Set the current index of the combo box.
+
+        """
+        with self.loopback_guard('index'):
+            self.widget().setCurrentIndex(index)
+
+    def set_search_delay(self, delay):
+        """ Set the delay before the typed text is searched.
+
+        """
+        self._search_timer.setInterval(delay)
@@ -2,7 +2,9 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from .qt.QtGui import QTextEdit
+from enaml.text_delta import apply_edits, text_edits
+
+from .qt.QtGui import QTextEdit, QTextCursor
 from .qt.QtCore import Signal, QTimer
 from .qt_control import QtControl
 
@@ -29,6 +31,23 @@ class QtMultilineField(QtControl):
     #: Whether or not to auto synchronize the text on change.
     _auto_sync_text = True
 
+    #: The version of the text last synchronized with the server. The
+    #: versions are only assigned by the server.
+    _text_version = 0
+
+    #: The text sent with the edits which the server has not yet
+    #: acknowledged, or None if there are no such edits.
+    _sent_text = None
+
+    #: Whether a sync was requested while edits were unacknowledged.
+    _sync_pending = False
+
+    #: The text last synchronized with the server.
+    _synced_text = u''
+
+    #: Whether the user has edited the text since the last sync.
+    _dirty = False
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -44,30 +63,52 @@ class QtMultilineField(QtControl):
         """
         super(QtMultilineField, self).create(tree)
         self._auto_sync_text = tree['auto_sync_text']
+        self._text_version = tree['text_version']
         self.set_text(tree['text'])
         self.set_read_only(tree['read_only'])
         widget = self.widget()
+        widget.textChanged.connect(self.on_text_edited)
         widget.delayedTextChanged.connect(self.on_text_changed)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _send_text_changed(self):
-        """ Send the current text as an update to the server widget.
+    def _send_text_edits(self):
+        """ Send the edits made by the user to the server widget.
+
+        Only one batch of edits is sent at a time, since the edits are
+        computed against the text of the last version acknowledged by
+        the server. Edits made while a batch is unacknowledged are sent
+        once the server replies.
 
         """
+        if self._sent_text is not None:
+            self._sync_pending = True
+            return
+        self._dirty = False
         text = self.widget().toPlainText()
-        self.send_action('text_changed', {'text': text})
+        edits = text_edits(self._synced_text, text)
+        if edits:
+            content = {'base': self._text_version, 'edits': edits}
+            self.send_action('edit_text', content)
+            self._sent_text = text
 
     #--------------------------------------------------------------------------
     # Signal Handlers
     #--------------------------------------------------------------------------
+    def on_text_edited(self):
+        """ The signal handler for 'textChanged' signal.
+
+        """
+        if 'text' not in self.loopback_guard:
+            self._dirty = True
+
     def on_text_changed(self):
         """ The signal handler for 'delayedTextChanged' signal.
 
         """
-        if self._auto_sync_text and 'text' not in self.loopback_guard:
-            self._send_text_changed()
+        if self._auto_sync_text and self._dirty:
+            self._send_text_edits()
 
     #--------------------------------------------------------------------------
     # Message Handlers
@@ -76,8 +117,45 @@ class QtMultilineField(QtControl):
         """ Handle the 'set_text' action from the Enaml widget.
 
         """
+        self._text_version = content.get('version', self._text_version)
+        self._sent_text = None
+        self._sync_pending = False
         self.set_text(content['text'])
 
+    def on_action_text_ack(self, content):
+        """ Handle the 'text_ack' action from the Enaml widget.
+
+        The server applied the edits which were last sent and assigned
+        them a new version. Any edits made since are sent next.
+
+        """
+        self._text_version = content['version']
+        self._synced_text = self._sent_text
+        self._sent_text = None
+        sync = self._sync_pending or self._auto_sync_text
+        self._sync_pending = False
+        if sync and self._dirty:
+            self._send_text_edits()
+
+    def on_action_edit_text(self, content):
+        """ Handle the 'edit_text' action from the Enaml widget.
+
+        The edits are only applied if they were made against the text
+        last synchronized with the server and the user has not edited
+        the text since. Otherwise, the server rejects the user edits,
+        which are sent now if they are not already in flight, and it
+        replies with its full text.
+
+        """
+        if (self._dirty or self._sent_text is not None or
+                content['base'] != self._text_version):
+            self._send_text_edits()
+            return
+        edits = content['edits']
+        self.apply_edits(edits)
+        self._text_version = content['version']
+        self._synced_text = apply_edits(self._synced_text, edits)
+
     def on_action_set_auto_sync_text(self, content):
         """ Handle the 'set_auto_sync_text' action from the Enaml widget.
 
@@ -94,7 +172,7 @@ class QtMultilineField(QtControl):
         """ Handle the 'sync_text' action from the Enaml widget.
 
         """
-        self._send_text_changed()
+        self._send_text_edits()
 
     #--------------------------------------------------------------------------
     # Widget Update Methods
@@ -103,8 +181,26 @@ class QtMultilineField(QtControl):
         """ Set the text in the underlying widget.
 
         """
+        self._dirty = False
+        self._synced_text = text
+        with self.loopback_guard('text'):
+            self.widget().setPlainText(text)
+
+    def apply_edits(self, edits):
+        """ Apply a list of text edits to the underlying widget.
+
+        The edits are applied with a cursor in a single undo block, so
+        the rest of the document is left untouched.
+
+        """
+        cursor = QTextCursor(self.widget().document())
         with self.loopback_guard('text'):
-            self.widget().setText(text)
+            cursor.beginEditBlock()
+            for position, removed, inserted in edits:
+                cursor.setPosition(position)
+                cursor.setPosition(position + removed, QTextCursor.KeepAnchor)
+                cursor.insertText(inserted)
+            cursor.endEditBlock()
 
     def set_read_only(self, read_only):
         """ Set whether or not the widget is read only.
@@ -9,6 +9,7 @@ from .qt.QtCore import Qt, QEvent, Signal
 from .qt.QtGui import QTabWidget, QTabBar, QResizeEvent, QApplication
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_page import QtPage
+from .realize_scheduler import RealizeScheduler
 
 
 TAB_POSITIONS = {
@@ -257,6 +258,9 @@ class QtNotebook(QtConstraintsWidget):
     """ A Qt implementation of an Enaml Notebook.
 
     """
+    #: The scheduler for the lazy realization of the pages.
+    _scheduler = None
+
     #--------------------------------------------------------------------------
     # Setup methods
     #--------------------------------------------------------------------------
@@ -281,6 +285,11 @@ class QtNotebook(QtConstraintsWidget):
         self.set_tab_position(tree['tab_position'])
         self.set_tabs_closable(tree['tabs_closable'])
         self.set_tabs_movable(tree['tabs_movable'])
+        self._scheduler = RealizeScheduler()
+        self.set_lazy(tree['lazy'])
+        self.set_prebuild_next(tree['prebuild_next'])
+        self.set_unrealize_delay(tree['unrealize_delay'])
+        self._init_page = tree['current_page']
 
     def init_layout(self):
         """ Handle the layout initialization for the notebook.
@@ -288,10 +297,51 @@ class QtNotebook(QtConstraintsWidget):
         """
         super(QtNotebook, self).init_layout()
         widget = self.widget()
+        init_page = self._init_page
+        del self._init_page
         for child in self.children():
             if isinstance(child, QtPage):
                 widget.addPage(child.widget())
+                if child.object_id() == init_page:
+                    widget.setCurrentWidget(child.widget())
         widget.layoutRequested.connect(self.on_layout_requested)
+        widget.currentChanged.connect(self.on_current_changed)
+
+    def activate(self):
+        """ Activate the notebook.
+
+        This informs the realize scheduler of the initial page.
+
+        """
+        super(QtNotebook, self).activate()
+        self.on_current_changed()
+
+    def destroy(self):
+        """ A reimplemented destructor method.
+
+        This method stops the pending timers of the realize scheduler.
+
+        """
+        self._scheduler.clear()
+        super(QtNotebook, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Utility Methods
+    #--------------------------------------------------------------------------
+    def page_at(self, index):
+        """ Get the QtPage for the tab at the given index.
+
+        Returns
+        -------
+        result : QtPage or None
+            The page for the tab, or None if there is no such tab.
+
+        """
+        qpage = self.widget().widget(index)
+        if qpage is not None:
+            for child in self.children():
+                if isinstance(child, QtPage) and child.widget() is qpage:
+                    return child
 
     #--------------------------------------------------------------------------
     # Child Events
@@ -301,6 +351,7 @@ class QtNotebook(QtConstraintsWidget):
 
         """
         if isinstance(child, QtPage):
+            self._scheduler.discard(child)
             self.widget().removePage(child.widget())
 
     def child_added(self, child):
@@ -321,6 +372,16 @@ class QtNotebook(QtConstraintsWidget):
         """
         self.size_hint_updated()
 
+    def on_current_changed(self):
+        """ Handle the `currentChanged` signal from the QNotebook.
+
+        """
+        index = self.widget().currentIndex()
+        page = self.page_at(index) if index != -1 else None
+        self._scheduler.show(page, self.page_at(index + 1))
+        page_id = page.object_id() if page is not None else None
+        self.send_action('current_page_changed', {'page_id': page_id})
+
     #--------------------------------------------------------------------------
     # Message Handlers
     #--------------------------------------------------------------------------
@@ -348,6 +409,24 @@ class QtNotebook(QtConstraintsWidget):
         """
         self.set_tabs_movable(content['tabs_movable'])
 
+    def on_action_set_lazy(self, content):
+        """ Handle the 'set_lazy' action from the Enaml widget.
+
+        """
+        self.set_lazy(content['lazy'])
+
+    def on_action_set_prebuild_next(self, content):
+        """ Handle the 'set_prebuild_next' action from the Enaml widget.
+
+        """
+        self.set_prebuild_next(content['prebuild_next'])
+
+    def on_action_set_unrealize_delay(self, content):
+        """ Handle the 'set_unrealize_delay' action from the Enaml widget.
+
+        """
+        self.set_unrealize_delay(content['unrealize_delay'])
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -375,3 +454,20 @@ class QtNotebook(QtConstraintsWidget):
         """
         self.widget().setMovable(movable)
 
+    def set_lazy(self, lazy):
+        """ Set whether the pages are realized lazily.
+
+        """
+        self._scheduler.lazy = lazy
+
+    def set_prebuild_next(self, prebuild):
+        """ Set whether the next page is realized while idle.
+
+        """
+        self._scheduler.prebuild_next = prebuild
+
+    def set_unrealize_delay(self, delay):
+        """ Set the delay before a hidden page is unrealized.
+
+        """
+        self._scheduler.unrealize_delay = delay
@@ -285,6 +285,10 @@ class QtPage(QtWidget):
     #: Temporary internal storage for the icon source url.
     _icon_source = ''
 
+    #: The deferred resource for the icon, which keeps the icon
+    #: pinned in the resource cache while it is displayed.
+    _icon_loader = None
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -433,11 +437,16 @@ class QtPage(QtWidget):
         """ Sets the widget's icon to the provided image.
 
         """
+        loader = None
         if icon_source:
             loader = self._session.load_resource(icon_source)
             loader.on_load(self._on_icon_load)
         else:
             self._on_icon_load(QIcon())
+        old_loader = self._icon_loader
+        self._icon_loader = loader
+        if old_loader is not None:
+            old_loader.cancel()
 
     #--------------------------------------------------------------------------
     # Private API
@@ -4,7 +4,7 @@
 #------------------------------------------------------------------------------
 import logging
 
-from .qt.QtGui import QImage, QIcon, QPixmap
+from .qt.QtGui import QImage, QIcon, QPixmap, qRgb
 
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,74 @@ _ICON_STATE_MAP = {
 }
 
 
+_ARRAY_FORMAT_MAP = {
+    1: QImage.Format_Indexed8,
+    3: QImage.Format_RGB888,
+    4: QImage.Format_ARGB32,
+}
+
+
+_GRAY_COLOR_TABLE = [qRgb(i, i, i) for i in xrange(256)]
+
+
+def convert_array_image(image):
+    """ Convert the given 'array' format image dict into a QImage.
+
+    The QImage is created over the buffer of the image data. The data
+    is a numpy array when the client is in-process, and a bytestring of
+    packed rows when it was sent by a remote server. RGB and grayscale
+    data are used without copying, and the data is kept alive on the
+    QImage wrapper. Grayscale data is wrapped as an indexed image with
+    a gray color table. RGBA data is converted to a format supported by
+    Qt 4, which makes a copy owned by the QImage.
+
+    An array whose pixels are not packed within its rows, such as a
+    column slice or a transposed array, is first copied into a C
+    contiguous array, since Qt only supports a row stride.
+
+    Parameters
+    ----------
+    image : dict
+        A dictionary representation of an Enaml Image with an 'array'
+        format.
+
+    Returns
+    -------
+    result : QImage
+        The QImage instance for the given Enaml image dict.
+
+    """
+    data = image['data']
+    width, height = image['size']
+    channels = image['channels']
+    strides = getattr(data, 'strides', None)
+    if strides is not None:
+        packed = (
+            strides[0] >= width * channels and
+            (len(strides) < 2 or strides[1] == channels) and
+            (len(strides) < 3 or strides[2] == 1)
+        )
+        if not packed:
+            import numpy
+            data = numpy.ascontiguousarray(data)
+            strides = data.strides
+        stride = strides[0]
+    else:
+        stride = len(data) // height
+    qimage = QImage(data, width, height, stride, _ARRAY_FORMAT_MAP[channels])
+    if channels == 4:
+        # Qt 4 has no RGBA byte order format. On a little-endian host,
+        # RGBA bytes read as ARGB32 have the red and blue swapped. The
+        # swapped image owns a copy of the data.
+        return qimage.rgbSwapped()
+    if channels == 1:
+        qimage.setColorTable(_GRAY_COLOR_TABLE)
+    # The QImage does not own the buffer, so the data is kept alive
+    # for as long as the image wrapper.
+    qimage._enaml_array_data = data
+    return qimage
+
+
 def convert_from_Image(image):
     """ Convert the given resource dict into a QImage.
 
@@ -39,6 +107,8 @@ def convert_from_Image(image):
 
     """
     format = image['format']
+    if format == 'array':
+        return convert_array_image(image)
     if format == 'auto':
         format = ''
     return QImage.fromData(image['data'], format)
@@ -0,0 +1,51 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from enaml.lru_cache import LRUCache
+
+from .qt.QtGui import QFont, QIcon, QImage, QPixmap
+
+
+#: The default budget of the global resource cache, in bytes.
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+#: The nominal size, in bytes, charged for a QFont. A QFont is a small
+#: handle to shared font data; the nominal size keeps the number of
+#: cached fonts bounded without dominating the budget.
+FONT_BYTES = 256
+
+
+def resource_size(resource):
+    """ Estimate the memory used by a Qt resource handle.
+
+    Parameters
+    ----------
+    resource : object
+        A QImage, QPixmap, QIcon or QFont handle.
+
+    Returns
+    -------
+    result : int
+        The estimated size of the resource in bytes. Unknown resource
+        types are charged a single byte.
+
+    """
+    if isinstance(resource, QImage):
+        return resource.byteCount()
+    if isinstance(resource, QPixmap):
+        return resource.width() * resource.height() * resource.depth() / 8
+    if isinstance(resource, QIcon):
+        size = 0
+        for qsize in resource.availableSizes():
+            size += qsize.width() * qsize.height() * 4
+        return size
+    if isinstance(resource, QFont):
+        return FONT_BYTES
+    return 1
+
+
+#: The resource cache shared by the resource managers and font caches
+#: of every Qt session in the process.
+QtGlobalResourceCache = LRUCache(DEFAULT_CACHE_BYTES, resource_size)
@@ -4,11 +4,13 @@
 #------------------------------------------------------------------------------
 import logging
 from urlparse import urlparse
+from weakref import ref
 
 from enaml.utils import id_generator
 
 from .q_deferred_caller import deferredCall
 from .qt_resource import convert_resource
+from .qt_resource_cache import QtGlobalResourceCache
 
 
 logger = logging.getLogger(__name__)
@@ -26,19 +28,29 @@ class DeferredResource(object):
     Loading occurs asynchronously. This object allows a widget to supply
     a callback to be invoked when the resource is loaded.
 
+    Once the resource is loaded, it is pinned in the resource cache for
+    as long as the deferred resource is alive, so a consumer should hold
+    on to the deferred resource while it uses the resource, and release
+    it when the resource is no longer used.
+
     """
-    __slots__ = ('_callback')
+    __slots__ = (
+        '_callback', '_canceller', '_prioritizer', '_releaser', '__weakref__'
+    )
 
     def __init__(self):
         """ Initialize a DeferredResource.
 
         """
         self._callback = None
+        self._canceller = None
+        self._prioritizer = None
+        self._releaser = None
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _notify(self, resource):
+    def _notify(self, resource, final=True):
         """ Notify the consumer that the resource is available.
 
         This method is invoked directly by a `QtResourceManager`. It
@@ -49,9 +61,17 @@ class DeferredResource(object):
         resource : object
             An object of the appropriate type for the requested resource.
 
+        final : bool, optional
+            Whether this is the final resource for the request. If False,
+            the resource is a preview and the callback will be invoked
+            again with the final resource. The default is True.
+
         """
         callback = self._callback
-        self._callback = None
+        if final:
+            self._callback = None
+            self._canceller = None
+            self._prioritizer = None
         if callback is not None:
             callback(resource)
 
@@ -65,22 +85,86 @@ class DeferredResource(object):
         ----------
         callback : callable
             A callable which accepts a single argument, which is the
-            resource object loaded for the requested resource.
+            resource object loaded for the requested resource. If the
+            resource is loaded progressively, the callable is invoked
+            with each preview and then with the final resource.
 
         """
         self._callback = callback
 
+    def cancel(self):
+        """ Cancel the loading of the resource.
+
+        The load callback will not be invoked. If no other consumer is
+        waiting for the same resource, the request to the server is
+        cancelled. If the resource is already loaded, it is released.
+
+        """
+        self._callback = None
+        self._prioritizer = None
+        canceller = self._canceller
+        self._canceller = None
+        if canceller is not None:
+            canceller(self)
+        self.release()
+
+    def release(self):
+        """ Release the pin of the loaded resource in the cache.
+
+        This is called automatically when the deferred resource is
+        garbage collected.
+
+        """
+        releaser = self._releaser
+        self._releaser = None
+        if releaser is not None:
+            releaser()
+
+    def raise_priority(self, priority):
+        """ Raise the priority of the request for the resource.
+
+        This has no effect if the resource has already been loaded.
+
+        Parameters
+        ----------
+        priority : int
+            The new priority for the request.
+
+        """
+        prioritizer = self._prioritizer
+        if prioritizer is not None:
+            prioritizer(priority)
+
 
 class QtResourceManager(object):
     """ An object which manages requesting urls from the server session.
 
+    The loaded resource handles are stored in a cache which is shared by
+    the resource managers of every session in the process, and which is
+    bounded by the memory used by the handles. The cache keys are scoped
+    to the manager, since each session resolves urls independently. A
+    handle is pinned in the cache while a `DeferredResource` to which it
+    was delivered is alive, and the handles of the manager are purged
+    from the cache when the manager is closed.
+
     """
-    def __init__(self):
+    def __init__(self, cache=None):
         """ Initialize a QtResourceManager.
 
+        Parameters
+        ----------
+        cache : LRUCache, optional
+            The cache in which to store the loaded resource handles.
+            The default is the global Qt resource cache.
+
         """
-        self._handles = {}
+        if cache is None:
+            cache = QtGlobalResourceCache
+        self._cache = cache
+        self._cache_scope = object()
         self._pending = {}
+        self._requests = {}
+        self._pins = {}
 
     def load(self, url, metadata, request):
         """ Load the resource handle for the given url.
@@ -100,7 +184,9 @@ class QtResourceManager(object):
 
         request : URLRequest
             An URLRequest instance to use for making requests from the
-            server side session, if such requests are required.
+            server side session, if such requests are required. It is
+            also used to cancel the request if every consumer of the
+            resource cancels its load.
 
         Returns
         -------
@@ -117,26 +203,31 @@ class QtResourceManager(object):
             logger.error(msg % url)
             return loader
         keyval = key_handler(metadata)
-        key = (url, keyval)
-        handles = self._handles
-        if key in handles:
-            deferredCall(loader._notify, handles[key])
+        key = (self._cache_scope, url, keyval)
+        handle = self._cache.get(key)
+        if handle is not None:
+            self._pin(key, loader)
+            deferredCall(loader._notify, handle)
             return loader
         pending = self._pending
+        loader._canceller = lambda loader: self._cancel(key, loader)
+        loader._prioritizer = lambda p: self._raise_priority(key, p)
         if key in pending:
             pending[key].append(loader)
             return loader
         req_id = req_id_generator.next()
         pending[req_id] = key
         pending[key] = [loader]
+        self._requests[key] = (req_id, request)
         request(req_id, url, metadata)
         return loader
 
-    def on_load(self, req_id, url, resource):
+    def on_load(self, req_id, url, resource, final=True):
         """ Handle the loading of a requested resource.
 
         This method is called by the QtSession object when it receives
-        a reply for a previously requested resource.
+        a reply for a previously requested resource. Preview resources
+        are delivered to the waiting loaders, but are not cached.
 
         Parameters
         ----------
@@ -149,18 +240,33 @@ class QtResourceManager(object):
         resource : dict
             The dictionary representation of the loaded resource.
 
+        final : bool, optional
+            Whether this is the final resource for the request. The
+            default is True.
+
         """
         pending = self._pending
+        if not final:
+            key = pending.get(req_id)
+            loaders = pending.get(key)
+            if loaders:
+                qt_resource = convert_resource(resource)
+                if qt_resource is not None:
+                    for loader in loaders[:]:
+                        loader._notify(qt_resource, False)
+            return
         if req_id in pending:
             key = pending.pop(req_id)
+            self._requests.pop(key, None)
             if key in pending:
                 loaders = pending.pop(key)
             else:
                 loaders = ()
             qt_resource = convert_resource(resource)
             if qt_resource is not None:
-                self._handles[key] = qt_resource
+                self._cache.put(key, qt_resource)
                 for loader in loaders:
+                    self._pin(key, loader)
                     loader._notify(qt_resource)
 
     def on_fail(self, req_id, url):
@@ -186,12 +292,78 @@ class QtResourceManager(object):
         pending = self._pending
         if req_id in pending:
             key = pending.pop(req_id)
+            self._requests.pop(key, None)
             if key in pending:
                 del pending[key]
 
+    def close(self):
+        """ Close the resource manager.
+
+        This is called by the QtSession when it is closed. The handles
+        of the manager are purged from the cache, whether or not they
+        are still pinned, and pending requests are abandoned.
+
+        """
+        scope = self._cache_scope
+        self._cache.purge(lambda key: key[0] is scope)
+        self._pending.clear()
+        self._requests.clear()
+        self._pins.clear()
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _pin(self, key, loader):
+        """ Pin a cached handle for a loader to which it is delivered.
+
+        The pin is released when the loader is released or garbage
+        collected.
+
+        """
+        cache = self._cache
+        pins = self._pins
+
+        def release(loader_ref):
+            if pins.pop(loader_ref, None) is not None:
+                cache.unpin(key)
+
+        cache.pin(key)
+        loader_ref = ref(loader, release)
+        pins[loader_ref] = key
+        loader._releaser = lambda: release(loader_ref)
+
+    def _cancel(self, key, loader):
+        """ Cancel the load of a resource by a deferred loader.
+
+        This is invoked by `DeferredResource.cancel`. The request to
+        the server is cancelled when it has no remaining loaders.
+
+        """
+        pending = self._pending
+        loaders = pending.get(key)
+        if loaders is None:
+            return
+        if loader in loaders:
+            loaders.remove(loader)
+        if not loaders:
+            del pending[key]
+            req_id, request = self._requests.pop(key)
+            del pending[req_id]
+            request.cancel(req_id)
+
+    def _raise_priority(self, key, priority):
+        """ Raise the priority of the server request for a resource.
+
+        This is invoked by `DeferredResource.raise_priority`.
+
+        """
+        item = self._requests.get(key)
+        if item is not None:
+            req_id, request = item
+            raise_priority = getattr(request, 'raise_priority', None)
+            if raise_priority is not None:
+                raise_priority(req_id, priority)
+
     def _make_image_key(self, metadata):
         """ Make a key value for the image metadata.
 
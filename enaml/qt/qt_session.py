@@ -2,11 +2,11 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from collections import defaultdict
 import logging
 
 from enaml.utils import make_dispatcher
 
+from .q_deferred_caller import deferredCall
 from .qt_resource_manager import QtResourceManager
 from .qt_widget_registry import QtWidgetRegistry
 
@@ -59,6 +59,34 @@ class URLRequest(object):
         session = self._session
         session.send(session._session_id, 'url_request', content)
 
+    def cancel(self, req_id):
+        """ Cancel a previous request for a url resource.
+
+        Parameters
+        ----------
+        req_id : str
+            The unique identifier of the request to cancel.
+
+        """
+        session = self._session
+        session.send(session._session_id, 'url_cancel', {'id': req_id})
+
+    def raise_priority(self, req_id, priority):
+        """ Raise the priority of a previous request for a url resource.
+
+        Parameters
+        ----------
+        req_id : str
+            The unique identifier of the request.
+
+        priority : int
+            The new priority for the request.
+
+        """
+        content = {'id': req_id, 'priority': priority}
+        session = self._session
+        session.send(session._session_id, 'url_priority', content)
+
 
 class QtSession(object):
     """ An object which manages a session of Qt client objects.
@@ -303,7 +331,8 @@ class QtSession(object):
         manager = self._resource_manager
         if status == 'ok':
             resource = content['resource']
-            manager.on_load(req_id, url, resource)
+            final = content.get('final', True)
+            manager.on_load(req_id, url, resource, final)
         else:
             manager.on_fail(req_id, url)
 
@@ -313,26 +342,98 @@ class QtSession(object):
         Actions sent to the message batch are processed in the following
         order 'children_changed' -> 'destroy' -> 'relayout' -> other...
 
+        Updates are disabled on the affected top-level windows until the
+        next cycle of the event loop. Messages for objects destroyed by
+        the batch are dropped, and the relayout actions are collapsed so
+        that each layout owner is relaid out only once.
+
         """
-        actions = defaultdict(list)
+        children = []
+        destroys = []
+        relayouts = []
+        others = []
+        groups = {
+            'children_changed': children,
+            'destroy': destroys,
+            'relayout': relayouts,
+        }
         for item in content['batch']:
-            action = item[1]
-            actions[action].append(item)
-        ordered = []
-        batch_order = ('children_changed', 'destroy', 'relayout')
-        for key in batch_order:
-            ordered.extend(actions.pop(key, ()))
-        for value in actions.itervalues():
-            ordered.extend(value)
+            groups.get(item[1], others).append(item)
+
         objects = self._registered_objects
-        for object_id, action, msg_content in ordered:
+        destroyed = set()
+        windows = set()
+
+        def resolve(item):
+            object_id, action = item[0], item[1]
+            if object_id in destroyed:
+                return None
             try:
                 obj = objects[object_id]
             except KeyError:
                 msg = "Invalid object id sent to QtSession %s:%s"
                 logger.warn(msg % (object_id, action))
-            else:
-                dispatch_action(obj, action, msg_content)
+                return None
+            root = obj
+            while root._parent is not None:
+                root = root._parent
+            if root not in windows:
+                windows.add(root)
+                widget = root.widget()
+                if widget is not None and widget.isWidgetType():
+                    if widget.updatesEnabled():
+                        widget.setUpdatesEnabled(False)
+                        deferredCall(widget.setUpdatesEnabled, True)
+            return obj
+
+        dispatch = dispatch_action
+
+        for item in children:
+            obj = resolve(item)
+            if obj is not None:
+                dispatch(obj, item[1], item[2])
+
+        for item in destroys:
+            obj = resolve(item)
+            if obj is not None:
+                stack = [obj]
+                while stack:
+                    child = stack.pop()
+                    destroyed.add(child._object_id)
+                    stack.extend(child._children)
+                dispatch(obj, item[1], item[2])
+
+        # The layout state for every relayout action is updated first,
+        # then each distinct layout owner is relaid out exactly once,
+        # starting with the deepest owners so that their new size hints
+        # are available when their ancestors are relaid out. A nested
+        # owner still notifies its ancestors of a new size hint, which
+        # updates the size hint caches of the widgets between them and
+        # only replaces constraints in the ancestor's existing layout.
+        owners = {}
+        for item in relayouts:
+            obj = resolve(item)
+            if obj is None:
+                continue
+            if not hasattr(obj, 'update_layout_info'):
+                dispatch(obj, item[1], item[2])
+                continue
+            obj.update_layout_info(item[2])
+            owner = obj.relayout_owner()
+            if owner is not None and owner not in owners:
+                depth = 0
+                parent = owner._parent
+                while parent is not None:
+                    depth += 1
+                    parent = parent._parent
+                owners[owner] = depth
+        for owner in sorted(owners, key=owners.__getitem__, reverse=True):
+            owner.relayout()
+
+        for item in others:
+            obj = resolve(item)
+            if obj is not None:
+                dispatch(obj, item[1], item[2])
 
     def on_action_close(self, content):
         """ Handle the 'close' action sent by the Enaml session.
@@ -342,6 +443,7 @@ class QtSession(object):
             window.destroy()
         self._windows = []
         self._registered_objects = {}
+        self._resource_manager.close()
         self._resource_manager = None
         self._socket.on_message(None)
         self._socket = None
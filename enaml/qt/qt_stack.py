@@ -2,15 +2,20 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
+from time import time
+
 from .qt.QtCore import QTimer, QEvent, Signal
-from .qt.QtGui import QStackedWidget, QPixmap
+from .qt.QtGui import QStackedWidget, QPixmap, QWidget
 from .qt_constraints_widget import QtConstraintsWidget
 from .qt_stack_item import QtStackItem
+from .q_deferred_caller import deferredCall
 from .q_pixmap_painter import QPixmapPainter
 from .q_pixmap_transition import (
     QDirectedTransition, QSlideTransition, QWipeTransition, QIrisTransition,
     QFadeTransition, QCrossFadeTransition
 )
+from .realize_scheduler import RealizeScheduler
+from .transition_cache import FrameRateGate, PixmapCache
 
 
 _TRANSITION_TYPES = {
@@ -30,6 +35,21 @@ _TRANSITION_DIRECTIONS = {
 }
 
 
+#: The events on a stack item or any of its descendants which
+#: invalidate the cached pixmap of the item.
+_INVALIDATING_EVENTS = (
+    QEvent.Paint, QEvent.Resize, QEvent.LayoutRequest, QEvent.Show,
+    QEvent.ChildAdded, QEvent.ChildRemoved, QEvent.EnabledChange,
+    QEvent.FontChange, QEvent.PaletteChange, QEvent.StyleChange,
+)
+
+
+#: The events on a descendant of a stack item which invalidate the
+#: cached pixmap of the item. A stack item is hidden at the end of a
+#: transition, which must not invalidate the pixmap of the item.
+_DESCENDANT_EVENTS = (QEvent.ShowToParent, QEvent.HideToParent)
+
+
 def make_transition(info):
     """ Make a QPixmapTransition from a description dictionary.
 
@@ -62,6 +82,21 @@ def make_transition(info):
 class QStack(QStackedWidget):
     """ A QStackedWidget subclass which adds support for transitions.
 
+    The pixmap rendered for a widget at the start of a transition is
+    cached, and is reused by later transitions until the widget or any
+    of its descendants repaints, changes its size, layout, children,
+    visibility, style or enabled state. Rendering a complex widget is
+    typically the most expensive part of a transition, so most
+    transitions only render the current widget.
+
+    A hidden widget does not repaint, so a change to a hidden widget
+    which only repaints it, such as new text of a fixed size field, is
+    not seen and a stale pixmap may be reused. Such changes should be
+    reported with `invalidatePixmapCache`.
+
+    The frame rate of each transition is measured, and transitions are
+    skipped while it is below the minimum frame rate of the stack.
+
     """
     #: A signal emitted when a LayoutRequest event is posted to the
     #: stack widget. This will typically occur when the size hint of
@@ -82,6 +117,11 @@ class QStack(QStackedWidget):
         self._painter = None
         self._transition = None
         self._transition_index = 0
+        self._pixmap_cache = PixmapCache()
+        self._frame_gate = FrameRateGate()
+        self._grabbing = False
+        self._frames = 0
+        self._started = 0.0
 
     #--------------------------------------------------------------------------
     # Private API
@@ -97,6 +137,7 @@ class QStack(QStackedWidget):
         if painter is not None:
             painter.setTargetWidget(None)
         self._painter = None
+        self._frame_gate.record(self._frames, time() - self._started)
         self.setCurrentIndex(self._transition_index)
         # This final show() makes sure the underlyling widget is visible.
         # If transitions are being fired rapidly, it's possible that the
@@ -122,22 +163,23 @@ class QStack(QStackedWidget):
         if from_index == to_index:
             return
 
-        # If there is no transition applied, just change the index.
+        # If there is no transition applied, or if the transitions are
+        # too slow to be worth running, just change the index.
         transition = self._transition
-        if transition is None:
+        if transition is None or self._frame_gate.should_skip():
             self.setCurrentIndex(to_index)
             return
 
-        # Otherwise, grab the pixmaps for the start and ending states
-        # and set them on the transtion. The widgets are resized to the
-        # current size so that the pixmaps are grabbed in a good state.
+        # Otherwise, get the pixmaps for the start and ending states
+        # and set them on the transtion. The time spent rendering the
+        # pixmaps counts against the frame rate of the transition.
+        self._started = time()
+        self._frames = 0
         src_widget = self.widget(from_index)
         dst_widget = self.widget(to_index)
         size = self.size()
-        src_widget.resize(size)
-        dst_widget.resize(size)
-        src_pixmap = QPixmap.grabWidget(src_widget)
-        dst_pixmap = QPixmap.grabWidget(dst_widget)
+        src_pixmap = self._widgetPixmap(src_widget, size)
+        dst_pixmap = self._widgetPixmap(dst_widget, size)
         out_pixmap = QPixmap(size)
         transition.setPixmaps(src_pixmap, dst_pixmap, out_pixmap)
 
@@ -152,6 +194,66 @@ class QStack(QStackedWidget):
         transition.pixmapUpdated.connect(painter.drawPixmap)
         transition.start()
 
+    def _onPixmapUpdated(self):
+        """ A signal handler for the `pixmapUpdated` signal of the
+        transition.
+
+        This counts the frames drawn by the running transition.
+
+        """
+        self._frames += 1
+
+    def _trackWidget(self, widget, track=True):
+        """ Install or remove the event filter on a widget and all of
+        its descendant widgets.
+
+        """
+        widgets = [widget] + widget.findChildren(QWidget)
+        for child in widgets:
+            if track:
+                child.installEventFilter(self)
+            else:
+                child.removeEventFilter(self)
+
+    def _stackItem(self, obj):
+        """ Get the widget of the stack which contains an object.
+
+        Returns
+        -------
+        result : QWidget or None
+            The widget of the stack which is or contains the object, or
+            None if the object is not in the stack.
+
+        """
+        while obj is not None:
+            parent = obj.parent()
+            if parent is self:
+                return obj
+            obj = parent
+
+    def _widgetPixmap(self, widget, size):
+        """ Get the pixmap for a widget rendered at a given size.
+
+        The widget is resized to the given size so that the pixmap is
+        rendered in a good state. A cached pixmap is returned if the
+        widget has not repainted since it was rendered.
+
+        """
+        widget.resize(size)
+        cache = self._pixmap_cache
+        key = (size.width(), size.height())
+        pixmap = cache.get(widget, key)
+        if pixmap is None:
+            # Rendering the widget sends it paint events, which must
+            # not invalidate the pixmap being rendered.
+            self._grabbing = True
+            try:
+                pixmap = QPixmap.grabWidget(widget)
+            finally:
+                self._grabbing = False
+            cache.put(widget, key, pixmap)
+        return pixmap
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
@@ -168,6 +270,107 @@ class QStack(QStackedWidget):
             self.layoutRequested.emit()
         return res
 
+    def eventFilter(self, obj, event):
+        """ Filter the events for the widgets of the stack and their
+        descendants.
+
+        An event which indicates that a widget or one of its descendants
+        has repainted or changed invalidates the cached pixmap of the
+        widget. A widget which is added to a descendant is tracked.
+
+        """
+        if self._grabbing:
+            return False
+        event_type = event.type()
+        if event_type == QEvent.ChildAdded:
+            child = event.child()
+            if child.isWidgetType():
+                self._trackWidget(child)
+        if event_type in _INVALIDATING_EVENTS:
+            item = self._stackItem(obj)
+        elif event_type in _DESCENDANT_EVENTS:
+            item = self._stackItem(obj)
+            if item is obj:
+                item = None
+        else:
+            item = None
+        if item is not None:
+            self._pixmap_cache.invalidate(item)
+        return False
+
+    def addWidget(self, widget):
+        """ Add a widget to the end of the stack.
+
+        This is reimplemented to track the changes of the widget.
+
+        """
+        self._trackWidget(widget)
+        return super(QStack, self).addWidget(widget)
+
+    def insertWidget(self, index, widget):
+        """ Insert a widget into the stack at a given index.
+
+        This is reimplemented to track the changes of the widget.
+
+        """
+        self._trackWidget(widget)
+        return super(QStack, self).insertWidget(index, widget)
+
+    def removeWidget(self, widget):
+        """ Remove a widget from the stack.
+
+        This is reimplemented to discard the cached widget pixmap.
+
+        """
+        self._trackWidget(widget, False)
+        self._pixmap_cache.invalidate(widget)
+        super(QStack, self).removeWidget(widget)
+
+    def invalidatePixmapCache(self, widget=None):
+        """ Discard the cached pixmaps of the widgets.
+
+        This should be called when a hidden widget has changed in a way
+        which is not seen by the event filter of the stack, such as a
+        repaint of a descendant with new contents of the same size.
+
+        Parameters
+        ----------
+        widget : QWidget, optional
+            The widget whose pixmaps should be discarded. The default
+            discards the pixmaps of all of the widgets.
+
+        """
+        if widget is None:
+            self._pixmap_cache.clear()
+        else:
+            self._pixmap_cache.invalidate(widget)
+
+    def minimumFps(self):
+        """ Get the minimum frame rate at which transitions are run.
+
+        Returns
+        -------
+        result : float
+            The minimum frame rate. A value of 0 means transitions are
+            never skipped.
+
+        """
+        return self._frame_gate.minimum_fps
+
+    def setMinimumFps(self, fps):
+        """ Set the minimum frame rate at which transitions are run.
+
+        Parameters
+        ----------
+        fps : float
+            The minimum frame rate. A value of 0 means transitions are
+            never skipped.
+
+        """
+        gate = self._frame_gate
+        gate.minimum_fps = fps
+        gate.reset()
+
     def transition(self):
         """ Get the transition installed on this widget.
 
@@ -193,9 +396,12 @@ class QStack(QStackedWidget):
         old = self._transition
         if old is not None:
             old.finished.disconnect(self._onTransitionFinished)
+            old.pixmapUpdated.disconnect(self._onPixmapUpdated)
         self._transition = transition
+        self._frame_gate.reset()
         if transition is not None:
             transition.finished.connect(self._onTransitionFinished)
+            transition.pixmapUpdated.connect(self._onPixmapUpdated)
 
     def transitionTo(self, index):
         """ Transition the stack widget to the given index.
@@ -224,6 +430,9 @@ class QtStack(QtConstraintsWidget):
     #: The initial selected index in the stack.
     _initial_index = 0
 
+    #: The scheduler for the lazy realization of the stack items.
+    _scheduler = None
+
     def create_widget(self, parent, tree):
         """ Create the underlying QStack widget.
 
@@ -237,6 +446,10 @@ class QtStack(QtConstraintsWidget):
         super(QtStack, self).create(tree)
         self.set_transition(tree['transition'])
         self._initial_index = tree['index']
+        self._scheduler = RealizeScheduler()
+        self.set_lazy(tree['lazy'])
+        self.set_prebuild_next(tree['prebuild_next'])
+        self.set_unrealize_delay(tree['unrealize_delay'])
 
     def init_layout(self):
         """ Initialize the layout of the underlying control.
@@ -252,6 +465,68 @@ class QtStack(QtConstraintsWidget):
         widget.layoutRequested.connect(self.on_layout_requested)
         widget.currentChanged.connect(self.on_current_changed)
 
+    def activate(self):
+        """ Activate the stack.
+
+        This informs the realize scheduler of the initial item.
+
+        """
+        super(QtStack, self).activate()
+        self._update_scheduler()
+
+    def destroy(self):
+        """ A reimplemented destructor method.
+
+        This method stops the pending timers of the realize scheduler.
+
+        """
+        self._scheduler.clear()
+        super(QtStack, self).destroy()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _item_at(self, index):
+        """ Get the QtStackItem at the given index, or None.
+
+        """
+        qitem = self.widget().widget(index)
+        if qitem is not None:
+            for child in self.children():
+                if isinstance(child, QtStackItem) and child.widget() is qitem:
+                    return child
+
+    def _update_scheduler(self):
+        """ Inform the realize scheduler of the current item.
+
+        """
+        index = self.widget().currentIndex()
+        item = self._item_at(index) if index != -1 else None
+        self._scheduler.show(item, self._item_at(index + 1))
+
+    def _set_index_guarded(self, index):
+        """ Set the current index from within the loopback guard.
+
+        """
+        with self.loopback_guard('index'):
+            self.set_index(index)
+
+    def item_contents_changed(self, item):
+        """ Discard the cached pixmap of a stack item.
+
+        This is called by a QtStackItem when its contents are added or
+        removed, which includes the realization and unrealization of
+        the contents of a lazy stack. The contents of a hidden item do
+        not repaint, so the change is not seen by the event filter.
+
+        Parameters
+        ----------
+        item : QtStackItem
+            The stack item whose contents changed.
+
+        """
+        self.widget().invalidatePixmapCache(item.widget())
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -260,6 +535,7 @@ class QtStack(QtConstraintsWidget):
 
         """
         if isinstance(child, QtStackItem):
+            self._scheduler.discard(child)
             self.widget().removeWidget(child.widget())
 
     def child_added(self, child):
@@ -284,6 +560,7 @@ class QtStack(QtConstraintsWidget):
         """ Handle the `currentChanged` signal from the QStack.
 
         """
+        self._update_scheduler()
         if 'index' not in self.loopback_guard:
             index = self.widget().currentIndex()
             self.send_action('index_changed', {'index': index})
@@ -294,9 +571,34 @@ class QtStack(QtConstraintsWidget):
     def on_action_set_index(self, content):
         """ Handle the 'set_index' action from the Enaml widget.
 
+        The contents of the new item of a lazy stack are realized just
+        before this action, and their child events are deferred. The
+        index is therefore set on the next cycle, so that a transition
+        does not capture an empty item.
+
         """
-        with self.loopback_guard('index'):
-            self.set_index(content['index'])
+        if self._scheduler.lazy:
+            deferredCall(self._set_index_guarded, content['index'])
+        else:
+            self._set_index_guarded(content['index'])
+
+    def on_action_set_lazy(self, content):
+        """ Handle the 'set_lazy' action from the Enaml widget.
+
+        """
+        self.set_lazy(content['lazy'])
+
+    def on_action_set_prebuild_next(self, content):
+        """ Handle the 'set_prebuild_next' action from the Enaml widget.
+
+        """
+        self.set_prebuild_next(content['prebuild_next'])
+
+    def on_action_set_unrealize_delay(self, content):
+        """ Handle the 'set_unrealize_delay' action from the Enaml widget.
+
+        """
+        self.set_unrealize_delay(content['unrealize_delay'])
 
     def on_action_set_transition(self, content):
         """ Handle the 'set_transition' action from the Enaml widget.
@@ -317,5 +619,24 @@ class QtStack(QtConstraintsWidget):
         """ Set the transition on the underlying widget.
 
         """
-        self.widget().setTransition(make_transition(transition))
+        widget = self.widget()
+        widget.setTransition(make_transition(transition))
+        widget.setMinimumFps(transition.get('minimum_fps', 0))
+
+    def set_lazy(self, lazy):
+        """ Set whether the stack items are realized lazily.
+
+        """
+        self._scheduler.lazy = lazy
 
+    def set_prebuild_next(self, prebuild):
+        """ Set whether the next stack item is realized while idle.
+
+        """
+        self._scheduler.prebuild_next = prebuild
+
+    def set_unrealize_delay(self, delay):
+        """ Set the delay before a hidden stack item is unrealized.
+
+        """
+        self._scheduler.unrealize_delay = delay
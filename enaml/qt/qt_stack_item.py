@@ -89,6 +89,16 @@ class QtStackItem(QtWidget):
                 widget = child.widget()
         return widget
 
+    def contents_changed(self):
+        """ Inform the parent stack that the contents have changed.
+
+        """
+        # Imported here since the stack module imports this module.
+        from .qt_stack import QtStack
+        parent = self.parent()
+        if isinstance(parent, QtStack):
+            parent.item_contents_changed(self)
+
     #--------------------------------------------------------------------------
     # Child Events
     #--------------------------------------------------------------------------
@@ -98,6 +108,7 @@ class QtStackItem(QtWidget):
         """
         if isinstance(child, QtContainer):
             self.widget().setStackWidget(self.stack_widget())
+            self.contents_changed()
 
     def child_added(self, child):
         """ Handle the child added event for a QtStackItem.
@@ -105,6 +116,7 @@ class QtStackItem(QtWidget):
         """
         if isinstance(child, QtContainer):
             self.widget().setStackWidget(self.stack_widget())
+            self.contents_changed()
 
     #--------------------------------------------------------------------------
     # Widget Update Methods
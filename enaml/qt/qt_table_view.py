@@ -0,0 +1,75 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtGui import QTableView
+from .qt_item_view import QtItemView
+
+
+class QtTableView(QtItemView):
+    """ A Qt implementation of an Enaml TableView.
+
+    """
+    def create_widget(self, parent, tree):
+        """ Create the underlying table view widget.
+
+        """
+        widget = QTableView(parent)
+        # Fixed row heights let the view lay out any number of rows
+        # without asking the model for the size of every row.
+        vheader = widget.verticalHeader()
+        vheader.setDefaultSectionSize(vheader.minimumSectionSize() + 6)
+        return widget
+
+    def create(self, tree):
+        """ Create and initialize the underlying widget.
+
+        """
+        super(QtTableView, self).create(tree)
+        self.set_show_horizontal_header(tree['show_horizontal_header'])
+        self.set_show_vertical_header(tree['show_vertical_header'])
+        self.set_show_grid(tree['show_grid'])
+
+    #--------------------------------------------------------------------------
+    # Message Handlers
+    #--------------------------------------------------------------------------
+    def on_action_set_show_horizontal_header(self, content):
+        """ Handle the 'set_show_horizontal_header' action from the Enaml
+        widget.
+
+        """
+        self.set_show_horizontal_header(content['show_horizontal_header'])
+
+    def on_action_set_show_vertical_header(self, content):
+        """ Handle the 'set_show_vertical_header' action from the Enaml
+        widget.
+
+        """
+        self.set_show_vertical_header(content['show_vertical_header'])
+
+    def on_action_set_show_grid(self, content):
+        """ Handle the 'set_show_grid' action from the Enaml widget.
+
+        """
+        self.set_show_grid(content['show_grid'])
+
+    #--------------------------------------------------------------------------
+    # Widget Update Methods
+    #--------------------------------------------------------------------------
+    def set_show_horizontal_header(self, show):
+        """ Set the visibility of the column headers.
+
+        """
+        self.widget().horizontalHeader().setVisible(show)
+
+    def set_show_vertical_header(self, show):
+        """ Set the visibility of the row headers.
+
+        """
+        self.widget().verticalHeader().setVisible(show)
+
+    def set_show_grid(self, show):
+        """ Set the visibility of the grid lines.
+
+        """
+        self.widget().setShowGrid(show)
@@ -11,6 +11,13 @@ class QtWebView(QtControl):
     """ A Qt implementation of an Enaml WebView.
 
     """
+    #: Whether a page is being loaded. The elements of a page which is
+    #: loading cannot be patched yet.
+    _loading = False
+
+    #: The patches received while a page is loading.
+    _pending_patches = []
+
     def create_widget(self, parent, tree):
         """ Create the underlying QWebView control.
 
@@ -22,12 +29,40 @@ class QtWebView(QtControl):
 
         """
         super(QtWebView, self).create(tree)
+        widget = self.widget()
+        widget.loadStarted.connect(self.on_load_started)
+        widget.loadFinished.connect(self.on_load_finished)
         html = tree['html']
         if html:
             self.set_html(html)
         else:
             self.set_url(tree['url'])
 
+    #--------------------------------------------------------------------------
+    # Signal Handlers
+    #--------------------------------------------------------------------------
+    def on_load_started(self):
+        """ The signal handler for the 'loadStarted' signal.
+
+        This also handles navigation started from within the page, so
+        that patches received before the new page has loaded are
+        queued.
+
+        """
+        self._loading = True
+
+    def on_load_finished(self):
+        """ The signal handler for the 'loadFinished' signal.
+
+        The patches received while the page was loading are applied.
+
+        """
+        self._loading = False
+        patches = self._pending_patches
+        self._pending_patches = []
+        for patch in patches:
+            self.patch_html(*patch)
+
     #--------------------------------------------------------------------------
     # Message Handling
     #--------------------------------------------------------------------------
@@ -43,6 +78,13 @@ class QtWebView(QtControl):
         """
         self.set_html(content['html'])
 
+    def on_action_patch_html(self, content):
+        """ Handle the 'patch_html' action from the Enaml widget.
+
+        """
+        self.patch_html(content['html'], content['element_id'],
+                        content['mode'])
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -50,11 +92,41 @@ class QtWebView(QtControl):
         """ Set the url for the underlying control.
 
         """
+        self._loading = True
+        self._pending_patches = []
         self.widget().setUrl(QUrl(url))
 
     def set_html(self, html):
         """ Set the html source for the underlying control.
 
         """
+        self._loading = True
+        self._pending_patches = []
         self.widget().setHtml(html, 'c:/')
 
+    def patch_html(self, html, element_id, mode):
+        """ Insert an html fragment into an element of the page.
+
+        The fragment is inserted into the loaded document, so the page
+        is not reloaded. A patch received while the page is loading is
+        applied once it has loaded.
+
+        """
+        if self._loading:
+            self._pending_patches.append((html, element_id, mode))
+            return
+        frame = self.widget().page().mainFrame()
+        if element_id:
+            selector = u'[id="%s"]' % element_id.replace(u'"', u'\\"')
+        else:
+            selector = u'body'
+        element = frame.findFirstElement(selector)
+        if element.isNull():
+            return
+        if mode == 'append':
+            element.appendInside(html)
+        elif mode == 'prepend':
+            element.prependInside(html)
+        else:
+            element.setInnerXml(html)
+
@@ -0,0 +1,134 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from .qt.QtCore import QTimer
+
+
+class RealizeScheduler(object):
+    """ An object which schedules the lazy realization of the contents
+    of the items of a notebook or stack.
+
+    The owner widget informs the scheduler whenever the shown item
+    changes. The contents of the shown item are requested if they are
+    not realized. The contents of the next item may be requested while
+    the event loop is idle, and the contents of an item which has been
+    hidden for the unrealize delay are released.
+
+    """
+    def __init__(self):
+        """ Initialize a RealizeScheduler.
+
+        """
+        #: Whether the contents of the items are realized lazily.
+        self.lazy = False
+
+        #: Whether to realize the contents of the next item when idle.
+        self.prebuild_next = False
+
+        #: The delay in ms before a hidden item is unrealized, or 0.
+        self.unrealize_delay = 0
+
+        self._current = None
+        self._timers = {}
+        self._prebuild_items = set()
+        self._unrealizing = set()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _cancel(self, item):
+        """ Cancel the pending unrealize timer for an item.
+
+        """
+        timer = self._timers.pop(item, None)
+        if timer is not None:
+            timer.stop()
+
+    def _schedule_unrealize(self, item):
+        """ Start the unrealize timer for a hidden item.
+
+        """
+        self._cancel(item)
+        if self.lazy and self.unrealize_delay > 0:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._unrealize(item))
+            timer.start(self.unrealize_delay)
+            self._timers[item] = timer
+
+    def _unrealize(self, item):
+        """ Unrealize the contents of an item which is still hidden.
+
+        """
+        self._timers.pop(item, None)
+        if item is not self._current and item.children_realized():
+            self._unrealizing.add(item)
+            item.request_unrealize_children()
+
+    def _prebuild(self, item):
+        """ Realize the contents of an item while the loop is idle.
+
+        """
+        if item not in self._prebuild_items:
+            return
+        self._prebuild_items.discard(item)
+        if not item.children_realized():
+            item.request_realize_children()
+            if item is not self._current:
+                self._schedule_unrealize(item)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def show(self, item, next_item=None):
+        """ Update the scheduler for a newly shown item.
+
+        Parameters
+        ----------
+        item : QtObject or None
+            The client object of the shown item.
+
+        next_item : QtObject or None, optional
+            The client object of the item which is likely to be shown
+            next. Its contents are prebuilt if `prebuild_next` is True.
+
+        """
+        previous = self._current
+        self._current = item
+        if previous is not None and previous is not item:
+            self._schedule_unrealize(previous)
+        if item is None or not self.lazy:
+            return
+        self._cancel(item)
+        # An item which is shown before the server replies to a request
+        # to unrealize it must be realized again. The server handles
+        # the requests in order.
+        if item in self._unrealizing or not item.children_realized():
+            self._unrealizing.discard(item)
+            item.request_realize_children()
+        if self.prebuild_next and next_item is not None:
+            # A zero timeout fires once the event queue is empty.
+            self._prebuild_items.add(next_item)
+            QTimer.singleShot(0, lambda: self._prebuild(next_item))
+
+    def discard(self, item):
+        """ Discard the state held for an item which was removed.
+
+        """
+        self._cancel(item)
+        self._prebuild_items.discard(item)
+        self._unrealizing.discard(item)
+        if item is self._current:
+            self._current = None
+
+    def clear(self):
+        """ Stop all timers and discard all state.
+
+        """
+        for timer in self._timers.itervalues():
+            timer.stop()
+        self._timers.clear()
+        self._prebuild_items.clear()
+        self._unrealizing.clear()
+        self._current = None
@@ -0,0 +1,236 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import OrderedDict
+
+
+#: A sentinel returned by `RowBlockCache.get` for a row which is not
+#: yet available.
+MISSING = object()
+
+
+class RowBlockCache(object):
+    """ A bounded cache of the rows of a remote item model.
+
+    Rows are fetched and cached in fixed size blocks. Reading a row
+    which is not cached marks its block, and the blocks within the
+    prefetch distance, as wanted. The wanted blocks are collected with
+    `take_wanted` and requested from the server in a single message.
+    The least recently used blocks are evicted once the cache holds
+    more than its maximum number of blocks.
+
+    Every change which invalidates cached rows increments the cache
+    generation. Replies to requests made in an older generation are
+    discarded, since their rows may no longer be at the same indices.
+
+    This class has no toolkit dependencies.
+
+    """
+    def __init__(self, block_size=64, prefetch=100, max_blocks=256):
+        """ Initialize a RowBlockCache.
+
+        Parameters
+        ----------
+        block_size : int, optional
+            The number of rows in a block.
+
+        prefetch : int, optional
+            The number of rows before and after a missing row which are
+            requested along with it.
+
+        max_blocks : int, optional
+            The maximum number of blocks to hold in the cache.
+
+        """
+        self._block_size = block_size
+        self._max_blocks = max_blocks
+        self._blocks = OrderedDict()
+        self._pending = set()
+        self._wanted = set()
+        self._row_count = 0
+        self._generation = 0
+        self.set_prefetch(prefetch)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _want(self, block):
+        """ Mark a block and its prefetch neighbours as wanted.
+
+        """
+        size = self._block_size
+        last = max(0, (self._row_count - 1) // size)
+        spread = self._spread
+        blocks = self._blocks
+        pending = self._pending
+        wanted = self._wanted
+        for b in xrange(max(0, block - spread), min(last, block + spread) + 1):
+            if b not in blocks and b not in pending:
+                wanted.add(b)
+
+    def _invalidate_from(self, row):
+        """ Discard the cached blocks at or after a row.
+
+        """
+        first = row // self._block_size
+        blocks = self._blocks
+        for b in [b for b in blocks if b >= first]:
+            del blocks[b]
+        self._pending.clear()
+        self._wanted.clear()
+        self._generation += 1
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def generation(self):
+        """ Get the current generation of the cache.
+
+        """
+        return self._generation
+
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        return self._row_count
+
+    def set_prefetch(self, prefetch):
+        """ Set the number of rows to prefetch around a missing row.
+
+        """
+        size = self._block_size
+        self._spread = (prefetch + size - 1) // size
+
+    def get(self, row, column):
+        """ Get the value of an item.
+
+        Parameters
+        ----------
+        row : int
+            The row of the item.
+
+        column : int
+            The column of the item.
+
+        Returns
+        -------
+        result : object
+            The value of the item, or MISSING if the row is not cached.
+            In that case the block of the row is marked as wanted.
+
+        """
+        block = row // self._block_size
+        rows = self._blocks.get(block)
+        if rows is None:
+            if block not in self._pending:
+                self._want(block)
+            return MISSING
+        self._blocks[block] = self._blocks.pop(block)
+        offset = row - block * self._block_size
+        if offset >= len(rows):
+            return MISSING
+        values = rows[offset]
+        if column >= len(values):
+            return None
+        return values[column]
+
+    def has_wanted(self):
+        """ Get whether there are wanted blocks to be requested.
+
+        """
+        return len(self._wanted) > 0
+
+    def take_wanted(self):
+        """ Take the wanted blocks as a list of row ranges to request.
+
+        The blocks are marked as pending until their rows are stored.
+        Adjacent blocks are merged into a single range.
+
+        Returns
+        -------
+        result : list
+            A list of [row, count] ranges.
+
+        """
+        size = self._block_size
+        wanted = sorted(self._wanted)
+        self._wanted.clear()
+        self._pending.update(wanted)
+        ranges = []
+        for b in wanted:
+            row = b * size
+            if ranges and ranges[-1][0] + ranges[-1][1] == row:
+                ranges[-1][1] += size
+            else:
+                ranges.append([row, size])
+        return ranges
+
+    def store(self, row, rows, generation):
+        """ Store rows which were fetched from the server.
+
+        Parameters
+        ----------
+        row : int
+            The first row of the data. It is aligned to a block.
+
+        rows : list
+            The list of rows of values.
+
+        generation : int
+            The generation of the request which fetched the rows.
+
+        Returns
+        -------
+        result : bool
+            Whether the rows were stored. Rows fetched in an older
+            generation are discarded.
+
+        """
+        if generation != self._generation:
+            return False
+        size = self._block_size
+        blocks = self._blocks
+        first = row // size
+        for idx in xrange(0, len(rows), size):
+            block = first + idx // size
+            self._pending.discard(block)
+            blocks.pop(block, None)
+            blocks[block] = rows[idx:idx + size]
+        while len(blocks) > self._max_blocks:
+            blocks.popitem(last=False)
+        return True
+
+    def invalidate(self, row, count):
+        """ Discard the cached values of a range of rows.
+
+        """
+        size = self._block_size
+        first = row // size
+        last = (row + count - 1) // size
+        blocks = self._blocks
+        for b in [b for b in blocks if first <= b <= last]:
+            del blocks[b]
+        self._pending.difference_update(xrange(first, last + 1))
+
+    def insert_rows(self, row, count):
+        """ Update the cache for rows inserted into the model.
+
+        """
+        self._row_count += count
+        self._invalidate_from(row)
+
+    def remove_rows(self, row, count):
+        """ Update the cache for rows removed from the model.
+
+        """
+        self._row_count = max(0, self._row_count - count)
+        self._invalidate_from(row)
+
+    def reset(self, row_count):
+        """ Discard all cached rows and set a new row count.
+
+        """
+        self._row_count = row_count
+        self._invalidate_from(0)
@@ -0,0 +1,165 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+
+
+class PixmapCache(object):
+    """ A cache of the pixmaps rendered for the items of a widget.
+
+    A pixmap is stored for an item along with the size at which it was
+    rendered, and is only returned for a request of the same size. The
+    owner of the cache invalidates the pixmap of an item whenever the
+    item repaints, so that a stale rendering is never reused.
+
+    This class has no toolkit dependencies.
+
+    """
+    def __init__(self):
+        """ Initialize a PixmapCache.
+
+        """
+        self._pixmaps = {}
+
+    def __len__(self):
+        """ Get the number of cached pixmaps.
+
+        """
+        return len(self._pixmaps)
+
+    def get(self, item, size):
+        """ Get the cached pixmap for an item.
+
+        Parameters
+        ----------
+        item : object
+            The item which was rendered.
+
+        size : tuple
+            The (width, height) of the wanted pixmap.
+
+        Returns
+        -------
+        result : object or None
+            The cached pixmap, or None if the item has no valid pixmap
+            of the given size.
+
+        """
+        entry = self._pixmaps.get(item)
+        if entry is not None and entry[0] == size:
+            return entry[1]
+
+    def put(self, item, size, pixmap):
+        """ Store the pixmap rendered for an item.
+
+        Parameters
+        ----------
+        item : object
+            The item which was rendered.
+
+        size : tuple
+            The (width, height) of the pixmap.
+
+        pixmap : object
+            The rendered pixmap.
+
+        """
+        self._pixmaps[item] = (size, pixmap)
+
+    def invalidate(self, item):
+        """ Discard the pixmap of an item, if any.
+
+        """
+        self._pixmaps.pop(item, None)
+
+    def clear(self):
+        """ Discard all of the cached pixmaps.
+
+        """
+        self._pixmaps.clear()
+
+
+class FrameRateGate(object):
+    """ An object which decides whether an animation is fast enough to
+    be worth running.
+
+    The owner records the number of frames drawn by each animation and
+    the time it took, including the time spent preparing it. Once the
+    measured frame rate falls below the minimum, animations are skipped.
+    The measurement is discarded after a number of skipped animations,
+    so that the next animation is measured again.
+
+    This class has no toolkit dependencies.
+
+    """
+    #: The weight of the most recent measurement in the moving average.
+    SMOOTHING = 0.5
+
+    def __init__(self, minimum_fps=0, retry_after=8):
+        """ Initialize a FrameRateGate.
+
+        Parameters
+        ----------
+        minimum_fps : float, optional
+            The minimum frame rate at which an animation is run. The
+            default of 0 never skips an animation.
+
+        retry_after : int, optional
+            The number of skipped animations after which the frame rate
+            is measured again.
+
+        """
+        self.minimum_fps = minimum_fps
+        self.retry_after = retry_after
+        self._fps = None
+        self._skipped = 0
+
+    def fps(self):
+        """ Get the measured frame rate, or None if it is not known.
+
+        """
+        return self._fps
+
+    def record(self, frames, elapsed):
+        """ Record the frames drawn by an animation.
+
+        Parameters
+        ----------
+        frames : int
+            The number of frames which were drawn.
+
+        elapsed : float
+            The time taken by the animation, in seconds.
+
+        """
+        if elapsed <= 0:
+            return
+        fps = frames / float(elapsed)
+        if self._fps is None:
+            self._fps = fps
+        else:
+            k = self.SMOOTHING
+            self._fps = k * fps + (1.0 - k) * self._fps
+        self._skipped = 0
+
+    def should_skip(self):
+        """ Get whether the next animation should be skipped.
+
+        Calling this method counts a skipped animation when it returns
+        True.
+
+        """
+        fps = self._fps
+        if self.minimum_fps <= 0 or fps is None or fps >= self.minimum_fps:
+            return False
+        self._skipped += 1
+        if self._skipped >= self.retry_after:
+            self.reset()
+        return True
+
+    def reset(self):
+        """ Discard the measured frame rate.
+
+        """
+        self._fps = None
+        self._skipped = 0
@@ -5,15 +5,107 @@
 import logging
 from urlparse import urlparse
 
-from traits.api import HasTraits, Dict, Str
+from traits.api import HasTraits, Dict, Instance, Str
 
+from .application import Application
+from .async_image_provider import AsyncImageProvider
 from .icon_provider import IconProvider
+from .image_cache import CachingReply, ImageCache
 from .image_provider import ImageProvider
 
 
 logger = logging.getLogger(__name__)
 
 
+class _ImageLoad(object):
+    """ A private class which loads an image which is not cached.
+
+    The image is first resampled from the cached natural image on the
+    worker threads of the cache. If that is not possible, the image is
+    requested from the provider. The load can be cancelled and its
+    priority raised like an `ImageRequest`. The cache is None if the
+    provider has no cache key, in which case the image is requested
+    from the provider and is not cached.
+
+    """
+    def __init__(self, cache, key, provider, path, size, reply, priority):
+        self._cache = cache
+        self._key = key
+        self._provider = provider
+        self._path = path
+        self._size = size
+        self._reply = reply
+        self._priority = priority
+        self._request = None
+        self._cancelled = False
+
+    def start(self):
+        """ Start the load of the image.
+
+        """
+        cache = self._cache
+        if cache is not None:
+            key = self._key
+            path = self._path
+            size = self._size
+            reply = CachingReply(cache, key, path, size, self._resampled)
+            self._request = cache.request_resampled(
+                key, path, size, reply, self._priority
+            )
+        if self._request is None:
+            self._request_provider()
+
+    def cancel(self):
+        """ Cancel the load of the image.
+
+        """
+        self._cancelled = True
+        request = self._request
+        if request is not None:
+            self._request = None
+            request.cancel()
+
+    def raise_priority(self, priority):
+        """ Raise the priority of the load of the image.
+
+        """
+        self._priority = max(self._priority, priority)
+        request = self._request
+        if request is not None:
+            request.raise_priority(priority)
+
+    def _resampled(self, image):
+        """ Handle the result of the resampling of the image.
+
+        """
+        if self._cancelled:
+            return
+        if image is None:
+            self._request_provider()
+        else:
+            self._request = None
+            self._reply(image)
+
+    def _request_provider(self):
+        """ Request the image from the provider.
+
+        """
+        provider = self._provider
+        path = self._path
+        size = self._size
+        reply = self._reply
+        cache = self._cache
+        if cache is not None:
+            reply = CachingReply(cache, self._key, path, size, reply)
+        if isinstance(provider, AsyncImageProvider):
+            self._request = provider.request_image(
+                path, size, reply, self._priority
+            )
+        else:
+            self._request = None
+            provider.request_image(path, size, reply)
+
+
 class ResourceManager(HasTraits):
     """ A class which manages resource loading for a `Session`.
 
@@ -33,6 +125,16 @@ class ResourceManager(HasTraits):
     #: A dict of icon providers for the `icon://...` scheme.
     icon_providers = Dict(Str, IconProvider)
 
+    #: The cache of images loaded from the image providers. By default,
+    #: this is the image cache of the application, which is shared by
+    #: the resource managers of all of its sessions.
+    image_cache = Instance(ImageCache)
+    def _image_cache_default(self):
+        app = Application.instance()
+        if app is not None:
+            return app.image_cache()
+        return ImageCache()
+
     def load(self, url, metadata, reply):
         """ Load a resource from the manager.
 
@@ -51,6 +153,13 @@ class ResourceManager(HasTraits):
             object, or None if the loading fails. It must be safe to
             invoke this reply from a thread.
 
+        Returns
+        -------
+        result : object or None
+            An object with a `cancel` method which can be called to
+            cancel the request if the reply is no longer needed, or
+            None if the request cannot be cancelled.
+
         """
         scheme = urlparse(url).scheme
         handler = getattr(self, '_load_' + scheme, None)
@@ -59,7 +168,7 @@ class ResourceManager(HasTraits):
             logger.error(msg % url)
             reply(None)
             return
-        handler(url, metadata, reply)
+        return handler(url, metadata, reply)
 
     #--------------------------------------------------------------------------
     # Private API
@@ -68,7 +177,10 @@ class ResourceManager(HasTraits):
         """ Load an image resource.
 
         This is a private handler method called by the `load` method.
-        It should not be called directly by user code.
+        It should not be called directly by user code. The images of
+        a provider with a `cache_key` are served from the image cache
+        when possible, or resampled from the cached natural image on a
+        worker thread.
 
         Parameters
         ----------
@@ -79,13 +191,21 @@ class ResourceManager(HasTraits):
             The image loader accepts optional 'size' metadata which
             is the desired size with which to load the image. The
             default is (-1, -1) which indicates the images natural
-            size should be used.
+            size should be used. It also accepts optional 'priority'
+            metadata which is passed to an `AsyncImageProvider`.
 
         reply : URLReply
             A url reply which will be invoked with the loaded image
             object, or None if the loading fails. It must be safe to
             invoke this reply from a thread.
 
+        Returns
+        -------
+        result : object or None
+            An object with `cancel` and `raise_priority` methods which
+            controls the load of an image which is not cached, or None
+            if the image was served from the cache.
+
         """
         spec = urlparse(url)
         provider = self.image_providers.get(spec.netloc)
@@ -94,8 +214,20 @@ class ResourceManager(HasTraits):
             logger.error(msg % url)
             reply(None)
             return
-        size = metadata.get('size', (-1, -1))
-        provider.request_image(spec.path, size, reply)
+        path = spec.path
+        size = tuple(metadata.get('size', (-1, -1)))
+        key = getattr(provider, 'cache_key', None)
+        cache = None
+        if key is not None:
+            cache = self.image_cache
+            image = cache.get(key, path, size)
+            if image is not None:
+                reply(image)
+                return
+        priority = metadata.get('priority', 0)
+        load = _ImageLoad(cache, key, provider, path, size, reply, priority)
+        load.start()
+        return load
 
     def _load_icon(self, url, metadata, reply):
         """ Load an icon resource.
@@ -0,0 +1,262 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from itertools import count
+import logging
+import types
+
+from enaml.socket_interface import ActionSocketInterface
+from enaml.utils import make_dispatcher
+from enaml.weakmethod import WeakMethod
+from enaml.wire_format import decode_message, encode_message
+
+from .server_application import CONTROL_ID
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for the control actions sent by the server.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+class RemoteActionSocket(object):
+    """ An ActionSocketInterface implementation for a client session of
+    a session served by a ServerApplication.
+
+    Messages which arrive before a callback is registered are held and
+    delivered when the callback is registered.
+
+    """
+    def __init__(self, client, session_id):
+        """ Initialize a RemoteActionSocket.
+
+        Parameters
+        ----------
+        client : ClientConnection
+            The connection to the server of the session.
+
+        session_id : str
+            The identifier of the session.
+
+        """
+        self._client = client
+        self._session_id = session_id
+        self._callback = None
+        self._held = []
+
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by the
+        server session.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+        if callback is not None and self._held:
+            held = self._held
+            self._held = []
+            for message in held:
+                callback(*message)
+
+    def send(self, object_id, action, content):
+        """ Send an action to the server session.
+
+        """
+        frames = encode_message(object_id, action, content)
+        frames.insert(0, self._session_id)
+        self._client.write(frames)
+
+    def receive(self, object_id, action, content):
+        """ Receive a message sent by the server session.
+
+        """
+        callback = self._callback
+        if callback is None:
+            self._held.append((object_id, action, content))
+        else:
+            callback(object_id, action, content)
+
+
+ActionSocketInterface.register(RemoteActionSocket)
+
+
+class ClientConnection(object):
+    """ A client connection to a ServerApplication.
+
+    A ClientConnection starts sessions on the server and creates the
+    action sockets which a client session uses to communicate with
+    its server session.
+
+    """
+    def __init__(self, transport, loop):
+        """ Initialize a ClientConnection.
+
+        Parameters
+        ----------
+        transport : Transport
+            The transport on which the server is listening.
+
+        loop : EventLoop
+            The event loop on which to run the connection.
+
+        """
+        connection = transport.connect(loop)
+        connection.on_message(self._on_message)
+        connection.on_close(self._on_close)
+        self._connection = connection
+        self._sockets = {}
+        self._requests = {}
+        self._counter = count()
+        self._closed = False
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_message(self, frames):
+        """ Handle a message read from the connection.
+
+        """
+        session_id = frames[0]
+        object_id, action, content = decode_message(frames[1:])
+        if session_id == CONTROL_ID:
+            dispatch_action(self, action, content)
+            return
+        socket = self._sockets.get(session_id)
+        if socket is None:
+            msg = 'message for unknown session from server: %s:%s'
+            logger.warn(msg % (session_id, action))
+            return
+        socket.receive(object_id, action, content)
+        if object_id == session_id and action == 'close':
+            del self._sockets[session_id]
+
+    def _on_close(self):
+        """ Handle the closing of the connection.
+
+        """
+        self._closed = True
+
+    def _send_control(self, action, content, callback):
+        """ Send a control request with a reply callback.
+
+        """
+        req_id = self._counter.next()
+        self._requests[req_id] = callback
+        content['id'] = req_id
+        frames = encode_message(CONTROL_ID, action, content)
+        frames.insert(0, CONTROL_ID)
+        self.write(frames)
+
+    #--------------------------------------------------------------------------
+    # Control Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_session_started(self, content):
+        """ Handle the 'session_started' control action.
+
+        """
+        session_id = content['session_id']
+        self._sockets[session_id] = RemoteActionSocket(self, session_id)
+        callback = self._requests.pop(content['id'], None)
+        if callback is not None:
+            callback(content)
+
+    def on_action_discover_reply(self, content):
+        """ Handle the 'discover_reply' control action.
+
+        """
+        callback = self._requests.pop(content['id'], None)
+        if callback is not None:
+            callback(content['sessions'])
+
+    def on_action_error(self, content):
+        """ Handle the 'error' control action.
+
+        """
+        logger.error('server error: %s' % content['message'])
+        callback = self._requests.pop(content.get('id'), None)
+        if callback is not None:
+            callback(None)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def write(self, frames):
+        """ Write a message to the server.
+
+        """
+        self._connection.write(frames)
+
+    def is_closed(self):
+        """ Get whether the connection to the server is closed.
+
+        """
+        return self._closed
+
+    def discover(self, callback):
+        """ Request the information about the sessions of the server.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which is invoked with the list of session info
+            dicts provided by the server.
+
+        """
+        self._send_control('discover', {}, callback)
+
+    def start_session(self, name, callback):
+        """ Start a session on the server.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        callback : callable
+            A callable which is invoked with a dict of the 'session_id',
+            'widget_groups' and 'snapshot' of the started session, or
+            None if the session could not be started. The client session
+            should be opened with the snapshot and activated with the
+            socket for the session id before the callback returns.
+
+        """
+        self._send_control('start_session', {'name': name}, callback)
+
+    def end_session(self, session_id):
+        """ End a session on the server.
+
+        Parameters
+        ----------
+        session_id : str
+            The identifier of the session to end.
+
+        """
+        content = {'session_id': session_id}
+        frames = encode_message(CONTROL_ID, 'end_session', content)
+        frames.insert(0, CONTROL_ID)
+        self.write(frames)
+
+    def socket(self, session_id):
+        """ Get the action socket for a started session.
+
+        Parameters
+        ----------
+        session_id : str
+            The identifier of the session.
+
+        Returns
+        -------
+        result : RemoteActionSocket or None
+            The socket for the session, or None if the session is not
+            known to the connection.
+
+        """
+        return self._sockets.get(session_id)
+
+    def close(self):
+        """ Close the connection to the server.
+
+        """
+        self._connection.close()
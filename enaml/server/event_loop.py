@@ -0,0 +1,499 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import deque
+import errno
+import fcntl
+from heapq import heappush, heappop
+from itertools import count
+import logging
+import math
+import os
+import select
+from threading import Lock, current_thread
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class TimerHandle(object):
+    """ A handle to a callback scheduled with `EventLoop.call_later`.
+
+    """
+    __slots__ = ('callback', 'args', 'kwargs', 'cancelled')
+
+    def __init__(self, callback, args, kwargs):
+        self.callback = callback
+        self.args = args
+        self.kwargs = kwargs
+        self.cancelled = False
+
+    def cancel(self):
+        """ Cancel the scheduled callback.
+
+        """
+        self.cancelled = True
+
+
+class SelectPoller(object):
+    """ A poller which watches file descriptors with `select.select`.
+
+    It is the fallback for platforms without `poll`, and is limited to
+    descriptors below FD_SETSIZE.
+
+    """
+    def __init__(self):
+        """ Initialize a SelectPoller.
+
+        """
+        self._readers = set()
+        self._writers = set()
+
+    def update(self, fd, readable, writable):
+        """ Set the events which are watched for a file descriptor.
+
+        Parameters
+        ----------
+        fd : int
+            The file descriptor.
+
+        readable : bool
+            Whether to watch the descriptor for reading.
+
+        writable : bool
+            Whether to watch the descriptor for writing.
+
+        """
+        if readable:
+            self._readers.add(fd)
+        else:
+            self._readers.discard(fd)
+        if writable:
+            self._writers.add(fd)
+        else:
+            self._writers.discard(fd)
+
+    def poll(self, timeout):
+        """ Wait for the watched file descriptors to become ready.
+
+        Parameters
+        ----------
+        timeout : float or None
+            The maximum time, in seconds, to wait. None waits
+            indefinitely.
+
+        Returns
+        -------
+        result : list
+            A list of (fd, readable, writable) tuples for the ready
+            file descriptors.
+
+        """
+        readable, writable, ignored = select.select(
+            self._readers, self._writers, [], timeout,
+        )
+        writable = set(writable)
+        events = [(fd, True, fd in writable) for fd in readable]
+        writable.difference_update(readable)
+        events.extend((fd, False, True) for fd in writable)
+        return events
+
+    def close(self):
+        """ Close the resources held by the poller.
+
+        """
+        self._readers.clear()
+        self._writers.clear()
+
+
+class PollPoller(object):
+    """ A poller which watches file descriptors with `select.poll`, or
+    with `select.epoll` where it is available.
+
+    The cost of an iteration depends on the number of ready file
+    descriptors rather than on the number of watched descriptors, and
+    there is no limit on the value of a descriptor.
+
+    """
+    def __init__(self):
+        """ Initialize a PollPoller.
+
+        """
+        epoll = getattr(select, 'epoll', None)
+        if epoll is not None:
+            self._poll = epoll()
+            self._in = select.EPOLLIN
+            self._out = select.EPOLLOUT
+            self._err = select.EPOLLERR | select.EPOLLHUP
+            self._millis = False
+        else:
+            self._poll = select.poll()
+            self._in = select.POLLIN
+            self._out = select.POLLOUT
+            self._err = select.POLLERR | select.POLLHUP | select.POLLNVAL
+            self._millis = True
+        self._masks = {}
+
+    def update(self, fd, readable, writable):
+        """ Set the events which are watched for a file descriptor.
+
+        See `SelectPoller.update`.
+
+        """
+        mask = (self._in if readable else 0) | (self._out if writable else 0)
+        masks = self._masks
+        current = masks.get(fd, 0)
+        if mask == current:
+            return
+        if not mask:
+            del masks[fd]
+            try:
+                self._poll.unregister(fd)
+            except (KeyError, EnvironmentError):
+                # The descriptor was closed before it was removed.
+                pass
+        elif current:
+            masks[fd] = mask
+            self._poll.modify(fd, mask)
+        else:
+            masks[fd] = mask
+            self._poll.register(fd, mask)
+
+    def poll(self, timeout):
+        """ Wait for the watched file descriptors to become ready.
+
+        See `SelectPoller.poll`. An error or hangup on a descriptor is
+        reported as both readable and writable, so that its callbacks
+        can observe the failure.
+
+        """
+        if self._millis:
+            if timeout is not None:
+                timeout = int(math.ceil(timeout * 1000))
+        elif timeout is None:
+            timeout = -1
+        ready_in = self._in | self._err
+        ready_out = self._out | self._err
+        return [
+            (fd, bool(mask & ready_in), bool(mask & ready_out))
+            for fd, mask in self._poll.poll(timeout)
+        ]
+
+    def close(self):
+        """ Close the resources held by the poller.
+
+        """
+        self._masks.clear()
+        close = getattr(self._poll, 'close', None)
+        if close is not None:
+            close()
+
+
+def make_poller():
+    """ Make the most scalable poller available on the platform.
+
+    Returns
+    -------
+    result : PollPoller or SelectPoller
+        A PollPoller if `select.epoll` or `select.poll` is available,
+        otherwise a SelectPoller.
+
+    """
+    if hasattr(select, 'epoll') or hasattr(select, 'poll'):
+        return PollPoller()
+    return SelectPoller()
+
+
+class EventLoop(object):
+    """ A poll based event loop for the headless server.
+
+    The loop multiplexes the file descriptors registered as readers and
+    writers, and runs the callbacks scheduled with `call_soon` and
+    `call_later`. The descriptors are watched with epoll or poll where
+    available, and with select otherwise; see `make_poller`. The api
+    follows the naming of the asyncio event loop, which is not
+    available to Python 2.
+
+    All methods must be called on the loop thread, except `call_soon`
+    and `stop`, which are thread-safe.
+
+    """
+    def __init__(self, poller=None):
+        """ Initialize an EventLoop.
+
+        Parameters
+        ----------
+        poller : SelectPoller or PollPoller, optional
+            The poller which watches the file descriptors. The default
+            is the poller returned by `make_poller`.
+
+        """
+        self._poller = poller or make_poller()
+        self._readers = {}
+        self._writers = {}
+        self._ready = deque()
+        self._timers = []
+        self._counter = count()
+        self._lock = Lock()
+        self._thread = None
+        self._running = False
+        self._wake_read, self._wake_write = os.pipe()
+        for fd in (self._wake_read, self._wake_write):
+            _set_nonblocking(fd)
+        self.add_reader(self._wake_read, self._drain_wakeup)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _drain_wakeup(self):
+        """ Drain the bytes written to the wakeup pipe.
+
+        """
+        try:
+            while os.read(self._wake_read, 4096):
+                pass
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def _wakeup(self):
+        """ Wake the loop from a blocking select.
+
+        """
+        try:
+            os.write(self._wake_write, '\0')
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                raise
+
+    def _update_poller(self, fd):
+        """ Update the events watched by the poller for a descriptor.
+
+        """
+        readable = fd in self._readers
+        writable = fd in self._writers
+        self._poller.update(fd, readable, writable)
+
+    def _run_callback(self, callback, args, kwargs):
+        """ Run a callback, logging any exception it raises.
+
+        """
+        try:
+            callback(*args, **kwargs)
+        except Exception:
+            logger.exception('exception in event loop callback')
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def call_soon(self, callback, *args, **kwargs):
+        """ Schedule a callback on the next iteration of the loop.
+
+        This method is thread-safe.
+
+        Parameters
+        ----------
+        callback : callable
+            The callable to invoke.
+
+        *args, **kwargs
+            The arguments to pass to the callback.
+
+        """
+        with self._lock:
+            self._ready.append((callback, args, kwargs))
+        if not self.is_loop_thread():
+            self._wakeup()
+
+    def call_later(self, seconds, callback, *args, **kwargs):
+        """ Schedule a callback after a delay.
+
+        Parameters
+        ----------
+        seconds : float
+            The delay, in seconds, before invoking the callback.
+
+        callback : callable
+            The callable to invoke.
+
+        *args, **kwargs
+            The arguments to pass to the callback.
+
+        Returns
+        -------
+        result : TimerHandle
+            A handle which can be used to cancel the callback.
+
+        """
+        handle = TimerHandle(callback, args, kwargs)
+        when = time.time() + seconds
+        heappush(self._timers, (when, self._counter.next(), handle))
+        return handle
+
+    def add_reader(self, fd, callback):
+        """ Invoke a callback when a file descriptor is readable.
+
+        Parameters
+        ----------
+        fd : int or object
+            The file descriptor, or an object with a `fileno` method.
+
+        callback : callable
+            A callable which takes no arguments.
+
+        """
+        fd = _fileno(fd)
+        self._readers[fd] = callback
+        self._update_poller(fd)
+
+    def remove_reader(self, fd):
+        """ Stop watching a file descriptor for reading.
+
+        """
+        fd = _fileno(fd)
+        if self._readers.pop(fd, None) is not None:
+            self._update_poller(fd)
+
+    def add_writer(self, fd, callback):
+        """ Invoke a callback when a file descriptor is writable.
+
+        Parameters
+        ----------
+        fd : int or object
+            The file descriptor, or an object with a `fileno` method.
+
+        callback : callable
+            A callable which takes no arguments.
+
+        """
+        fd = _fileno(fd)
+        self._writers[fd] = callback
+        self._update_poller(fd)
+
+    def remove_writer(self, fd):
+        """ Stop watching a file descriptor for writing.
+
+        """
+        fd = _fileno(fd)
+        if self._writers.pop(fd, None) is not None:
+            self._update_poller(fd)
+
+    def is_loop_thread(self):
+        """ Get whether the caller is on the thread running the loop.
+
+        If the loop is not running, every thread is considered to be
+        the loop thread, so that the loop can be driven by `run_once`.
+
+        """
+        thread = self._thread
+        if thread is None:
+            return True
+        return current_thread() is thread
+
+    def has_ready(self):
+        """ Get whether there are callbacks ready to run.
+
+        Timers which have not yet expired are not included.
+
+        """
+        return len(self._ready) > 0
+
+    def run_once(self, timeout=None):
+        """ Run a single iteration of the loop.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time, in seconds, to wait for a file descriptor
+            to become ready when there are no callbacks ready to run.
+            The default waits indefinitely.
+
+        """
+        timers = self._timers
+        if self._ready:
+            timeout = 0
+        elif timers:
+            delay = max(0, timers[0][0] - time.time())
+            timeout = delay if timeout is None else min(timeout, delay)
+        try:
+            events = self._poller.poll(timeout)
+        except (select.error, EnvironmentError) as e:
+            if e.args[0] != errno.EINTR:
+                raise
+            events = ()
+        for fd, readable, writable in events:
+            if readable:
+                callback = self._readers.get(fd)
+                if callback is not None:
+                    self._run_callback(callback, (), {})
+            if writable:
+                callback = self._writers.get(fd)
+                if callback is not None:
+                    self._run_callback(callback, (), {})
+        now = time.time()
+        while timers and timers[0][0] <= now:
+            handle = heappop(timers)[2]
+            if not handle.cancelled:
+                item = (handle.callback, handle.args, handle.kwargs)
+                self._ready.append(item)
+        # Only the callbacks which are ready at this point are run, so
+        # that a callback which reschedules itself cannot starve I/O.
+        with self._lock:
+            ready = self._ready
+            self._ready = deque()
+        for callback, args, kwargs in ready:
+            self._run_callback(callback, args, kwargs)
+
+    def run(self):
+        """ Run the loop until `stop` is called.
+
+        """
+        self._thread = current_thread()
+        self._running = True
+        try:
+            while self._running:
+                self.run_once()
+        finally:
+            self._running = False
+            self._thread = None
+
+    def stop(self):
+        """ Stop the loop after the current iteration.
+
+        This method is thread-safe.
+
+        """
+        self._running = False
+        self._wakeup()
+
+    def close(self):
+        """ Close the resources held by the loop.
+
+        The loop cannot be used once it is closed.
+
+        """
+        self._readers.clear()
+        self._writers.clear()
+        self._poller.close()
+        os.close(self._wake_read)
+        os.close(self._wake_write)
+
+
+def _fileno(fd):
+    """ Get the integer file descriptor of a descriptor or an object
+    with a `fileno` method.
+
+    """
+    if isinstance(fd, (int, long)):
+        return fd
+    return fd.fileno()
+
+
+def _set_nonblocking(fd):
+    """ Put a file descriptor into non-blocking mode.
+
+    """
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
@@ -0,0 +1,426 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import cPickle
+import logging
+import multiprocessing
+import socket
+import uuid
+import zlib
+
+from enaml.utils import make_dispatcher
+from enaml.wire_format import decode_message, encode_message
+
+from .server_application import CONTROL_ID, ServerApplication, SessionChannel
+from .socket_transport import SocketConnection
+from .worker_application import worker_main
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for the control actions sent by the workers.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+class WorkerChannel(SessionChannel):
+    """ A SessionChannel for a session hosted by a worker process.
+
+    The session is started asynchronously by the worker, so the reply
+    to the client is held until both the worker has started the session
+    and the session has been attached to a client.
+
+    """
+    def __init__(self, server, session_id):
+        """ Initialize a WorkerChannel.
+
+        """
+        super(WorkerChannel, self).__init__(server, session_id)
+        self.request_id = None
+        self.started = None
+
+
+class WorkerSession(object):
+    """ A lightweight stand-in for a session hosted by a worker process.
+
+    The session object itself lives in the worker, so the front process
+    only knows its identifier and the worker which hosts it.
+
+    """
+    def __init__(self, session_id, worker):
+        """ Initialize a WorkerSession.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier of the session.
+
+        worker : WorkerHandle
+            The handle of the worker which hosts the session.
+
+        """
+        self.session_id = session_id
+        self.worker = worker
+
+
+class WorkerHandle(object):
+    """ An object which manages a worker process of a
+    ProcessServerApplication.
+
+    """
+    def __init__(self, server, process, connection):
+        """ Initialize a WorkerHandle.
+
+        Parameters
+        ----------
+        server : ProcessServerApplication
+            The application which owns the worker.
+
+        process : multiprocessing.Process
+            The running worker process.
+
+        connection : Connection
+            The connection to the worker process.
+
+        """
+        self.server = server
+        self.process = process
+        self.connection = connection
+        self.session_ids = set()
+        self.closed = False
+        connection.on_message(self.on_message)
+        connection.on_close(self.on_close)
+
+    def send_control(self, action, content):
+        """ Send a control message to the worker.
+
+        """
+        frames = encode_message(CONTROL_ID, action, content)
+        frames.insert(0, CONTROL_ID)
+        self.connection.write(frames)
+
+    def on_message(self, frames):
+        """ Handle a message read from the worker.
+
+        The messages of sessions are pushed onto their channels without
+        being decoded.
+
+        """
+        session_id = frames[0]
+        if session_id == CONTROL_ID:
+            object_id, action, content = decode_message(frames[1:])
+            dispatch_action(self.server, action, content)
+            return
+        channel = self.server._channels.get(session_id)
+        if channel is not None:
+            channel.push(frames)
+
+    def on_close(self):
+        """ Handle the closing of the connection to the worker.
+
+        """
+        self.closed = True
+        self.server._on_worker_closed(self)
+
+    def close(self, timeout=1.0):
+        """ Close the connection to the worker and wait for it to exit.
+
+        """
+        self.connection.close()
+        process = self.process
+        process.join(timeout)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+class ProcessServerApplication(ServerApplication):
+    """ A ServerApplication which hosts its sessions in a pool of
+    worker processes.
+
+    Each session is assigned to a worker by a hash of its session id.
+    Workers which have exited are skipped, and sessions cannot be
+    started once every worker has exited.
+    The front process accepts the client connections and routes the
+    messages of a session between its client and its worker without
+    decoding them, so the expressions of sessions on different workers
+    are evaluated in parallel.
+
+    The session factories are pickled and loaded by the workers, so the
+    session classes must be importable by reference.
+
+    """
+    def __init__(self, factories, transport, processes=None, loop=None,
+                 **kwargs):
+        """ Initialize a ProcessServerApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor and to the workers.
+
+        transport : Transport
+            The transport on which to accept client connections.
+
+        processes : int, optional
+            The number of worker processes. The default is the number
+            of cpus of the host.
+
+        loop : EventLoop, optional
+            The event loop to use for the front process.
+
+        **kwargs
+            The queue limits to pass to the superclass constructor.
+
+        """
+        factories = list(factories)
+        super(ProcessServerApplication, self).__init__(
+            factories, transport, loop, **kwargs
+        )
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if processes < 1:
+            raise ValueError('A process pool requires at least one process')
+        data = cPickle.dumps(factories, cPickle.HIGHEST_PROTOCOL)
+        self._workers = []
+        inherited = []
+        for idx in xrange(processes):
+            front, back = socket.socketpair()
+            args = (data, back, inherited[:] + [front])
+            process = multiprocessing.Process(target=worker_main, args=args)
+            process.daemon = True
+            process.start()
+            back.close()
+            inherited.append(front)
+            connection = SocketConnection(self._loop, front)
+            self._workers.append(WorkerHandle(self, process, connection))
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _receive(self, channel, frames):
+        """ Forward a message from a client to the worker of a session.
+
+        """
+        worker = self._sessions.get(channel.session_id)
+        if worker is not None:
+            worker.connection.write(frames)
+
+    def _push_started(self, channel):
+        """ Push the 'session_started' message for a channel.
+
+        """
+        content = dict(channel.started)
+        content['id'] = channel.request_id
+        channel.started = None
+        frames = encode_message(CONTROL_ID, 'session_started', content)
+        frames.insert(0, CONTROL_ID)
+        channel.push(frames, first=True)
+
+    def _close_channel(self, channel):
+        """ Close the channel of an ended session.
+
+        The channel is discarded once its queued messages are written.
+
+        """
+        channel.closing = True
+        handler = channel.handler
+        if handler is None:
+            self._discard_channel(channel)
+        else:
+            handler.schedule_pump()
+
+    def _on_worker_closed(self, worker):
+        """ Handle the unexpected exit of a worker process.
+
+        The sessions of the worker are ended, and their clients are
+        sent the 'close' message of each session.
+
+        """
+        if worker.session_ids:
+            logger.error('worker process exited with active sessions')
+        for session_id in worker.session_ids:
+            self._sessions.pop(session_id, None)
+            channel = self._channels.get(session_id)
+            if channel is not None:
+                channel.started = None
+                frames = encode_message(session_id, 'close', {})
+                frames.insert(0, session_id)
+                channel.push(frames)
+                self._close_channel(channel)
+        worker.session_ids.clear()
+
+    #--------------------------------------------------------------------------
+    # Worker Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_session_started(self, content):
+        """ Handle the 'session_started' control action of a worker.
+
+        """
+        channel = self._channels.get(content['session_id'])
+        if channel is None:
+            return
+        channel.started = content
+        if channel.handler is not None:
+            self._push_started(channel)
+
+    def on_action_session_failed(self, content):
+        """ Handle the 'session_failed' control action of a worker.
+
+        """
+        session_id = content['session_id']
+        worker = self._sessions.pop(session_id, None)
+        if worker is not None:
+            worker.session_ids.discard(session_id)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        handler = channel.handler
+        if handler is not None:
+            handler.channels.remove(channel)
+            reply = {'id': channel.request_id, 'message': content['message']}
+            handler.send_control('error', reply)
+        self._discard_channel(channel)
+
+    def on_action_session_ended(self, content):
+        """ Handle the 'session_ended' control action of a worker.
+
+        """
+        channel = self._channels.get(content['session_id'])
+        if channel is not None:
+            self._close_channel(channel)
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start_session(self, name):
+        """ Start a new session of the given name on its worker.
+
+        The session is started asynchronously. Its messages are queued
+        until it is attached to a client.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        Returns
+        -------
+        result : str
+            The unique identifier for the created session.
+
+        """
+        if name not in self._named_factories:
+            raise ValueError('Invalid session name')
+        session_id = uuid.uuid4().hex
+        worker = self.worker_for(session_id)
+        if worker is None:
+            raise ValueError('No worker process is available')
+        self._sessions[session_id] = worker
+        self._channels[session_id] = WorkerChannel(self, session_id)
+        worker.session_ids.add(session_id)
+        content = {'name': name, 'session_id': session_id}
+        worker.send_control('start_session', content)
+        return session_id
+
+    def end_session(self, session_id):
+        """ End the session with the given session id.
+
+        The channel of the session is closed when its worker reports
+        that the session has ended.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier for the session to close.
+
+        """
+        if session_id not in self._sessions:
+            raise ValueError('Invalid session id')
+        worker = self._sessions.pop(session_id)
+        worker.session_ids.discard(session_id)
+        worker.send_control('end_session', {'session_id': session_id})
+
+    def session(self, session_id):
+        """ Get the session for the given session id.
+
+        Sessions live in the worker processes, so this always returns
+        None. Use `session_ids` for the ids of the active sessions.
+
+        """
+        return None
+
+    def sessions(self):
+        """ Get the currently active sessions for the application.
+
+        Sessions live in the worker processes, so the returned objects
+        are WorkerSession instances which carry the id of the session
+        and the handle of its worker.
+
+        """
+        items = self._sessions.items()
+        return [WorkerSession(sid, worker) for sid, worker in items]
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def workers(self):
+        """ Get the handles of the worker processes.
+
+        """
+        return self._workers[:]
+
+    def worker_for(self, session_id):
+        """ Get the worker which hosts the session with the given id.
+
+        Parameters
+        ----------
+        session_id : str
+            The identifier of the session.
+
+        Returns
+        -------
+        result : WorkerHandle or None
+            The handle of the worker which hosts the session. If the
+            session is not active, this is the first running worker at
+            or after the one to which the id is sharded, or None if all
+            of the workers have exited.
+
+        """
+        worker = self._sessions.get(session_id)
+        if worker is not None:
+            return worker
+        workers = self._workers
+        count = len(workers)
+        start = zlib.crc32(session_id) & 0xffffffff
+        for offset in xrange(count):
+            worker = workers[(start + offset) % count]
+            if not worker.closed:
+                return worker
+
+    def attach_session(self, session_id, handler, request_id=None):
+        """ Attach a started session to a client.
+
+        The client is sent the 'session_started' control message once
+        the worker has started the session.
+
+        """
+        channel = self._channels[session_id]
+        if channel.handler is not None:
+            raise ValueError('Session is already attached')
+        channel.handler = handler
+        channel.request_id = request_id
+        handler.channels.append(channel)
+        if channel.started is not None:
+            self._push_started(channel)
+
+    def destroy(self):
+        """ Destroy the application and shut down the worker processes.
+
+        """
+        super(ProcessServerApplication, self).destroy()
+        for worker in self._workers:
+            worker.connection.on_close(None)
+            worker.close()
@@ -0,0 +1,639 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import deque
+import logging
+import types
+
+from enaml.application import Application
+from enaml.socket_interface import ActionSocketInterface
+from enaml.utils import make_dispatcher
+from enaml.weakmethod import WeakMethod
+from enaml.wire_format import decode_message, encode_message
+
+from .event_loop import EventLoop
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for the control actions sent by clients.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+#: The session id used for the control messages between a client and
+#: the server which are not addressed to a session.
+CONTROL_ID = ''
+
+
+def message_size(frames):
+    """ Get the number of bytes in the frames of a message.
+
+    """
+    return sum(len(frame) for frame in frames)
+
+
+class ServerActionSocket(object):
+    """ An ActionSocketInterface implementation for a session served
+    by a ServerApplication.
+
+    Messages sent on the socket are encoded and pushed onto the
+    outbound queue of the session's channel.
+
+    """
+    def __init__(self, channel):
+        """ Initialize a ServerActionSocket.
+
+        Parameters
+        ----------
+        channel : SessionChannel
+            The channel of the session which owns the socket.
+
+        """
+        self._channel = channel
+        self._callback = None
+
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by a client
+        object.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+
+    def send(self, object_id, action, content):
+        """ Send an action to the client of an object.
+
+        """
+        channel = self._channel
+        frames = encode_message(object_id, action, content)
+        frames.insert(0, channel.session_id)
+        channel.push(frames)
+
+    def receive(self, object_id, action, content):
+        """ Receive a message sent by the client.
+
+        """
+        callback = self._callback
+        if callback is not None:
+            callback(object_id, action, content)
+
+
+ActionSocketInterface.register(ServerActionSocket)
+
+
+class SessionChannel(object):
+    """ The outbound message queue of a session served by a
+    ServerApplication.
+
+    A channel buffers the messages sent by its session until they can
+    be written to the client connection. The channels of a connection
+    are written in round-robin order, so that a session which sends a
+    burst of messages does not delay the other sessions of the client.
+
+    """
+    def __init__(self, server, session_id):
+        """ Initialize a SessionChannel.
+
+        Parameters
+        ----------
+        server : ServerApplication
+            The application which serves the session.
+
+        session_id : str
+            The identifier of the session.
+
+        """
+        self.server = server
+        self.session_id = session_id
+        self.socket = ServerActionSocket(self)
+        self.handler = None
+        self.snapshot = None
+        self.closing = False
+        self._queue = deque()
+        self._queued_bytes = 0
+
+    def push(self, frames, first=False):
+        """ Push a message onto the queue.
+
+        Parameters
+        ----------
+        frames : list
+            The frames of the message.
+
+        first : bool, optional
+            Whether to push the message to the front of the queue. The
+            default is False.
+
+        """
+        size = message_size(frames)
+        if first:
+            self._queue.appendleft((frames, size))
+        else:
+            self._queue.append((frames, size))
+        self._queued_bytes += size
+        self.server._on_channel_push(self)
+
+    def pop(self):
+        """ Pop the next message from the queue.
+
+        Returns
+        -------
+        result : list or None
+            The frames of the message, or None if the queue is empty.
+
+        """
+        queue = self._queue
+        if not queue:
+            return None
+        frames, size = queue.popleft()
+        self._queued_bytes -= size
+        return frames
+
+    def queued_bytes(self):
+        """ Get the number of bytes in the queue.
+
+        """
+        return self._queued_bytes
+
+    def clear(self):
+        """ Discard the messages in the queue.
+
+        """
+        self._queue.clear()
+        self._queued_bytes = 0
+
+
+class ClientHandler(object):
+    """ An object which serves the sessions of a client connection.
+
+    """
+    def __init__(self, server, connection):
+        """ Initialize a ClientHandler.
+
+        Parameters
+        ----------
+        server : ServerApplication
+            The application which serves the client.
+
+        connection : Connection
+            The connection to the client.
+
+        """
+        self.server = server
+        self.connection = connection
+        self.channels = []
+        self.closed = False
+        self._next = 0
+        self._paused = False
+        self._pump_pending = False
+        connection.on_message(self.on_message)
+        connection.on_drain(self.pump)
+        connection.on_close(self.on_close)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def send_control(self, action, content):
+        """ Send a control message directly to the client.
+
+        """
+        frames = encode_message(CONTROL_ID, action, content)
+        frames.insert(0, CONTROL_ID)
+        self.connection.write(frames)
+
+    def schedule_pump(self):
+        """ Schedule a pump of the channels on the next loop cycle.
+
+        The messages sent by the sessions during a cycle are written
+        together when the cycle completes.
+
+        """
+        if not self._pump_pending and not self.closed:
+            self._pump_pending = True
+            self.server._loop.call_soon(self.pump)
+
+    def pump(self):
+        """ Write the queued messages of the channels to the client.
+
+        Messages are written in round-robin order until the write
+        buffer of the connection reaches the server's write limit.
+        Reading from the client is paused while any channel is over
+        the high water mark, and resumed once every channel is under
+        the low water mark.
+
+        """
+        self._pump_pending = False
+        if self.closed:
+            return
+        server = self.server
+        connection = self.connection
+        channels = self.channels
+        limit = server.write_limit
+        idle = 0
+        while channels and idle < len(channels):
+            if connection.buffered_bytes() >= limit:
+                break
+            index = self._next % len(channels)
+            channel = channels[index]
+            frames = channel.pop()
+            if frames is None:
+                if channel.closing:
+                    del channels[index]
+                    server._discard_channel(channel)
+                    continue
+                idle += 1
+                self._next = index + 1
+                continue
+            idle = 0
+            connection.write(frames)
+            self._next = index + 1
+        self.update_reading()
+
+    def channel_pushed(self, channel):
+        """ Pause reading if a channel has grown past the high water
+        mark.
+
+        A push only grows the queue of its channel, so only that
+        channel needs to be checked. Reading is resumed by the pump.
+
+        Parameters
+        ----------
+        channel : SessionChannel
+            The channel onto which a message was pushed.
+
+        """
+        if not self._paused:
+            if channel.queued_bytes() > self.server.high_water:
+                self._paused = True
+                self.connection.set_reading(False)
+
+    def update_reading(self):
+        """ Pause or resume reading based on the channel queue sizes.
+
+        """
+        server = self.server
+        if self._paused:
+            low = server.low_water
+            if all(c.queued_bytes() <= low for c in self.channels):
+                self._paused = False
+                self.connection.set_reading(True)
+        else:
+            high = server.high_water
+            if any(c.queued_bytes() > high for c in self.channels):
+                self._paused = True
+                self.connection.set_reading(False)
+
+    def on_message(self, frames):
+        """ Handle a message read from the connection.
+
+        """
+        session_id = frames[0]
+        if session_id == CONTROL_ID:
+            try:
+                object_id, action, content = decode_message(frames[1:])
+            except Exception:
+                logger.exception('invalid message from client')
+                return
+            dispatch_action(self, action, content)
+            return
+        channel = self.server._channels.get(session_id)
+        if channel is None or channel.handler is not self:
+            msg = 'message for invalid session from client: %s'
+            logger.warn(msg % session_id)
+            return
+        self.server._receive(channel, frames)
+
+    def on_close(self):
+        """ Handle the closing of the connection.
+
+        The sessions of the client are ended.
+
+        """
+        self.closed = True
+        server = self.server
+        for channel in self.channels:
+            channel.handler = None
+            channel.clear()
+            if channel.session_id in server._sessions:
+                server.end_session(channel.session_id)
+        self.channels = []
+
+    #--------------------------------------------------------------------------
+    # Control Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_discover(self, content):
+        """ Handle the 'discover' control action from the client.
+
+        """
+        reply = {'id': content.get('id'), 'sessions': self.server.discover()}
+        self.send_control('discover_reply', reply)
+
+    def on_action_start_session(self, content):
+        """ Handle the 'start_session' control action from the client.
+
+        """
+        server = self.server
+        try:
+            session_id = server.start_session(content['name'])
+        except ValueError as e:
+            reply = {'id': content.get('id'), 'message': str(e)}
+            self.send_control('error', reply)
+            return
+        server.attach_session(session_id, self, content.get('id'))
+
+    def on_action_end_session(self, content):
+        """ Handle the 'end_session' control action from the client.
+
+        """
+        session_id = content['session_id']
+        channel = self.server._channels.get(session_id)
+        if channel is not None and channel.handler is self:
+            self.server.end_session(session_id)
+
+
+class ServerApplication(Application):
+    """ A headless Enaml application which serves sessions to remote
+    clients.
+
+    A ServerApplication runs an event loop which accepts connections
+    from clients through a pluggable transport. A client may start any
+    number of sessions over its connection. Each session has its own
+    outbound queue. A client which does not read its messages fast
+    enough is throttled by pausing the reading of its requests, and
+    its sessions are ended if a queue exceeds the maximum size.
+
+    """
+    def __init__(self, factories, transport, loop=None,
+                 high_water=1024 * 1024, low_water=256 * 1024,
+                 max_queue_bytes=64 * 1024 * 1024, write_limit=256 * 1024):
+        """ Initialize a ServerApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor.
+
+        transport : Transport
+            The transport on which to accept client connections.
+
+        loop : EventLoop, optional
+            The event loop to use for the application. A new loop is
+            created by default.
+
+        high_water : int, optional
+            The size in bytes of a session queue above which reading
+            from the client of the session is paused.
+
+        low_water : int, optional
+            The size in bytes which every session queue of a client
+            must be under before reading from the client is resumed.
+
+        max_queue_bytes : int, optional
+            The size in bytes of a session queue above which the
+            session is ended.
+
+        write_limit : int, optional
+            The number of bytes which may be buffered for writing to a
+            connection before its session queues stop being pumped.
+
+        """
+        super(ServerApplication, self).__init__(factories)
+        self._transport = transport
+        self._loop = loop or EventLoop()
+        self._listening = False
+        self._sessions = {}
+        self._channels = {}
+        self.high_water = high_water
+        self.low_water = low_water
+        self.max_queue_bytes = max_queue_bytes
+        self.write_limit = write_limit
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_connection(self, connection):
+        """ Handle a new client connection from the transport.
+
+        """
+        ClientHandler(self, connection)
+
+    def _on_channel_push(self, channel):
+        """ Handle a message pushed onto a session channel.
+
+        """
+        if channel.queued_bytes() > self.max_queue_bytes:
+            msg = 'session `%s` exceeded its queue size and was ended'
+            logger.warn(msg % channel.session_id)
+            channel.clear()
+            if channel.session_id in self._sessions:
+                self._loop.call_soon(self._end_overflowed, channel.session_id)
+            return
+        handler = channel.handler
+        if handler is not None:
+            handler.schedule_pump()
+            handler.channel_pushed(channel)
+
+    def _receive(self, channel, frames):
+        """ Deliver a message from a client to the session of a channel.
+
+        Parameters
+        ----------
+        channel : SessionChannel
+            The channel of the session to which the message is sent.
+
+        frames : list
+            The frames of the message, including the session id.
+
+        """
+        try:
+            object_id, action, content = decode_message(frames[1:])
+        except Exception:
+            logger.exception('invalid message from client')
+            return
+        channel.socket.receive(object_id, action, content)
+
+    def _end_overflowed(self, session_id):
+        """ End a session whose channel overflowed its queue.
+
+        """
+        if session_id in self._sessions:
+            self.end_session(session_id)
+
+    def _discard_channel(self, channel):
+        """ Discard the channel of an ended session.
+
+        """
+        if self._channels.get(channel.session_id) is channel:
+            del self._channels[channel.session_id]
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start_session(self, name):
+        """ Start a new session of the given name.
+
+        The session is opened and activated, and its snapshot is held
+        until the session is attached to a client. The messages sent
+        by the session are queued until then.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session to start.
+
+        Returns
+        -------
+        result : str
+            The unique identifier for the created session.
+
+        """
+        session = self._open_session(name)
+        session_id = session.session_id
+        channel = SessionChannel(self, session_id)
+        channel.snapshot = session.snapshot()
+        self._sessions[session_id] = session
+        self._channels[session_id] = channel
+        session.activate(channel.socket)
+        return session_id
+
+    def end_session(self, session_id):
+        """ End the session with the given session id.
+
+        The 'close' message of the session is written to its client
+        before the channel of the session is discarded.
+
+        Parameters
+        ----------
+        session_id : str
+            The unique identifier for the session to close.
+
+        """
+        if session_id not in self._sessions:
+            raise ValueError('Invalid session id')
+        self._sessions.pop(session_id).close()
+        channel = self._channels.get(session_id)
+        if channel is not None:
+            channel.closing = True
+            handler = channel.handler
+            if handler is None:
+                self._discard_channel(channel)
+            else:
+                handler.schedule_pump()
+
+    def session(self, session_id):
+        """ Get the session for the given session id.
+
+        """
+        return self._sessions.get(session_id)
+
+    def sessions(self):
+        """ Get the currently active sessions for the application.
+
+        """
+        return self._sessions.values()
+
+    def start(self):
+        """ Start listening for clients and run the event loop.
+
+        """
+        self.listen()
+        self._loop.run()
+
+    def stop(self):
+        """ Stop the application's event loop.
+
+        """
+        self._loop.stop()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the event loop.
+
+        """
+        self._loop.call_soon(callback, *args, **kwargs)
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the event loop after a delay.
+
+        """
+        self._loop.call_later(ms / 1000.0, callback, *args, **kwargs)
+
+    def is_main_thread(self):
+        """ Indicates whether the caller is on the event loop thread.
+
+        """
+        return self._loop.is_loop_thread()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def session_ids(self):
+        """ Get the identifiers of the currently active sessions.
+
+        """
+        return self._sessions.keys()
+
+    def loop(self):
+        """ Get the event loop of the application.
+
+        """
+        return self._loop
+
+    def listen(self):
+        """ Start accepting client connections on the transport.
+
+        This is called by `start`. It may be called directly to accept
+        connections when the loop is driven by other means.
+
+        """
+        if not self._listening:
+            self._listening = True
+            self._transport.listen(self._loop, self._on_connection)
+
+    def attach_session(self, session_id, handler, request_id=None):
+        """ Attach a started session to a client.
+
+        The client is sent a 'session_started' control message with
+        the snapshot of the session, followed by the messages which
+        the session has queued since it was started.
+
+        Parameters
+        ----------
+        session_id : str
+            The identifier of a session which is not yet attached.
+
+        handler : ClientHandler
+            The handler for the client connection.
+
+        request_id : object, optional
+            The id of the client request which started the session.
+
+        """
+        channel = self._channels[session_id]
+        if channel.handler is not None:
+            raise ValueError('Session is already attached')
+        session = self._sessions[session_id]
+        content = {
+            'id': request_id,
+            'session_id': session_id,
+            'widget_groups': session.widget_groups[:],
+            'snapshot': channel.snapshot,
+        }
+        channel.snapshot = None
+        channel.handler = handler
+        handler.channels.append(channel)
+        frames = encode_message(CONTROL_ID, 'session_started', content)
+        frames.insert(0, CONTROL_ID)
+        channel.push(frames, first=True)
+
+    def destroy(self):
+        """ Destroy the application and stop accepting connections.
+
+        """
+        super(ServerApplication, self).destroy()
+        if self._listening:
+            self._transport.close()
+            self._listening = False
@@ -0,0 +1,286 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import deque
+import errno
+import logging
+import os
+import socket
+
+from .transport import Connection, FrameReader, Transport, pack_frames
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The errors which indicate that a non-blocking call would block.
+_WOULD_BLOCK = (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINPROGRESS)
+
+
+#: The number of bytes to read from a socket at once.
+_READ_SIZE = 256 * 1024
+
+
+class SocketConnection(Connection):
+    """ A Connection over a non-blocking stream socket.
+
+    """
+    def __init__(self, loop, sock):
+        """ Initialize a SocketConnection.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            The event loop on which to run the connection.
+
+        sock : socket
+            The connected stream socket.
+
+        """
+        sock.setblocking(False)
+        self._loop = loop
+        self._sock = sock
+        self._fd = sock.fileno()
+        self._reader = FrameReader()
+        self._chunks = deque()
+        self._buffered = 0
+        self._reading = False
+        self._closed = False
+        self._message_cb = None
+        self._drain_cb = None
+        self._close_cb = None
+        self.set_reading(True)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_readable(self):
+        """ Read the available data from the socket.
+
+        """
+        try:
+            data = self._sock.recv(_READ_SIZE)
+        except socket.error as e:
+            if e.args[0] in _WOULD_BLOCK:
+                return
+            self.close()
+            return
+        if not data:
+            self.close()
+            return
+        callback = self._message_cb
+        for frames in self._reader.feed(data):
+            if self._closed:
+                break
+            if callback is not None:
+                callback(frames)
+
+    def _on_writable(self):
+        """ Write the buffered data to the socket.
+
+        """
+        chunks = self._chunks
+        sock = self._sock
+        while chunks:
+            chunk = chunks[0]
+            try:
+                sent = sock.send(chunk)
+            except socket.error as e:
+                if e.args[0] in _WOULD_BLOCK:
+                    return
+                self.close()
+                return
+            self._buffered -= sent
+            if sent < len(chunk):
+                chunks[0] = buffer(chunk, sent)
+                return
+            chunks.popleft()
+        self._loop.remove_writer(self._fd)
+        callback = self._drain_cb
+        if callback is not None:
+            callback()
+
+    #--------------------------------------------------------------------------
+    # Connection Interface
+    #--------------------------------------------------------------------------
+    def on_message(self, callback):
+        """ Register the callback for messages read from the connection.
+
+        """
+        self._message_cb = callback
+
+    def on_drain(self, callback):
+        """ Register the callback for when the write buffer is empty.
+
+        """
+        self._drain_cb = callback
+
+    def on_close(self, callback):
+        """ Register the callback for when the connection is closed.
+
+        """
+        self._close_cb = callback
+
+    def write(self, frames):
+        """ Write a message to the connection.
+
+        """
+        if self._closed:
+            return
+        chunks = self._chunks
+        needs_writer = not chunks
+        for chunk in pack_frames(frames):
+            chunks.append(chunk)
+            self._buffered += len(chunk)
+        if needs_writer:
+            self._loop.add_writer(self._fd, self._on_writable)
+
+    def buffered_bytes(self):
+        """ Get the number of bytes waiting to be written.
+
+        """
+        return self._buffered
+
+    def set_reading(self, reading):
+        """ Pause or resume reading messages from the connection.
+
+        """
+        if self._closed or reading == self._reading:
+            return
+        self._reading = reading
+        if reading:
+            self._loop.add_reader(self._fd, self._on_readable)
+        else:
+            self._loop.remove_reader(self._fd)
+
+    def close(self):
+        """ Close the connection.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+        loop = self._loop
+        loop.remove_reader(self._fd)
+        loop.remove_writer(self._fd)
+        self._chunks.clear()
+        self._buffered = 0
+        try:
+            self._sock.close()
+        except socket.error:
+            pass
+        callback = self._close_cb
+        self._message_cb = self._drain_cb = self._close_cb = None
+        if callback is not None:
+            callback()
+
+
+class SocketTransport(Transport):
+    """ A Transport over TCP or Unix domain stream sockets.
+
+    """
+    def __init__(self, address):
+        """ Initialize a SocketTransport.
+
+        Parameters
+        ----------
+        address : tuple or str
+            A (host, port) tuple for a TCP socket, or a filesystem path
+            for a Unix domain socket. A port of zero chooses a free port
+            when listening; the chosen address is given by `address`.
+
+        """
+        self._address = address
+        self._sock = None
+        self._loop = None
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _make_socket(self):
+        """ Create an unconnected socket for the address.
+
+        """
+        if isinstance(self._address, basestring):
+            return socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _on_accept(self, callback):
+        """ Accept the pending connections on the listening socket.
+
+        """
+        while True:
+            try:
+                sock, addr = self._sock.accept()
+            except socket.error as e:
+                if e.args[0] in _WOULD_BLOCK:
+                    return
+                logger.exception('failed to accept connection')
+                return
+            if sock.family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            callback(SocketConnection(self._loop, sock))
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def address(self):
+        """ Get the address of the transport.
+
+        Returns
+        -------
+        result : tuple or str
+            The (host, port) of a TCP transport, or the path of a Unix
+            domain socket transport.
+
+        """
+        return self._address
+
+    #--------------------------------------------------------------------------
+    # Transport Interface
+    #--------------------------------------------------------------------------
+    def listen(self, loop, callback):
+        """ Start accepting connections.
+
+        """
+        sock = self._make_socket()
+        if isinstance(self._address, basestring):
+            if os.path.exists(self._address):
+                os.unlink(self._address)
+        else:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(self._address)
+        sock.listen(128)
+        sock.setblocking(False)
+        if not isinstance(self._address, basestring):
+            self._address = sock.getsockname()
+        self._sock = sock
+        self._loop = loop
+        loop.add_reader(sock.fileno(), lambda: self._on_accept(callback))
+
+    def connect(self, loop):
+        """ Make a connection to a listening transport.
+
+        """
+        sock = self._make_socket()
+        sock.connect(self._address)
+        return SocketConnection(loop, sock)
+
+    def close(self):
+        """ Stop accepting connections.
+
+        """
+        sock = self._sock
+        if sock is None:
+            return
+        self._loop.remove_reader(sock.fileno())
+        sock.close()
+        self._sock = None
+        if isinstance(self._address, basestring):
+            try:
+                os.unlink(self._address)
+            except OSError:
+                pass
@@ -0,0 +1,242 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from abc import ABCMeta, abstractmethod
+import struct
+
+
+#: The struct used for the frame count and frame lengths of a message.
+_UINT32 = struct.Struct('!I')
+
+
+#: Frames smaller than this are joined with the message header before
+#: being written, rather than written as separate chunks.
+_JOIN_LIMIT = 64 * 1024
+
+
+def pack_frames(frames):
+    """ Pack a multi-frame message into chunks for a byte stream.
+
+    A message is written as the number of frames followed by each frame
+    prefixed with its length, all as big-endian unsigned 32-bit ints.
+
+    Parameters
+    ----------
+    frames : list
+        The str or buffer frames of the message.
+
+    Returns
+    -------
+    result : list
+        The str or buffer chunks to write to the stream. Large frames
+        are returned as-is to avoid copying them.
+
+    """
+    pack = _UINT32.pack
+    chunks = []
+    parts = [pack(len(frames))]
+    for frame in frames:
+        parts.append(pack(len(frame)))
+        if len(frame) < _JOIN_LIMIT:
+            parts.append(str(frame))
+        else:
+            chunks.append(''.join(parts))
+            chunks.append(frame)
+            parts = []
+    if parts:
+        chunks.append(''.join(parts))
+    return chunks
+
+
+class FrameReader(object):
+    """ An incremental parser for messages packed with `pack_frames`.
+
+    """
+    def __init__(self):
+        """ Initialize a FrameReader.
+
+        """
+        self._buffer = bytearray()
+
+    def feed(self, data):
+        """ Feed bytes read from the stream to the parser.
+
+        Parameters
+        ----------
+        data : str
+            The bytes read from the stream.
+
+        Returns
+        -------
+        result : list
+            The list of messages completed by the data. Each message is
+            a list of str frames.
+
+        """
+        buf = self._buffer
+        buf.extend(data)
+        unpack = _UINT32.unpack_from
+        size = _UINT32.size
+        total = len(buf)
+        messages = []
+        offset = 0
+        while True:
+            if total - offset < size:
+                break
+            nframes = unpack(buf, offset)[0]
+            pos = offset + size
+            frames = []
+            for i in xrange(nframes):
+                if total - pos < size:
+                    break
+                length = unpack(buf, pos)[0]
+                pos += size
+                if total - pos < length:
+                    break
+                frames.append(str(buf[pos:pos + length]))
+                pos += length
+            if len(frames) < nframes:
+                break
+            messages.append(frames)
+            offset = pos
+        if offset:
+            del buf[:offset]
+        return messages
+
+
+class Connection(object):
+    """ An abstract base class for a connection made by a Transport.
+
+    A connection carries multi-frame messages in both directions. All
+    methods are called on the event loop thread.
+
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def on_message(self, callback):
+        """ Register the callback for messages read from the connection.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which accepts the list of frames of a message.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_drain(self, callback):
+        """ Register the callback for when the write buffer is empty.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which takes no arguments. It is invoked when all
+            of the buffered messages have been written.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_close(self, callback):
+        """ Register the callback for when the connection is closed.
+
+        Parameters
+        ----------
+        callback : callable
+            A callable which takes no arguments.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, frames):
+        """ Write a message to the connection.
+
+        The message is buffered and written when the connection is
+        writable.
+
+        Parameters
+        ----------
+        frames : list
+            The str or buffer frames of the message.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def buffered_bytes(self):
+        """ Get the number of bytes waiting to be written.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_reading(self, reading):
+        """ Pause or resume reading messages from the connection.
+
+        Parameters
+        ----------
+        reading : bool
+            Whether the connection should read messages.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """ Close the connection.
+
+        """
+        raise NotImplementedError
+
+
+class Transport(object):
+    """ An abstract base class for a server transport.
+
+    A transport accepts the connections made by remote clients and
+    creates the connections for clients to a server.
+
+    """
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def listen(self, loop, callback):
+        """ Start accepting connections.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            The event loop on which to run the transport.
+
+        callback : callable
+            A callable which accepts a new Connection.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def connect(self, loop):
+        """ Make a connection to a listening transport.
+
+        Parameters
+        ----------
+        loop : EventLoop
+            The event loop on which to run the connection.
+
+        Returns
+        -------
+        result : Connection
+            The connection to the server.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """ Stop accepting connections.
+
+        """
+        raise NotImplementedError
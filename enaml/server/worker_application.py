@@ -0,0 +1,317 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import cPickle
+import logging
+import types
+
+from enaml.application import Application
+from enaml.socket_interface import ActionSocketInterface
+from enaml.utils import make_dispatcher
+from enaml.weakmethod import WeakMethod
+from enaml.wire_format import decode_message, encode_message
+
+from .event_loop import EventLoop
+from .server_application import CONTROL_ID
+from .socket_transport import SocketConnection
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The dispatch function for the control actions sent by the front
+#: process of the pool.
+dispatch_action = make_dispatcher('on_action_', logger)
+
+
+class WorkerActionSocket(object):
+    """ An ActionSocketInterface implementation for a session hosted by
+    a WorkerApplication.
+
+    Messages sent on the socket are encoded and written to the front
+    process, which routes them to the client of the session.
+
+    """
+    def __init__(self, worker, session_id):
+        """ Initialize a WorkerActionSocket.
+
+        Parameters
+        ----------
+        worker : WorkerApplication
+            The application which hosts the session.
+
+        session_id : str
+            The identifier of the session.
+
+        """
+        self._worker = worker
+        self._session_id = session_id
+        self._callback = None
+
+    def on_message(self, callback):
+        """ Register a callback for receiving messages sent by a client
+        object.
+
+        """
+        if isinstance(callback, types.MethodType):
+            callback = WeakMethod(callback)
+        self._callback = callback
+
+    def send(self, object_id, action, content):
+        """ Send an action to the client of an object.
+
+        """
+        frames = encode_message(object_id, action, content)
+        frames.insert(0, self._session_id)
+        self._worker.write(frames)
+
+    def receive(self, object_id, action, content):
+        """ Receive a message sent by the client.
+
+        """
+        callback = self._callback
+        if callback is not None:
+            callback(object_id, action, content)
+
+
+ActionSocketInterface.register(WorkerActionSocket)
+
+
+class WorkerApplication(Application):
+    """ An Enaml application which hosts a shard of the sessions of a
+    ProcessServerApplication in a worker process.
+
+    The worker is connected to the front process by a single stream.
+    The front process starts and ends sessions with control messages,
+    and forwards the messages of clients without decoding them.
+
+    """
+    def __init__(self, factories, connection, loop):
+        """ Initialize a WorkerApplication.
+
+        Parameters
+        ----------
+        factories : iterable
+            An iterable of SessionFactory instances to pass to the
+            superclass constructor.
+
+        connection : Connection
+            The connection to the front process.
+
+        loop : EventLoop
+            The event loop which runs the connection.
+
+        """
+        super(WorkerApplication, self).__init__(factories)
+        connection.on_message(self._on_message)
+        connection.on_close(self._on_close)
+        self._connection = connection
+        self._loop = loop
+        self._sessions = {}
+        self._sockets = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _on_message(self, frames):
+        """ Handle a message read from the front process.
+
+        """
+        session_id = frames[0]
+        try:
+            object_id, action, content = decode_message(frames[1:])
+        except Exception:
+            logger.exception('invalid message from front process')
+            return
+        if session_id == CONTROL_ID:
+            dispatch_action(self, action, content)
+            return
+        socket = self._sockets.get(session_id)
+        if socket is None:
+            msg = 'message for invalid session: %s:%s'
+            logger.warn(msg % (session_id, action))
+            return
+        socket.receive(object_id, action, content)
+
+    def _on_close(self):
+        """ Handle the closing of the connection to the front process.
+
+        """
+        self._loop.stop()
+
+    def _send_control(self, action, content):
+        """ Send a control message to the front process.
+
+        """
+        frames = encode_message(CONTROL_ID, action, content)
+        frames.insert(0, CONTROL_ID)
+        self.write(frames)
+
+    def _start(self, name, session_id):
+        """ Open and activate a session with the given id.
+
+        The session id is assigned by the front process, so the session
+        cannot be taken from the session pool.
+
+        """
+        if name not in self._named_factories:
+            raise ValueError('Invalid session name')
+        session = self._named_factories[name]()
+        session.open(session_id)
+        self._activate(session)
+
+    def _activate(self, session):
+        """ Activate an opened session.
+
+        The 'session_started' control message, which carries the
+        snapshot of the session, is sent before the session is
+        activated so that it precedes the messages of the session.
+
+        """
+        session_id = session.session_id
+        content = {
+            'session_id': session_id,
+            'widget_groups': session.widget_groups[:],
+            'snapshot': session.snapshot(),
+        }
+        socket = WorkerActionSocket(self, session_id)
+        self._sessions[session_id] = session
+        self._sockets[session_id] = socket
+        self._send_control('session_started', content)
+        session.activate(socket)
+
+    #--------------------------------------------------------------------------
+    # Control Action Handlers
+    #--------------------------------------------------------------------------
+    def on_action_start_session(self, content):
+        """ Handle the 'start_session' control action.
+
+        """
+        session_id = content['session_id']
+        try:
+            self._start(content['name'], session_id)
+        except Exception as e:
+            logger.exception('failed to start session')
+            self._sessions.pop(session_id, None)
+            self._sockets.pop(session_id, None)
+            reply = {'session_id': session_id, 'message': str(e)}
+            self._send_control('session_failed', reply)
+
+    def on_action_end_session(self, content):
+        """ Handle the 'end_session' control action.
+
+        """
+        session_id = content['session_id']
+        if session_id in self._sessions:
+            self.end_session(session_id)
+
+    #--------------------------------------------------------------------------
+    # Abstract API Implementation
+    #--------------------------------------------------------------------------
+    def start_session(self, name):
+        """ Start a new session of the given name.
+
+        """
+        session = self._open_session(name)
+        self._activate(session)
+        return session.session_id
+
+    def end_session(self, session_id):
+        """ End the session with the given session id.
+
+        The front process is sent a 'session_ended' control message
+        after the messages sent by the session while closing.
+
+        """
+        if session_id not in self._sessions:
+            raise ValueError('Invalid session id')
+        self._sessions.pop(session_id).close()
+        self._sockets.pop(session_id, None)
+        self._send_control('session_ended', {'session_id': session_id})
+
+    def session(self, session_id):
+        """ Get the session for the given session id.
+
+        """
+        return self._sessions.get(session_id)
+
+    def sessions(self):
+        """ Get the currently active sessions for the application.
+
+        """
+        return self._sessions.values()
+
+    def start(self):
+        """ Run the event loop until the front process disconnects.
+
+        """
+        self._loop.run()
+
+    def stop(self):
+        """ Stop the application's event loop.
+
+        """
+        self._loop.stop()
+
+    def deferred_call(self, callback, *args, **kwargs):
+        """ Invoke a callable on the next cycle of the event loop.
+
+        """
+        self._loop.call_soon(callback, *args, **kwargs)
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        """ Invoke a callable on the event loop after a delay.
+
+        """
+        self._loop.call_later(ms / 1000.0, callback, *args, **kwargs)
+
+    def is_main_thread(self):
+        """ Indicates whether the caller is on the event loop thread.
+
+        """
+        return self._loop.is_loop_thread()
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def write(self, frames):
+        """ Write a message to the front process.
+
+        """
+        self._connection.write(frames)
+
+
+def worker_main(factory_data, sock, inherited=()):
+    """ The entry point of a worker process of a ProcessServerApplication.
+
+    Parameters
+    ----------
+    factory_data : str
+        The pickled list of SessionFactory instances. The session
+        classes are imported by reference when the data is loaded.
+
+    sock : socket
+        The worker end of the stream to the front process.
+
+    inherited : iterable, optional
+        The sockets inherited from the front process which must be
+        closed, so that the front process and the other workers see
+        their streams close when their owners exit.
+
+    """
+    for other in inherited:
+        other.close()
+    # The application of the front process is inherited when the
+    # worker is forked, and the worker must create its own.
+    Application._instance = None
+    factories = cPickle.loads(factory_data)
+    loop = EventLoop()
+    connection = SocketConnection(loop, sock)
+    app = WorkerApplication(factories, connection, loop)
+    try:
+        app.start()
+    finally:
+        app.destroy()
+        connection.close()
+        loop.close()
@@ -131,16 +131,21 @@ class URLReply(object):
         ----------
         resource : Resource
             The loaded resource object, or None if the resource failed
-            to load.
+            to load. The reply may be invoked with preview resources
+            before it is invoked with the final resource.
 
         """
+        final = not getattr(resource, 'preview', False)
+        session = self._session
+        if final:
+            session._url_requests.pop(self._req_id, None)
         reply = {'id': self._req_id, 'url': self._url}
         if resource is None:
             reply['status'] = 'fail'
         else:
             reply['status'] = 'ok'
+            reply['final'] = final
             reply['resource'] = resource.snapshot()
-        session = self._session
         session.send(session.session_id, 'url_reply', reply)
 
 
@@ -212,6 +217,11 @@ class Session(HasTraits):
     #: This value should not be manipulated by user code.
     _registered_objects = Instance(dict, ())
 
+    #: A private dictionary which maps the id of a pending url request
+    #: to the cancellable request object returned by the resource
+    #: manager. This value should not be manipulated by user code.
+    _url_requests = Instance(dict, ())
+
     #: The private deferred message batch used for collapsing layout
     #: related messages into a single batch to send to the client
     #: session for more efficient handling.
@@ -362,8 +372,16 @@ class Session(HasTraits):
             window.destroy()
         self.windows = []
         self._registered_objects = {}
-        self.socket.on_message(None)
-        self.socket = None
+        requests = self._url_requests.values()
+        self._url_requests = {}
+        for request in requests:
+            if request is not None:
+                request.cancel()
+        # A session which was opened but never activated, such as a
+        # pooled session, has no socket.
+        if self.socket is not None:
+            self.socket.on_message(None)
+            self.socket = None
         self.state = 'closed'
 
     def add_window(self, window):
@@ -542,6 +560,37 @@ class Session(HasTraits):
         """
         url = content['url']
         metadata = content['metadata']
-        reply = URLReply(self, content['id'], url)
-        self.resource_manager.load(url, metadata, reply)
+        req_id = content['id']
+        reply = URLReply(self, req_id, url)
+        # The entry is added before the load, since a resource which is
+        # loaded synchronously is replied to from within `load`, and
+        # its final reply removes the entry.
+        requests = self._url_requests
+        requests[req_id] = None
+        request = self.resource_manager.load(url, metadata, reply)
+        if req_id in requests:
+            if request is None:
+                del requests[req_id]
+            else:
+                requests[req_id] = request
+
+    def on_action_url_priority(self, content):
+        """ Handle the 'url_priority' action from the client session.
+
+        The priority of a pending request is raised, if the request
+        supports it.
+
+        """
+        request = self._url_requests.get(content['id'])
+        raise_priority = getattr(request, 'raise_priority', None)
+        if raise_priority is not None:
+            raise_priority(content['priority'])
+
+    def on_action_url_cancel(self, content):
+        """ Handle the 'url_cancel' action from the client session.
+
+        """
+        request = self._url_requests.pop(content['id'], None)
+        if request is not None:
+            request.cancel()
 
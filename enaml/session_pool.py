@@ -0,0 +1,186 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from collections import deque
+import logging
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+
+#: The scheduler priority of the tasks which refill a pool. It is lower
+#: than the default priority so that refilling yields to other tasks.
+REFILL_PRIORITY = -100
+
+
+class SessionPool(object):
+    """ A pool of opened sessions which are waiting to be activated.
+
+    Opening a session builds and initializes the declarative trees of
+    all of its windows, which dominates the time taken to start it. A
+    pool opens sessions ahead of time so that starting a session only
+    requires taking one from the pool and activating it. A pool is
+    refilled by low priority tasks on the application scheduler, one
+    session per task.
+
+    """
+    def __init__(self, application):
+        """ Initialize a SessionPool.
+
+        Parameters
+        ----------
+        application : Application
+            The application which owns the pool.
+
+        """
+        self._application = application
+        self._sizes = {}
+        self._idle = {}
+        self._tasks = {}
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _open(self, name):
+        """ Open a new session of the given name.
+
+        """
+        factory = self._application._named_factories[name]
+        session = factory()
+        session.open(uuid.uuid4().hex)
+        return session
+
+    def _fill(self, name):
+        """ Open a session for the pool of the given name.
+
+        This is run as a scheduled task. Another task is scheduled if
+        the pool remains below its size.
+
+        """
+        self._tasks.pop(name, None)
+        idle = self._idle.get(name)
+        if idle is None or len(idle) >= self._sizes.get(name, 0):
+            return
+        try:
+            session = self._open(name)
+        except Exception:
+            msg = 'failed to open a session for the `%s` pool'
+            logger.exception(msg % name)
+            return
+        idle.append(session)
+        self.refill(name)
+
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def set_size(self, name, size):
+        """ Set the number of sessions to keep open for a session name.
+
+        The pool is refilled or trimmed in the background as needed. A
+        size of zero removes the pool.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session factory of the pool.
+
+        size : int
+            The number of opened sessions to keep in the pool.
+
+        """
+        if size < 0:
+            raise ValueError('The pool size must be non-negative')
+        if size == 0:
+            self._sizes.pop(name, None)
+            self.discard(name)
+            return
+        self._sizes[name] = size
+        idle = self._idle.setdefault(name, deque())
+        while len(idle) > size:
+            idle.pop().close()
+        self.refill(name)
+
+    def size(self, name):
+        """ Get the configured size of the pool for a session name.
+
+        """
+        return self._sizes.get(name, 0)
+
+    def idle_count(self, name):
+        """ Get the number of opened sessions in the pool for a name.
+
+        """
+        return len(self._idle.get(name, ()))
+
+    def acquire(self, name):
+        """ Take an opened session from the pool.
+
+        The pool is refilled in the background.
+
+        Parameters
+        ----------
+        name : str
+            The name of the session factory.
+
+        Returns
+        -------
+        result : Session or None
+            An opened session which has not been activated, or None if
+            the pool for the name is empty.
+
+        """
+        idle = self._idle.get(name)
+        if not idle:
+            session = None
+        else:
+            session = idle.popleft()
+        if name in self._sizes:
+            self.refill(name)
+        return session
+
+    def refill(self, name):
+        """ Schedule a task to refill the pool for a session name.
+
+        This is a no-op if the pool is full or a task is pending.
+
+        """
+        if name in self._tasks:
+            return
+        if self.idle_count(name) >= self._sizes.get(name, 0):
+            return
+        app = self._application
+        task = app.schedule(self._fill, (name,), priority=REFILL_PRIORITY)
+        self._tasks[name] = task
+
+    def discard(self, name):
+        """ Close the pooled sessions for a session name.
+
+        This is called when the factory for the name is replaced, so
+        that sessions are not handed out from an old factory. The pool
+        is refilled in the background if it has a size.
+
+        """
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.unschedule()
+        for session in self._idle.pop(name, ()):
+            session.close()
+        if name in self._sizes:
+            self._idle[name] = deque()
+            self.refill(name)
+
+    def clear(self):
+        """ Close all of the pooled sessions and remove all pools.
+
+        """
+        for task in self._tasks.values():
+            task.unschedule()
+        self._tasks = {}
+        self._sizes = {}
+        idle = self._idle
+        self._idle = {}
+        for sessions in idle.values():
+            for session in sessions:
+                session.close()
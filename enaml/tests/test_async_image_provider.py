@@ -0,0 +1,199 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from threading import Event, Lock
+import time
+import unittest
+
+from enaml.async_image_provider import AsyncImageProvider
+from enaml.image_provider import Image
+from enaml.tests.test_local_socket import LoopApplication
+
+
+class GatedProvider(AsyncImageProvider):
+    """ A provider whose loads block until the gate is opened.
+
+    """
+    def __init__(self, max_workers=1):
+        super(GatedProvider, self).__init__(max_workers)
+        self.gate = Event()
+        self.lock = Lock()
+        self.loaded = []
+
+    def load_image(self, path, size):
+        with self.lock:
+            self.loaded.append(path)
+        self.gate.wait()
+        return Image(data=path)
+
+
+class TestAsyncImageProvider(unittest.TestCase):
+    """ Unit tests for the thread pooled AsyncImageProvider.
+
+    """
+    def setUp(self):
+        self.app = LoopApplication()
+        self.provider = GatedProvider()
+
+    def tearDown(self):
+        self.provider.shutdown()
+        self.app.destroy()
+
+    def wait_for(self, predicate):
+        """ Process events until the predicate is true or timeout.
+
+        """
+        deadline = time.time() + 5.0
+        while not predicate():
+            if time.time() > deadline:
+                self.fail('timed out waiting for the provider')
+            time.sleep(0.005)
+            self.app.process_events()
+
+    def test_duplicate_requests_share_a_load(self):
+        """ Test that concurrent requests for an image load it once.
+
+        """
+        provider = self.provider
+        results = []
+        provider.request_image('a', (-1, -1), results.append)
+        provider.request_image('a', (-1, -1), results.append)
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 2)
+        self.assertEqual(provider.loaded, ['a'])
+        self.assertIs(results[0], results[1])
+        self.assertEqual(results[0].data, 'a')
+
+    def test_priority_order(self):
+        """ Test that queued loads run in order of priority.
+
+        """
+        provider = self.provider
+        results = []
+        provider.request_image('first', (-1, -1), results.append)
+        self.wait_for(lambda: provider.loaded == ['first'])
+        provider.request_image('low', (-1, -1), results.append)
+        provider.request_image('high', (-1, -1), results.append, 5)
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 3)
+        self.assertEqual(provider.loaded, ['first', 'high', 'low'])
+
+    def test_raised_priority(self):
+        """ Test that a duplicate request can raise the priority.
+
+        """
+        provider = self.provider
+        results = []
+        provider.request_image('first', (-1, -1), results.append)
+        self.wait_for(lambda: provider.loaded == ['first'])
+        provider.request_image('a', (-1, -1), results.append)
+        provider.request_image('b', (-1, -1), results.append, 1)
+        provider.request_image('a', (-1, -1), results.append, 2)
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 4)
+        self.assertEqual(provider.loaded, ['first', 'a', 'b'])
+
+    def test_request_raise_priority(self):
+        """ Test that a queued request can raise its own priority.
+
+        """
+        provider = self.provider
+        results = []
+        provider.request_image('first', (-1, -1), results.append)
+        self.wait_for(lambda: provider.loaded == ['first'])
+        provider.request_image('a', (-1, -1), results.append, 1)
+        request = provider.request_image('b', (-1, -1), results.append)
+        request.raise_priority(2)
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 3)
+        self.assertEqual(provider.loaded, ['first', 'b', 'a'])
+        request.raise_priority(5)
+
+    def test_cancel_before_load(self):
+        """ Test that a cancelled request is never loaded.
+
+        """
+        provider = self.provider
+        results = []
+        provider.request_image('first', (-1, -1), results.append)
+        self.wait_for(lambda: provider.loaded == ['first'])
+        request = provider.request_image('a', (-1, -1), results.append)
+        request.cancel()
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 1)
+        time.sleep(0.05)
+        self.app.process_events()
+        self.assertEqual(provider.loaded, ['first'])
+        self.assertEqual(len(results), 1)
+
+    def test_cancel_one_of_shared_requests(self):
+        """ Test that cancelling one request does not cancel the others
+        which share its load.
+
+        """
+        provider = self.provider
+        kept = []
+        cancelled = []
+        request = provider.request_image('a', (-1, -1), cancelled.append)
+        provider.request_image('a', (-1, -1), kept.append)
+        request.cancel()
+        provider.gate.set()
+        self.wait_for(lambda: len(kept) == 1)
+        self.assertEqual(cancelled, [])
+
+    def test_cancel_during_load(self):
+        """ Test that a request cancelled while loading is not delivered.
+
+        """
+        provider = self.provider
+        results = []
+        request = provider.request_image('a', (-1, -1), results.append)
+        self.wait_for(lambda: provider.loaded == ['a'])
+        request.cancel()
+        provider.request_image('b', (-1, -1), results.append)
+        provider.gate.set()
+        self.wait_for(lambda: len(results) == 1)
+        self.assertEqual(results[0].data, 'b')
+
+    def test_preview_before_final(self):
+        """ Test that a preview is delivered before the final image.
+
+        """
+        class PreviewProvider(GatedProvider):
+            def load_preview(self, path, size):
+                return Image(data='preview')
+
+        provider = PreviewProvider()
+        results = []
+        try:
+            provider.request_image('a', (-1, -1), results.append)
+            self.wait_for(lambda: len(results) == 1)
+            self.assertTrue(results[0].preview)
+            provider.gate.set()
+            self.wait_for(lambda: len(results) == 2)
+        finally:
+            provider.shutdown()
+        self.assertEqual(results[1].data, 'a')
+        self.assertFalse(results[1].preview)
+
+    def test_failed_load(self):
+        """ Test that an exception in a load delivers None.
+
+        """
+        class FailingProvider(AsyncImageProvider):
+            def load_image(self, path, size):
+                raise ValueError(path)
+
+        provider = FailingProvider()
+        results = []
+        try:
+            provider.request_image('a', (-1, -1), results.append)
+            self.wait_for(lambda: len(results) == 1)
+        finally:
+            provider.shutdown()
+        self.assertIsNone(results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.combo_box import ComboBox
+from enaml.widgets.container import Container
+from enaml.widgets.item_model import ListModel
+from enaml.widgets.model_combo_box import ModelComboBox
+from enaml.widgets.window import Window
+
+
+class ComboSession(Session):
+    """ A session with a combo box and a model combo box.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        self.combo = ComboBox(
+            parent=container, name='combo', items=[u'a', u'b', u'c'],
+            index=1,
+        )
+        symbols = [u'SYM%05d' % i for i in range(20000)]
+        self.model = ListModel(items=symbols)
+        self.model_combo = ModelComboBox(
+            parent=container, name='model_combo', model=self.model,
+            search_limit=5,
+        )
+        self.windows = [window]
+
+
+class TestComboBox(unittest.TestCase):
+    """ Tests for the server side of the ComboBox and ModelComboBox.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('combos', 'Combo boxes', ComboSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('combos')
+        self.session = self.app.session(session_id)
+        self.client = self.app.client_session(session_id)
+        self.messages = []
+        self.client.set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self, name):
+        obj = self.client.find(name)
+        return [
+            (action, content) for object_id, action, content in self.messages
+            if object_id == obj.object_id()
+        ]
+
+    def test_items_mutations(self):
+        combo = self.session.combo
+        combo.items.append(u'd')
+        combo.items.insert(0, u'z')
+        del combo.items[2:4]
+        self.app.process_events()
+        self.assertEqual(self.actions('combo'), [
+            ('insert_items', {'index': 3, 'items': [u'd']}),
+            ('insert_items', {'index': 0, 'items': [u'z']}),
+            ('set_index', {'index': 2}),
+            ('remove_items', {'index': 2, 'count': 2}),
+            ('set_index', {'index': -1}),
+        ])
+        self.assertEqual(combo.items, [u'z', u'a', u'd'])
+
+    def test_items_replacement(self):
+        combo = self.session.combo
+        combo.items[1] = u'x'
+        combo.items[::2] = [u'p', u'q']
+        combo.items = [u'n']
+        self.app.process_events()
+        self.assertEqual(self.actions('combo'), [
+            ('replace_items', {'index': 1, 'items': [u'x']}),
+            ('set_items', {'items': [u'p', u'x', u'q']}),
+            ('set_items', {'items': [u'n']}),
+        ])
+        self.assertEqual(combo.index, 1)
+
+    def test_negative_and_clipped_indices(self):
+        combo = self.session.combo
+        del combo.items[-1]
+        del combo.items[-2]
+        combo.items[5:] = [u'z']
+        self.app.process_events()
+        self.assertEqual(self.actions('combo'), [
+            ('remove_items', {'index': 2, 'count': 1}),
+            ('remove_items', {'index': 0, 'count': 1}),
+            ('set_index', {'index': 0}),
+            ('set_items', {'items': [u'b', u'z']}),
+        ])
+        self.assertEqual(combo.selected_item, u'b')
+
+    def test_replace_selected_item_keeps_selection(self):
+        combo = self.session.combo
+        combo.items[1] = u'x'
+        self.app.process_events()
+        self.assertEqual(combo.index, 1)
+        self.assertEqual(combo.selected_item, u'x')
+        actions = [action for action, content in self.actions('combo')]
+        self.assertNotIn('remove_items', actions)
+        self.assertNotIn('set_index', actions)
+
+    def test_model_snapshot_has_shape_only(self):
+        state = self.client.find('model_combo').state
+        self.assertEqual(state['row_count'], 20000)
+        self.assertEqual(state['index'], -1)
+        self.assertNotIn('items', state)
+
+    def test_model_fetch_and_select(self):
+        obj = self.client.find('model_combo')
+        obj.send_action('fetch_rows', {'ranges': [[100, 2]], 'generation': 0})
+        obj.send_action('index_changed', {'index': 101})
+        self.app.process_events()
+        self.assertEqual(self.actions('model_combo'), [
+            ('rows', {
+                'ranges': [[100, [[u'SYM00100'], [u'SYM00101']]]],
+                'row_count': 20000,
+                'generation': 0,
+            }),
+        ])
+        self.assertEqual(self.session.model_combo.selected_item, u'SYM00101')
+
+    def test_model_search(self):
+        obj = self.client.find('model_combo')
+        obj.send_action('search', {'text': u'sym1999', 'request': 7})
+        obj.send_action('search', {'text': u'', 'request': 8})
+        self.app.process_events()
+        self.assertEqual(self.actions('model_combo'), [
+            ('search_results', {'request': 7, 'matches': [
+                [19990, u'SYM19990'], [19991, u'SYM19991'],
+                [19992, u'SYM19992'], [19993, u'SYM19993'],
+                [19994, u'SYM19994'],
+            ]}),
+            ('search_results', {'request': 8, 'matches': []}),
+        ])
+
+    def test_model_changes_track_index(self):
+        combo = self.session.model_combo
+        combo.index = 10
+        self.session.model.insert_items(0, [u'NEW'])
+        self.assertEqual(combo.index, 11)
+        self.session.model.remove_items(5, 2)
+        self.assertEqual(combo.index, 9)
+        self.session.model.remove_items(9, 1)
+        self.assertEqual(combo.index, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
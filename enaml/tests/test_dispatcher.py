@@ -0,0 +1,114 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.utils import make_dispatcher
+
+
+class Base(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def on_action_a(self, content):
+        self.calls.append(('base_a', content))
+
+    def on_action_b(self, content):
+        self.calls.append(('base_b', content))
+
+
+class Derived(Base):
+
+    def on_action_b(self, content):
+        self.calls.append(('derived_b', content))
+
+    @staticmethod
+    def on_action_static(calls):
+        calls.append('static')
+
+
+class TestMakeDispatcher(unittest.TestCase):
+    """ Unit tests for the cached dispatcher returned by make_dispatcher.
+
+    """
+    def setUp(self):
+        self.dispatch = make_dispatcher('on_action_')
+
+    def test_inherited_handlers(self):
+        """ Test that inherited and overridden handlers are resolved.
+
+        """
+        obj = Derived()
+        self.dispatch(obj, 'a', 1)
+        self.dispatch(obj, 'b', 2)
+        self.assertEqual(obj.calls, [('base_a', 1), ('derived_b', 2)])
+
+    def test_table_cached(self):
+        """ Test that the dispatch table is computed once per class.
+
+        """
+        table = self.dispatch.dispatch_table(Derived)
+        self.assertIs(table, self.dispatch.dispatch_table(Derived))
+        self.assertEqual(sorted(table), ['a', 'b', 'static'])
+
+    def test_static_handler(self):
+        """ Test that static method handlers do not receive the object.
+
+        """
+        calls = []
+        self.dispatch(Derived(), 'static', calls)
+        self.assertEqual(calls, ['static'])
+
+    def test_dynamic_fallback(self):
+        """ Test that handlers not in the table are still found.
+
+        """
+        obj = Base()
+        self.dispatch(obj, 'a', 0)
+        calls = []
+        obj.on_action_late = calls.append
+        self.dispatch(obj, 'late', 1)
+        self.assertEqual(calls, [1])
+
+    def test_instance_handler_overrides_class(self):
+        """ Test that a handler on the instance overrides the class.
+
+        """
+        obj = Base()
+        self.dispatch(obj, 'a', 0)
+        calls = []
+        obj.on_action_a = calls.append
+        self.dispatch(obj, 'a', 1)
+        self.assertEqual(calls, [1])
+        self.assertEqual(obj.calls, [('base_a', 0)])
+
+    def test_replaced_class_handler(self):
+        """ Test that a handler replaced on a class is only seen once
+        the table is invalidated.
+
+        """
+        class Patched(Base):
+            pass
+        obj = Patched()
+        self.dispatch(obj, 'a', 0)
+        Patched.on_action_a = lambda self, c: self.calls.append(('new', c))
+        self.dispatch(obj, 'a', 1)
+        self.dispatch.invalidate(Base)
+        self.dispatch(obj, 'a', 2)
+        self.assertEqual(obj.calls, [
+            ('base_a', 0), ('base_a', 1), ('new', 2),
+        ])
+
+    def test_missing_handler(self):
+        """ Test that dispatching to a missing handler is a no-op.
+
+        """
+        obj = Base()
+        self.dispatch(obj, 'missing', 0)
+        self.assertEqual(obj.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
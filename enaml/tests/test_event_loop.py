@@ -0,0 +1,100 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import resource
+import select
+import socket
+import unittest
+
+from enaml.server.event_loop import EventLoop, PollPoller, SelectPoller
+
+
+class PollerTests(object):
+    """ Tests which are run for each poller of the event loop.
+
+    """
+    def make_poller(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.loop = EventLoop(self.make_poller())
+        self.left, self.right = socket.socketpair()
+
+    def tearDown(self):
+        self.loop.close()
+        self.left.close()
+        self.right.close()
+
+    def test_reader(self):
+        calls = []
+        self.loop.add_reader(self.left.fileno(), lambda: calls.append(1))
+        self.loop.run_once(0)
+        self.assertEqual(calls, [])
+        self.right.send('x')
+        self.loop.run_once(1.0)
+        self.assertEqual(calls, [1])
+        self.loop.remove_reader(self.left)
+        self.loop.run_once(0)
+        self.assertEqual(calls, [1])
+
+    def test_reader_and_writer(self):
+        calls = []
+        fd = self.left.fileno()
+        self.loop.add_reader(fd, lambda: calls.append('read'))
+        self.loop.add_writer(fd, lambda: calls.append('write'))
+        self.loop.run_once(1.0)
+        self.assertEqual(calls, ['write'])
+        self.right.send('x')
+        self.loop.remove_writer(fd)
+        self.loop.run_once(1.0)
+        self.assertEqual(calls, ['write', 'read'])
+
+    def test_hangup_is_readable(self):
+        calls = []
+        self.loop.add_reader(self.left.fileno(), lambda: calls.append(1))
+        self.right.close()
+        self.loop.run_once(1.0)
+        self.assertEqual(calls, [1])
+
+    def test_call_soon(self):
+        calls = []
+        self.loop.call_soon(calls.append, 1)
+        self.loop.run_once(0)
+        self.assertEqual(calls, [1])
+
+
+class TestSelectPoller(PollerTests, unittest.TestCase):
+
+    def make_poller(self):
+        return SelectPoller()
+
+
+@unittest.skipUnless(
+    hasattr(select, 'epoll') or hasattr(select, 'poll'), 'requires poll'
+)
+class TestPollPoller(PollerTests, unittest.TestCase):
+
+    def make_poller(self):
+        return PollPoller()
+
+    def test_descriptor_above_fd_setsize(self):
+        target = 2048
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY and soft <= target:
+            self.skipTest('the descriptor limit is too low')
+        fd = os.dup2(self.left.fileno(), target) or target
+        try:
+            calls = []
+            self.loop.add_reader(fd, lambda: calls.append(1))
+            self.right.send('x')
+            self.loop.run_once(1.0)
+            self.assertEqual(calls, [1])
+            self.loop.remove_reader(fd)
+        finally:
+            os.close(fd)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.validation.api import IntValidator
+from enaml.widgets.container import Container
+from enaml.widgets.field import Field
+from enaml.widgets.window import Window
+
+
+class FieldSession(Session):
+    """ A session with a single validated field.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        self.field = Field(
+            parent=container, name='field', validator=IntValidator(),
+            submit_triggers=['auto_sync'],
+        )
+        self.windows = [window]
+
+
+class TestField(unittest.TestCase):
+    """ Tests for the server side of the Field submissions.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('field', 'A field', FieldSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('field')
+        self.session = self.app.session(session_id)
+        self.client = self.app.client_session(session_id)
+        self.messages = []
+        self.client.set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self):
+        obj = self.client.find('field')
+        return [
+            (action, content) for object_id, action, content in self.messages
+            if object_id == obj.object_id()
+        ]
+
+    def test_snapshot(self):
+        state = self.client.find('field').state
+        self.assertEqual(state['submit_triggers'], ['auto_sync'])
+        self.assertEqual(state['sync_delay'], 300)
+
+    def test_submissions_are_coalesced(self):
+        field = self.session.field
+        changes = []
+        field.on_trait_change(lambda new: changes.append(new), 'text')
+        obj = self.client.find('field')
+        obj.send_action('submit_text', {'text': u'1', 'request': 1})
+        obj.send_action('submit_text', {'text': u'12', 'request': 2})
+        obj.send_action('submit_text', {'text': u'12x', 'request': 3})
+        self.app.process_events()
+        self.assertEqual(self.actions(), [
+            ('invalid_text', {'text': u'12x', 'request': 3}),
+        ])
+        self.assertEqual(changes, [])
+        obj.send_action('submit_text', {'text': u'123', 'request': 4})
+        self.app.process_events()
+        self.assertEqual(changes, [u'123'])
+        self.assertEqual(len(self.actions()), 1)
+
+    def test_sync_delay_is_published(self):
+        self.session.field.sync_delay = 50
+        self.app.process_events()
+        self.assertEqual(self.actions(), [
+            ('set_sync_delay', {'sync_delay': 50}),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
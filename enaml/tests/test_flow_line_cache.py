@@ -0,0 +1,137 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import random
+import unittest
+
+from enaml.qt.flow_line_cache import FlowLine, FlowLineCache
+
+
+def reference_breaks(metrics, extent, spacing):
+    """ Compute the line breaks of a list of metrics without a cache.
+
+    """
+    breaks = []
+    line = None
+    for index, m in enumerate(metrics):
+        if line is None or not line.add(m, extent, spacing):
+            line = FlowLine(index)
+            line.add(m, extent, spacing)
+            breaks.append(line)
+    return [(l.start, l.end, l.hint_extent, l.min_ortho) for l in breaks]
+
+
+class Items(object):
+    """ A list of item metrics which counts the measured items.
+
+    """
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.measured = 0
+
+    def measure(self, index):
+        self.measured += 1
+        return self.metrics[index]
+
+
+def make_metrics(width, height=20):
+    return (width, width // 2, height, height // 2, 0, 0)
+
+
+class TestFlowLineCache(unittest.TestCase):
+    """ Unit tests for the FlowLineCache.
+
+    """
+    def setUp(self):
+        self.items = Items([make_metrics(50) for i in range(100)])
+        self.cache = FlowLineCache()
+        self.cache.insert(0, 100)
+
+    def lines(self, extent, spacing=10):
+        lines = self.cache.lines(extent, spacing, self.items.measure)
+        return [(l.start, l.end, l.hint_extent, l.min_ortho) for l in lines]
+
+    def check(self, extent, spacing=10):
+        expected = reference_breaks(self.items.metrics, extent, spacing)
+        self.assertEqual(self.lines(extent, spacing), expected)
+
+    def test_initial_lines(self):
+        self.check(290)
+        self.assertEqual(self.items.measured, 100)
+        self.assertEqual(len(self.lines(290)), 20)
+
+    def test_cached_lines_are_reused(self):
+        self.check(290)
+        first = self.cache.lines(290, 10, self.items.measure)
+        self.items.measured = 0
+        second = self.cache.lines(295, 10, self.items.measure)
+        self.assertEqual(self.items.measured, 0)
+        self.assertEqual([id(l) for l in first], [id(l) for l in second])
+
+    def test_width_change(self):
+        self.check(290)
+        self.check(170)
+        self.check(1000)
+        self.check(10)
+        self.assertEqual(self.items.measured, 100)
+
+    def test_invalidate_rebuilds_from_affected_line(self):
+        self.check(290)
+        before = self.cache.lines(290, 10, self.items.measure)
+        self.items.metrics[52] = make_metrics(50, 40)
+        self.cache.invalidate(52)
+        self.items.measured = 0
+        after = self.cache.lines(290, 10, self.items.measure)
+        self.assertEqual(self.items.measured, 1)
+        self.assertIs(after[0], before[0])
+        self.assertIsNot(after[10], before[10])
+        self.assertIs(after[11], before[11])
+        self.check(290)
+
+    def test_insert_and_remove(self):
+        self.check(290)
+        self.items.metrics[10:10] = [make_metrics(120)] * 3
+        self.cache.insert(10, 3)
+        self.check(290)
+        del self.items.metrics[0:5]
+        self.cache.remove(0, 5)
+        self.check(290)
+        del self.items.metrics[-1]
+        self.cache.remove(len(self.items.metrics))
+        self.check(290)
+
+    def test_spacing_change(self):
+        self.check(290)
+        self.check(290, spacing=0)
+
+    def test_oversized_item(self):
+        self.items.metrics[3] = make_metrics(500)
+        self.cache.invalidate(3)
+        self.check(290)
+
+    def test_random_operations(self):
+        rnd = random.Random(7)
+        metrics = self.items.metrics
+        for i in range(300):
+            op = rnd.randint(0, 3)
+            if op == 0:
+                index = rnd.randint(0, len(metrics))
+                count = rnd.randint(1, 4)
+                widths = [rnd.randint(10, 200) for j in range(count)]
+                metrics[index:index] = map(make_metrics, widths)
+                self.cache.insert(index, count)
+            elif op == 1 and metrics:
+                index = rnd.randint(0, len(metrics) - 1)
+                count = min(rnd.randint(1, 3), len(metrics) - index)
+                del metrics[index:index + count]
+                self.cache.remove(index, count)
+            elif op == 2 and metrics:
+                index = rnd.randint(0, len(metrics) - 1)
+                metrics[index] = make_metrics(rnd.randint(10, 200))
+                self.cache.invalidate(index)
+            self.check(rnd.randint(50, 600))
+
+
+if __name__ == '__main__':
+    unittest.main()
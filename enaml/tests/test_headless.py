@@ -0,0 +1,107 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.headless.load_test import LoadTest, percentile
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.container import Container
+from enaml.widgets.field import Field
+from enaml.widgets.window import Window
+
+
+class FieldSession(Session):
+    """ A session with a field which echoes its text as upper case into
+    its placeholder.
+
+    """
+    def on_open(self):
+        window = Window(name='window')
+        container = Container(parent=window)
+        field = Field(parent=container, name='field')
+
+        def echo(text):
+            field.placeholder = text.upper()
+        field.on_trait_change(echo, 'text')
+        self.windows = [window]
+
+
+class TestHeadlessApplication(unittest.TestCase):
+    """ Tests for the HeadlessApplication and HeadlessSession.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('field', 'A field session', FieldSession)
+        self.app = HeadlessApplication([factory])
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_build_from_snapshot(self):
+        session_id = self.app.start_session('field')
+        client = self.app.client_session(session_id)
+        self.assertEqual(client.object_count(), 3)
+        field = client.find('field')
+        self.assertEqual(field.class_name, 'Field')
+        self.assertEqual(field.state['text'], u'')
+        self.assertEqual(field.parent().parent(), client.find('window'))
+
+    def test_action_round_trip(self):
+        session_id = self.app.start_session('field')
+        client = self.app.client_session(session_id)
+        client.find('field').send_action('submit_text', {'text': u'abc'})
+        self.app.process_events()
+        server_field = self.app.session(session_id).windows[0].find('field')
+        self.assertEqual(server_field.text, u'abc')
+        self.assertEqual(client.find('field').state['placeholder'], u'ABC')
+
+    def test_end_session(self):
+        session_id = self.app.start_session('field')
+        client = self.app.client_session(session_id)
+        self.app.end_session(session_id)
+        self.app.process_events()
+        self.assertTrue(client.closed)
+        self.assertEqual(client.object_count(), 0)
+
+
+class TestLoadTest(unittest.TestCase):
+    """ Tests for the LoadTest harness.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('field', 'A field session', FieldSession)
+        self.app = HeadlessApplication([factory])
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_run(self):
+        seen = []
+
+        def script(client, iteration):
+            seen.append(client)
+            text = u'text %d' % iteration
+            client.find('field').send_action('submit_text', {'text': text})
+
+        result = LoadTest(self.app, 'field', script, 3, 4).run()
+        self.assertEqual(len(set(seen)), 3)
+        self.assertEqual(len(result.latencies), 12)
+        self.assertEqual(len(result.startup), 3)
+        self.assertTrue(result.throughput() > 0)
+        self.assertIn('throughput', result.report())
+        self.assertEqual(self.app.sessions(), [])
+        self.assertTrue(all(client.closed for client in seen))
+
+    def test_percentile(self):
+        values = [5, 1, 4, 2, 3]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 3)
+        self.assertEqual(percentile(values, 100), 5)
+        self.assertEqual(percentile([], 50), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
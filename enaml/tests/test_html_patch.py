@@ -0,0 +1,157 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.html_patch import element_range, patch_html
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.container import Container
+from enaml.widgets.html import Html
+from enaml.widgets.web_view import WebView
+from enaml.widgets.window import Window
+
+
+DOCUMENT = (
+    '<html><body class="report">'
+    '<div id="log"><p>one</p><div><p>nested</p></div></div>'
+    '<!-- <div id="hidden"></div> -->'
+    '<ul id=items><li>a</li></ul>'
+    '<br id="br"/>'
+    '</body></html>'
+)
+
+
+class TestHtmlPatch(unittest.TestCase):
+    """ Tests for the html patch utilities.
+
+    """
+    def test_element_range(self):
+        start, end = element_range(DOCUMENT, 'log')
+        self.assertEqual(
+            DOCUMENT[start:end], '<p>one</p><div><p>nested</p></div>'
+        )
+        start, end = element_range(DOCUMENT, 'items')
+        self.assertEqual(DOCUMENT[start:end], '<li>a</li>')
+
+    def test_body_range(self):
+        start, end = element_range(DOCUMENT, '')
+        self.assertTrue(DOCUMENT[start:].startswith('<div id="log">'))
+        self.assertEqual(DOCUMENT[end:], '</body></html>')
+        self.assertEqual(element_range('<p>x</p>', ''), (0, 8))
+
+    def test_missing_elements(self):
+        self.assertRaises(ValueError, element_range, DOCUMENT, 'hidden')
+        self.assertRaises(ValueError, element_range, DOCUMENT, 'br')
+        self.assertRaises(ValueError, element_range, DOCUMENT, 'lo')
+
+    def test_unclosed_element(self):
+        source = '<div id="log"><p>one'
+        self.assertEqual(element_range(source, 'log'), (14, len(source)))
+
+    def test_modes(self):
+        source = '<div id="x"><p>a</p></div>'
+        self.assertEqual(
+            patch_html(source, 'x', '<p>b</p>'),
+            '<div id="x"><p>a</p><p>b</p></div>',
+        )
+        self.assertEqual(
+            patch_html(source, 'x', '<p>b</p>', 'prepend'),
+            '<div id="x"><p>b</p><p>a</p></div>',
+        )
+        self.assertEqual(
+            patch_html(source, 'x', 'b', 'replace'), '<div id="x">b</div>'
+        )
+        self.assertRaises(ValueError, patch_html, source, 'x', 'b', 'bad')
+
+
+class HtmlSession(Session):
+    """ A session with an html widget and a web view.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        self.html = Html(
+            parent=container, name='html',
+            source='<body><div id="log"></div></body>',
+        )
+        self.web_view = WebView(parent=container, name='web_view')
+        self.windows = [window]
+
+
+class TestHtmlWidgets(unittest.TestCase):
+    """ Tests for the server side of the streamed html updates.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('html', 'Html widgets', HtmlSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('html')
+        self.session = self.app.session(session_id)
+        self.client = self.app.client_session(session_id)
+        self.messages = []
+        self.client.set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self, name):
+        obj = self.client.find(name)
+        return [
+            (action, content) for object_id, action, content in self.messages
+            if object_id == obj.object_id()
+        ]
+
+    def test_html_patch_sends_fragment(self):
+        html = self.session.html
+        html.patch_source('<p>1</p>', 'log')
+        html.patch_source('<p>0</p>', 'log', 'prepend')
+        self.app.process_events()
+        self.assertEqual(html.source, (
+            '<body><div id="log"><p>0</p><p>1</p></div></body>'
+        ))
+        self.assertEqual(self.actions('html'), [
+            ('patch_html', {
+                'element_id': 'log', 'html': '<p>1</p>', 'mode': 'append',
+            }),
+            ('patch_html', {
+                'element_id': 'log', 'html': '<p>0</p>', 'mode': 'prepend',
+            }),
+        ])
+
+    def test_html_patch_missing_element(self):
+        html = self.session.html
+        self.assertRaises(ValueError, html.patch_source, '<p/>', 'other')
+        self.app.process_events()
+        self.assertEqual(self.actions('html'), [])
+
+    def test_web_view_patch(self):
+        web_view = self.session.web_view
+        web_view.patch_html(u'<p>a</p>')
+        web_view.patch_html(u'<p>b</p>')
+        self.app.process_events()
+        self.assertEqual(web_view.html, u'<p>a</p><p>b</p>')
+        self.assertEqual(
+            [action for action, content in self.actions('web_view')],
+            ['patch_html', 'patch_html'],
+        )
+
+    def test_web_view_patch_with_url(self):
+        web_view = self.session.web_view
+        web_view.url = u'http://example.com'
+        self.assertRaises(ValueError, web_view.patch_html, u'<p>a</p>')
+        self.app.process_events()
+        self.assertEqual(web_view.html, u'')
+        self.assertEqual(
+            [action for action, content in self.actions('web_view')],
+            ['set_url'],
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import time
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.image_cache import CachingReply, ImageCache
+from enaml.image_provider import Image, ImageProvider
+from enaml.resource_manager import ResourceManager
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.tests.test_local_socket import LoopApplication
+
+
+class CountingProvider(ImageProvider):
+    """ A provider which counts the images it loads.
+
+    """
+    cache_key = 'counting'
+
+    def __init__(self, requests=None):
+        self.requests = requests if requests is not None else []
+
+    def request_image(self, path, size, callback):
+        self.requests.append((path, size))
+        callback(Image(data='x' * 16, size=size))
+
+
+def fake_resample(image, size):
+    return Image(data=image.data[:4], size=size)
+
+
+def wait_for(app, predicate):
+    """ Process the events of an app until the predicate is true.
+
+    """
+    deadline = time.time() + 5.0
+    while not predicate():
+        if time.time() > deadline:
+            raise AssertionError('timed out waiting for the cache')
+        time.sleep(0.005)
+        app.process_events()
+
+
+class TestImageCache(unittest.TestCase):
+    """ Unit tests for the server side ImageCache.
+
+    """
+    def test_exact_hit(self):
+        cache = ImageCache()
+        image = Image(data='abc')
+        cache.put('p', 'a.png', (10, 10), image)
+        self.assertIs(cache.get('p', 'a.png', [10, 10]), image)
+        self.assertIsNone(cache.get('p', 'a.png', (20, 20)))
+        self.assertIsNone(cache.get('q', 'a.png', (10, 10)))
+
+    def test_resampled_variant(self):
+        app = LoopApplication()
+        cache = ImageCache(resampler=fake_resample)
+        try:
+            self.assertIsNone(
+                cache.request_resampled('p', 'a.png', (8, 8), None)
+            )
+            cache.put('p', 'a.png', (-1, -1), Image(data='abcdefgh'))
+            self.assertIsNone(cache.get('p', 'a.png', (8, 8)))
+            results = []
+            reply = CachingReply(cache, 'p', 'a.png', (8, 8), results.append)
+            request = cache.request_resampled('p', 'a.png', (8, 8), reply)
+            self.assertIsNotNone(request)
+            wait_for(app, lambda: results)
+        finally:
+            cache.shutdown()
+            app.destroy()
+        image = results[0]
+        self.assertEqual(image.data, 'abcd')
+        self.assertEqual(image.size, (8, 8))
+        self.assertIs(cache.get('p', 'a.png', (8, 8)), image)
+
+    def test_memory_bound(self):
+        cache = ImageCache(max_bytes=10)
+        cache.put('p', 'a', (-1, -1), Image(data='x' * 6))
+        cache.put('p', 'b', (-1, -1), Image(data='x' * 6))
+        self.assertEqual(cache.stats()['bytes'], 6)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_previews_are_not_cached(self):
+        cache = ImageCache()
+        results = []
+        reply = CachingReply(cache, 'p', 'a', (-1, -1), results.append)
+        reply(Image(data='low', preview=True))
+        self.assertIsNone(cache.get('p', 'a', (-1, -1)))
+        reply(Image(data='full'))
+        self.assertEqual(cache.get('p', 'a', (-1, -1)).data, 'full')
+        self.assertEqual(len(results), 2)
+
+
+class TestResourceManagerImageCache(unittest.TestCase):
+    """ Tests for the image cache shared by resource managers.
+
+    """
+    def setUp(self):
+        self.app = LoopApplication()
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_cache_shared_by_managers(self):
+        requests = []
+        results = []
+        for i in range(3):
+            manager = ResourceManager()
+            manager.image_providers['icons'] = CountingProvider(requests)
+            metadata = {'size': [16, 16]}
+            manager.load('image://icons/open.png', metadata, results.append)
+        self.assertEqual(requests, [('/open.png', (16, 16))])
+        self.assertEqual(len(results), 3)
+        self.assertIs(results[0], results[2])
+
+    def test_provider_without_key_is_not_cached(self):
+        provider = CountingProvider()
+        provider.cache_key = None
+        manager = ResourceManager()
+        manager.image_providers['icons'] = provider
+        results = []
+        for i in range(2):
+            manager.load('image://icons/open.png', {}, results.append)
+        self.assertEqual(len(provider.requests), 2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(manager.image_cache.stats()['bytes'], 0)
+
+    def test_sizes_are_cached_separately(self):
+        provider = CountingProvider()
+        manager = ResourceManager()
+        manager.image_cache = ImageCache(resampler=lambda i, s: None)
+        manager.image_providers['icons'] = provider
+        results = []
+        manager.load('image://icons/open.png', {}, results.append)
+        metadata = {'size': (8, 8)}
+        manager.load('image://icons/open.png', metadata, results.append)
+        wait_for(self.app, lambda: len(results) == 2)
+        manager.load('image://icons/open.png', {}, results.append)
+        self.assertEqual(
+            provider.requests, [('/open.png', (-1, -1)), ('/open.png', (8, 8))]
+        )
+        manager.image_cache.shutdown()
+
+    def test_resampled_load_is_cached(self):
+        provider = CountingProvider()
+        manager = ResourceManager()
+        manager.image_cache = ImageCache(resampler=fake_resample)
+        manager.image_providers['icons'] = provider
+        results = []
+        manager.load('image://icons/open.png', {}, results.append)
+        request = manager.load(
+            'image://icons/open.png', {'size': (8, 8)}, results.append
+        )
+        self.assertIsNotNone(request)
+        wait_for(self.app, lambda: len(results) == 2)
+        manager.image_cache.shutdown()
+        self.assertEqual(provider.requests, [('/open.png', (-1, -1))])
+        self.assertEqual(results[1].size, (8, 8))
+        request = manager.load(
+            'image://icons/open.png', {'size': (8, 8)}, results.append
+        )
+        self.assertIsNone(request)
+        self.assertIs(results[2], results[1])
+
+
+
+class ImageSession(Session):
+    """ A session with a synchronous image provider.
+
+    """
+    def on_open(self):
+        self.provider = CountingProvider()
+        self.resource_manager.image_providers['icons'] = self.provider
+
+
+class TestSessionURLRequests(unittest.TestCase):
+    """ Tests for the url requests tracked by a session.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('images', 'Images', ImageSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('images')
+        self.session = self.app.session(session_id)
+        self.client = self.app.client_session(session_id)
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_synchronous_replies_are_not_tracked(self):
+        client = self.client
+        req_ids = [client.load_resource('image://icons/open.png')]
+        self.app.process_events()
+        req_ids.append(client.load_resource('image://icons/open.png'))
+        self.app.process_events()
+        for req_id in req_ids:
+            self.assertEqual(client.url_replies[req_id]['status'], 'ok')
+        self.assertEqual(len(self.session.provider.requests), 1)
+        self.assertEqual(self.session._url_requests, {})
+
+    def test_images_are_shared_by_sessions(self):
+        self.client.load_resource('image://icons/open.png')
+        self.app.process_events()
+        session_id = self.app.start_session('images')
+        session = self.app.session(session_id)
+        client = self.app.client_session(session_id)
+        req_id = client.load_resource('image://icons/open.png')
+        self.app.process_events()
+        self.assertEqual(client.url_replies[req_id]['status'], 'ok')
+        self.assertEqual(len(self.session.provider.requests), 1)
+        self.assertEqual(session.provider.requests, [])
+
+if __name__ == '__main__':
+    unittest.main()
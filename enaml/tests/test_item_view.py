@@ -0,0 +1,150 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.container import Container
+from enaml.widgets.item_model import ItemModel, ListModel
+from enaml.widgets.item_view import MAX_FETCH_ROWS
+from enaml.widgets.list_view import ListView
+from enaml.widgets.table_view import TableView
+from enaml.widgets.window import Window
+
+
+class LargeModel(ItemModel):
+    """ A table model which computes its values on demand.
+
+    """
+    def row_count(self):
+        return 10 ** 6
+
+    def column_count(self):
+        return 2
+
+    def data(self, row, column):
+        return row * 10 + column
+
+
+class ViewSession(Session):
+    """ A session with a list view and a table view.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        self.list_model = ListModel(items=range(50))
+        self.table_model = LargeModel()
+        ListView(parent=container, name='list', model=self.list_model)
+        TableView(parent=container, name='table', model=self.table_model)
+        self.windows = [window]
+
+
+class TestItemView(unittest.TestCase):
+    """ Tests for the server side of the ListView and TableView.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('views', 'Item views', ViewSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('views')
+        self.session = self.app.session(session_id)
+        self.client = self.app.client_session(session_id)
+        self.messages = []
+        self.client.set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self, name):
+        obj = self.client.find(name)
+        return [
+            (action, content) for object_id, action, content in self.messages
+            if object_id == obj.object_id()
+        ]
+
+    def fetch(self, name, ranges):
+        obj = self.client.find(name)
+        content = {'ranges': ranges, 'generation': 3}
+        obj.send_action('fetch_rows', content)
+        self.app.process_events()
+        action, content = self.actions(name)[-1]
+        self.assertEqual(action, 'rows')
+        return content
+
+    def test_snapshot_has_shape_only(self):
+        state = self.client.find('table').state
+        self.assertEqual(state['row_count'], 10 ** 6)
+        self.assertEqual(state['column_count'], 2)
+        self.assertEqual(state['headers'], [None, None])
+        self.assertNotIn('items', state)
+        self.assertEqual(self.client.find('list').state['row_count'], 50)
+
+    def test_fetch_rows(self):
+        content = self.fetch('table', [[100, 2], [999999, 10]])
+        self.assertEqual(content['generation'], 3)
+        self.assertEqual(content['row_count'], 10 ** 6)
+        self.assertEqual(content['ranges'], [
+            [100, [[1000, 1001], [1010, 1011]]],
+            [999999, [[9999990, 9999991]]],
+        ])
+
+    def test_fetch_is_bounded(self):
+        content = self.fetch('table', [[0, 10 ** 6], [-5, 10], [2 * 10 ** 6, 1]])
+        ranges = content['ranges']
+        self.assertEqual(len(ranges), 1)
+        self.assertEqual(len(ranges[0][1]), MAX_FETCH_ROWS)
+
+    def test_list_model_changes(self):
+        model = self.session.list_model
+        model.insert_items(5, [100, 101])
+        model.remove_items(0, 1)
+        model.update_item(3, 42)
+        model.items = range(3)
+        self.app.process_events()
+        self.assertEqual(self.actions('list'), [
+            ('rows_inserted', {'row': 5, 'count': 2}),
+            ('rows_removed', {'row': 0, 'count': 1}),
+            ('data_changed', {'row': 3, 'count': 1}),
+            ('reset', {'row_count': 3, 'column_count': 1, 'headers': [None]}),
+        ])
+        content = self.fetch('list', [[0, 64]])
+        self.assertEqual(content['ranges'], [[0, [[u'0'], [u'1'], [u'2']]]])
+
+    def test_selection_and_activation(self):
+        view = self.session.windows[0].find('list')
+        activated = []
+        view.on_trait_change(lambda row: activated.append(row), 'activated')
+        obj = self.client.find('list')
+        obj.send_action('selection_changed', {'rows': [1, 4]})
+        obj.send_action('activated', {'row': 4})
+        self.app.process_events()
+        self.assertEqual(view.selected_rows, [1, 4])
+        self.assertEqual(activated, [4])
+        self.assertEqual(self.actions('list'), [])
+
+
+    def test_selection_follows_model_changes(self):
+        view = self.session.windows[0].find('list')
+        model = self.session.list_model
+        obj = self.client.find('list')
+        obj.send_action('selection_changed', {'rows': [1, 4, 8]})
+        self.app.process_events()
+        model.insert_items(3, [100, 101])
+        self.assertEqual(view.selected_rows, [1, 6, 10])
+        model.remove_items(5, 3)
+        self.assertEqual(view.selected_rows, [1, 7])
+        model.items = range(3)
+        self.assertEqual(view.selected_rows, [])
+        self.app.process_events()
+        actions = [action for action, content in self.actions('list')]
+        self.assertNotIn('set_selected_rows', actions)
+
+
+if __name__ == '__main__':
+    unittest.main()
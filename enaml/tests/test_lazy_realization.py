@@ -0,0 +1,166 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.container import Container
+from enaml.widgets.field import Field
+from enaml.widgets.flow_area import FlowArea
+from enaml.widgets.flow_item import FlowItem
+from enaml.widgets.notebook import Notebook
+from enaml.widgets.page import Page
+from enaml.widgets.stack import Stack
+from enaml.widgets.stack_item import StackItem
+from enaml.widgets.window import Window
+
+
+class LazySession(Session):
+    """ A session with a lazy notebook, a lazy stack and a virtual
+    flow area.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        notebook = Notebook(parent=container, name='notebook', lazy=True)
+        for i in range(3):
+            page = Page(parent=notebook, name='page%d' % i)
+            content = Container(parent=page)
+            Field(parent=content, name='field%d' % i)
+        stack = Stack(parent=container, name='stack', lazy=True)
+        for i in range(3):
+            item = StackItem(parent=stack, name='item%d' % i)
+            content = Container(parent=item)
+            Field(parent=content, name='stack_field%d' % i)
+        flow = FlowArea(parent=container, name='flow', virtual=True)
+        for i in range(3):
+            item = FlowItem(parent=flow, name='flow_item%d' % i)
+            content = Container(parent=item)
+            Field(parent=content, name='flow_field%d' % i)
+        self.windows = [window]
+
+
+class TestLazyRealization(unittest.TestCase):
+    """ Tests for the lazy realization of Notebook, Stack and FlowArea
+    contents.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('lazy', 'Lazy widgets', LazySession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('lazy')
+        self.window = self.app.session(session_id).windows[0]
+        self.client = self.app.client_session(session_id)
+        self.messages = []
+        self.client.set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self):
+        self.app.process_events()
+        return [(action, content) for _, action, content in self.messages]
+
+    def test_only_shown_contents_are_built(self):
+        client = self.client
+        self.assertIsNotNone(client.find('field0'))
+        self.assertIsNone(client.find('field1'))
+        self.assertIsNone(client.find('field2'))
+        self.assertIsNotNone(client.find('stack_field0'))
+        self.assertIsNone(client.find('stack_field1'))
+        self.assertFalse(client.find('page1').state['children_realized'])
+        self.assertIsNotNone(client.find('page1'))
+
+    def test_realize_on_request(self):
+        self.window.find('field1').text = u'changed'
+        self.assertEqual(self.actions(), [])
+        self.client.find('page1').send_action('realize_children', {})
+        self.app.process_events()
+        field = self.client.find('field1')
+        self.assertIsNotNone(field)
+        self.assertEqual(field.state['text'], u'changed')
+        self.window.find('field1').text = u'again'
+        self.app.process_events()
+        self.assertEqual(field.state['text'], u'again')
+
+    def test_unrealize_on_request(self):
+        page = self.client.find('page0')
+        page.send_action('unrealize_children', {})
+        self.app.process_events()
+        self.assertIsNone(self.client.find('field0'))
+        del self.messages[:]
+        self.window.find('field0').text = u'hidden'
+        self.assertEqual(self.actions(), [])
+        page.send_action('realize_children', {})
+        self.app.process_events()
+        self.assertEqual(self.client.find('field0').state['text'], u'hidden')
+
+    def test_snapshot_keeps_client_current_page(self):
+        notebook = self.window.find('notebook')
+        page1 = self.window.find('page1')
+        client_page = self.client.find('page1')
+        client_page.send_action('realize_children', {})
+        content = {'page_id': client_page.object_id()}
+        self.client.find('notebook').send_action(
+            'current_page_changed', content
+        )
+        self.app.process_events()
+        snap = notebook.snapshot()
+        self.assertEqual(snap['current_page'], page1.object_id)
+        self.assertTrue(page1.children_realized())
+        self.assertFalse(self.window.find('page0').children_realized())
+
+    def test_children_added_to_unrealized_page(self):
+        page = self.window.find('page2')
+        Field(parent=page.children[0], name='extra')
+        self.assertEqual(self.actions(), [])
+        self.client.find('page2').send_action('realize_children', {})
+        self.app.process_events()
+        self.assertIsNotNone(self.client.find('extra'))
+
+    def test_stack_index_realizes_item(self):
+        self.window.find('stack').index = 2
+        actions = [action for action, content in self.actions()]
+        self.assertEqual(actions, ['realize_children', 'set_index'])
+        self.assertIsNotNone(self.client.find('stack_field2'))
+        self.assertIsNone(self.client.find('stack_field1'))
+
+    def test_virtual_flow_items_are_placeholders(self):
+        client = self.client
+        state = client.find('flow').state
+        self.assertTrue(state['virtual'])
+        self.assertEqual(state['placeholder_size'], (100, 100))
+        for i in range(3):
+            item = client.find('flow_item%d' % i)
+            self.assertFalse(item.state['children_realized'])
+            self.assertIsNone(client.find('flow_field%d' % i))
+        client.find('flow_item1').send_action('realize_children', {})
+        self.app.process_events()
+        self.assertIsNotNone(client.find('flow_field1'))
+
+    def test_item_added_to_virtual_flow(self):
+        flow = self.window.find('flow')
+        item = FlowItem(parent=flow, name='flow_extra')
+        Field(parent=Container(parent=item), name='flow_extra_field')
+        self.app.process_events()
+        self.assertFalse(
+            self.client.find('flow_extra').state['children_realized']
+        )
+        self.assertIsNone(self.client.find('flow_extra_field'))
+
+    def test_disable_virtual_flow(self):
+        self.window.find('flow').virtual = False
+        actions = [action for action, content in self.actions()]
+        self.assertEqual(actions, ['realize_children'] * 3 + ['set_virtual'])
+        for i in range(3):
+            self.assertIsNotNone(self.client.find('flow_field%d' % i))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.widgets.container import Container
+from enaml.widgets.list_control import ListControl, make_item_data
+from enaml.widgets.window import Window
+
+
+class ListSession(Session):
+    """ A session with a list control of data items.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        control = ListControl(parent=container, name='list')
+        control.set_items([u'a', u'b', {'text': u'c', 'checked': False}])
+        self.windows = [window]
+
+
+class TestListControl(unittest.TestCase):
+    """ Tests for the data items of the ListControl.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('list', 'A list control', ListSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('list')
+        session = self.app.session(session_id)
+        self.control = session.windows[0].find('list')
+        self.client = self.app.client_session(session_id).find('list')
+        self.messages = []
+        self.app.client_session(session_id).set_message_listener(
+            lambda *msg: self.messages.append(msg)
+        )
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self):
+        self.app.process_events()
+        object_id = self.client.object_id()
+        return [
+            (action, content) for oid, action, content in self.messages
+            if oid == object_id
+        ]
+
+    def texts(self):
+        return [data['text'] for data in self.control.items()]
+
+    def test_make_item_data(self):
+        self.assertEqual(make_item_data('x'), {'text': u'x'})
+        self.assertEqual(make_item_data({'checked': True}), {'checked': True})
+        self.assertRaises(TypeError, make_item_data, 1)
+        self.assertRaises(ValueError, make_item_data, {'bogus': 1})
+
+    def test_snapshot_items(self):
+        items = self.client.state['items']
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[2], {'text': u'c', 'checked': False})
+        self.assertEqual(self.client.state['items_generation'], 1)
+        self.assertIsNot(items, self.control._item_data)
+
+    def test_set_items_is_one_message(self):
+        self.control.set_items(unicode(i) for i in range(10000))
+        actions = self.actions()
+        self.assertEqual(len(actions), 1)
+        action, content = actions[0]
+        self.assertEqual(action, 'set_items')
+        self.assertEqual(len(content['items']), 10000)
+        self.assertEqual(self.control.item_count(), 10000)
+
+    def test_insert_and_remove_items(self):
+        self.control.insert_items(1, [u'x', u'y'])
+        self.control.remove_items(0, 2)
+        self.control.remove_items(10, 1)
+        self.assertEqual(self.texts(), [u'y', u'b', u'c'])
+        self.assertEqual(self.actions(), [
+            ('insert_items', {'index': 1, 'items': [{'text': u'x'},
+                                                    {'text': u'y'}],
+                              'generation': 2}),
+            ('remove_items', {'index': 0, 'count': 2, 'generation': 3}),
+        ])
+
+    def test_move_items(self):
+        self.control.move_items(0, 2, 1)
+        self.control.move_items(0, 1, 0)
+        self.assertEqual(self.texts(), [u'c', u'a', u'b'])
+        self.assertEqual(self.actions(), [
+            ('move_items', {'index': 0, 'count': 2, 'destination': 1,
+                            'generation': 2}),
+        ])
+
+    def test_update_items(self):
+        self.control.update_items(2, [u'z', u'ignored'])
+        self.assertEqual(self.texts(), [u'a', u'b', u'z'])
+        self.assertEqual(self.actions(), [
+            ('update_items', {'index': 2, 'items': [{'text': u'z'}]}),
+        ])
+
+    def test_item_events(self):
+        changed = []
+        clicked = []
+        otc = self.control.on_trait_change
+        otc(lambda index: changed.append(index), 'item_changed')
+        otc(lambda index: clicked.append(index), 'item_clicked')
+        content = {
+            'index': 2, 'text': u'C', 'checked': True, 'generation': 1,
+        }
+        self.client.send_action('item_changed', content)
+        self.client.send_action('item_clicked', {'index': 1, 'generation': 1})
+        self.app.process_events()
+        self.assertEqual(changed, [2])
+        self.assertEqual(clicked, [1])
+        data = self.control.items()[2]
+        self.assertEqual(data, {'text': u'C', 'checked': True})
+
+    def test_stale_item_events_are_dropped(self):
+        changed = []
+        clicked = []
+        otc = self.control.on_trait_change
+        otc(lambda index: changed.append(index), 'item_changed')
+        otc(lambda index: clicked.append(index), 'item_clicked')
+        self.control.remove_items(0, 1)
+        content = {
+            'index': 1, 'text': u'B', 'checked': None, 'generation': 1,
+        }
+        self.client.send_action('item_changed', content)
+        self.client.send_action('item_clicked', {'index': 5, 'generation': 2})
+        self.app.process_events()
+        self.assertEqual(changed, [])
+        self.assertEqual(clicked, [])
+        self.assertEqual(self.texts(), [u'b', u'c'])
+
+
+if __name__ == '__main__':
+    unittest.main()
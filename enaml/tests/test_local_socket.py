@@ -0,0 +1,120 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.application import Application
+from enaml.local_socket import local_socket_pair
+
+
+class LoopApplication(Application):
+    """ A minimal application which runs deferred calls on demand.
+
+    """
+    def __init__(self):
+        super(LoopApplication, self).__init__([])
+        self.pending = []
+
+    def process_events(self):
+        while self.pending:
+            pending = self.pending
+            self.pending = []
+            for callback, args, kwargs in pending:
+                callback(*args, **kwargs)
+
+    def start_session(self, name):
+        raise NotImplementedError
+
+    def end_session(self, session_id):
+        raise NotImplementedError
+
+    def session(self, session_id):
+        return None
+
+    def sessions(self):
+        return []
+
+    def start(self):
+        self.process_events()
+
+    def stop(self):
+        pass
+
+    def deferred_call(self, callback, *args, **kwargs):
+        self.pending.append((callback, args, kwargs))
+
+    def timed_call(self, ms, callback, *args, **kwargs):
+        self.pending.append((callback, args, kwargs))
+
+    def is_main_thread(self):
+        return True
+
+
+class TestLocalActionSocket(unittest.TestCase):
+    """ Unit tests for the in-process LocalActionSocket.
+
+    """
+    def setUp(self):
+        self.app = LoopApplication()
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def test_synchronous_delivery(self):
+        """ Test that synchronous sockets deliver before send returns.
+
+        """
+        server, client = local_socket_pair(synchronous=True)
+        received = []
+        client.on_message(lambda *msg: received.append(msg))
+        server.send('o_1', 'set_text', {'text': 'a'})
+        self.assertEqual(received, [('o_1', 'set_text', {'text': 'a'})])
+        self.assertEqual(self.app.pending, [])
+
+    def test_deferred_delivery(self):
+        """ Test that deferred sockets deliver a cycle in one call.
+
+        """
+        server, client = local_socket_pair()
+        received = []
+        client.on_message(lambda *msg: received.append(msg))
+        for idx in range(100):
+            server.send('o_1', 'set_value', {'value': idx})
+        self.assertEqual(received, [])
+        self.assertEqual(len(self.app.pending), 1)
+        self.app.process_events()
+        values = [msg[2]['value'] for msg in received]
+        self.assertEqual(values, range(100))
+
+    def test_reply_during_delivery(self):
+        """ Test that messages sent during delivery are delivered later.
+
+        """
+        server, client = local_socket_pair()
+        received = []
+
+        def on_client(object_id, action, content):
+            client.send(object_id, 'reply', content)
+
+        client.on_message(on_client)
+        server.on_message(lambda *msg: received.append(msg))
+        server.send('o_1', 'request', {})
+        self.app.process_events()
+        self.assertEqual(received, [('o_1', 'reply', {})])
+
+    def test_disconnected_callback(self):
+        """ Test that messages to a closed socket are dropped.
+
+        """
+        server, client = local_socket_pair()
+        received = []
+        client.on_message(lambda *msg: received.append(msg))
+        server.send('o_1', 'close', {})
+        client.on_message(None)
+        self.app.process_events()
+        self.assertEqual(received, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.lru_cache import LRUCache
+
+
+class Blob(object):
+    """ An item with a size.
+
+    """
+    def __init__(self, size):
+        self.size = size
+
+
+def blob_size(blob):
+    return blob.size
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_hit_and_miss(self):
+        cache = LRUCache(10)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b', 2), 2)
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_byte_budget(self):
+        cache = LRUCache(100, blob_size)
+        cache.put('a', Blob(60))
+        cache.put('b', Blob(30))
+        self.assertEqual(cache.stats()['bytes'], 90)
+        cache.put('c', Blob(50))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()['bytes'], 80)
+
+    def test_replace_updates_size(self):
+        cache = LRUCache(100, blob_size)
+        cache.put('a', Blob(60))
+        cache.put('a', Blob(10))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()['bytes'], 10)
+
+    def test_pinned_tier_promotes_items(self):
+        cache = LRUCache(100, blob_size)
+        a = Blob(60)
+        cache.put('a', a)
+        cache.pin('a')
+        cache.put('b', Blob(60))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()['pinned'], 1)
+        self.assertIn('a', cache)
+        self.assertIs(cache.get('a'), a)
+        self.assertEqual(cache.stats()['pinned_hits'], 1)
+        self.assertNotIn('b', cache)
+
+    def test_unpinned_items_are_dropped(self):
+        cache = LRUCache(100, blob_size)
+        a = Blob(60)
+        cache.put('a', a)
+        cache.put('b', Blob(60))
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_unpin_releases_evicted_items(self):
+        cache = LRUCache(1)
+        cache.pin('a')
+        cache.pin('a')
+        cache.put('a', 'x')
+        cache.put('b', 'y')
+        cache.unpin('a')
+        self.assertIn('a', cache)
+        cache.unpin('a')
+        self.assertNotIn('a', cache)
+        cache.unpin('a')
+        self.assertEqual(cache.stats()['pinned'], 0)
+
+    def test_purge(self):
+        cache = LRUCache(2)
+        cache.put(('s1', 'a'), 1)
+        cache.pin(('s1', 'a'))
+        cache.put(('s1', 'b'), 2)
+        cache.put(('s2', 'a'), 3)
+        cache.purge(lambda key: key[0] == 's1')
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.stats()['pinned'], 0)
+        self.assertEqual(cache.get(('s2', 'a')), 3)
+        cache.put(('s1', 'a'), 1)
+        cache.put(('s2', 'b'), 4)
+        cache.put(('s2', 'c'), 5)
+        self.assertNotIn(('s1', 'a'), cache)
+
+    def test_set_max_bytes(self):
+        cache = LRUCache(3)
+        for key in 'abc':
+            cache.put(key, key)
+        cache.set_max_bytes(1)
+        self.assertEqual(cache.max_bytes(), 1)
+        self.assertEqual(len(cache), 1)
+        self.assertIn('c', cache)
+
+    def test_discard_and_clear(self):
+        cache = LRUCache(100, blob_size)
+        cache.put('a', Blob(10))
+        cache.put('b', Blob(20))
+        cache.discard('a')
+        self.assertEqual(cache.stats()['bytes'], 20)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.core.object import Object
+
+
+class EventObject(Object):
+    """ An Object which records the children events it receives.
+
+    """
+    def children_event(self, event):
+        super(EventObject, self).children_event(event)
+        self.__dict__.setdefault('_events', []).append(event)
+
+    def events(self):
+        return self.__dict__.get('_events', [])
+
+
+class AnchorObject(Object):
+    """ An Object which moves its companions with it, in the same way
+    as an Include.
+
+    """
+    def parent_event(self, event):
+        super(AnchorObject, self).parent_event(event)
+        companions = self.__dict__.get('_companions')
+        if companions and event.new is not None:
+            event.new.insert_children(self, companions)
+
+
+class TestObjectChildren(unittest.TestCase):
+    """ Unit tests for the bulk children API of Object.
+
+    """
+    def test_insert_children_order(self):
+        """ Test that children are inserted before the marker.
+
+        """
+        parent = Object()
+        a, b, c, d = [Object(parent) for i in range(4)]
+        e = Object()
+        parent.insert_children(c, [e, a])
+        self.assertEqual(parent.children, (b, e, a, c, d))
+        self.assertIs(e.parent, parent)
+
+    def test_insert_children_from_other_parent(self):
+        """ Test that moving many children emits one event per parent.
+
+        """
+        src = EventObject()
+        dst = EventObject()
+        kids = [Object(src) for i in range(100)]
+        del src.events()[:]
+        moved = kids[::2]
+        dst.insert_children(None, moved)
+        self.assertEqual(dst.children, tuple(moved))
+        self.assertEqual(src.children, tuple(kids[1::2]))
+        self.assertEqual(len(src.events()), 1)
+        self.assertEqual(len(dst.events()), 1)
+        self.assertTrue(all(k.parent is dst for k in moved))
+
+    def test_insert_children_from_many_parents(self):
+        """ Test that children from several parents are all moved.
+
+        """
+        srcs = [EventObject() for i in range(3)]
+        kids = [Object(src) for src in srcs for i in range(3)]
+        for src in srcs:
+            del src.events()[:]
+        dst = Object()
+        dst.insert_children(None, kids)
+        self.assertEqual(dst.children, tuple(kids))
+        for src in srcs:
+            self.assertEqual(src.children, ())
+            self.assertEqual(len(src.events()), 1)
+
+    def test_insert_children_with_companions(self):
+        """ Test that the children inserted by a parent event handler
+        are placed directly before the child.
+
+        """
+        src = Object()
+        anchor = AnchorObject(src)
+        companions = [Object(src) for i in range(2)]
+        anchor.__dict__['_companions'] = companions
+        dst = Object()
+        a, b = Object(dst), Object(dst)
+        dst.insert_children(b, [anchor])
+        self.assertEqual(dst.children, tuple([a] + companions + [anchor, b]))
+        self.assertEqual(src.children, ())
+
+    def test_remove_children(self):
+        """ Test the removal of children in bulk.
+
+        """
+        parent = EventObject()
+        kids = [Object(parent) for i in range(10)]
+        other = Object()
+        del parent.events()[:]
+        parent.remove_children(kids[:5] + [other])
+        self.assertEqual(parent.children, tuple(kids[5:]))
+        self.assertEqual(len(parent.events()), 1)
+        self.assertTrue(all(k.parent is None for k in kids[:5]))
+
+
+class TestNameIndex(unittest.TestCase):
+    """ Unit tests for the name index used by `find` and `find_all`.
+
+    """
+    def setUp(self):
+        self.root = root = Object(name='root')
+        self.a = a = Object(root, name='a')
+        self.b = b = Object(root, name='item')
+        self.c = Object(a, name='item')
+        self.d = Object(a, name='d')
+        self.e = Object(b, name='item')
+
+    def check(self, obj, name, regex=False):
+        """ Check that the indexed lookups match a tree traversal.
+
+        """
+        expected_all = obj.find_all(name, regex)
+        expected = obj.find(name, regex)
+        self.root.enable_name_index()
+        self.assertEqual(obj.find_all(name, regex), expected_all)
+        self.assertIs(obj.find(name, regex), expected)
+
+    def test_find_order(self):
+        """ Test that indexed lookups preserve breadth first order.
+
+        """
+        self.check(self.root, 'item')
+        self.check(self.a, 'item')
+        self.check(self.root, 'missing')
+        self.check(self.root, 'it.*|d', regex=True)
+        self.assertEqual(
+            self.root.find_all('item'), [self.b, self.c, self.e]
+        )
+
+    def test_rename(self):
+        """ Test that renaming an object updates the index.
+
+        """
+        self.root.enable_name_index()
+        self.d.name = 'item2'
+        self.assertIsNone(self.root.find('d'))
+        self.assertIs(self.root.find('item2'), self.d)
+        self.assertEqual(self.root.find_all('item\\d', True), [self.d])
+
+    def test_reparent(self):
+        """ Test that adding and removing subtrees updates the index.
+
+        """
+        self.root.enable_name_index()
+        other = Object()
+        new = Object(other, name='item')
+        self.root.insert_children(self.a, [other])
+        self.assertEqual(
+            self.root.find_all('item'), [self.b, new, self.c, self.e]
+        )
+        self.root.remove_children([self.a])
+        self.assertEqual(self.root.find_all('item'), [self.b, new, self.e])
+        self.assertIsNone(self.root.find('d'))
+        self.assertIs(self.a.find('d'), self.d)
+        self.b.set_parent(None)
+        self.assertEqual(self.root.find_all('item'), [new])
+
+    def test_destroy(self):
+        """ Test that destroyed objects are removed from the index.
+
+        """
+        self.root.enable_name_index()
+        self.a.destroy()
+        self.assertEqual(self.root.find_all('item'), [self.b, self.e])
+        self.assertIsNone(self.root.find('d'))
+
+
+if __name__ == '__main__':
+    unittest.main()
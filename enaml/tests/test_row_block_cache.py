@@ -0,0 +1,86 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.qt.row_block_cache import MISSING, RowBlockCache
+
+
+def make_rows(row, count):
+    return [[r] for r in range(row, row + count)]
+
+
+class TestRowBlockCache(unittest.TestCase):
+    """ Tests for the client side cache of the rows of an item model.
+
+    """
+    def setUp(self):
+        self.cache = RowBlockCache(block_size=10, prefetch=10, max_blocks=4)
+        self.cache.reset(1000)
+
+    def test_missing_rows_are_wanted_with_prefetch(self):
+        cache = self.cache
+        self.assertIs(cache.get(55, 0), MISSING)
+        self.assertIs(cache.get(56, 0), MISSING)
+        self.assertEqual(cache.take_wanted(), [[40, 30]])
+        self.assertFalse(cache.has_wanted())
+        # Pending blocks are not requested again.
+        self.assertIs(cache.get(45, 0), MISSING)
+        self.assertFalse(cache.has_wanted())
+
+    def test_prefetch_is_clamped_to_the_model(self):
+        cache = self.cache
+        cache.get(0, 0)
+        cache.get(999, 0)
+        self.assertEqual(cache.take_wanted(), [[0, 20], [980, 20]])
+
+    def test_store_and_get(self):
+        cache = self.cache
+        cache.get(55, 0)
+        gen = cache.generation()
+        ranges = cache.take_wanted()
+        for row, count in ranges:
+            self.assertTrue(cache.store(row, make_rows(row, count), gen))
+        self.assertEqual(cache.get(55, 0), 55)
+        self.assertEqual(cache.get(41, 0), 41)
+        self.assertEqual(cache.get(41, 3), None)
+        self.assertFalse(cache.has_wanted())
+
+    def test_stale_generation_is_discarded(self):
+        cache = self.cache
+        cache.get(5, 0)
+        gen = cache.generation()
+        ranges = cache.take_wanted()
+        cache.insert_rows(500, 1)
+        self.assertFalse(cache.store(0, make_rows(0, 20), gen))
+        self.assertEqual(cache.row_count(), 1001)
+        self.assertIs(cache.get(5, 0), MISSING)
+        self.assertEqual(cache.take_wanted(), ranges)
+
+    def test_lru_eviction(self):
+        cache = self.cache
+        gen = cache.generation()
+        for block in range(6):
+            cache.store(block * 10, make_rows(block * 10, 10), gen)
+        self.assertIs(cache.get(0, 0), MISSING)
+        self.assertIs(cache.get(15, 0), MISSING)
+        self.assertEqual(cache.get(25, 0), 25)
+        cache.store(100, make_rows(100, 10), gen)
+        # The block of row 25 was used most recently, so it is kept.
+        self.assertEqual(cache.get(25, 0), 25)
+        self.assertIs(cache.get(35, 0), MISSING)
+
+    def test_invalidate(self):
+        cache = self.cache
+        gen = cache.generation()
+        cache.store(0, make_rows(0, 30), gen)
+        cache.invalidate(12, 3)
+        self.assertEqual(cache.get(5, 0), 5)
+        self.assertEqual(cache.get(25, 0), 25)
+        self.assertIs(cache.get(12, 0), MISSING)
+        self.assertEqual(cache.generation(), gen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,313 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from enaml.server.client import ClientConnection
+from enaml.server.process_server_application import ProcessServerApplication
+from enaml.server.server_application import ServerApplication
+from enaml.server.socket_transport import SocketTransport
+from enaml.server.transport import FrameReader, pack_frames
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+
+
+class EmptySession(Session):
+    """ A session with no windows.
+
+    """
+    def on_open(self):
+        pass
+
+
+class FakeConnection(object):
+    """ A connection which records the messages written to it.
+
+    """
+    def __init__(self):
+        self.written = []
+        self.reading = True
+        self.buffered = 0
+
+    def on_message(self, callback):
+        pass
+
+    def on_drain(self, callback):
+        pass
+
+    def on_close(self, callback):
+        pass
+
+    def write(self, frames):
+        self.written.append(frames)
+        self.buffered += sum(len(f) for f in frames)
+
+    def buffered_bytes(self):
+        return self.buffered
+
+    def set_reading(self, reading):
+        self.reading = reading
+
+
+class TestFraming(unittest.TestCase):
+    """ Tests for the framing of messages on a byte stream.
+
+    """
+    def test_round_trip_in_pieces(self):
+        messages = [['a', '', 'bc'], ['x' * 70000, 'y'], []]
+        data = ''.join(
+            str(chunk) for m in messages for chunk in pack_frames(m)
+        )
+        reader = FrameReader()
+        received = []
+        for i in xrange(0, len(data), 7):
+            received.extend(reader.feed(data[i:i + 7]))
+        self.assertEqual(received, messages)
+
+
+class ServerTestCase(unittest.TestCase):
+
+    def make_transport(self):
+        return SocketTransport(('127.0.0.1', 0))
+
+    def make_app(self, factories, transport):
+        return ServerApplication(factories, transport)
+
+    def setUp(self):
+        factories = [SessionFactory('empty', 'An empty session', EmptySession)]
+        self.transport = self.make_transport()
+        self.app = self.make_app(factories, self.transport)
+        self.app.listen()
+        self.loop = self.app.loop()
+        self.client = ClientConnection(self.transport, self.loop)
+
+    def tearDown(self):
+        self.client.close()
+        self.app.destroy()
+        self.loop.close()
+
+    def run_until(self, predicate):
+        deadline = time.time() + 5.0
+        while not predicate():
+            if time.time() > deadline:
+                self.fail('timed out waiting for the server')
+            self.loop.run_once(0.01)
+
+    def start_session(self):
+        started = []
+        self.client.start_session('empty', started.append)
+        self.run_until(lambda: started)
+        return started[0]
+
+
+class TestServerApplication(ServerTestCase):
+    """ Tests for the ServerApplication over a TCP socket transport.
+
+    """
+    def test_discover(self):
+        replies = []
+        self.client.discover(replies.append)
+        self.run_until(lambda: replies)
+        self.assertEqual(replies[0][0]['name'], 'empty')
+
+    def test_start_session(self):
+        info = self.start_session()
+        session_id = info['session_id']
+        self.assertEqual(info['snapshot'], [])
+        self.assertEqual(info['widget_groups'], ['default'])
+        self.assertIsNotNone(self.app.session(session_id))
+        self.assertIsNotNone(self.client.socket(session_id))
+
+    def test_invalid_session_name(self):
+        replies = []
+        self.client.start_session('missing', replies.append)
+        self.run_until(lambda: replies)
+        self.assertEqual(replies, [None])
+
+    def test_session_round_trip(self):
+        session_id = self.start_session()['session_id']
+        socket = self.client.socket(session_id)
+        received = []
+        socket.on_message(lambda *msg: received.append(msg))
+        content = {'id': 'r_1', 'url': 'none://x', 'metadata': {}}
+        socket.send(session_id, 'url_request', content)
+        self.run_until(lambda: received)
+        object_id, action, content = received[0]
+        self.assertEqual(object_id, session_id)
+        self.assertEqual(action, 'url_reply')
+        self.assertEqual(content['status'], 'fail')
+
+    def test_end_session(self):
+        session_id = self.start_session()['session_id']
+        socket = self.client.socket(session_id)
+        received = []
+        socket.on_message(lambda *msg: received.append(msg))
+        self.client.end_session(session_id)
+        self.run_until(lambda: received)
+        self.assertEqual(received[0][1], 'close')
+        self.assertIsNone(self.app.session(session_id))
+
+    def test_client_close_ends_sessions(self):
+        self.start_session()
+        self.start_session()
+        self.assertEqual(len(self.app.sessions()), 2)
+        self.client.close()
+        self.run_until(lambda: not self.app.sessions())
+
+
+class TestUnixSocketServer(ServerTestCase):
+    """ Tests for the ServerApplication over a Unix socket transport.
+
+    """
+    def make_transport(self):
+        self.tmpdir = tempfile.mkdtemp()
+        return SocketTransport(os.path.join(self.tmpdir, 'enaml.sock'))
+
+    def tearDown(self):
+        super(TestUnixSocketServer, self).tearDown()
+        shutil.rmtree(self.tmpdir)
+
+    def test_start_session(self):
+        info = self.start_session()
+        self.assertIsNotNone(self.app.session(info['session_id']))
+
+
+class TestProcessServer(ServerTestCase):
+    """ Tests for the ProcessServerApplication.
+
+    """
+    def make_app(self, factories, transport):
+        return ProcessServerApplication(factories, transport, processes=2)
+
+    def test_start_session(self):
+        info = self.start_session()
+        session_id = info['session_id']
+        self.assertEqual(info['snapshot'], [])
+        self.assertIn(session_id, self.app.session_ids())
+        worker = self.app.worker_for(session_id)
+        self.assertIn(session_id, worker.session_ids)
+
+    def test_session_round_trip(self):
+        session_id = self.start_session()['session_id']
+        socket = self.client.socket(session_id)
+        received = []
+        socket.on_message(lambda *msg: received.append(msg))
+        content = {'id': 'r_1', 'url': 'none://x', 'metadata': {}}
+        socket.send(session_id, 'url_request', content)
+        self.run_until(lambda: received)
+        self.assertEqual(received[0][1], 'url_reply')
+        self.assertEqual(received[0][2]['status'], 'fail')
+
+    def test_end_session(self):
+        session_id = self.start_session()['session_id']
+        socket = self.client.socket(session_id)
+        received = []
+        socket.on_message(lambda *msg: received.append(msg))
+        self.client.end_session(session_id)
+        self.run_until(lambda: received)
+        self.assertEqual(received[0][1], 'close')
+        self.run_until(lambda: session_id not in self.app._channels)
+        self.assertNotIn(session_id, self.app.session_ids())
+
+    def test_sessions_are_sharded(self):
+        workers = set()
+        for i in range(32):
+            session_id = self.start_session()['session_id']
+            worker = self.app.worker_for(session_id)
+            self.assertIn(session_id, worker.session_ids)
+            workers.add(worker)
+            if len(workers) == 2:
+                break
+        self.assertEqual(workers, set(self.app.workers()))
+        pids = set(w.process.pid for w in workers)
+        self.assertEqual(len(pids), 2)
+
+    def test_worker_exit_closes_sessions(self):
+        session_id = self.start_session()['session_id']
+        socket = self.client.socket(session_id)
+        received = []
+        socket.on_message(lambda *msg: received.append(msg))
+        self.app.worker_for(session_id).process.terminate()
+        self.run_until(lambda: received)
+        self.assertEqual(received[0][1], 'close')
+        self.assertNotIn(session_id, self.app.session_ids())
+
+    def test_sessions_skip_exited_workers(self):
+        dead = self.app.workers()[0]
+        dead.process.terminate()
+        self.run_until(lambda: dead.closed)
+        session_ids = [self.start_session()['session_id'] for i in range(8)]
+        for session_id in session_ids:
+            worker = self.app.worker_for(session_id)
+            self.assertIsNot(worker, dead)
+            self.assertIn(session_id, worker.session_ids)
+        hosted = [s.session_id for s in self.app.sessions()]
+        self.assertEqual(sorted(hosted), sorted(session_ids))
+
+    def test_no_running_workers(self):
+        workers = self.app.workers()
+        for worker in workers:
+            worker.process.terminate()
+        self.run_until(lambda: all(w.closed for w in workers))
+        replies = []
+        self.client.start_session('empty', replies.append)
+        self.run_until(lambda: replies)
+        self.assertEqual(replies, [None])
+        self.assertEqual(self.app.sessions(), [])
+
+
+class TestBackpressure(unittest.TestCase):
+    """ Tests for the session queues of the ServerApplication.
+
+    """
+    def setUp(self):
+        factories = [SessionFactory('empty', 'An empty session', EmptySession)]
+        self.app = ServerApplication(
+            factories, SocketTransport(('127.0.0.1', 0)), high_water=100,
+            low_water=10, max_queue_bytes=1000, write_limit=50,
+        )
+        self.connection = FakeConnection()
+        from enaml.server.server_application import ClientHandler
+        self.handler = ClientHandler(self.app, self.connection)
+
+    def tearDown(self):
+        self.app.destroy()
+        self.app.loop().close()
+
+    def test_round_robin_and_pause(self):
+        app = self.app
+        ids = [app.start_session('empty') for i in range(2)]
+        for session_id in ids:
+            app.attach_session(session_id, self.handler)
+        for i in range(5):
+            for session_id in ids:
+                app.session(session_id).send(session_id, 'ping', {'n': i})
+        self.assertFalse(self.connection.reading)
+        self.handler.pump()
+        self.assertEqual(len(self.connection.written), 1)
+        while any(c.queued_bytes() for c in app._channels.values()):
+            self.connection.buffered = 0
+            self.handler.pump()
+        self.assertTrue(self.connection.reading)
+        # The session_started control messages go first, then the
+        # channels alternate.
+        written = [frames[0] for frames in self.connection.written]
+        self.assertEqual(written[:2], ['', ''])
+        self.assertEqual(written[2:6], ids + ids)
+
+    def test_overflow_ends_session(self):
+        app = self.app
+        session_id = app.start_session('empty')
+        app.attach_session(session_id, self.handler)
+        app.session(session_id).send(session_id, 'big', {'data': 'x' * 2000})
+        app.loop().run_once(0)
+        self.assertIsNone(app.session(session_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.server.server_application import ServerApplication
+from enaml.server.socket_transport import SocketTransport
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+
+
+class CountingSession(Session):
+    """ A session with no windows which records the opened sessions.
+
+    """
+    opened = []
+
+    def on_open(self):
+        CountingSession.opened.append(self)
+
+
+class TestSessionPool(unittest.TestCase):
+    """ Tests for the pre-opened session pools of an Application.
+
+    """
+    def setUp(self):
+        CountingSession.opened = []
+        factory = SessionFactory('counting', 'A session', CountingSession)
+        transport = SocketTransport(('127.0.0.1', 0))
+        self.app = ServerApplication([factory], transport)
+        self.loop = self.app.loop()
+
+    def tearDown(self):
+        if self.app is not None:
+            self.app.destroy()
+        self.loop.close()
+
+    def run_loop(self):
+        for i in range(20):
+            self.loop.run_once(0)
+
+    def test_pool_is_filled_in_background(self):
+        self.app.set_pool_size('counting', 2)
+        self.assertEqual(self.app.pool_size('counting'), 2)
+        self.assertEqual(self.app.pooled_count('counting'), 0)
+        self.run_loop()
+        self.assertEqual(self.app.pooled_count('counting'), 2)
+        self.assertEqual(len(CountingSession.opened), 2)
+        for session in CountingSession.opened:
+            self.assertEqual(session.state, 'opened')
+
+    def test_start_session_uses_pool(self):
+        self.app.set_pool_size('counting', 1)
+        self.run_loop()
+        pooled = CountingSession.opened[0]
+        session_id = self.app.start_session('counting')
+        self.assertEqual(session_id, pooled.session_id)
+        self.assertIs(self.app.session(session_id), pooled)
+        self.assertEqual(pooled.state, 'active')
+        self.assertEqual(self.app.pooled_count('counting'), 0)
+        self.run_loop()
+        self.assertEqual(self.app.pooled_count('counting'), 1)
+
+    def test_start_session_without_pool(self):
+        session_id = self.app.start_session('counting')
+        self.assertEqual(self.app.session(session_id).state, 'active')
+        self.run_loop()
+        self.assertEqual(len(CountingSession.opened), 1)
+
+    def test_invalid_name(self):
+        with self.assertRaises(ValueError):
+            self.app.set_pool_size('missing', 1)
+
+    def test_shrink_pool(self):
+        self.app.set_pool_size('counting', 3)
+        self.run_loop()
+        self.app.set_pool_size('counting', 1)
+        self.assertEqual(self.app.pooled_count('counting'), 1)
+        closed = [s for s in CountingSession.opened if s.state == 'closed']
+        self.assertEqual(len(closed), 2)
+        self.app.set_pool_size('counting', 0)
+        self.assertEqual(self.app.pooled_count('counting'), 0)
+        self.run_loop()
+        self.assertEqual(len(CountingSession.opened), 3)
+
+    def test_replaced_factory_discards_pool(self):
+        self.app.set_pool_size('counting', 1)
+        self.run_loop()
+        old = CountingSession.opened[0]
+        factory = SessionFactory('counting', 'A session', CountingSession)
+        self.app.add_factories([factory])
+        self.assertEqual(old.state, 'closed')
+        self.run_loop()
+        self.assertEqual(self.app.pooled_count('counting'), 1)
+
+    def test_destroy_closes_pool(self):
+        self.app.set_pool_size('counting', 2)
+        self.run_loop()
+        self.app.destroy()
+        self.app = None
+        for session in CountingSession.opened:
+            self.assertEqual(session.state, 'closed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import random
+import unittest
+
+from enaml.headless.headless_application import HeadlessApplication
+from enaml.session import Session
+from enaml.session_factory import SessionFactory
+from enaml.text_delta import apply_edits, text_edits
+from enaml.widgets.container import Container
+from enaml.widgets.multiline_field import MultilineField
+from enaml.widgets.window import Window
+
+
+class TestTextEdits(unittest.TestCase):
+    """ Tests for computing and applying text edits.
+
+    """
+    def test_equal_texts(self):
+        self.assertEqual(text_edits(u'abc', u'abc'), [])
+
+    def test_single_edits(self):
+        self.assertEqual(text_edits(u'abc', u'abXc'), [[2, 0, u'X']])
+        self.assertEqual(text_edits(u'abc', u'ac'), [[1, 1, u'']])
+        self.assertEqual(text_edits(u'abc', u'aXYc'), [[1, 1, u'XY']])
+        self.assertEqual(text_edits(u'', u'abc'), [[0, 0, u'abc']])
+        self.assertEqual(text_edits(u'aaa', u'aaaa'), [[3, 0, u'a']])
+
+    def test_large_text(self):
+        old = u'x' * 20000 + u'y' * 20000
+        new = old[:12345] + u'hello' + old[12350:]
+        edits = text_edits(old, new)
+        self.assertEqual(edits, [[12345, 5, u'hello']])
+        self.assertEqual(apply_edits(old, edits), new)
+
+    def test_random_round_trip(self):
+        rng = random.Random(0)
+
+        def make_text():
+            size = rng.randint(0, 50)
+            return u''.join(rng.choice(u'ab\n') for _ in range(size))
+
+        for _ in range(200):
+            old = make_text()
+            new = make_text()
+            self.assertEqual(apply_edits(old, text_edits(old, new)), new)
+
+    def test_apply_out_of_range(self):
+        self.assertRaises(ValueError, apply_edits, u'abc', [[2, 5, u'']])
+
+
+class FieldSession(Session):
+    """ A session with a multiline field.
+
+    """
+    def on_open(self):
+        window = Window()
+        container = Container(parent=window)
+        MultilineField(parent=container, name='field', text=u'line\n' * 1000)
+        self.windows = [window]
+
+
+class TestMultilineFieldSync(unittest.TestCase):
+    """ Tests for the edit synchronization of the MultilineField.
+
+    """
+    def setUp(self):
+        factory = SessionFactory('field', 'A multiline field', FieldSession)
+        self.app = HeadlessApplication([factory])
+        session_id = self.app.start_session('field')
+        session = self.app.session(session_id)
+        self.field = session.windows[0].find('field')
+        client = self.app.client_session(session_id)
+        self.client = client.find('field')
+        self.messages = []
+        client.set_message_listener(lambda *msg: self.messages.append(msg))
+
+    def tearDown(self):
+        self.app.destroy()
+
+    def actions(self):
+        self.app.process_events()
+        return [(action, content) for _, action, content in self.messages]
+
+    def test_server_change_sends_edits(self):
+        self.field.text += u'tail'
+        action, content = self.actions()[-1]
+        self.assertEqual(action, 'edit_text')
+        self.assertEqual(content['base'], 0)
+        self.assertEqual(content['version'], 1)
+        self.assertEqual(content['edits'], [[5000, 0, u'tail']])
+
+    def test_client_edits_are_applied(self):
+        content = {'base': 0, 'edits': [[0, 4, u'LINE'], [4, 0, u'!']]}
+        self.client.send_action('edit_text', content)
+        content = {'base': 1, 'edits': [[4996, 5, u'']]}
+        self.client.send_action('edit_text', content)
+        self.app.process_events()
+        expected = u'LINE!\n' + u'line\n' * 998
+        self.assertEqual(self.field.text, expected)
+        self.assertEqual(self.actions(), [
+            ('text_ack', {'version': 1}), ('text_ack', {'version': 2}),
+        ])
+
+    def test_concurrent_edits_are_versioned_by_server(self):
+        # The server edits the text while an edit from the client is in
+        # flight. The client edit is rejected, and the next client edit
+        # is made against the text of the set_text reply.
+        self.field.text = u'line\n' * 999
+        content = {'base': 0, 'edits': [[0, 0, u'a']]}
+        self.client.send_action('edit_text', content)
+        actions = self.actions()
+        self.assertEqual(actions[0][0], 'edit_text')
+        self.assertEqual(actions[-1], (
+            'set_text', {'text': u'line\n' * 999, 'version': 1},
+        ))
+        del self.messages[:]
+        content = {'base': 1, 'edits': [[0, 0, u'b']]}
+        self.client.send_action('edit_text', content)
+        self.assertEqual(self.actions(), [('text_ack', {'version': 2})])
+        self.assertEqual(self.field.text, u'b' + u'line\n' * 999)
+        # A batch based on a version the server never assigned to this
+        # text is rejected rather than applied.
+        del self.messages[:]
+        content = {'base': 1, 'edits': [[0, 0, u'c']]}
+        self.client.send_action('edit_text', content)
+        self.assertEqual(self.actions()[-1][0], 'set_text')
+        self.assertEqual(self.field.text, u'b' + u'line\n' * 999)
+
+    def test_conflict_resends_text(self):
+        self.field.text = u'server'
+        content = {'base': 0, 'edits': [[0, 0, u'client']]}
+        self.client.send_action('edit_text', content)
+        action, content = self.actions()[-1]
+        self.assertEqual(self.field.text, u'server')
+        self.assertEqual(action, 'set_text')
+        self.assertEqual(content, {'text': u'server', 'version': 1})
+
+    def test_invalid_edits_resend_text(self):
+        content = {'base': 0, 'edits': [[10 ** 6, 0, u'x']]}
+        self.client.send_action('edit_text', content)
+        action, content = self.actions()[-1]
+        self.assertEqual(action, 'set_text')
+        self.assertEqual(content['version'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.qt.transition_cache import FrameRateGate, PixmapCache
+
+
+class TestPixmapCache(unittest.TestCase):
+    """ Unit tests for the PixmapCache.
+
+    """
+    def setUp(self):
+        self.cache = PixmapCache()
+
+    def test_get_missing(self):
+        """ Test that an unknown item has no pixmap.
+
+        """
+        self.assertIsNone(self.cache.get('a', (10, 10)))
+
+    def test_put_get(self):
+        """ Test that a stored pixmap is returned for the same size.
+
+        """
+        self.cache.put('a', (10, 10), 'pixmap')
+        self.assertEqual(self.cache.get('a', (10, 10)), 'pixmap')
+        self.assertIsNone(self.cache.get('a', (20, 10)))
+
+    def test_invalidate(self):
+        """ Test that an invalidated pixmap is not returned.
+
+        """
+        self.cache.put('a', (10, 10), 'pa')
+        self.cache.put('b', (10, 10), 'pb')
+        self.cache.invalidate('a')
+        self.cache.invalidate('c')
+        self.assertIsNone(self.cache.get('a', (10, 10)))
+        self.assertEqual(self.cache.get('b', (10, 10)), 'pb')
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestFrameRateGate(unittest.TestCase):
+    """ Unit tests for the FrameRateGate.
+
+    """
+    def test_never_skips_by_default(self):
+        """ Test that a gate without a minimum never skips.
+
+        """
+        gate = FrameRateGate()
+        gate.record(1, 1.0)
+        self.assertFalse(gate.should_skip())
+
+    def test_unmeasured(self):
+        """ Test that an unmeasured animation is not skipped.
+
+        """
+        gate = FrameRateGate(minimum_fps=30)
+        self.assertFalse(gate.should_skip())
+
+    def test_skip_slow(self):
+        """ Test that a slow animation is skipped and a fast one is not.
+
+        """
+        gate = FrameRateGate(minimum_fps=30)
+        gate.record(15, 0.25)
+        self.assertEqual(gate.fps(), 60.0)
+        self.assertFalse(gate.should_skip())
+        gate.record(1, 0.25)
+        self.assertEqual(gate.fps(), 32.0)
+        self.assertFalse(gate.should_skip())
+        gate.record(0, 0.25)
+        self.assertTrue(gate.should_skip())
+
+    def test_retry(self):
+        """ Test that the frame rate is measured again after skipping.
+
+        """
+        gate = FrameRateGate(minimum_fps=30, retry_after=3)
+        gate.record(1, 1.0)
+        self.assertTrue(gate.should_skip())
+        self.assertTrue(gate.should_skip())
+        self.assertTrue(gate.should_skip())
+        self.assertIsNone(gate.fps())
+        self.assertFalse(gate.should_skip())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.wire_format import encode_message, decode_message
+
+
+class TestWireFormat(unittest.TestCase):
+
+    def test_round_trip(self):
+        content = {'value': [1, 2.5, 'a'], 'flag': True}
+        frames = encode_message('o_1', 'set_value', content)
+        self.assertEqual(len(frames), 1)
+        self.assertEqual(
+            decode_message(frames), ('o_1', 'set_value', content)
+        )
+
+    def test_buffers_are_sent_as_frames(self):
+        data = bytearray('\x00\xff\x10\x80')
+        content = {'resource': {'format': 'array', 'data': data}}
+        frames = encode_message('s_1', 'url_reply', content)
+        self.assertEqual(len(frames), 2)
+        self.assertNotIn('\\u00ff', frames[0])
+        self.assertEqual(str(frames[1]), str(data))
+        object_id, action, decoded = decode_message(frames)
+        self.assertEqual(decoded['resource']['data'], str(data))
+        self.assertEqual(decoded['resource']['format'], 'array')
+
+    def test_unserializable_object(self):
+        with self.assertRaises(TypeError):
+            encode_message('o_1', 'set_value', {'value': object()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+import unittest
+
+from enaml.validation.api import (
+    CompoundValidator, IntValidator, LengthValidator, RegexValidator,
+    Validator,
+)
+from enaml.validation.client_validators import make_validator, null_validator
+
+
+class ServerOnlyValidator(Validator):
+    """ A validator without a client side validator.
+
+    """
+    def validate(self, text, component):
+        return (text.strip(), text != u'forbidden')
+
+
+class TestServerValidators(unittest.TestCase):
+
+    def test_length_validator(self):
+        v = LengthValidator(minimum=2, maximum=4)
+        self.assertFalse(v.validate(u'a', None)[1])
+        self.assertTrue(v.validate(u'ab', None)[1])
+        self.assertTrue(v.validate(u'abcd', None)[1])
+        self.assertFalse(v.validate(u'abcde', None)[1])
+        self.assertTrue(LengthValidator().validate(u'', None)[1])
+
+    def test_compound_validator(self):
+        v = CompoundValidator(validators=[
+            ServerOnlyValidator(), LengthValidator(maximum=3),
+        ])
+        self.assertEqual(v.validate(u' ab ', None), (u'ab', True))
+        self.assertFalse(v.validate(u'abcd', None)[1])
+        self.assertFalse(v.validate(u'forbidden', None)[1])
+
+    def test_compound_client_validator(self):
+        v = CompoundValidator(validators=[
+            ServerOnlyValidator(), IntValidator(maximum=10),
+        ])
+        info = v.client_validator()
+        self.assertEqual(info['type'], 'compound')
+        self.assertEqual(len(info['arguments']['validators']), 1)
+        v.validators = [ServerOnlyValidator()]
+        self.assertIsNone(v.client_validator())
+
+
+class TestClientValidators(unittest.TestCase):
+
+    def test_length(self):
+        func = make_validator(LengthValidator(maximum=3).client_validator())
+        self.assertTrue(func(u'abc'))
+        self.assertFalse(func(u'abcd'))
+
+    def test_compound(self):
+        v = CompoundValidator(validators=[
+            RegexValidator(regex=r'[0-9a-f]*$'),
+            LengthValidator(minimum=2),
+            IntValidator(base=16, maximum=255),
+        ])
+        func = make_validator(v.client_validator())
+        self.assertTrue(func(u'ff'))
+        self.assertFalse(func(u'f'))
+        self.assertFalse(func(u'fg'))
+        self.assertFalse(func(u'100'))
+
+    def test_compiled_once(self):
+        info = IntValidator(minimum=0, maximum=7).client_validator()
+        func = make_validator(info)
+        self.assertIs(make_validator(dict(info, message=u'other')), func)
+        other = IntValidator(minimum=0, maximum=8).client_validator()
+        self.assertIsNot(make_validator(other), func)
+
+    def test_unknown_type(self):
+        info = {'type': 'unknown', 'arguments': {}}
+        self.assertIs(make_validator(info), null_validator)
+
+
+if __name__ == '__main__':
+    unittest.main()
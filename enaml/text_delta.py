@@ -0,0 +1,135 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Utilities for synchronizing large texts with edit operations.
+
+An edit is a [position, removed, inserted] list which replaces the
+`removed` characters at `position` with the `inserted` text. A list of
+edits is applied in order, so the position of an edit refers to the
+text produced by the edits which precede it.
+
+"""
+
+
+#: The size of the blocks compared when searching for a common prefix
+#: or suffix. Whole blocks are compared with a single slice comparison.
+_MATCH_BLOCK = 4096
+
+
+def _common_prefix(a, b, limit):
+    """ Get the length of the common prefix of two strings.
+
+    Parameters
+    ----------
+    a, b : unicode
+        The strings to compare.
+
+    limit : int
+        The maximum length to return. It must not be larger than the
+        length of either string.
+
+    """
+    i = 0
+    while i < limit:
+        n = min(_MATCH_BLOCK, limit - i)
+        if a[i:i + n] == b[i:i + n]:
+            i += n
+            continue
+        lo, hi = 0, n
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a[i:i + mid] == b[i:i + mid]:
+                lo = mid
+            else:
+                hi = mid
+        return i + lo
+    return limit
+
+
+def _common_suffix(a, b, limit):
+    """ Get the length of the common suffix of two strings.
+
+    Parameters
+    ----------
+    a, b : unicode
+        The strings to compare.
+
+    limit : int
+        The maximum length to return. It must not be larger than the
+        length of either string.
+
+    """
+    la = len(a)
+    lb = len(b)
+    i = 0
+    while i < limit:
+        n = min(_MATCH_BLOCK, limit - i)
+        if a[la - i - n:la - i] == b[lb - i - n:lb - i]:
+            i += n
+            continue
+        lo, hi = 0, n
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if a[la - i - mid:la - i] == b[lb - i - mid:lb - i]:
+                lo = mid
+            else:
+                hi = mid
+        return i + lo
+    return limit
+
+
+def text_edits(old, new):
+    """ Compute the edits which transform one text into another.
+
+    The edits replace the part of the text between the common prefix
+    and the common suffix of the two texts, so a typical change made
+    by a user produces a single small edit.
+
+    Parameters
+    ----------
+    old : unicode
+        The original text.
+
+    new : unicode
+        The new text.
+
+    Returns
+    -------
+    result : list
+        A list of edits, which is empty if the texts are equal.
+
+    """
+    if old == new:
+        return []
+    limit = min(len(old), len(new))
+    prefix = _common_prefix(old, new, limit)
+    suffix = _common_suffix(old, new, limit - prefix)
+    removed = len(old) - prefix - suffix
+    inserted = new[prefix:len(new) - suffix]
+    return [[prefix, removed, inserted]]
+
+
+def apply_edits(text, edits):
+    """ Apply a list of edits to a text.
+
+    Parameters
+    ----------
+    text : unicode
+        The text to edit.
+
+    edits : list
+        The list of edits to apply in order.
+
+    Returns
+    -------
+    result : unicode
+        The edited text.
+
+    """
+    for position, removed, inserted in edits:
+        if position < 0 or removed < 0 or position + removed > len(text):
+            raise ValueError('edit is out of range of the text')
+        text = text[:position] + inserted + text[position + removed:]
+    return text
+
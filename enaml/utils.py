@@ -10,6 +10,7 @@ from functools import wraps
 import logging
 from random import shuffle
 from string import letters, digits
+from types import MethodType
 
 
 def id_generator(stem):
@@ -240,10 +241,34 @@ def log_exceptions(func):
 
 
 
+def _drop_instance(func):
+    """ Wrap a callable so that it ignores its first argument.
+
+    This is used by `make_dispatcher` to give static and class method
+    handlers the same calling convention as plain method functions.
+
+    """
+    def wrapper(obj, *args):
+        return func(*args)
+    return wrapper
+
+
 def make_dispatcher(prefix, logger=None):
     """ Create a function which will dispatch arguments to specially
     named handler methods on an object.
 
+    The handlers for a given class are resolved once, the first time
+    an instance of that class is dispatched, and cached in a table
+    which maps the unprefixed names to the handler functions. Handlers
+    which are added to a class after its table has been built will
+    still be found, albeit through the slower `getattr` path. A handler
+    set on an instance overrides the handler of its class.
+
+    A handler which is *replaced* on a class after its table has been
+    built is not seen by the dispatcher, since the table still holds
+    the original function. Code which patches handlers on a class at
+    runtime must call the `invalidate` function of the dispatcher.
+
     Parameters
     ----------
     prefix : str
@@ -257,17 +282,93 @@ def make_dispatcher(prefix, logger=None):
     -------
     result : types.FunctionType
         A function with the signature func(obj, name, *args). Calling
-        it is equivalent to `getattr(obj, prefix + name)(*args)`
+        it is equivalent to `getattr(obj, prefix + name)(*args)`. The
+        function has a `dispatch_table` attribute which is a function
+        that returns the cached handler table for a given class, and an
+        `invalidate` attribute which is a function that discards the
+        cached table of a given class, or of every class if called
+        without an argument.
 
     """
+    tables = {}
+    plen = len(prefix)
+
+    def dispatch_table(cls):
+        """ Get the dispatch table for the given class.
+
+        Parameters
+        ----------
+        cls : type
+            The class for which to retrieve the dispatch table.
+
+        Returns
+        -------
+        result : dict
+            A dictionary mapping the unprefixed handler names to
+            functions which accept the instance as the first argument.
+            This dictionary should not be modified by user code.
+
+        """
+        try:
+            return tables[cls]
+        except KeyError:
+            pass
+        table = {}
+        for attr in dir(cls):
+            if not attr.startswith(prefix):
+                continue
+            handler = getattr(cls, attr, None)
+            if isinstance(handler, MethodType) and handler.im_self is None:
+                table[attr[plen:]] = handler.im_func
+            elif callable(handler):
+                # Static and class methods do not accept the instance.
+                table[attr[plen:]] = _drop_instance(handler)
+        tables[cls] = table
+        return table
+
+    def invalidate(cls=None):
+        """ Discard a cached dispatch table.
+
+        Parameters
+        ----------
+        cls : type, optional
+            The class whose table should be discarded. The tables of
+            its subclasses are discarded as well. If not given, every
+            table is discarded.
+
+        """
+        if cls is None:
+            tables.clear()
+        else:
+            for key in list(tables):
+                if issubclass(key, cls):
+                    del tables[key]
+
     def dispatcher(obj, name, *args):
+        # A handler on the instance takes precedence over the class.
+        inst_dict = getattr(obj, '__dict__', None)
+        if inst_dict and prefix + name in inst_dict:
+            inst_dict[prefix + name](*args)
+            return
+        try:
+            handler = tables[type(obj)][name]
+        except KeyError:
+            handler = dispatch_table(type(obj)).get(name)
+        if handler is not None:
+            handler(obj, *args)
+            return
+        # Fall back to a dynamic lookup to support handlers defined on
+        # the instance or added to the class after the table was built.
         handler = getattr(obj, prefix + name, None)
         if handler is not None:
             handler(*args)
         elif logger is not None:
             msg = "no dispatch handler found for '%s' on `%s` object"
             logger.warn(msg % (name, obj))
+
     dispatcher.__name__ = prefix + '_dispatcher'
+    dispatcher.dispatch_table = dispatch_table
+    dispatcher.invalidate = invalidate
     return dispatcher
 
 
@@ -7,3 +7,5 @@ from .int_validator import IntValidator
 from .float_validator import FloatValidator
 from .regex_validator import RegexValidator
 
+from .length_validator import LengthValidator
+from .compound_validator import CompoundValidator
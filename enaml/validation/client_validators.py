@@ -12,6 +12,8 @@ validation system should whichever is more appropriate.
 """
 import re
 
+from enaml.lru_cache import LRUCache
+
 
 def null_validator(text):
     """ A validator function which will return True for all text input.
@@ -124,13 +126,88 @@ def float_validator(minimum=None, maximum=None, allow_exponent=False):
     return validator
 
 
+def length_validator(minimum=None, maximum=None):
+    """ Creates a callable which will validate the length of text input.
+
+    Parameters
+    ----------
+    minimum : None or int
+        The minimum number of characters, inclusive. None indicates no
+        lower bound.
+
+    maximum : None or int
+        The maximum number of characters, inclusive. None indicates no
+        upper bound.
+
+    Returns
+    -------
+    results : callable
+        A callable which takes a single unicode argument and returns
+        True if the length of the text is in range, False otherwise.
+
+    """
+    def validator(text):
+        length = len(text)
+        if minimum is not None and length < minimum:
+            return False
+        if maximum is not None and length > maximum:
+            return False
+        return True
+    return validator
+
+
+def compound_validator(validators):
+    """ Creates a callable which will validate text input against a
+    list of validators.
+
+    Parameters
+    ----------
+    validators : list
+        The list of dict representations of the child validators.
+
+    Returns
+    -------
+    results : callable
+        A callable which takes a single unicode argument and returns
+        True if the text is valid for every child validator, False
+        otherwise.
+
+    """
+    funcs = tuple(make_validator(info) for info in validators)
+    def validator(text):
+        for func in funcs:
+            if not func(text):
+                return False
+        return True
+    return validator
+
+
 _VALIDATOR_TYPES = {
     'regex': regex_validator,
     'int': int_validator,
     'float': float_validator,
+    'length': length_validator,
+    'compound': compound_validator,
 }
 
 
+#: The cache of the compiled validator functions. A validator which is
+#: sent to the client repeatedly, for example to every row of a form,
+#: is only compiled once.
+_validator_cache = LRUCache(128)
+
+
+def _freeze(value):
+    """ Convert a validator argument into a hashable value.
+
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.iteritems()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
 def make_validator(info):
     """ Make a validator function for the given dict represenation.
 
@@ -147,11 +224,20 @@ def make_validator(info):
         True if the text is valid. False otherwise. If the validator 
         type is not supported, a null validator which accepts all text 
         will be returned.
-    
+
     """
     vtype = info['type']
-    if vtype in _VALIDATOR_TYPES:
-        return _VALIDATOR_TYPES[vtype](**info['arguments'])
-    else:
+    if vtype not in _VALIDATOR_TYPES:
         return null_validator
+    arguments = info['arguments']
+    try:
+        key = (vtype, _freeze(arguments))
+        hash(key)
+    except TypeError:
+        return _VALIDATOR_TYPES[vtype](**arguments)
+    validator = _validator_cache.get(key)
+    if validator is None:
+        validator = _VALIDATOR_TYPES[vtype](**arguments)
+        _validator_cache.put(key, validator)
+    return validator
 
@@ -0,0 +1,72 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Instance, List
+
+from .validator import Validator
+
+
+class CompoundValidator(Validator):
+    """ A concrete Validator which combines other validators.
+
+    The text is valid only if it is valid for every one of the child
+    validators. The child validators are applied in order, and each is
+    given the text as modified by the previous validator.
+
+    """
+    #: The list of validators which must all accept the text.
+    validators = List(Instance(Validator))
+
+    def validate(self, text, component):
+        """ Validates the given text against every child validator.
+
+        Parameters
+        ----------
+        text : unicode
+            The unicode text edited by the client widget.
+
+        component : Declarative
+            The declarative component currently making use of the
+            validator.
+
+        Returns
+        -------
+        result : (unicode, bool)
+            A 2-tuple of (optionally modified) unicode text, and whether
+            or not that text should be considered valid.
+
+        """
+        for validator in self.validators:
+            text, valid = validator.validate(text, component)
+            if not valid:
+                return (text, False)
+        return (text, True)
+
+    def client_validator(self):
+        """ The client side compound validator.
+
+        Only the child validators which provide a client validator are
+        included. The remaining checks are made by the server.
+
+        Returns
+        -------
+        result : dict or None
+            The dict representation of the client side compound
+            validator, or None if no child validator provides a client
+            validator.
+
+        """
+        children = []
+        for validator in self.validators:
+            child = validator.client_validator()
+            if child is not None:
+                children.append(child)
+        if not children:
+            return None
+        res = {}
+        res['type'] = 'compound'
+        res['message'] = self.message
+        res['arguments'] = {'validators': children}
+        return res
+
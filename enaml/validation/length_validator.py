@@ -0,0 +1,70 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Either, Int
+
+from .validator import Validator
+
+
+class LengthValidator(Validator):
+    """ A concrete Validator which handles the length of text input.
+
+    This validator ensures that the number of characters in the text
+    falls within a specified range.
+
+    """
+    #: The minimum number of characters, inclusive, or None if there
+    #: is no lower bound.
+    minimum = Either(None, Int)
+
+    #: The maximum number of characters, inclusive, or None if there
+    #: is no upper bound.
+    maximum = Either(None, Int)
+
+    def validate(self, text, component):
+        """ Validates the length of the given text.
+
+        Parameters
+        ----------
+        text : unicode
+            The unicode text edited by the client widget.
+
+        component : Declarative
+            The declarative component currently making use of the
+            validator.
+
+        Returns
+        -------
+        result : (unicode, bool)
+            A 2-tuple of (optionally modified) unicode text, and whether
+            or not that text should be considered valid.
+
+        """
+        length = len(text)
+        minimum = self.minimum
+        if minimum is not None and length < minimum:
+            return (text, False)
+        maximum = self.maximum
+        if maximum is not None and length > maximum:
+            return (text, False)
+        return (text, True)
+
+    def client_validator(self):
+        """ The client side length validator.
+
+        Returns
+        -------
+        result : dict
+            The dict representation of the client side length validator.
+
+        """
+        res = {}
+        res['type'] = 'length'
+        res['message'] = self.message
+        res['arguments'] = {
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+        }
+        return res
+
@@ -86,3 +86,29 @@
   }
 }
 
+
+// Length Validator - allows text with a number of characters in a range
+{
+  "type": "length",
+  "arguments": {
+    // The minimum number of characters, inclusive. Null indicates no
+    // lower bound.
+    "minimum": null,
+
+    // The maximum number of characters, inclusive. Null indicates no
+    // upper bound.
+    "maximum": null,
+  }
+}
+
+
+// Compound Validator - allows text which is valid for every validator
+{
+  "type": "compound",
+  "arguments": {
+    // The list of child validators, in the format described above.
+    // Child validators of a type which the client does not support
+    // are ignored.
+    "validators": [],
+  }
+}
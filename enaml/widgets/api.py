@@ -29,11 +29,13 @@ from .image_view import ImageView
 from .label import Label
 from .list_control import ListControl
 from .list_item import ListItem
+from .list_view import ListView
 from .main_window import MainWindow
 from .mdi_area import MdiArea
 from .mdi_window import MdiWindow
 from .menu import Menu
 from .menu_bar import MenuBar
+from .model_combo_box import ModelComboBox
 from .mpl_canvas import MPLCanvas
 from .multiline_field import MultilineField
 from .notebook import Notebook
@@ -49,6 +51,7 @@ from .split_item import SplitItem
 from .splitter import Splitter
 from .stack import Stack
 from .stack_item import StackItem
+from .table_view import TableView
 #from .text_editor import TextEditor
 from .time_selector import TimeSelector
 from .tool_bar import ToolBar
@@ -56,3 +59,6 @@ from .traits_item import TraitsItem
 from .web_view import WebView
 from .window import Window
 
+# Model imports
+from .item_model import ItemModel, ListModel, TableModel
+
@@ -2,7 +2,9 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Bool, List, Int, Property, Unicode, cached_property
+from traits.api import (
+    Bool, Instance, List, Int, Property, Unicode, cached_property
+)
 
 from .control import Control
 
@@ -33,6 +35,12 @@ class ComboBox(Control):
     #: hug width weakly, by default.
     hug_width = 'weak'
 
+    #: A private copy of the items known to the client. The index of an
+    #: items event is checked against it, since Traits reports an index
+    #: one past the item for a deletion at a negative index, and the
+    #: unclipped start for a slice.
+    _client_items = Instance(list, ())
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
@@ -53,15 +61,87 @@ class ComboBox(Control):
         """
         super(ComboBox, self).bind()
         self.publish_attributes('index', 'editable')
-        self.on_trait_change(self._send_items, 'items, items_items')
+        self._client_items = list(self.items)
+        self.on_trait_change(self._send_items, 'items')
+        self.on_trait_change(self._send_items_event, 'items_items')
 
     def _send_items(self):
         """ Send the 'set_items' action to the client widget.
 
         """
+        self._client_items = list(self.items)
         content = {'items': self.items}
         self.send_action('set_items', content)
 
+    def _send_items_event(self, event):
+        """ Send the actions for an in-place change of the items.
+
+        A change to a contiguous range of the items is sent as a remove
+        and an insert of that range, so that the client does not need
+        to rebuild the list. A range which is replaced by the same number
+        of items is sent as a change to the text of the items, so that
+        the selection of the client is not disturbed. The index is
+        updated so that it continues to refer to the same item, or to
+        -1 if the item was removed. If the index of the event does not
+        describe the change, all of the items are sent instead.
+
+        """
+        index = self._event_index(event)
+        if index is None:
+            self._send_items()
+            if self.index >= len(self.items):
+                self.index = -1
+            return
+        self._client_items = list(self.items)
+        removed = len(event.removed)
+        added = event.added
+        if removed and len(added) == removed:
+            content = {'index': index, 'items': added}
+            self.send_action('replace_items', content)
+            return
+        if removed:
+            content = {'index': index, 'count': removed}
+            self.send_action('remove_items', content)
+        if added:
+            content = {'index': index, 'items': added}
+            self.send_action('insert_items', content)
+        current = self.index
+        if current >= index + removed:
+            self.index = current + len(added) - removed
+        elif current >= index and removed and len(added) != removed:
+            self.index = -1
+
+    def _event_index(self, event):
+        """ Get the real index of an in-place change of the items.
+
+        Returns
+        -------
+        result : int or None
+            The index at which the items were changed, or None if it
+            cannot be determined from the event.
+
+        """
+        index = event.index
+        if isinstance(index, slice):
+            return None
+        old = self._client_items
+        new = self.items
+        removed = event.removed
+        added = event.added
+        if len(new) != len(old) - len(removed) + len(added):
+            return None
+        candidates = (index,)
+        if removed and not added:
+            candidates = (index, index - 1)
+        for idx in candidates:
+            if idx < 0 or idx + len(removed) > len(old):
+                continue
+            if old[idx:idx + len(removed)] != removed:
+                continue
+            if new[idx:idx + len(added)] != added:
+                continue
+            return idx
+
     #--------------------------------------------------------------------------
     # Message Handling
     #--------------------------------------------------------------------------
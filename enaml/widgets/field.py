@@ -2,8 +2,9 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Bool, Int, Unicode, Enum, List, Instance
+from traits.api import Bool, Int, Unicode, Enum, List, Instance, Range
 
+from enaml.application import deferred_call
 from enaml.validation.validator import Validator
 
 from .control import Control
@@ -27,13 +28,18 @@ class Field(Control):
 
     #: The list of actions which should cause the client to submit its
     #: text to the server for validation and update. The currently
-    #: supported values are 'lost_focus', 'return_pressed' and 
-    #: 'text_edited' .
+    #: supported values are 'lost_focus', 'return_pressed',
+    #: 'text_edited' and 'auto_sync'. The 'auto_sync' trigger submits
+    #: the text once the user has stopped typing for `sync_delay` ms.
     submit_triggers = List(
-        Enum('lost_focus', 'return_pressed', 'text_edited'), 
+        Enum('lost_focus', 'return_pressed', 'text_edited', 'auto_sync'),
             ['lost_focus', 'return_pressed']
     )
 
+    #: The delay in ms between the last keystroke and the submission
+    #: of the text, when 'auto_sync' is one of the submit triggers.
+    sync_delay = Range(low=0, value=300)
+
     #: The grayed-out text to display if the field is empty and the
     #: widget doesn't have focus. Defaults to the empty string.
     placeholder = Unicode
@@ -55,6 +61,10 @@ class Field(Control):
     #: the width hug by default, so they expand freely in width.
     hug_width = 'ignore'
 
+    #: The most recent 'submit_text' content which has not yet been
+    #: validated, or None if no submission is pending.
+    _pending_submit = Instance(dict)
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
@@ -66,6 +76,7 @@ class Field(Control):
         snap['text'] = self.text
         snap['validator'] = self._client_validator()
         snap['submit_triggers'] = self.submit_triggers
+        snap['sync_delay'] = self.sync_delay
         snap['placeholder'] = self.placeholder
         snap['echo_mode'] = self.echo_mode
         snap['max_length'] = self.max_length
@@ -80,6 +91,7 @@ class Field(Control):
         super(Field, self).bind()
         attrs = (
             'text', 'placeholder', 'echo_mode', 'max_length', 'read_only',
+            'sync_delay',
         )
         self.publish_attributes(*attrs)
         self.on_trait_change(self._send_validator, 'validator')
@@ -109,28 +121,49 @@ class Field(Control):
         content = {'submit_triggers': self.submit_triggers}
         self.send_action('set_submit_triggers', content)
 
-    #--------------------------------------------------------------------------
-    # Message Handling
-    #--------------------------------------------------------------------------
-    def on_action_submit_text(self, content):
-        """ Handle the 'submit_text' action from the client widget.
+    def _process_submit(self):
+        """ Validate the pending submission from the client widget.
+
+        The reply carries the 'request' number of the submission, if
+        one was given, so that the client can discard a reply for text
+        which the user has since edited.
 
         """
+        content = self._pending_submit
+        self._pending_submit = None
+        if content is None or not self.is_active:
+            return
         edit_text = content['text']
         validator = self.validator
         if validator is not None:
             text, valid = validator.validate(edit_text, self)
         else:
             text, valid = edit_text, True
+        reply = {'text': text}
+        if 'request' in content:
+            reply['request'] = content['request']
         if valid:
             # If the new text differs from the original edit text,
             # we push an update to the client.
             if text != edit_text:
-                content = {'text': text}
-                self.send_action('set_text', content)
+                self.send_action('set_text', reply)
             self.set_guarded(text=text)
         else:
             # notify the client that server validation failed.
-            content = {'text': text}
-            self.send_action('invalid_text', content)
+            self.send_action('invalid_text', reply)
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_submit_text(self, content):
+        """ Handle the 'submit_text' action from the client widget.
+
+        The submission is validated on the next cycle of the event loop.
+        When the client submits several texts before then, only the
+        most recent one is validated and replied to.
+
+        """
+        if self._pending_submit is None:
+            deferred_call(self._process_submit)
+        self._pending_submit = content
 
@@ -2,10 +2,10 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Enum, Range, Property, cached_property
+from traits.api import Bool, Enum, Int, Range, Property, cached_property
 
 from enaml.core.trait_types import CoercingInstance
-from enaml.layout.geometry import Box
+from enaml.layout.geometry import Box, Size
 
 from .constraints_widget import ConstraintsWidget
 from .flow_item import FlowItem
@@ -33,6 +33,27 @@ class FlowArea(ConstraintsWidget):
     #: The margins to use around the outside of the flow area.
     margins = CoercingInstance(Box, (10, 10, 10, 10))
 
+    #: Whether the contents of the flow items are realized lazily. If
+    #: True, the snapshot does not include the contents of the items.
+    #: The client realizes the contents of an item when it scrolls into
+    #: view, and lays out the other items using placeholder sizes.
+    virtual = Bool(False)
+
+    #: The distance in pixels beyond the edges of the viewport within
+    #: which the items of a virtual flow area are realized.
+    overscan = Range(low=0, value=200)
+
+    #: The number of milliseconds after which the contents of an item
+    #: of a virtual flow area which scrolled out of view are unrealized
+    #: on the client to reclaim memory. A value of 0 means the contents
+    #: are never unrealized.
+    unrealize_delay = Int(0)
+
+    #: The size used in the layout for an item of a virtual flow area
+    #: which has never been realized and which has no preferred size.
+    #: An item which was realized keeps its last size.
+    placeholder_size = CoercingInstance(Size, (100, 100))
+
     #: A read only property which returns the area's flow items.
     flow_items = Property(depends_on='children')
 
@@ -47,12 +68,19 @@ class FlowArea(ConstraintsWidget):
         """ Returns the snapshot dict for the FlowArea.
 
         """
+        if self.virtual:
+            for item in self.flow_items:
+                item._set_children_realized(False)
         snap = super(FlowArea, self).snapshot()
         snap['direction'] = self.direction
         snap['align'] = self.align
         snap['horizontal_spacing'] = self.horizontal_spacing
         snap['vertical_spacing'] = self.vertical_spacing
         snap['margins'] = self.margins
+        snap['virtual'] = self.virtual
+        snap['overscan'] = self.overscan
+        snap['unrealize_delay'] = self.unrealize_delay
+        snap['placeholder_size'] = self.placeholder_size
         return snap
 
     def bind(self):
@@ -62,13 +90,36 @@ class FlowArea(ConstraintsWidget):
         super(FlowArea, self).bind()
         attrs = (
             'direction', 'align', 'horizontal_spacing','vertical_spacing',
-            'margins',
+            'margins', 'virtual', 'overscan', 'unrealize_delay',
+            'placeholder_size',
         )
         self.publish_attributes(*attrs)
 
+    def children_event(self, event):
+        """ Handle a `ChildrenEvent` for the flow area.
+
+        The contents of the items added to an active virtual flow area
+        are unrealized before their snapshots are taken, so that the
+        client realizes them when they scroll into view.
+
+        """
+        super(FlowArea, self).children_event(event)
+        if self.virtual and self.is_active:
+            for child in set(event.new) - set(event.old):
+                if isinstance(child, FlowItem):
+                    child._set_children_realized(False)
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _virtual_changed(self, virtual):
+        """ Realize the contents of every item when virtual is disabled.
+
+        """
+        if not virtual:
+            for item in self.flow_items:
+                item.realize_children()
+
     @cached_property
     def _get_flow_items(self):
         """ The getter for the 'flow_items' property.
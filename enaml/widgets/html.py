@@ -4,12 +4,18 @@
 #------------------------------------------------------------------------------
 from traits.api import Str
 
+from enaml.html_patch import patch_html
+
 from .control import Control
 
 
 class Html(Control):
     """ An extremely simple widget for displaying HTML.
 
+    Content can be streamed into the widget with `patch_source`, which
+    sends only the new fragment to the client instead of the full
+    source.
+
     """
     #: The Html source code to be rendered.
     source = Str
@@ -41,3 +47,40 @@ class Html(Control):
         super(Html, self).bind()
         self.publish_attributes('source')
 
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def patch_source(self, html, element_id='', mode='append'):
+        """ Insert an html fragment into an element of the source.
+
+        The source is updated, but only the fragment is sent to the
+        client widget. A client may not be able to patch its document
+        in place, in which case it reloads the patched source. The Qt
+        client only patches in place when appending to the body; any
+        other patch reloads the whole document, so streaming content
+        should be appended to the body.
+
+        Parameters
+        ----------
+        html : str
+            The html fragment to insert.
+
+        element_id : str, optional
+            The id of the element to patch. The default empty string
+            patches the body of the document.
+
+        mode : str, optional
+            One of 'append', 'prepend' or 'replace'. The default is
+            'append'.
+
+        Raises
+        ------
+        ValueError
+            The mode is not supported, or the element cannot be found.
+
+        """
+        source = patch_html(self.source, element_id, html, mode)
+        self.set_guarded(source=source)
+        content = {'element_id': element_id, 'html': html, 'mode': mode}
+        self.send_action('patch_html', content)
+
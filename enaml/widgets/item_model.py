@@ -0,0 +1,282 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Any, Callable, Event, HasTraits, List, Unicode
+
+
+#: The number of rows fetched at a time by the default implementation
+#: of `ItemModel.search`.
+SEARCH_BLOCK_SIZE = 1000
+
+
+class ItemModel(HasTraits):
+    """ An abstract model of rows and columns of data for an ItemView.
+
+    An item view only requests the rows which are visible in its client
+    widget, so a model need not hold its data in memory. A subclass
+    must implement `row_count` and `data`. It should fire the change
+    events when its data changes so that the views can update.
+
+    The values returned by `data` and `header_data` are sent to the
+    client as-is, so they must be unicode, numbers or None.
+
+    """
+    #: An event fired when the data of a range of rows changes. The
+    #: payload is a (row, count) tuple.
+    data_changed = Event
+
+    #: An event fired when rows are inserted into the model. The
+    #: payload is a (row, count) tuple.
+    rows_inserted = Event
+
+    #: An event fired when rows are removed from the model. The payload
+    #: is a (row, count) tuple.
+    rows_removed = Event
+
+    #: An event fired when the shape or all of the data of the model
+    #: changes.
+    model_reset = Event
+
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        raise NotImplementedError
+
+    def column_count(self):
+        """ Get the number of columns in the model.
+
+        The default implementation returns 1.
+
+        """
+        return 1
+
+    def data(self, row, column):
+        """ Get the display value of an item in the model.
+
+        Parameters
+        ----------
+        row : int
+            The row of the item.
+
+        column : int
+            The column of the item.
+
+        Returns
+        -------
+        result : unicode, number or None
+            The value to display for the item.
+
+        """
+        raise NotImplementedError
+
+    def header_data(self, section, orientation):
+        """ Get the display value of a header section.
+
+        Parameters
+        ----------
+        section : int
+            The column or row of the header section.
+
+        orientation : str
+            Either 'horizontal' for a column header or 'vertical' for a
+            row header.
+
+        Returns
+        -------
+        result : unicode or None
+            The header text, or None to let the client choose a default.
+
+        """
+        return None
+
+    def fetch(self, row, count):
+        """ Get the display values of a range of rows.
+
+        The default implementation calls `data` for every item. A model
+        which can access its data in bulk should reimplement this.
+
+        Parameters
+        ----------
+        row : int
+            The first row to fetch. It is within the bounds of the model.
+
+        count : int
+            The number of rows to fetch. The range is within the bounds
+            of the model.
+
+        Returns
+        -------
+        result : list
+            A list with a list of column values for each row.
+
+        """
+        data = self.data
+        columns = range(self.column_count())
+        return [
+            [data(r, c) for c in columns] for r in xrange(row, row + count)
+        ]
+
+    def search(self, text, limit):
+        """ Find the rows whose first column contains a text.
+
+        The default implementation scans the model in blocks with a
+        case-insensitive substring match. A model which can search its
+        data more efficiently, such as with an index, should reimplement
+        this.
+
+        Parameters
+        ----------
+        text : unicode
+            The text to search for.
+
+        limit : int
+            The maximum number of matches to return.
+
+        Returns
+        -------
+        result : list
+            A list of [row, value] pairs for the matching rows, in the
+            order of the rows.
+
+        """
+        needle = text.lower()
+        matches = []
+        row_count = self.row_count()
+        for start in xrange(0, row_count, SEARCH_BLOCK_SIZE):
+            count = min(SEARCH_BLOCK_SIZE, row_count - start)
+            for offset, values in enumerate(self.fetch(start, count)):
+                value = values[0] if values else None
+                if value is None:
+                    continue
+                if needle in unicode(value).lower():
+                    matches.append([start + offset, value])
+                    if len(matches) >= limit:
+                        return matches
+        return matches
+
+
+class ListModel(ItemModel):
+    """ An ItemModel for a sequence of items displayed as one column.
+
+    """
+    #: The sequence of items. Replacing the sequence resets the model.
+    #: Changes made in-place must be reported with the change events
+    #: or made through the methods of the model.
+    items = Any(())
+
+    #: A callable which converts an item into its display value. The
+    #: default converts the item to unicode.
+    to_text = Callable(unicode)
+
+    def row_count(self):
+        """ Get the number of items in the model.
+
+        """
+        return len(self.items)
+
+    def data(self, row, column):
+        """ Get the display value of the item of a row.
+
+        """
+        return self.to_text(self.items[row])
+
+    def fetch(self, row, count):
+        """ Get the display values of a range of items.
+
+        """
+        to_text = self.to_text
+        return [[to_text(item)] for item in self.items[row:row + count]]
+
+    def insert_items(self, row, items):
+        """ Insert items into the sequence and fire `rows_inserted`.
+
+        The sequence must support slice assignment.
+
+        """
+        self.items[row:row] = items
+        self.rows_inserted = (row, len(items))
+
+    def remove_items(self, row, count):
+        """ Remove items from the sequence and fire `rows_removed`.
+
+        The sequence must support slice deletion.
+
+        """
+        del self.items[row:row + count]
+        self.rows_removed = (row, count)
+
+    def update_item(self, row, item):
+        """ Replace an item of the sequence and fire `data_changed`.
+
+        """
+        self.items[row] = item
+        self.data_changed = (row, 1)
+
+    def _items_changed(self):
+        """ Reset the model when the sequence is replaced.
+
+        """
+        self.model_reset = True
+
+
+class TableModel(ItemModel):
+    """ An ItemModel for a sequence of rows of values.
+
+    """
+    #: The sequence of rows. Each row is a sequence with a value for
+    #: every column. Replacing the sequence resets the model.
+    rows = Any(())
+
+    #: The column headers. The number of headers determines the number
+    #: of columns, unless it is empty, in which case the length of the
+    #: first row is used.
+    headers = List(Unicode)
+
+    def row_count(self):
+        """ Get the number of rows in the model.
+
+        """
+        return len(self.rows)
+
+    def column_count(self):
+        """ Get the number of columns in the model.
+
+        """
+        if self.headers:
+            return len(self.headers)
+        rows = self.rows
+        return len(rows[0]) if len(rows) > 0 else 0
+
+    def data(self, row, column):
+        """ Get the value of an item in the model.
+
+        """
+        return self.rows[row][column]
+
+    def header_data(self, section, orientation):
+        """ Get the column header text for a section.
+
+        """
+        if orientation == 'horizontal' and section < len(self.headers):
+            return self.headers[section]
+
+    def fetch(self, row, count):
+        """ Get the values of a range of rows.
+
+        """
+        ncols = self.column_count()
+        return [list(r[:ncols]) for r in self.rows[row:row + count]]
+
+    def _rows_changed(self):
+        """ Reset the model when the sequence is replaced.
+
+        """
+        self.model_reset = True
+
+    def _headers_changed(self):
+        """ Reset the model when the headers are replaced.
+
+        """
+        self.model_reset = True
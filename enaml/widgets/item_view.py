@@ -0,0 +1,226 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Enum, Instance, Int, List, Range
+
+from enaml.core.trait_types import EnamlEvent
+
+from .control import Control
+from .item_model import ItemModel
+
+
+#: The maximum number of rows which are sent in reply to a single
+#: fetch request from the client.
+MAX_FETCH_ROWS = 10000
+
+
+def model_shape(model):
+    """ Get the dict of the shape of a model for a client widget.
+
+    Parameters
+    ----------
+    model : ItemModel or None
+        The model of the widget.
+
+    Returns
+    -------
+    result : dict
+        A dict with the 'row_count', 'column_count' and 'headers' of
+        the model.
+
+    """
+    if model is None:
+        return {'row_count': 0, 'column_count': 0, 'headers': []}
+    columns = model.column_count()
+    headers = [model.header_data(c, 'horizontal') for c in range(columns)]
+    return {
+        'row_count': model.row_count(),
+        'column_count': columns,
+        'headers': headers,
+    }
+
+
+def fetch_model_rows(model, ranges):
+    """ Fetch the rows of a model requested by a client widget.
+
+    Parameters
+    ----------
+    model : ItemModel or None
+        The model of the widget.
+
+    ranges : list
+        The list of [row, count] ranges requested by the client.
+
+    Returns
+    -------
+    result : tuple
+        A tuple of the row count of the model and a list of [row, data]
+        pairs for the parts of the ranges which are in the bounds of
+        the model. At most MAX_FETCH_ROWS rows are returned.
+
+    """
+    if model is None:
+        return 0, []
+    row_count = model.row_count()
+    budget = MAX_FETCH_ROWS
+    fetched = []
+    for row, count in ranges:
+        row = max(0, row)
+        count = min(count, row_count - row, budget)
+        if count <= 0:
+            continue
+        budget -= count
+        fetched.append([row, model.fetch(row, count)])
+    return row_count, fetched
+
+
+class ItemView(Control):
+    """ A base class for controls which display the data of an
+    ItemModel.
+
+    The client widget only requests the rows which it displays, plus a
+    number of rows before and after them, so an item view can display
+    a model with millions of rows. `ItemView` is an abstract class and
+    should not be used directly.
+
+    """
+    #: The model which provides the data for the view.
+    model = Instance(ItemModel)
+
+    #: The number of rows the client fetches before and after the rows
+    #: which it needs to display, so that scrolling does not wait for
+    #: the server.
+    prefetch = Range(low=0, value=100)
+
+    #: The selection mode of the view.
+    selection_mode = Enum('single', 'extended', 'none')
+
+    #: The rows which are selected in the view.
+    selected_rows = List(Int)
+
+    #: An event fired when the user activates a row. The payload will
+    #: be the row index.
+    activated = EnamlEvent
+
+    #: An item view expands freely in height and width by default.
+    hug_width = 'weak'
+    hug_height = 'weak'
+
+    #--------------------------------------------------------------------------
+    # Initialization
+    #--------------------------------------------------------------------------
+    def snapshot(self):
+        """ Returns the snapshot dictionary for the item view.
+
+        """
+        snap = super(ItemView, self).snapshot()
+        snap.update(self._model_shape())
+        snap['prefetch'] = self.prefetch
+        snap['selection_mode'] = self.selection_mode
+        snap['selected_rows'] = self.selected_rows
+        return snap
+
+    def bind(self):
+        """ A method called after initialization which allows the widget
+        to bind any event handlers necessary.
+
+        """
+        super(ItemView, self).bind()
+        self.publish_attributes('prefetch', 'selection_mode', 'selected_rows')
+        otc = self.on_trait_change
+        otc(self._send_reset, 'model, model:model_reset')
+        otc(self._send_data_changed, 'model:data_changed')
+        otc(self._send_rows_inserted, 'model:rows_inserted')
+        otc(self._send_rows_removed, 'model:rows_removed')
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_fetch_rows(self, content):
+        """ Handle the 'fetch_rows' action from the client widget.
+
+        The content contains a list of [row, count] 'ranges'. The reply
+        contains the data for the parts of the ranges which are in the
+        bounds of the model, along with the current row count so that
+        the client can detect a stale request.
+
+        """
+        row_count, ranges = fetch_model_rows(self.model, content['ranges'])
+        reply = {
+            'ranges': ranges,
+            'row_count': row_count,
+            'generation': content.get('generation'),
+        }
+        self.send_action('rows', reply)
+
+    def on_action_selection_changed(self, content):
+        """ Handle the 'selection_changed' action from the client widget.
+
+        """
+        self.set_guarded(selected_rows=content['rows'])
+
+    def on_action_activated(self, content):
+        """ Handle the 'activated' action from the client widget.
+
+        """
+        self.activated(content['row'])
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _model_shape(self):
+        """ Get the dict of the shape of the model for the client.
+
+        """
+        return model_shape(self.model)
+
+    def _send_reset(self):
+        """ Send the 'reset' action to the client widget.
+
+        The client clears its selection when its model is reset, so the
+        selected rows are cleared without being sent back to it.
+
+        """
+        self.send_action('reset', self._model_shape())
+        if self.selected_rows:
+            self.set_guarded(selected_rows=[])
+
+    def _send_data_changed(self, change):
+        """ Send the 'data_changed' action to the client widget.
+
+        """
+        row, count = change
+        self.send_action('data_changed', {'row': row, 'count': count})
+
+    def _send_rows_inserted(self, change):
+        """ Send the 'rows_inserted' action to the client widget.
+
+        The client shifts its selection along with its rows, so the
+        selected rows are updated to match without being sent back.
+
+        """
+        row, count = change
+        self.send_action('rows_inserted', {'row': row, 'count': count})
+        selected = self.selected_rows
+        if any(r >= row for r in selected):
+            rows = [r + count if r >= row else r for r in selected]
+            self.set_guarded(selected_rows=rows)
+
+    def _send_rows_removed(self, change):
+        """ Send the 'rows_removed' action to the client widget.
+
+        The selected rows are updated to match the client, which drops
+        the removed rows from its selection and shifts the rest.
+
+        """
+        row, count = change
+        self.send_action('rows_removed', {'row': row, 'count': count})
+        selected = self.selected_rows
+        if any(r >= row for r in selected):
+            rows = [
+                r - count if r >= row + count else r
+                for r in selected if not row <= r < row + count
+            ]
+            self.set_guarded(selected_rows=rows)
+
@@ -2,15 +2,55 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Bool, Enum, Range, Property, cached_property
+from traits.api import (
+    Bool, Enum, Instance, Int, Range, Property, cached_property
+)
 
-from enaml.core.trait_types import CoercingInstance
+from enaml.core.trait_types import CoercingInstance, EnamlEvent
 from enaml.layout.geometry import Size
 
 from .control import Control
 from .list_item import ListItem
 
 
+#: The keys which are allowed in the dict for a data item. They have the
+#: same meaning as the attributes of the same name on a `ListItem`.
+ITEM_DATA_KEYS = frozenset((
+    'text', 'tool_tip', 'status_tip', 'background', 'foreground', 'font',
+    'icon_source', 'checkable', 'checked', 'selectable', 'editable',
+    'enabled', 'visible',
+))
+
+
+def make_item_data(item):
+    """ Convert a value into the data dict for a list control item.
+
+    Parameters
+    ----------
+    item : basestring or dict
+        The text of the item, or a dict of item data. The keys of the
+        dict must be a subset of `ITEM_DATA_KEYS`.
+
+    Returns
+    -------
+    result : dict
+        The data dict for the item. It only contains the keys which
+        were given, so that the default item data is not sent to the
+        client for every item.
+
+    """
+    if isinstance(item, basestring):
+        return {'text': unicode(item)}
+    if not isinstance(item, dict):
+        msg = 'list control item must be a string or a dict, not `%s`'
+        raise TypeError(msg % type(item).__name__)
+    invalid = set(item) - ITEM_DATA_KEYS
+    if invalid:
+        msg = 'invalid list control item keys: %s'
+        raise ValueError(msg % ', '.join(sorted(invalid)))
+    return dict(item)
+
+
 class ListControl(Control):
     """ A `ListControl` displays a collection `ListItem` children.
 
@@ -18,6 +58,16 @@ class ListControl(Control):
     fairly heavy weight. `ListControl` is well suited for use when the
     number of `ListItem` children is under ~1000.
 
+    For larger collections, the items can be given as plain data with
+    `set_items` and changed with the range methods `insert_items`,
+    `remove_items`, `move_items` and `update_items`. Each of these sends
+    a single message which the client applies as one block operation.
+    The data items are displayed after the `ListItem` children, and the
+    indices used by the range methods are relative to the first data
+    item. Changes to the `ListItem` children are still sent to the
+    client one item at a time, so the range methods should be preferred
+    for large or frequently changing collections.
+
     """
     #: The viewing mode of the list control. The 'list' mode arranges
     #: all items in a vertical list with small icons. The 'icon' mode
@@ -70,6 +120,28 @@ class ListControl(Control):
     #: A read only property which returns the control's list items.
     list_items = Property(depends_on='children')
 
+    #: An event fired when the user clicks on a data item. The payload
+    #: will be the index of the item.
+    item_clicked = EnamlEvent
+
+    #: An event fired when the user double clicks on a data item. The
+    #: payload will be the index of the item.
+    item_double_clicked = EnamlEvent
+
+    #: An event fired when the user edits or toggles a data item. The
+    #: payload will be the index of the item. The new text and checked
+    #: state are stored in the item data before the event is fired.
+    item_changed = EnamlEvent
+
+    #: The private list of item data dicts set with `set_items`. A
+    #: plain list is used so that large lists are not validated.
+    _item_data = Instance(list, ())
+
+    #: The private generation of the data items. It is incremented when
+    #: the indices of the data items change, and is echoed by the item
+    #: events of the client so that stale events can be dropped.
+    _items_generation = Int(0)
+
     #: A list control expands freely in height and width by default.
     hug_width = 'weak'
     hug_height = 'weak'
@@ -92,6 +164,8 @@ class ListControl(Control):
         snap['uniform_item_sizes'] = self.uniform_item_sizes
         snap['layout_mode'] = self.layout_mode
         snap['batch_size'] = self.batch_size
+        snap['items'] = [dict(data) for data in self._item_data]
+        snap['items_generation'] = self._items_generation
         return snap
 
     def bind(self):
@@ -107,6 +181,37 @@ class ListControl(Control):
         )
         self.publish_attributes(*attrs)
 
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_item_clicked(self, content):
+        """ Handle the 'item_clicked' action from the client widget.
+
+        """
+        if self._is_current_item(content):
+            self.item_clicked(content['index'])
+
+    def on_action_item_double_clicked(self, content):
+        """ Handle the 'item_double_clicked' action from the client
+        widget.
+
+        """
+        if self._is_current_item(content):
+            self.item_double_clicked(content['index'])
+
+    def on_action_item_changed(self, content):
+        """ Handle the 'item_changed' action from the client widget.
+
+        """
+        if not self._is_current_item(content):
+            return
+        index = content['index']
+        data = self._item_data[index]
+        data['text'] = content['text']
+        if content['checked'] is not None or 'checked' in data:
+            data['checked'] = content['checked']
+        self.item_changed(index)
+
     #--------------------------------------------------------------------------
     # Public API
     #--------------------------------------------------------------------------
@@ -116,9 +221,163 @@ class ListControl(Control):
         """
         self.send_action('refresh_items_layout', {})
 
+    def items(self):
+        """ Get the data items of the list control.
+
+        Returns
+        -------
+        result : list
+            A copy of the list of item data dicts.
+
+        """
+        return [dict(data) for data in self._item_data]
+
+    def item_count(self):
+        """ Get the number of data items in the list control.
+
+        """
+        return len(self._item_data)
+
+    def set_items(self, items):
+        """ Replace all of the data items of the list control.
+
+        Parameters
+        ----------
+        items : iterable
+            The new items. Each item is a string for the text of the
+            item, or a dict of item data with keys from ITEM_DATA_KEYS.
+
+        """
+        data = [make_item_data(item) for item in items]
+        self._item_data = data
+        content = {'items': data, 'generation': self._next_generation()}
+        self.send_action('set_items', content)
+
+    def insert_items(self, index, items):
+        """ Insert data items into the list control.
+
+        Parameters
+        ----------
+        index : int
+            The index at which to insert the items. It is clipped to
+            the bounds of the data items.
+
+        items : iterable
+            The items to insert, in the format accepted by `set_items`.
+
+        """
+        data = [make_item_data(item) for item in items]
+        if data:
+            index = self._clip_index(index)
+            self._item_data[index:index] = data
+            content = {
+                'index': index, 'items': data,
+                'generation': self._next_generation(),
+            }
+            self.send_action('insert_items', content)
+
+    def remove_items(self, index, count=1):
+        """ Remove a range of data items from the list control.
+
+        Parameters
+        ----------
+        index : int
+            The index of the first item to remove.
+
+        count : int, optional
+            The number of items to remove. The default is 1.
+
+        """
+        index = self._clip_index(index)
+        count = min(count, len(self._item_data) - index)
+        if count > 0:
+            del self._item_data[index:index + count]
+            content = {
+                'index': index, 'count': count,
+                'generation': self._next_generation(),
+            }
+            self.send_action('remove_items', content)
+
+    def move_items(self, index, count, destination):
+        """ Move a range of data items within the list control.
+
+        Parameters
+        ----------
+        index : int
+            The index of the first item to move.
+
+        count : int
+            The number of items to move.
+
+        destination : int
+            The index of the first moved item after the move, computed
+            after the range has been removed from the list.
+
+        """
+        item_data = self._item_data
+        index = self._clip_index(index)
+        count = min(count, len(item_data) - index)
+        if count <= 0:
+            return
+        moved = item_data[index:index + count]
+        del item_data[index:index + count]
+        destination = max(0, min(destination, len(item_data)))
+        item_data[destination:destination] = moved
+        if destination != index:
+            content = {
+                'index': index, 'count': count, 'destination': destination,
+                'generation': self._next_generation(),
+            }
+            self.send_action('move_items', content)
+
+    def update_items(self, index, items):
+        """ Replace a range of data items in the list control.
+
+        Parameters
+        ----------
+        index : int
+            The index of the first item to replace.
+
+        items : iterable
+            The replacement items, in the format accepted by
+            `set_items`. Items past the end of the list are ignored.
+
+        """
+        index = self._clip_index(index)
+        data = [make_item_data(item) for item in items]
+        data = data[:len(self._item_data) - index]
+        if data:
+            self._item_data[index:index + len(data)] = data
+            content = {'index': index, 'items': data}
+            self.send_action('update_items', content)
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _clip_index(self, index):
+        """ Clip an index to the bounds of the data items.
+
+        """
+        return max(0, min(index, len(self._item_data)))
+
+    def _next_generation(self):
+        """ Increment and return the generation of the data items.
+
+        """
+        self._items_generation += 1
+        return self._items_generation
+
+    def _is_current_item(self, content):
+        """ Get whether an item event from the client is current.
+
+        An event is stale if it was sent before the client applied the
+        latest change to the indices of the data items.
+
+        """
+        if content.get('generation') != self._items_generation:
+            return False
+        return 0 <= content['index'] < len(self._item_data)
+
     @cached_property
     def _get_list_items(self):
         """ The getter for the 'list_items' property.
@@ -0,0 +1,36 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Bool
+
+from .item_view import ItemView
+
+
+class ListView(ItemView):
+    """ A virtualized view of the first column of an ItemModel.
+
+    """
+    #: Whether or not the rows of the view have uniform heights. This
+    #: allows the client to lay out a large model very efficiently.
+    uniform_item_sizes = Bool(True)
+
+    #: Whether or not the text of the rows wraps at word boundaries.
+    word_wrap = Bool(False)
+
+    def snapshot(self):
+        """ Returns the snapshot dictionary for the list view.
+
+        """
+        snap = super(ListView, self).snapshot()
+        snap['uniform_item_sizes'] = self.uniform_item_sizes
+        snap['word_wrap'] = self.word_wrap
+        return snap
+
+    def bind(self):
+        """ Bind the change handlers for the list view.
+
+        """
+        super(ListView, self).bind()
+        self.publish_attributes('uniform_item_sizes', 'word_wrap')
+
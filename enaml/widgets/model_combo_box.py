@@ -0,0 +1,178 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Instance, Int, Property, Range, Unicode
+
+from .control import Control
+from .item_model import ItemModel
+from .item_view import fetch_model_rows, model_shape
+
+
+class ModelComboBox(Control):
+    """ A drop-down list which displays the first column of an
+    ItemModel.
+
+    The client widget only fetches the items which it displays, so a
+    ModelComboBox can offer a very large number of choices. Typing in
+    the combo box searches the model on the server, and the matching
+    items are offered for selection.
+
+    """
+    #: The model which provides the items of the combo box.
+    model = Instance(ItemModel)
+
+    #: The integer index of the currently selected item. If the given
+    #: index falls outside of the range of items, the item will be
+    #: deselected.
+    index = Int(-1)
+
+    #: The number of items the client fetches before and after the
+    #: items which it needs to display.
+    prefetch = Range(low=0, value=100)
+
+    #: The maximum number of matches returned for a search.
+    search_limit = Range(low=1, value=50)
+
+    #: The delay in ms between the last keystroke and the search.
+    search_delay = Range(low=0, value=150)
+
+    #: A readonly property that will return the currently selected
+    #: item. If the index falls out of range, the selected item will
+    #: be the empty string.
+    selected_item = Property(Unicode, depends_on=['index', 'model'])
+
+    #: How strongly a component hugs it's contents' width. ComboBoxes
+    #: hug width weakly, by default.
+    hug_width = 'weak'
+
+    #--------------------------------------------------------------------------
+    # Initialization
+    #--------------------------------------------------------------------------
+    def snapshot(self):
+        """ Returns the dict of creation attributes for the combo box.
+
+        """
+        snap = super(ModelComboBox, self).snapshot()
+        snap.update(model_shape(self.model))
+        snap['index'] = self.index
+        snap['prefetch'] = self.prefetch
+        snap['search_delay'] = self.search_delay
+        return snap
+
+    def bind(self):
+        """ A method called after initialization which allows the widget
+        to bind any event handlers necessary.
+
+        """
+        super(ModelComboBox, self).bind()
+        self.publish_attributes('index', 'prefetch', 'search_delay')
+        otc = self.on_trait_change
+        otc(self._send_reset, 'model, model:model_reset')
+        otc(self._send_data_changed, 'model:data_changed')
+        otc(self._send_rows_inserted, 'model:rows_inserted')
+        otc(self._send_rows_removed, 'model:rows_removed')
+
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_index_changed(self, content):
+        """ Handle the 'index_changed' action from the client widget.
+
+        """
+        self.set_guarded(index=content['index'])
+
+    def on_action_fetch_rows(self, content):
+        """ Handle the 'fetch_rows' action from the client widget.
+
+        The reply is the same as the reply of an ItemView.
+
+        """
+        row_count, ranges = fetch_model_rows(self.model, content['ranges'])
+        reply = {
+            'ranges': ranges,
+            'row_count': row_count,
+            'generation': content.get('generation'),
+        }
+        self.send_action('rows', reply)
+
+    def on_action_search(self, content):
+        """ Handle the 'search' action from the client widget.
+
+        The content contains the search 'text' and a 'request' number
+        which is returned with the matches, so that the client can
+        discard the replies to superseded searches.
+
+        """
+        model = self.model
+        text = content['text']
+        if model is None or not text:
+            matches = []
+        else:
+            matches = model.search(text, self.search_limit)
+        reply = {'request': content['request'], 'matches': matches}
+        self.send_action('search_results', reply)
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _send_reset(self):
+        """ Send the 'reset' action to the client widget.
+
+        The index is deselected if it is out of range of the new model.
+
+        """
+        shape = model_shape(self.model)
+        self.send_action('reset', shape)
+        if self.index >= shape['row_count']:
+            self.index = -1
+
+    def _send_data_changed(self, change):
+        """ Send the 'data_changed' action to the client widget.
+
+        """
+        row, count = change
+        self.send_action('data_changed', {'row': row, 'count': count})
+        if row <= self.index < row + count:
+            self.trait_property_changed('selected_item', None)
+
+    def _send_rows_inserted(self, change):
+        """ Send the 'rows_inserted' action to the client widget.
+
+        The index is updated to continue to refer to the same item.
+
+        """
+        row, count = change
+        self.send_action('rows_inserted', {'row': row, 'count': count})
+        if self.index >= row:
+            self.index += count
+
+    def _send_rows_removed(self, change):
+        """ Send the 'rows_removed' action to the client widget.
+
+        The index is updated to continue to refer to the same item, or
+        to -1 if the item was removed.
+
+        """
+        row, count = change
+        self.send_action('rows_removed', {'row': row, 'count': count})
+        index = self.index
+        if index >= row + count:
+            self.index = index - count
+        elif index >= row:
+            self.index = -1
+
+    #--------------------------------------------------------------------------
+    # Property Handlers
+    #--------------------------------------------------------------------------
+    def _get_selected_item(self):
+        """ The getter for the `selected_item` property.
+
+        """
+        model = self.model
+        idx = self.index
+        if model is None or idx < 0 or idx >= model.row_count():
+            return u''
+        value = model.data(idx, 0)
+        return u'' if value is None else unicode(value)
+
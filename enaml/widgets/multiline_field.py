@@ -2,7 +2,9 @@
 #  Copyright (c) 2013, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Bool, Unicode
+from traits.api import Bool, Int, Unicode
+
+from enaml.text_delta import apply_edits, text_edits
 
 from .control import Control
 
@@ -10,6 +12,15 @@ from .control import Control
 class MultilineField(Control):
     """ A simple multiline editable text widget.
 
+    The text is synchronized with the client widget as edits, each of
+    which replaces a range of the text, so that a small change to a
+    large text sends a small message. Every batch of edits increments
+    the text version, and only the server assigns versions. A batch
+    from the client is only applied if it was made against the current
+    version, and is acknowledged with the new version. Otherwise both
+    sides edited the text at the same time, and the client is sent the
+    full text of the server.
+
     """
     #: The unicode text to display in the field.
     text = Unicode
@@ -27,6 +38,9 @@ class MultilineField(Control):
     hug_width = 'ignore'
     hug_height = 'ignore'
 
+    #: The version of the text, incremented for every batch of edits.
+    _text_version = Int(0)
+
     #--------------------------------------------------------------------------
     # Initialization
     #--------------------------------------------------------------------------
@@ -36,6 +50,7 @@ class MultilineField(Control):
         """
         snap = super(MultilineField, self).snapshot()
         snap['text'] = self.text
+        snap['text_version'] = self._text_version
         snap['read_only'] = self.read_only
         snap['auto_sync_text'] = self.auto_sync_text
         return snap
@@ -45,17 +60,42 @@ class MultilineField(Control):
 
         """
         super(MultilineField, self).bind()
-        self.publish_attributes('text', 'read_only', 'auto_sync_text')
+        self.publish_attributes('read_only', 'auto_sync_text')
+        self.on_trait_change(self._send_text_edits, 'text')
 
     #--------------------------------------------------------------------------
     # Message Handling
     #--------------------------------------------------------------------------
+    def on_action_edit_text(self, content):
+        """ Handle the 'edit_text' action from the client widget.
+
+        The content contains the 'base' version of the text which the
+        'edits' were made against. Edits made against an older version
+        conflict with a change made by the server, and the client is
+        resynchronized with the full text instead.
+
+        """
+        if content['base'] != self._text_version:
+            self._send_full_text()
+            return
+        try:
+            text = apply_edits(self.text, content['edits'])
+        except ValueError:
+            self._send_full_text()
+            return
+        self._text_version += 1
+        self.set_guarded(text=text)
+        self.send_action('text_ack', {'version': self._text_version})
+
     def on_action_text_changed(self, content):
         """ Handle the 'text_changed' action from the client widget.
 
+        This action replaces the full text. It is kept for clients which
+        do not send edits.
+
         """
-        text = content['text']
-        self.set_guarded(text=text)
+        self._text_version += 1
+        self.set_guarded(text=content['text'])
 
     #--------------------------------------------------------------------------
     # Public API
@@ -66,3 +106,26 @@ class MultilineField(Control):
         """
         self.send_action('sync_text', {})
 
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _send_text_edits(self, obj, name, old, new):
+        """ Send the edits for a change to the text to the client.
+
+        """
+        if 'text' not in self.loopback_guard:
+            self._text_version += 1
+            content = {
+                'base': self._text_version - 1,
+                'version': self._text_version,
+                'edits': text_edits(old, new),
+            }
+            self.send_action('edit_text', content)
+
+    def _send_full_text(self):
+        """ Send the full text and its version to the client.
+
+        """
+        content = {'text': self.text, 'version': self._text_version}
+        self.send_action('set_text', content)
+
@@ -2,7 +2,7 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Enum, Bool, Property, cached_property
+from traits.api import Enum, Bool, Instance, Int, Property, cached_property
 
 from .constraints_widget import ConstraintsWidget
 from .page import Page
@@ -27,9 +27,29 @@ class Notebook(ConstraintsWidget):
     #: Whether or not the tabs in the notebook should be movable.
     tabs_movable = Bool(True)
 
+    #: Whether the contents of the pages are realized lazily. If True,
+    #: only the contents of the initially visible page are included in
+    #: the snapshot. The contents of the other pages are built by the
+    #: client when they are first shown.
+    lazy = Bool(False)
+
+    #: Whether a lazy notebook should realize the contents of the page
+    #: after the current page while the client is idle, so that it is
+    #: ready when the user selects it.
+    prebuild_next = Bool(False)
+
+    #: The number of milliseconds after which the contents of a hidden
+    #: page of a lazy notebook are unrealized on the client to reclaim
+    #: memory. A value of 0 means the contents are never unrealized.
+    unrealize_delay = Int(0)
+
     #: A read only property which returns the notebook's Pages.
     pages = Property(depends_on='children')
 
+    #: The page which is current on the client, as last reported by the
+    #: client. It is the page which is shown in a snapshot.
+    _current_page = Instance(Page)
+
     #: How strongly a component hugs it's contents' width. A Notebook
     #: ignores its width hug by default, so it expands freely in width.
     hug_width = 'ignore'
@@ -45,11 +65,18 @@ class Notebook(ConstraintsWidget):
         """ Returns the snapshot for the control.
 
         """
+        current = self._snapshot_page()
+        if self.lazy:
+            self._unrealize_hidden_pages(current)
         snap = super(Notebook, self).snapshot()
         snap['tab_style'] = self.tab_style
         snap['tab_position'] = self.tab_position
         snap['tabs_closable'] = self.tabs_closable
         snap['tabs_movable'] = self.tabs_movable
+        snap['lazy'] = self.lazy
+        snap['prebuild_next'] = self.prebuild_next
+        snap['unrealize_delay'] = self.unrealize_delay
+        snap['current_page'] = current and current.object_id
         return snap
 
     def bind(self):
@@ -59,12 +86,65 @@ class Notebook(ConstraintsWidget):
         super(Notebook, self).bind()
         attrs = (
             'tab_style', 'tab_position', 'tabs_closable', 'tabs_movable',
+            'lazy', 'prebuild_next', 'unrealize_delay',
         )
         self.publish_attributes(*attrs)
 
+    #--------------------------------------------------------------------------
+    # Message Handling
+    #--------------------------------------------------------------------------
+    def on_action_current_page_changed(self, content):
+        """ Handle the 'current_page_changed' action from the client.
+
+        """
+        page_id = content['page_id']
+        for page in self.pages:
+            if page.object_id == page_id:
+                self._current_page = page
+                return
+        self._current_page = None
+
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _snapshot_page(self):
+        """ Get the page which is shown by a snapshot.
+
+        Returns
+        -------
+        result : Page or None
+            The page which is current on the client if it is still an
+            open page, otherwise the first open page, or None if there
+            are no open pages.
+
+        """
+        current = self._current_page
+        if current is not None and current.visible:
+            if current in self.pages:
+                return current
+        for page in self.pages:
+            if page.visible:
+                return page
+
+    def _unrealize_hidden_pages(self, shown):
+        """ Unrealize the contents of all but the shown page.
+
+        This is called before the snapshot of a lazy notebook is taken.
+        The client realizes the contents of a page when it is shown.
+
+        """
+        for page in self.pages:
+            if page is not shown:
+                page._set_children_realized(False)
+
+    def _lazy_changed(self, lazy):
+        """ Realize the contents of every page when lazy is disabled.
+
+        """
+        if not lazy:
+            for page in self.pages:
+                page.realize_children()
+
     @cached_property
     def _get_pages(self):
         """ The getter for the 'pages' property.
@@ -2,7 +2,7 @@
 #  Copyright (c) 2012, Enthought, Inc.
 #  All rights reserved.
 #------------------------------------------------------------------------------
-from traits.api import Dict, Int, Property, cached_property
+from traits.api import Bool, Dict, Int, Property, cached_property
 
 from .constraints_widget import ConstraintsWidget
 from .stack_item import StackItem
@@ -20,9 +20,26 @@ class Stack(ConstraintsWidget):
     index = Int(0)
 
     #: The transition to use when change between stack items.
-    #: XXX Document the supported transitions.
+    #: XXX Document the supported transitions. The optional key
+    #: 'minimum_fps' sets the frame rate below which the client skips
+    #: the transition and changes the item immediately.
     transition = Dict
 
+    #: Whether the contents of the stack items are realized lazily. If
+    #: True, only the contents of the current item are included in the
+    #: snapshot. The contents of another item are realized when the
+    #: index changes to it.
+    lazy = Bool(False)
+
+    #: Whether a lazy stack should realize the contents of the item
+    #: after the current item while the client is idle.
+    prebuild_next = Bool(False)
+
+    #: The number of milliseconds after which the contents of a hidden
+    #: item of a lazy stack are unrealized on the client to reclaim
+    #: memory. A value of 0 means the contents are never unrealized.
+    unrealize_delay = Int(0)
+
     #: A read only property which returns the stack's StackItems
     stack_items = Property(depends_on='children')
 
@@ -33,9 +50,16 @@ class Stack(ConstraintsWidget):
         """ Returns the snapshot for the control.
 
         """
+        if self.lazy:
+            for index, item in enumerate(self.stack_items):
+                if index != self.index:
+                    item._set_children_realized(False)
         snap = super(Stack, self).snapshot()
         snap['index'] = self.index
         snap['transition'] = self.transition
+        snap['lazy'] = self.lazy
+        snap['prebuild_next'] = self.prebuild_next
+        snap['unrealize_delay'] = self.unrealize_delay
         return snap
 
     def bind(self):
@@ -43,7 +67,10 @@ class Stack(ConstraintsWidget):
 
         """
         super(Stack, self).bind()
-        self.publish_attributes('index', 'transition')
+        attrs = (
+            'index', 'transition', 'lazy', 'prebuild_next', 'unrealize_delay',
+        )
+        self.publish_attributes(*attrs)
 
     #--------------------------------------------------------------------------
     # Message Handling
@@ -58,6 +85,25 @@ class Stack(ConstraintsWidget):
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
+    def _index_changed(self, index):
+        """ Realize the contents of the new current item.
+
+        This static handler runs before the change is published, so the
+        client has the contents of the item before it is shown.
+
+        """
+        items = self.stack_items
+        if 0 <= index < len(items):
+            items[index].realize_children()
+
+    def _lazy_changed(self, lazy):
+        """ Realize the contents of every item when lazy is disabled.
+
+        """
+        if not lazy:
+            for item in self.stack_items:
+                item.realize_children()
+
     @cached_property
     def _get_stack_items(self):
         """ The getter for the 'stack_items' property.
@@ -0,0 +1,39 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2013, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+from traits.api import Bool
+
+from .item_view import ItemView
+
+
+class TableView(ItemView):
+    """ A virtualized view of the rows and columns of an ItemModel.
+
+    """
+    #: Whether or not the column headers are visible.
+    show_horizontal_header = Bool(True)
+
+    #: Whether or not the row headers are visible.
+    show_vertical_header = Bool(False)
+
+    #: Whether or not the grid lines are visible.
+    show_grid = Bool(True)
+
+    def snapshot(self):
+        """ Returns the snapshot dictionary for the table view.
+
+        """
+        snap = super(TableView, self).snapshot()
+        snap['show_horizontal_header'] = self.show_horizontal_header
+        snap['show_vertical_header'] = self.show_vertical_header
+        snap['show_grid'] = self.show_grid
+        return snap
+
+    def bind(self):
+        """ Bind the change handlers for the table view.
+
+        """
+        super(TableView, self).bind()
+        attrs = ('show_horizontal_header', 'show_vertical_header', 'show_grid')
+        self.publish_attributes(*attrs)
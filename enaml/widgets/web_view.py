@@ -4,6 +4,8 @@
 #------------------------------------------------------------------------------
 from traits.api import Unicode
 
+from enaml.html_patch import patch_html
+
 from .control import Control
 
 
@@ -11,7 +13,8 @@ class WebView(Control):
     """ A widget which displays a web page.
 
     Unlike the simpler `Html` widget, this widget supports the features
-    of a full web browser.
+    of a full web browser. Content can be streamed into the `html`
+    with `patch_html`, which sends only the new fragment to the client.
 
     """
     #: The URL to load in the web view. This can be a path to a remote
@@ -46,3 +49,41 @@ class WebView(Control):
         super(WebView, self).bind()
         self.publish_attributes('url', 'html')
 
+    #--------------------------------------------------------------------------
+    # Public API
+    #--------------------------------------------------------------------------
+    def patch_html(self, html, element_id=u'', mode='append'):
+        """ Insert an html fragment into an element of the html.
+
+        The html is updated, but only the fragment is sent to the
+        client widget, which inserts it into the loaded document. The
+        html cannot be patched while the web view displays the `url`.
+
+        Parameters
+        ----------
+        html : unicode
+            The html fragment to insert.
+
+        element_id : unicode, optional
+            The id of the element to patch. The default empty string
+            patches the body of the document.
+
+        mode : str, optional
+            One of 'append', 'prepend' or 'replace'. The default is
+            'append'.
+
+        Raises
+        ------
+        ValueError
+            The mode is not supported, the element cannot be found, or
+            the web view displays the url instead of the html.
+
+        """
+        if self.url and not self.html:
+            msg = 'cannot patch the html of a web view which displays a url'
+            raise ValueError(msg)
+        source = patch_html(self.html, element_id, html, mode)
+        self.set_guarded(html=source)
+        content = {'element_id': element_id, 'html': html, 'mode': mode}
+        self.send_action('patch_html', content)
+
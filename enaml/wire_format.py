@@ -0,0 +1,99 @@
+#------------------------------------------------------------------------------
+#  Copyright (c) 2012, Enthought, Inc.
+#  All rights reserved.
+#------------------------------------------------------------------------------
+""" Serialization of action messages for transports between processes.
+
+A message is encoded as a list of frames. The first frame is the JSON
+encoding of the (object_id, action, content) message, and the remaining
+frames hold the raw bytes of any buffer objects in the content, such as
+the numpy arrays of 'array' format images. The buffers are replaced in
+the JSON by a reference to their frame, so that they are sent without
+being encoded as text. A decoded buffer is a bytestring.
+
+"""
+import json
+
+
+#: The key used in the JSON frame to reference a buffer frame.
+BUFFER_KEY = '__enaml_buffer__'
+
+
+def _buffer_bytes(obj):
+    """ Get a buffer over the raw bytes of an object which supports
+    the buffer protocol, or None if the object is not a buffer.
+
+    """
+    try:
+        return buffer(obj)
+    except (TypeError, ValueError):
+        # A non-contiguous numpy array does not expose a buffer, but
+        # can be packed into one.
+        tostring = getattr(obj, 'tostring', None)
+        if tostring is not None:
+            return tostring()
+    return None
+
+
+def encode_message(object_id, action, content):
+    """ Encode an action message into a list of frames.
+
+    Parameters
+    ----------
+    object_id : str
+        The object id of the target object.
+
+    action : str
+        The action that should be performed by the object.
+
+    content : dict
+        The content dictionary for the action. It may contain any JSON
+        serializable object or object supporting the buffer protocol.
+
+    Returns
+    -------
+    result : list
+        The frames which encode the message. The first frame is a str
+        and the buffer frames are buffer objects over the memory of the
+        original objects, which can be sent by a transport without an
+        intermediate copy.
+
+    """
+    frames = [None]
+
+    def default(obj):
+        data = _buffer_bytes(obj)
+        if data is None:
+            msg = '%r is not JSON serializable or a buffer'
+            raise TypeError(msg % (obj,))
+        frames.append(data)
+        return {BUFFER_KEY: len(frames) - 1}
+
+    frames[0] = json.dumps([object_id, action, content], default=default)
+    return frames
+
+
+def decode_message(frames):
+    """ Decode a list of frames into an action message.
+
+    Parameters
+    ----------
+    frames : list
+        The str or buffer frames which encode the message, as created
+        by a call to `encode_message`.
+
+    Returns
+    -------
+    result : tuple
+        The (object_id, action, content) of the message.
+
+    """
+    if len(frames) == 1:
+        return tuple(json.loads(frames[0]))
+
+    def object_hook(dct):
+        if BUFFER_KEY in dct and len(dct) == 1:
+            return str(frames[dct[BUFFER_KEY]])
+        return dct
+
+    return tuple(json.loads(frames[0], object_hook=object_hook))
@@ -3,7 +3,6 @@
 #  All rights reserved.
 #------------------------------------------------------------------------------
 import logging
-import uuid
 
 import wx
 
@@ -66,14 +65,9 @@ class WxApplication(Application):
             The unique identifier for the created session.
 
         """
-        if name not in self._named_factories:
-            raise ValueError('Invalid session name')
-
-        # Create and open a new server-side session.
-        factory = self._named_factories[name]
-        session = factory()
-        session_id = uuid.uuid4().hex
-        session.open(session_id)
+        # Get an opened server-side session, from the pool if possible.
+        session = self._open_session(name)
+        session_id = session.session_id
         self._sessions[session_id] = session
 
         # Create and open a new client-side session.
@@ -44,6 +44,39 @@ class WxComboBox(WxControl):
         """
         self.set_items(content['items'])
 
+    def on_action_insert_items(self, content):
+        """ Handle the 'insert_items' action from the Enaml widget.
+
+        """
+        widget = self.widget()
+        index = content['index']
+        for offset, item in enumerate(content['items']):
+            widget.Insert(item, index + offset)
+
+    def on_action_remove_items(self, content):
+        """ Handle the 'remove_items' action from the Enaml widget.
+
+        """
+        widget = self.widget()
+        index = content['index']
+        for idx in reversed(xrange(index, index + content['count'])):
+            widget.Delete(idx)
+
+    def on_action_replace_items(self, content):
+        """ Handle the 'replace_items' action from the Enaml widget.
+
+        """
+        widget = self.widget()
+        index = content['index']
+        items = content['items']
+        current = widget.GetCurrentSelection()
+        for offset, item in enumerate(items):
+            widget.SetString(index + offset, item)
+        # Changing the string of the selected item can clear the
+        # selection, so it is restored.
+        if index <= current < index + len(items):
+            widget.SetSelection(current)
+
     #--------------------------------------------------------------------------
     # Event Handlers
     #--------------------------------------------------------------------------
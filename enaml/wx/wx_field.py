@@ -148,6 +148,16 @@ class WxField(WxControl):
     #: A flag indicating whether the current field is invalid.
     _is_error_state = False
 
+    #: The timer which delays an 'auto_sync' submission while the user
+    #: is typing.
+    _sync_timer = None
+
+    #: The delay in ms before an 'auto_sync' submission.
+    _sync_delay = 300
+
+    #: The number of the most recent submission to the server.
+    _submit_request = 0
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -180,12 +190,15 @@ class WxField(WxControl):
 
         """
         super(WxField, self).create(tree)
+        widget = self.widget()
+        self._sync_timer = wx.Timer(widget)
         self.set_text(tree['text'])
         self.set_validator(tree['validator'])
         self.set_submit_triggers(tree['submit_triggers'])
+        self.set_sync_delay(tree['sync_delay'])
         self.set_placeholder(tree['placeholder'])
         self.set_max_length(tree['max_length'])
-        widget = self.widget()
+        widget.Bind(wx.EVT_TIMER, self.on_sync_timer, self._sync_timer)
         widget.Bind(wx.EVT_KILL_FOCUS, self.on_lost_focus)
         widget.Bind(wx.EVT_TEXT_ENTER, self.on_return_pressed)
         widget.Bind(wx.EVT_TEXT, self.on_text_edited)
@@ -196,13 +209,17 @@ class WxField(WxControl):
     def _submit_text(self, text):
         """ Submit the given text as an update to the server widget.
 
+        The submission is numbered so that a reply for text which has
+        since been edited can be discarded.
+
         Parameters
         ----------
         text : unicode
             The unicode text to send to the server widget.
 
         """
-        content = {'text': text}
+        self._submit_request += 1
+        content = {'text': text, 'request': self._submit_request}
         self.send_action('submit_text', content)
 
     def _validate_and_submit(self):
@@ -210,6 +227,7 @@ class WxField(WxControl):
         the server widget if it's valid.
 
         """
+        self._sync_timer.Stop()
         text = self.widget().GetValue()
         if text != self._last_value:
             if self._validator(text):
@@ -254,8 +272,17 @@ class WxField(WxControl):
 
         """
         event.Skip()
-        if 'text_edited' in self._submit_triggers:
+        triggers = self._submit_triggers
+        if 'text_edited' in triggers:
             self._validate_and_submit()
+        elif 'auto_sync' in triggers:
+            self._sync_timer.Start(self._sync_delay, wx.TIMER_ONE_SHOT)
+
+    def on_sync_timer(self, event):
+        """ The event handler for the EVT_TIMER event of the sync timer.
+
+        """
+        self._validate_and_submit()
 
     #--------------------------------------------------------------------------
     # Message Handling
@@ -263,7 +290,13 @@ class WxField(WxControl):
     def on_action_set_text(self, content):
         """ Handle the 'set_text' action from the Enaml widget.
 
+        A reply to a submission is ignored if the text has been
+        submitted again since.
+
         """
+        request = content.get('request')
+        if request is not None and request != self._submit_request:
+            return
         self.set_text(content['text'])
 
     def on_action_set_validator(self, content):
@@ -277,7 +310,13 @@ class WxField(WxControl):
         widget.
 
         """
-        self.set_submit_triggers(content['sumbit_triggers'])
+        self.set_submit_triggers(content['submit_triggers'])
+
+    def on_action_set_sync_delay(self, content):
+        """ Handle the 'set_sync_delay' action from the Enaml widget.
+
+        """
+        self.set_sync_delay(content['sync_delay'])
 
     def on_action_set_placeholder(self, content):
         """ Hanlde the 'set_placeholder' action from the Enaml widget.
@@ -337,6 +376,14 @@ class WxField(WxControl):
 
         """
         self._submit_triggers = triggers
+        if 'auto_sync' not in triggers:
+            self._sync_timer.Stop()
+
+    def set_sync_delay(self, delay):
+        """ Set the delay before an 'auto_sync' submission.
+
+        """
+        self._sync_delay = delay
 
     def set_placeholder(self, placeholder):
         """ Sets the placeholder text in the widget.
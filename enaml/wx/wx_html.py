@@ -4,6 +4,8 @@
 #------------------------------------------------------------------------------
 import wx.html
 
+from enaml.html_patch import patch_html
+
 from .wx_control import WxControl
 
 
@@ -24,6 +26,9 @@ class WxHtml(WxControl):
     """ A Wx implementation of the Enaml Html widget.
 
     """
+    #: The html source displayed by the widget.
+    _source = ''
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -49,6 +54,13 @@ class WxHtml(WxControl):
         """
         self.set_source(content['source'])
 
+    def on_action_patch_html(self, content):
+        """ Handle the 'patch_html' action from the Enaml widget.
+
+        """
+        self.patch_html(content['html'], content['element_id'],
+                        content['mode'])
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -56,5 +68,19 @@ class WxHtml(WxControl):
         """ Set the source of the html widget
 
         """
+        self._source = source
         self.widget().SetPage(source)
 
+    def patch_html(self, html, element_id, mode):
+        """ Insert an html fragment into an element of the source.
+
+        A fragment appended to the body is appended to the page. Any
+        other patch reloads the patched source.
+
+        """
+        self._source = patch_html(self._source, element_id, html, mode)
+        if not element_id and mode == 'append':
+            self.widget().AppendToPage(html)
+        else:
+            self.widget().SetPage(self._source)
+
@@ -5,6 +5,8 @@
 import wx
 import wx.lib.newevent
 
+from enaml.text_delta import apply_edits, text_edits
+
 from .wx_control import WxControl
 
 
@@ -80,6 +82,23 @@ class WxMultilineField(WxControl):
     #: Whether or not to auto synchronize the text on change.
     _auto_sync_text = True
 
+    #: The version of the text last synchronized with the server. The
+    #: versions are only assigned by the server.
+    _text_version = 0
+
+    #: The text sent with the edits which the server has not yet
+    #: acknowledged, or None if there are no such edits.
+    _sent_text = None
+
+    #: Whether a sync was requested while edits were unacknowledged.
+    _sync_pending = False
+
+    #: The text last synchronized with the server.
+    _synced_text = u''
+
+    #: Whether the user has edited the text since the last sync.
+    _dirty = False
+
     #--------------------------------------------------------------------------
     # Setup Methods
     #--------------------------------------------------------------------------
@@ -96,30 +115,53 @@ class WxMultilineField(WxControl):
         """
         super(WxMultilineField, self).create(tree)
         self._auto_sync_text = tree['auto_sync_text']
+        self._text_version = tree['text_version']
         self.set_text(tree['text'])
         self.set_read_only(tree['read_only'])
         widget = self.widget()
+        widget.Bind(wx.EVT_TEXT, self.on_text_edited)
         widget.Bind(EVT_TEXT_CHANGED, self.on_text_changed)
 
     #--------------------------------------------------------------------------
     # Private API
     #--------------------------------------------------------------------------
-    def _send_text_changed(self):
-        """ Send the current text as an update to the server widget.
+    def _send_text_edits(self):
+        """ Send the edits made by the user to the server widget.
+
+        Only one batch of edits is sent at a time, since the edits are
+        computed against the text of the last version acknowledged by
+        the server. Edits made while a batch is unacknowledged are sent
+        once the server replies.
 
         """
+        if self._sent_text is not None:
+            self._sync_pending = True
+            return
+        self._dirty = False
         text = self.widget().GetValue()
-        self.send_action('text_changed', {'text': text})
+        edits = text_edits(self._synced_text, text)
+        if edits:
+            content = {'base': self._text_version, 'edits': edits}
+            self.send_action('edit_text', content)
+            self._sent_text = text
 
     #--------------------------------------------------------------------------
     # Event Handling
     #--------------------------------------------------------------------------
+    def on_text_edited(self, event):
+        """ The event handler for the EVT_TEXT event.
+
+        """
+        event.Skip()
+        if 'text' not in self.loopback_guard:
+            self._dirty = True
+
     def on_text_changed(self, event):
         """ The event handler for EVT_TEXT_CHANGED event.
 
         """
-        if self._auto_sync_text and 'text' not in self.loopback_guard:
-            self._send_text_changed()
+        if self._auto_sync_text and self._dirty:
+            self._send_text_edits()
 
     #--------------------------------------------------------------------------
     # Message Handling
@@ -128,8 +170,45 @@ class WxMultilineField(WxControl):
         """ Handle the 'set_text' action from the Enaml widget.
 
         """
+        self._text_version = content.get('version', self._text_version)
+        self._sent_text = None
+        self._sync_pending = False
         self.set_text(content['text'])
 
+    def on_action_text_ack(self, content):
+        """ Handle the 'text_ack' action from the Enaml widget.
+
+        The server applied the edits which were last sent and assigned
+        them a new version. Any edits made since are sent next.
+
+        """
+        self._text_version = content['version']
+        self._synced_text = self._sent_text
+        self._sent_text = None
+        sync = self._sync_pending or self._auto_sync_text
+        self._sync_pending = False
+        if sync and self._dirty:
+            self._send_text_edits()
+
+    def on_action_edit_text(self, content):
+        """ Handle the 'edit_text' action from the Enaml widget.
+
+        The edits are only applied if they were made against the text
+        last synchronized with the server and the user has not edited
+        the text since. Otherwise, the server rejects the user edits,
+        which are sent now if they are not already in flight, and it
+        replies with its full text.
+
+        """
+        if (self._dirty or self._sent_text is not None or
+                content['base'] != self._text_version):
+            self._send_text_edits()
+            return
+        edits = content['edits']
+        self.apply_edits(edits)
+        self._text_version = content['version']
+        self._synced_text = apply_edits(self._synced_text, edits)
+
     def on_action_set_auto_sync_text(self, content):
         """ Handle the 'set_auto_sync_text' action from the Enaml widget.
 
@@ -146,7 +225,7 @@ class WxMultilineField(WxControl):
         """ Handle the 'sync_text' action from the Enaml widget.
 
         """
-        self._send_text_changed()
+        self._send_text_edits()
 
     #--------------------------------------------------------------------------
     # Widget Update Methods
@@ -155,9 +234,20 @@ class WxMultilineField(WxControl):
         """ Updates the text control with the given unicode text.
 
         """
+        self._dirty = False
+        self._synced_text = text
         with self.loopback_guard('text'):
             self.widget().ChangeValue(text)
 
+    def apply_edits(self, edits):
+        """ Apply a list of text edits to the underlying widget.
+
+        """
+        widget = self.widget()
+        with self.loopback_guard('text'):
+            for position, removed, inserted in edits:
+                widget.Replace(position, position + removed, inserted)
+
     def set_read_only(self, read_only):
         """ Sets the read only state of the widget.
 
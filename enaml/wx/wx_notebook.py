@@ -366,7 +366,14 @@ class wxPreferencesNotebook(wx.Notebook):
 class WxNotebook(WxConstraintsWidget):
     """ A Wx implementation of an Enaml Notebook.
 
+    The contents of the pages of a lazy notebook are realized when a
+    page is first shown. The wx implementation does not prebuild or
+    unrealize pages.
+
     """
+    #: Whether the contents of the pages are realized lazily.
+    _lazy = False
+
     #--------------------------------------------------------------------------
     # Setup methods
     #--------------------------------------------------------------------------
@@ -390,6 +397,8 @@ class WxNotebook(WxConstraintsWidget):
         self.set_tab_position(tree['tab_position'])
         self.set_tabs_closable(tree['tabs_closable'])
         self.set_tabs_movable(tree['tabs_movable'])
+        self._lazy = tree['lazy']
+        self._init_page = tree['current_page']
 
     def init_layout(self):
         """ Handle the layout initialization for the notebook.
@@ -400,7 +409,46 @@ class WxNotebook(WxConstraintsWidget):
         for child in self.children():
             if isinstance(child, WxPage):
                 widget.AddWxPage(child.widget())
+        init_page = self._init_page
+        del self._init_page
+        for child in self.children():
+            if isinstance(child, WxPage) and child.object_id() == init_page:
+                index = widget.GetPageIndex(child.widget())
+                if index != -1:
+                    widget.SetSelection(index)
+                break
         widget.Bind(EVT_COMMAND_LAYOUT_REQUESTED, self.on_layout_requested)
+        widget.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+        widget.Bind(aui.EVT_AUINOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+
+    def activate(self):
+        """ Activate the notebook.
+
+        This realizes the contents of the initial page if needed.
+
+        """
+        super(WxNotebook, self).activate()
+        self._current_changed()
+
+    #--------------------------------------------------------------------------
+    # Private API
+    #--------------------------------------------------------------------------
+    def _current_changed(self):
+        """ Handle a change to the current page.
+
+        This requests the contents of the current page if needed, and
+        informs the Enaml widget of the current page.
+
+        """
+        current = self.widget().GetCurrentPage()
+        page_id = None
+        for child in self.children():
+            if isinstance(child, WxPage) and child.widget() is current:
+                if self._lazy and not child.children_realized():
+                    child.request_realize_children()
+                page_id = child.object_id()
+                break
+        self.send_action('current_page_changed', {'page_id': page_id})
 
     #--------------------------------------------------------------------------
     # Child Events
@@ -432,6 +480,13 @@ class WxNotebook(WxConstraintsWidget):
         """
         self.size_hint_updated()
 
+    def on_page_changed(self, event):
+        """ Handle the page changed event from the notebook.
+
+        """
+        event.Skip()
+        self._current_changed()
+
     #--------------------------------------------------------------------------
     # Message Handlers
     #--------------------------------------------------------------------------
@@ -459,6 +514,26 @@ class WxNotebook(WxConstraintsWidget):
         """
         self.set_tabs_movable(content['tabs_movable'])
 
+    def on_action_set_lazy(self, content):
+        """ Handle the 'set_lazy' action from the Enaml widget.
+
+        """
+        self._lazy = content['lazy']
+
+    def on_action_set_prebuild_next(self, content):
+        """ Handle the 'set_prebuild_next' action from the Enaml widget.
+
+        """
+        # Prebuilding pages on wx is not supported
+        pass
+
+    def on_action_set_unrealize_delay(self, content):
+        """ Handle the 'set_unrealize_delay' action from the Enaml widget.
+
+        """
+        # Unrealizing pages on wx is not supported
+        pass
+
     #--------------------------------------------------------------------------
     # Widget Update Methods
     #--------------------------------------------------------------------------
@@ -113,6 +113,7 @@ class WxObject(object):
         self._children = []
         self._widget = None
         self._initialized = False
+        self._children_realized = True
         self.set_parent(parent)
 
     #--------------------------------------------------------------------------
@@ -197,6 +198,37 @@ class WxObject(object):
         parent = self._parent
         parent_widget = parent.widget() if parent else None
         self._widget = self.create_widget(parent_widget, tree)
+        self._children_realized = tree['children_realized']
+
+    def children_realized(self):
+        """ Get whether the children of this object are realized.
+
+        Returns
+        -------
+        result : bool
+            False if the server has not yet sent the children of this
+            object, or if they were unrealized to reclaim memory.
+
+        """
+        return self._children_realized
+
+    def request_realize_children(self):
+        """ Request the server object to realize the children.
+
+        The children are built when the server replies with the
+        'realize_children' action.
+
+        """
+        self.send_action('realize_children', {})
+
+    def request_unrealize_children(self):
+        """ Request the server object to unrealize the children.
+
+        The children are destroyed when the server replies with the
+        'unrealize_children' action.
+
+        """
+        self.send_action('unrealize_children', {})
 
     def initialized(self):
         """ Get whether or not this object is initialized.
@@ -506,3 +538,29 @@ class WxObject(object):
         else:
             DeferredCall(self.destroy)
 
+    @deferred_updates
+    def on_action_realize_children(self, content):
+        """ Handle the 'realize_children' action from the Enaml object.
+
+        This method builds, initializes and activates the children from
+        their snapshots.
+
+        """
+        self._children_realized = True
+        session = self._session
+        for tree in content['children']:
+            child = session.build(tree, self)
+            if child is not None:
+                child.initialize()
+                child.activate()
+
+    def on_action_unrealize_children(self, content):
+        """ Handle the 'unrealize_children' action from the Enaml object.
+
+        This method destroys the children of the object.
+
+        """
+        self._children_realized = False
+        for child in self._children[:]:
+            child.destroy()
+
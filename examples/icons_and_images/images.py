@@ -24,6 +24,10 @@ class MyImageProvider(ImageProvider):
     """ A custom image provider for the image example.
 
     """
+    #: The images are the same for every session, so they are cached
+    #: and shared by all of the sessions.
+    cache_key = 'myimages'
+
     def request_image(self, path, size, callback):
         """ Request an image from this provider.
 